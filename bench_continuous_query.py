@@ -0,0 +1,100 @@
+# bench_continuous_query.py (연속 조회: 페이지 사이 고정 대기 vs TPS 기반 대기 vs 미리 받기)
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+
+from lsbase.openapi_client.OpenApi import OpenApi
+from lsbase.api_client.ls_api import LSTradingAPI
+from lsbase.api_client.rate_limiter import TrRateLimiter
+from lsbase import generated_models as gen_models
+
+REQUESTS = {
+    "t1444": ({"t1444InBlock": {"upcode": "001", "idx": 0}}, gen_models.T1444OutBlock1Item),
+    "t1305": ({"t1305InBlock": {"shcode": "005930", "dwmcode": 1, "date": "20240102", "idx": 0, "cnt": 500}}, gen_models.T1305OutBlock1Item),
+}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int, latency: float, pages: int, page_size: int) -> subprocess.Popen:
+    """소비자의 model_validate가 서버 응답을 막지 않도록 대체 서버를 별도 프로세스로 실행한다."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "lsbase.tools.local_server", "--port", str(port), "--latency", str(latency),
+         "--pages", str(pages), "--page-size", str(page_size), "--tick-rate", "0"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("local server did not start")
+
+
+async def run(base_url: str, tr_code: str, tps: float | None, prefetch: int, work_ms: float, page_size: int) -> tuple:
+    """(소요 시간(s), 항목 수)"""
+    wss_url = base_url.replace("http", "ws") + "/websocket"
+    api = OpenApi(base_url=base_url, wss_url_real=wss_url, wss_url_simulation=wss_url)
+    assert await api.login("bench", "bench"), api.last_message
+    limiter = TrRateLimiter(overrides={tr_code: tps}) if tps else None
+    ls_api = LSTradingAPI(api, rate_limiter=limiter, coalesce=False)
+    params, model = REQUESTS[tr_code]
+    params = {block: dict(fields) for block, fields in params.items()}
+
+    items = 0
+    start = time.perf_counter()
+    async for item in ls_api.continuous_query(tr_code, params, prefetch=prefetch):
+        model.model_validate(item)
+        items += 1
+        # 페이지의 마지막 항목을 처리할 때 소비자의 비동기 작업(DB 저장 등) 시간을 흉내 낸다.
+        if work_ms and items % page_size == 0:
+            await asyncio.sleep(work_ms / 1000)
+    elapsed = time.perf_counter() - start
+    await api.close()
+    return elapsed, items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연속 조회 벤치마크")
+    parser.add_argument("--pages", type=int, default=10, help="연속 조회 페이지 수")
+    parser.add_argument("--page-size", type=int, default=100, help="페이지당 항목 수")
+    parser.add_argument("--latency", type=float, default=0.1, help="서버 응답 지연(초)")
+    parser.add_argument("--tps", type=float, default=10, help="TR의 초당 전송 건수")
+    parser.add_argument("--work-ms", type=float, default=50, help="소비자가 페이지마다 쓰는 시간(ms)")
+    args = parser.parse_args()
+
+    port = free_port()
+    server = start_server(port, args.latency, args.pages, args.page_size)
+    base_url = f"http://127.0.0.1:{port}"
+    ideal = max(args.latency, 1 / args.tps) * args.pages
+    try:
+        print(f"pages={args.pages}, latency={args.latency}s, tps={args.tps}, work={args.work_ms}ms, "
+              f"network time × pages = {ideal:.2f}s\n")
+        print(f"{'tr':<6} | {'mode':<22} | {'wall s':>7} | {'items':>6}")
+        print("-" * 50)
+        for tr_code in REQUESTS:
+            for label, tps, prefetch in (
+                ("fixed 0.5s sleep", None, 0),
+                ("tps pacing", args.tps, 0),
+                ("tps pacing + prefetch", args.tps, 2),
+            ):
+                elapsed, items = asyncio.run(run(base_url, tr_code, tps, prefetch, args.work_ms, args.page_size))
+                print(f"{tr_code:<6} | {label:<22} | {elapsed:>7.2f} | {items:>6}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
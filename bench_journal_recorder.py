@@ -0,0 +1,80 @@
+# bench_journal_recorder.py (실시간 기록기: 수신 루프 추가 비용과 프레임당 기록 크기)
+
+import argparse
+import json
+import random
+import tempfile
+import time
+
+from lsbase.realtime.journal import JournalReader, JournalRecorder
+from bench_json_codec import S3_FRAME
+
+S3_BODY = json.loads(S3_FRAME)["body"]
+
+
+def make_frames(number: int, symbols: int = 50) -> list:
+    """체결 frame 목록. 종목마다 가격/체결량/누적거래량/시간만 바뀐다."""
+    rng = random.Random(0)
+    frames = []
+    volumes = [0] * symbols
+    for i in range(number):
+        n = rng.randrange(symbols)
+        volume = rng.randint(1, 500)
+        volumes[n] += volume
+        body = dict(S3_BODY)
+        body["chetime"] = f"{9 + i // 360000 % 6:02d}{i // 6000 % 60:02d}{i // 100 % 60:02d}"
+        body["price"] = f"{72000 + rng.randint(-5, 5) * 100:08d}"
+        body["cvolume"] = f"{volume:08d}"
+        body["volume"] = f"{volumes[n]:012d}"
+        body["shcode"] = f"{n:06d}"
+        frames.append(("S3_", body["shcode"], body))
+    return frames
+
+
+def run(frames: list, delta: bool) -> tuple:
+    """(수신 루프 µs/frame, 기록 완료까지 걸린 시간(s), 바이트/frame, 읽기 frames/s)"""
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = JournalRecorder(directory, delta=delta)
+        recorder.start()
+        record = recorder.record
+        start = time.perf_counter()
+        for trcode, key, body in frames:
+            record(trcode, key, body)
+        hot_us = (time.perf_counter() - start) / len(frames) * 1e6
+        recorder.stop()
+        elapsed = time.perf_counter() - start
+        bytes_per_frame = recorder.stats()["bytes_per_frame"]
+
+        start = time.perf_counter()
+        count = 0
+        for path in recorder.files:
+            with JournalReader(path) as reader:
+                for _ in reader:
+                    count += 1
+        read_fps = count / (time.perf_counter() - start)
+        assert count == len(frames)
+        if delta:
+            # 복원한 본문이 원본과 같은지 확인
+            with JournalReader(recorder.files[0]) as reader:
+                for frame, (_, _, body) in zip(reader, frames):
+                    assert frame.data == body
+    return hot_us, elapsed, bytes_per_frame, read_fps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실시간 기록기 벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=200000, help="frame 수")
+    args = parser.parse_args()
+
+    frames = make_frames(args.number)
+    raw_bytes = sum(len(json.dumps(body, separators=(",", ":"))) for _, _, body in frames) / len(frames)
+    print(f"JSON 본문 평균 {raw_bytes:.0f} bytes/frame, {len(frames):,} frames\n")
+    print(f"{'mode':<6} | {'hot path µs':>11} | {'total s':>8} | {'bytes/frame':>11} | {'read frames/s':>13}")
+    print("-" * 62)
+    for label, delta in (("full", False), ("delta", True)):
+        hot_us, elapsed, bytes_per_frame, read_fps = run(frames, delta)
+        print(f"{label:<6} | {hot_us:>11.2f} | {elapsed:>8.2f} | {bytes_per_frame:>11.1f} | {read_fps:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
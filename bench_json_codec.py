@@ -0,0 +1,65 @@
+# bench_json_codec.py (JSON 코덱별 메시지당 처리 비용 측정)
+
+import argparse
+import time
+
+from lsbase.openapi_client.codec import available_codecs, get_codec
+
+# 실시간 체결(S3_) 웹소켓 프레임 예시
+S3_FRAME = (
+    '{"header":{"tr_cd":"S3_","tr_key":"005930"},'
+    '"body":{"chetime":"093015","sign":"2","change":"00000500","drate":"0.70","price":"00072100",'
+    '"opentime":"090000","open":"00071600","hightime":"091203","high":"00072300","lowtime":"090001",'
+    '"low":"00071500","cgubun":"+","cvolume":"00000015","volume":"000003481234","value":"000000250843",'
+    '"mdvolume":"000001612003","mdchecnt":"00012812","msvolume":"000001869231","mschecnt":"00014021",'
+    '"cpower":"   115.95","w_avrg":"00071987","offerho":"00072100","bidho":"00072000","status":"00",'
+    '"jnilvolume":"000003211870","shcode":"005930","exchname":"KRX"}}'
+).encode("utf-8")
+
+
+def make_chart_page(rows: int) -> bytes:
+    """t8412(주식차트 N분) 응답 한 페이지 크기의 REST 응답 본문을 만든다."""
+    items = ",".join(
+        f'{{"date":"20240610","time":"{90000 + i:06d}","open":71600,"high":72300,"low":71500,'
+        f'"close":72100,"jdiff_vol":{1000 + i},"value":{72 + i},"jongchk":0,"rate":0.0,"sign":"2"}}'
+        for i in range(rows)
+    )
+    return (
+        '{"rsp_cd":"00000","rsp_msg":"조회완료",'
+        '"t8412OutBlock":{"shcode":"005930","cts_date":"20240607","cts_time":"153000"},'
+        f'"t8412OutBlock1":[{items}]}}'
+    ).encode("utf-8")
+
+
+def bench(func, arg, number: int) -> float:
+    """func(arg)를 number번 실행하고 1회당 소요 시간(µs)을 반환한다."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func(arg)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 코덱 벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=50000, help="실시간 프레임 반복 횟수")
+    parser.add_argument("--rows", type=int, default=2000, help="차트 페이지 행 수")
+    args = parser.parse_args()
+
+    chart_page = make_chart_page(args.rows)
+    chart_number = max(1, args.number // 500)
+    request_body = {"t8412InBlock": {"shcode": "005930", "ncnt": 1, "qrycnt": 2000, "nday": "0",
+                                     "sdate": "", "stime": "", "edate": "99999999", "etime": "",
+                                     "cts_date": "", "cts_time": "", "comp_yn": "N"}}
+
+    print(f"{'codec':<8} | {'S3_ loads':>12} | {'t8412 loads':>14} | {'request dumps':>14}")
+    print("-" * 58)
+    for name in available_codecs():
+        codec = get_codec(name)
+        tick_us = bench(codec.loads, S3_FRAME, args.number)
+        page_us = bench(codec.loads, chart_page, chart_number)
+        dumps_us = bench(codec.dumps, request_body, args.number)
+        print(f"{name:<8} | {tick_us:>9.2f} µs | {page_us / 1000:>11.2f} ms | {dumps_us:>11.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
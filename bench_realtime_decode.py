@@ -0,0 +1,61 @@
+# bench_realtime_decode.py (실시간 TR 본문 디코딩 비용: pydantic model_validate vs 생성된 디코더)
+
+import argparse
+import json
+import time
+
+from lsbase import generated_decoders as decoders
+from lsbase import generated_models as gen_models
+from bench_json_codec import S3_FRAME
+
+S3_BODY = json.loads(S3_FRAME)["body"]
+
+
+def decode_with_model(data: dict):
+    """기존 방식: 모델 검증 후 필요한 필드를 int로 변환"""
+    tick = gen_models.S3Response.model_validate(data)
+    return int(tick.price), int(tick.cvolume), int(tick.volume), tick.drate
+
+
+def decode_with_decoder(data: dict):
+    tick = decoders.decode("S3_", data)
+    return tick.price, tick.cvolume, tick.volume, tick.drate
+
+
+def decode_all_fields(data: dict):
+    """모든 필드를 변환하는 경우 (저장용)"""
+    return decoders.S3Tick(data).as_tuple()
+
+
+def bench(func, arg, number: int) -> float:
+    """func(arg)를 number번 실행하고 1회당 소요 시간(µs)을 반환한다."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func(arg)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실시간 디코더 벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=100000, help="반복 횟수")
+    args = parser.parse_args()
+
+    assert decode_with_model(S3_BODY) == decode_with_decoder(S3_BODY)
+
+    model_us = bench(decode_with_model, S3_BODY, args.number)
+    decoder_us = bench(decode_with_decoder, S3_BODY, args.number)
+    all_us = bench(decode_all_fields, S3_BODY, args.number)
+
+    print(f"{'method':<34} | {'µs/tick':>8} | {'ticks/s':>10}")
+    print("-" * 58)
+    for label, us in (
+        ("model_validate + int() (4 fields)", model_us),
+        ('decode("S3_", data) (4 fields)', decoder_us),
+        ("S3Tick(data).as_tuple() (all)", all_us),
+    ):
+        print(f"{label:<34} | {us:>8.2f} | {1e6 / us:>10,.0f}")
+    print(f"\n디코더가 {model_us / decoder_us:.1f}배 빠릅니다.")
+
+
+if __name__ == "__main__":
+    main()
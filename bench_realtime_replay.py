@@ -0,0 +1,56 @@
+# bench_realtime_replay.py (기록 재생으로 실시간 분배 처리량 측정)
+
+import argparse
+import asyncio
+import tempfile
+
+from lsbase.openapi_client.OpenApi import OpenApi
+from lsbase.realtime.journal import JournalRecorder
+from lsbase.realtime.replay import ReplayEngine
+from bench_journal_recorder import make_frames
+
+
+def write_journal(directory: str, number: int) -> None:
+    recorder = JournalRecorder(directory)
+    recorder.start()
+    for trcode, key, body in make_frames(number):
+        recorder.record(trcode, key, body)
+    recorder.stop()
+
+
+async def replay(directory: str, handlers: int, decode: bool) -> dict:
+    api = OpenApi()
+    counts = [0] * handlers
+
+    def make_handler(i):
+        def on_realtime(sender, trcode, key, realtimedata):
+            counts[i] += 1
+        return on_realtime
+
+    for i in range(handlers):
+        # 처리량을 재기 위해 버리지 않도록 block 정책을 사용합니다.
+        api.on_realtime.connect(make_handler(i), trcode="S3_", overflow="block", decode=decode)
+    try:
+        result = await ReplayEngine(directory).run(api)
+    finally:
+        await api.close()
+    assert all(count == result["frames"] for count in counts)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록 재생 분배 처리량 벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=200000, help="frame 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_journal(directory, args.number)
+        print(f"{'handlers':>8} | {'decode':>6} | {'frames/s':>10} | {'µs/frame':>8}")
+        print("-" * 42)
+        for handlers, decode in ((0, False), (1, False), (4, False), (1, True)):
+            result = asyncio.run(replay(directory, handlers, decode))
+            print(f"{handlers:>8} | {str(decode):>6} | {result['fps']:>10,.0f} | {1e6 / result['fps']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# bench_response_memory.py (대용량 응답 페이지의 ResponseValue 메모리 사용량 측정)
+
+import argparse
+import tracemalloc
+
+from bench_json_codec import make_chart_page
+from lsbase.openapi_client.codec import get_codec
+from lsbase.openapi_client.OpenApi import ResponseValue
+
+
+def make_symbol_master(rows: int) -> bytes:
+    """t8436(주식종목조회) 전체 종목 응답 본문을 만든다."""
+    items = ",".join(
+        f'{{"hname":"종목{i:04d}","shcode":"{i:06d}","expcode":"KR7{i:06d}003","etfgubun":"0",'
+        f'"uplmtprice":{90000 + i},"dnlmtprice":{50000 + i},"jnilclose":{70000 + i},"memedan":"00001",'
+        f'"recprice":{70000 + i},"gubun":"1","bu12gubun":"01","spac_gubun":"N","filler":""}}'
+        for i in range(rows)
+    )
+    return f'{{"rsp_cd":"00000","rsp_msg":"조회완료","t8436OutBlock":[{items}]}}'.encode("utf-8")
+
+
+def measure(label: str, payload: bytes, pages: int, retain_raw: bool, codec, as_text: bool = False) -> None:
+    """pages개의 응답을 만들어 보관할 때 남는 메모리와 최대 메모리를 출력한다.
+    as_text=True이면 이전 구현처럼 response.text()로 디코딩한 문자열을 보관한다.
+    """
+    tracemalloc.start()
+    kept = []
+    for _ in range(pages):
+        # OpenApi.request가 받은 바이트를 그대로 넘기는 것과 동일하게 매번 새 버퍼를 만든다.
+        data = bytes(bytearray(payload))
+        if as_text:
+            data = data.decode("utf-8")
+        response = ResponseValue("/stock/chart", "t8412", "N", "", data, codec, retain_raw)
+        response.request_data = b'{"t8412InBlock":{"shcode":"005930","qrycnt":2000}}'
+        response.body  # 소비자가 body에 접근하는 시점
+        kept.append(response)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    mode = "text (이전)" if as_text else f"retain_raw={retain_raw}"
+    print(f"{label:<20} | {mode:<17} | 보관 {current / pages / 1024:>9.1f} KiB/page | 최대 {peak / 1024 / 1024:>7.2f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ResponseValue 메모리 벤치마크")
+    parser.add_argument("--pages", type=int, default=10, help="보관할 페이지 수")
+    parser.add_argument("--rows", type=int, default=2000, help="차트 페이지 행 수")
+    parser.add_argument("--symbols", type=int, default=2700, help="t8436 종목 수")
+    args = parser.parse_args()
+
+    codec = get_codec()
+    chart_page = make_chart_page(args.rows)
+    symbol_master = make_symbol_master(args.symbols)
+    print(f"codec: {codec.name}, t8412 page: {len(chart_page) / 1024:.0f} KiB, t8436: {len(symbol_master) / 1024:.0f} KiB\n")
+    for label, payload in ((f"t8412 {args.rows}행", chart_page), (f"t8436 {args.symbols}종목", symbol_master)):
+        measure(label, payload, args.pages, True, codec, as_text=True)
+        for retain_raw in (True, False):
+            measure(label, payload, args.pages, retain_raw, codec)
+
+
+if __name__ == "__main__":
+    main()
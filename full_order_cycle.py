@@ -36,7 +36,7 @@ async def main():
     original_order_no = None
 
     try:
-        client._open_api.on_realtime.connect(on_realtime_order_status)
+        client._open_api.on_realtime.connect(on_realtime_order_status, trcode=realtime_tr_codes)
         
         if not await client.connect():
             print("오류: API 서버 연결에 실패했습니다.")
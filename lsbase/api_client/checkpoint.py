@@ -0,0 +1,92 @@
+# lsbase/api_client/checkpoint.py
+
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """
+    연속 조회 중 일시적인 오류(NetworkError, RateLimitError)를 다시 시도하는 정책입니다.
+    대기시간은 ReconnectPolicy와 같이 실패할 때마다 multiplier배씩 늘어납니다.
+    """
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_delay: float = 0.5,
+        max_delay: float = 10.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.1,
+    ):
+        """
+        :param max_retries: 한 페이지를 다시 시도하는 최대 횟수. 0이면 다시 시도하지 않습니다.
+        :param initial_delay: 첫 재시도 전 대기시간(초)
+        :param max_delay: 재시도 대기시간 상한(초)
+        :param multiplier: 실패할 때마다 대기시간에 곱하는 값
+        :param jitter: 대기시간에 더하는 무작위 비율 (0.1 -> 최대 +10%)
+        """
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(1부터) 재시도 전 대기시간(초)"""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        return delay * (1.0 + random.random() * self.jitter)
+
+
+class CheckpointStore:
+    """
+    연속 조회의 진행 상태를 이름별로 디스크에 저장합니다.
+    페이지를 처리할 때마다 다음 페이지를 요청하는 데 필요한 tr_cont, tr_cont_key와 갱신된 InBlock을 저장하므로,
+    오류나 재시작 뒤에 같은 이름으로 조회하면 처리한 다음 페이지부터 이어서 조회합니다.
+
+        api = LSTradingAPI(open_api, checkpoint_store=CheckpointStore("~/.cache/lsbase/checkpoints"))
+        async for page in api.continuous_pages("t8412", params, checkpoint="t8412-005930-2024"):
+            save(page)
+    """
+    def __init__(self, directory: str):
+        """
+        :param directory: 진행 상태 파일을 저장할 디렉터리
+        """
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        # 이름에 파일명으로 쓸 수 없는 문자가 있어도 되도록 해시를 사용합니다.
+        digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"checkpoint-{digest}.json")
+
+    def load(self, name: str) -> Optional[Dict[str, Any]]:
+        """저장된 진행 상태를 읽습니다. 없거나 읽을 수 없으면 None"""
+        try:
+            with open(self._path(name), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state if state.get("name") == name else None
+
+    def save(self, name: str, state: Dict[str, Any]) -> None:
+        """진행 상태를 저장합니다. 임시 파일에 쓴 뒤 교체하므로 도중에 종료되어도 이전 상태가 남습니다."""
+        record = dict(state, name=name, saved_at=time.time())
+        path = self._path(name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def clear(self, name: str) -> None:
+        """진행 상태를 삭제합니다. 다음 조회는 첫 페이지부터 시작합니다."""
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
@@ -0,0 +1,116 @@
+# lsbase/api_client/columnar.py
+
+import logging
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Union, get_args
+
+from .. import generated_models as gen_models
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 필드 타입별 NumPy dtype. 문자열은 고정 길이 유니코드 배열로 만듭니다.
+_DTYPES = {int: "int64", float: "float64"}
+
+_item_models: Optional[Dict[str, Any]] = None
+
+
+def outblock_item_model(tr_code: str, block: str = "OutBlock1"):
+    """TR의 OutBlock 목록 항목 모델(e.g., T1305OutBlock1Item). 자동 생성 모델에 없으면 None"""
+    global _item_models
+    if _item_models is None:
+        # 생성기의 클래스 이름 규칙(to_pascal_case)을 다시 구현하지 않도록 소문자 이름으로 찾습니다.
+        _item_models = {
+            name.lower(): model for name, model in vars(gen_models).items()
+            if name.endswith("Item") and isinstance(model, type)
+        }
+    return _item_models.get(f"{tr_code}{block}item".lower())
+
+
+def column_types(tr_code: str, block: str = "OutBlock1") -> Dict[str, type]:
+    """
+    OutBlock 목록의 필드별 파이썬 타입(int, float, str)을 반환합니다.
+    명세에서 생성한 generated_models의 항목 모델을 사용합니다. 모델이 없으면 빈 dict
+    """
+    model = outblock_item_model(tr_code, block)
+    if model is None:
+        return {}
+    types = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        # Optional[int] 등은 None이 아닌 타입을 사용합니다.
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if args:
+            annotation = args[0]
+        types[name] = annotation if annotation in (int, float) else str
+    return types
+
+
+def _convert(value: Any, kind: type) -> Any:
+    """값 하나를 kind로 변환합니다. 빈 값이나 해석할 수 없는 값은 0(문자열은 "")"""
+    if kind is str:
+        return "" if value is None else str(value)
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        try:
+            return kind(float(value))
+        except (TypeError, ValueError):
+            return kind()
+
+
+def _column(values: List[Any], kind: type) -> Union[List[Any], Any]:
+    if np is None:
+        # 이미 알맞은 타입이면 그대로 사용합니다.
+        if all(type(value) is kind for value in values):
+            return values
+        return [_convert(value, kind) for value in values]
+    if kind is str:
+        return np.asarray([_convert(value, str) for value in values] if None in values else values, dtype=str)
+    try:
+        # 숫자 또는 숫자 문자열이면 NumPy가 한 번에 변환합니다.
+        return np.asarray(values, dtype=_DTYPES[kind])
+    except (TypeError, ValueError):
+        return np.asarray([_convert(value, kind) for value in values], dtype=_DTYPES[kind])
+
+
+def to_columns(
+    batch: List[Dict[str, Any]],
+    types: Optional[Dict[str, type]] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    OutBlock 목록 한 페이지를 필드별 열(column)로 바꿉니다.
+
+    :param batch: OutBlock1 항목 목록
+    :param types: 필드별 타입(column_types). 없는 필드는 첫 항목의 값 타입을 사용합니다.
+    :param fields: 만들 필드. 생략하면 첫 항목의 모든 필드
+    :return: {필드명: numpy 배열}. NumPy가 없으면 {필드명: list}
+    """
+    if not batch:
+        return {name: _column([], (types or {}).get(name, str)) for name in (fields or ())}
+    names = list(fields) if fields is not None else list(batch[0])
+    types = types or {}
+
+    try:
+        # 항목의 필드가 모두 있으면 행 -> 열 변환을 C 수준(itemgetter, zip)에서 처리합니다.
+        getter = itemgetter(*names)
+        rows = list(map(getter, batch))
+        values = zip(*rows) if len(names) > 1 else [rows]
+    except KeyError:
+        values = ([item.get(name) for item in batch] for name in names)
+
+    columns = {}
+    for name, column in zip(names, values):
+        column = list(column)
+        kind = types.get(name)
+        if kind is None:
+            first = column[0]
+            kind = type(first) if isinstance(first, (int, float)) and not isinstance(first, bool) else str
+        columns[name] = _column(column, kind)
+    return columns
@@ -1,41 +1,183 @@
 # lsbase/api_client/ls_api.py
 
 import asyncio
+import copy
 import logging # 로깅 모듈 임포트
 from typing import Any, List, Dict, AsyncGenerator
 from ..core.api_interface import TradingAPI
 from ..core.exceptions import APIRequestError
 from ..openapi_client.OpenApi import OpenApi, ResponseValue
-from ..core.exceptions import APIRequestError, AuthenticationError, InvalidInputError, NetworkError
+from ..generated_continuation import CONTINUATION_PLANS
+from ..core.exceptions import APIRequestError, AuthenticationError, InvalidInputError, NetworkError, RateLimitError
+from ..core.enum import RequestPriority
+from .rate_limiter import TrRateLimiter
+from .scheduler import RequestScheduler, classify_tr
+from .singleflight import SingleFlight, make_request_key
+from .response_cache import ResponseCache
+from .columnar import column_types, to_columns
+from .checkpoint import CheckpointStore, RetryPolicy
 
 # 모듈 레벨 로거 설정
 logger = logging.getLogger(__name__)
 
+# 서버가 초당 전송 건수 초과로 요청을 거절할 때 반환하는 응답 코드
+RATE_LIMIT_RSP_CODES = ("IGW00201",)
+# 서버가 접근토큰을 거부할 때(만료, 폐기 등) 반환하는 응답 코드
+AUTH_RSP_CODES = ("IGW00121",)
+# 속도 제한기가 없을 때 연속 조회 페이지 사이에 쉬는 시간(초)
+CONTINUOUS_QUERY_INTERVAL = 0.5
+
+def _advance(in_block: Dict[str, Any], updates: Dict[str, Any]) -> bool:
+    """연속 키를 InBlock에 반영합니다. 이전 요청과 값이 같으면 같은 페이지를 다시 받게 되므로 갱신하지 않고 False"""
+    if all(in_block.get(key) == value for key, value in updates.items()):
+        logger.warning(f"연속 조회 키 {updates}가 이전 요청과 같아 조회를 종료합니다.")
+        return False
+    in_block.update(updates)
+    return True
+
+def _is_last_page(value: Any, stop: str) -> bool:
+    """연속 키 값이 종료 조건("blank", "zero")에 해당하는지 여부"""
+    if stop == "zero":
+        try:
+            return int(float(str(value))) == 0
+        except (ValueError, TypeError):
+            return False
+    return isinstance(value, str) and not value.strip()
+
 class LSTradingAPI(TradingAPI):
-    def __init__(self, open_api_client: OpenApi):
+    def __init__(self, open_api_client: OpenApi, rate_limiter: TrRateLimiter | None = None, scheduler: RequestScheduler | None = None, coalesce: bool = True, response_cache: ResponseCache | None = None, checkpoint_store: CheckpointStore | None = None, retry_policy: RetryPolicy | None = None):
         self._client = open_api_client
+        self._rate_limiter = rate_limiter
+        self._scheduler = scheduler
+        self._response_cache = response_cache
+        # 연속 조회 진행 상태 저장소 (continuous_query의 checkpoint 인자)
+        self._checkpoint_store = checkpoint_store
+        # 연속 조회 중 일시적인 오류를 다시 시도하는 정책
+        self._retry_policy = retry_policy or RetryPolicy()
+        # 조회 TR의 동일한 동시 요청을 하나로 합칩니다. (주문 TR에는 적용하지 않음)
+        self._singleflight = SingleFlight() if coalesce else None
+
+    @property
+    def rate_limiter(self) -> TrRateLimiter | None:
+        """TR별 속도 제한기. 설정되지 않았으면 None입니다."""
+        return self._rate_limiter
+
+    @property
+    def scheduler(self) -> RequestScheduler | None:
+        """우선순위 요청 스케줄러. 설정되지 않았으면 None입니다."""
+        return self._scheduler
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """TR 응답 캐시. 설정되지 않았으면 None입니다."""
+        return self._response_cache
 
-    async def query(self, tr_code: str, params: Dict[str, Any], tr_cont: str = "N", tr_cont_key: str = "") -> ResponseValue:
+    @property
+    def checkpoint_store(self) -> CheckpointStore | None:
+        """연속 조회 진행 상태 저장소. 설정되지 않았으면 None입니다."""
+        return self._checkpoint_store
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """연속 조회 재시도 정책"""
+        return self._retry_policy
+
+    @property
+    def singleflight(self) -> SingleFlight | None:
+        """동일 요청 합치기(singleflight) 상태. 비활성화되어 있으면 None입니다."""
+        return self._singleflight
+
+    async def _send(self, tr_code: str, params: Dict[str, Any], tr_cont: str, tr_cont_key: str, priority: RequestPriority) -> ResponseValue | None:
+        """속도 제한과 우선순위 스케줄링을 거쳐 OpenApi.request를 호출합니다."""
+        # 기록된 응답을 재생할 때는 서버로 요청하지 않으므로 초당 전송 건수를 아낄 필요가 없습니다.
+        if self._rate_limiter and not self._client.replaying:
+            await self._rate_limiter.acquire(tr_code)
+        if self._scheduler:
+            async with self._scheduler.slot(priority):
+                return await self._client.request(tr_code, params, tr_cont=tr_cont, tr_cont_key=tr_cont_key)
+        return await self._client.request(tr_code, params, tr_cont=tr_cont, tr_cont_key=tr_cont_key)
+
+    async def query(self, tr_code: str, params: Dict[str, Any], tr_cont: str = "N", tr_cont_key: str = "", *, priority: RequestPriority | None = None, use_cache: bool = True) -> ResponseValue:
         # InBlock(요청) 데이터 로그 (DEBUG 레벨)
         logger.debug(f"[Request] TR: {tr_code}, InBlock: {params}")
         
+        tr_class = classify_tr(tr_code)
+        if priority is None:
+            priority = tr_class
+
+        # 주문 TR은 같은 내용이라도 각각 실행되어야 하므로 캐시하거나 합치지 않습니다.
+        if tr_class == RequestPriority.ORDER:
+            return await self._query(tr_code, params, tr_cont, tr_cont_key, priority)
+
+        key = None
+        cache = self._response_cache if use_cache else None
+        if cache and cache.policy_for(tr_code):
+            key = make_request_key(tr_code, params, tr_cont, tr_cont_key)
+            cached = cache.get(key)
+            if cached is not None:
+                logger.debug(f"[Cache] TR: {tr_code} 캐시된 응답을 사용합니다.")
+                return cached
+        cache_key = key
+
+        async def fetch() -> ResponseValue:
+            response = await self._query(tr_code, params, tr_cont, tr_cont_key, priority)
+            # 같은 응답을 기다리던 요청(singleflight)마다 저장하지 않도록 실제로 요청한 쪽에서만 캐시에 저장합니다.
+            if cache_key:
+                cache.put(cache_key, response)
+            return response
+
+        if self._singleflight:
+            key = key or make_request_key(tr_code, params, tr_cont, tr_cont_key)
+            return await self._singleflight.do(key, fetch)
+        return await fetch()
+
+    async def _query(self, tr_code: str, params: Dict[str, Any], tr_cont: str, tr_cont_key: str, priority: RequestPriority) -> ResponseValue:
+        """
+        요청을 실행하고 응답 코드를 검사합니다. 실패하면 예외를 발생시킵니다.
+        토큰 캐시의 토큰이 폐기되어 서버가 거부하면(AuthenticationError) 토큰을 새로 발급받아 한 번 더 요청합니다.
+        """
+        token = self._client.access_token
         try:
-            response = await self._client.request(tr_code, params, tr_cont=tr_cont, tr_cont_key=tr_cont_key)
+            return await self._query_once(tr_code, params, tr_cont, tr_cont_key, priority)
+        except AuthenticationError as e:
+            if self._client.replaying or not await self._client.reissue_token(token):
+                raise
+            logger.warning(f"[Auth] TR: {tr_code} 접근토큰이 거부되어({e.rsp_cd}) 새로 발급받은 토큰으로 다시 요청합니다.")
+            return await self._query_once(tr_code, params, tr_cont, tr_cont_key, priority)
+
+    async def _query_once(self, tr_code: str, params: Dict[str, Any], tr_cont: str, tr_cont_key: str, priority: RequestPriority) -> ResponseValue:
+        """요청을 한 번 실행하고 응답 코드를 검사합니다."""
+        try:
+            response = await self._send(tr_code, params, tr_cont, tr_cont_key, priority)
             
             # 응답이 아예 없는 경우 (네트워크 타임아웃 등)
             if not response:
-                raise NetworkError(self._client.last_message, tr_code=tr_code)
+                last_message = self._client.last_message
+                # 초당 전송 건수 초과로 거절된 경우
+                if isinstance(last_message, dict) and last_message.get("rsp_cd") in RATE_LIMIT_RSP_CODES:
+                    raise RateLimitError(last_message.get("rsp_msg", ""), rsp_cd=last_message.get("rsp_cd"), tr_code=tr_code)
+                # 접근토큰이 거부된 경우
+                if isinstance(last_message, dict) and last_message.get("rsp_cd") in AUTH_RSP_CODES:
+                    raise AuthenticationError(last_message.get("rsp_msg", ""), rsp_cd=last_message.get("rsp_cd"), tr_code=tr_code)
+                raise NetworkError(last_message, tr_code=tr_code)
+
+            try:
+                body = response.body
+            except ValueError as e: # 응답 본문이 JSON이 아닌 경우 (json.JSONDecodeError, orjson.JSONDecodeError)
+                raise NetworkError(f"Invalid response body: {e}", tr_code=tr_code) from e
 
             # OutBlock(응답) 데이터 로그 (DEBUG 레벨)
-            logger.debug(f"[Response] TR: {tr_code}, OutBlock: {response.body}")
+            # 대용량 응답을 매번 문자열로 만들지 않도록 DEBUG가 켜져 있을 때만 포맷합니다.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[Response] TR: {tr_code}, OutBlock: {body}")
             
-            rsp_cd = response.body.get("rsp_cd")
+            rsp_cd = body.get("rsp_cd")
             # 성공이 아닌 모든 경우
             #if rsp_cd != "00000":
             if not rsp_cd.startswith("00"):
-                msg = response.body.get("rsp_msg", "알 수 없는 오류")
+                msg = body.get("rsp_msg", "알 수 없는 오류")
                 # 특정 에러 코드에 따라 예외를 분기
-                if rsp_cd == "IGW00121": # 예시: 인증 토큰 오류 코드
+                if rsp_cd in AUTH_RSP_CODES: # 인증 토큰 오류 코드
                     raise AuthenticationError(msg, rsp_cd=rsp_cd, tr_code=tr_code)
                 if rsp_cd == "APBK0042": # 예시: 입력값 오류 코드
                     raise InvalidInputError(msg, rsp_cd=rsp_cd, tr_code=tr_code)
@@ -48,77 +190,243 @@ class LSTradingAPI(TradingAPI):
         except asyncio.TimeoutError as e: # aiohttp 타임아웃 처리
             raise NetworkError(f"Request timed out: {e}", tr_code=tr_code) from e
 
-    async def continuous_query(self, tr_code: str, params: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+    async def continuous_query(self, tr_code: str, params: Dict[str, Any], *, prefetch: int = 0, checkpoint: str | None = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        연속 조회 TR의 OutBlock1 항목을 첫 페이지부터 차례로 반환합니다.
+        일시적인 오류(NetworkError, RateLimitError)는 retry_policy에 따라 같은 페이지를 다시 요청하고,
+        재시도로도 해결되지 않거나 그 밖의 API 오류가 발생하면 조회를 끝냅니다.
+
+        :param prefetch: 0이면 항목을 모두 소비한 뒤 다음 페이지를 요청합니다.
+                         0보다 크면 소비자가 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청하며, 최대 prefetch 페이지까지 앞서 받아 둡니다.
+                         어느 경우든 요청 간격은 속도 제한기(TR별 TPS)가 정합니다.
+        :param checkpoint: 진행 상태를 저장할 이름. 페이지를 처리할 때마다 checkpoint_store에 다음 페이지 요청 상태를 저장하고,
+                           같은 TR, 같은 params로 저장된 상태가 있으면 첫 페이지 대신 그 다음 페이지부터 조회합니다. 마지막 페이지까지 조회하면 삭제합니다.
+                           checkpoint를 지정하면 오류로 조회가 끝날 때 APIRequestError를 다시 발생시키므로, 같은 이름으로 다시 호출해 이어서 조회할 수 있습니다.
+        """
+        pages = self.continuous_pages(tr_code, params, prefetch=prefetch, checkpoint=checkpoint)
+        try:
+            async for batch in pages:
+                for item in batch:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def continuous_pages(self, tr_code: str, params: Dict[str, Any], *, prefetch: int = 0, checkpoint: str | None = None) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        continuous_query와 같지만 OutBlock1 목록을 페이지 단위로 반환합니다.
+        항목마다 제너레이터를 거치지 않으므로 페이지를 한꺼번에 검증하거나 저장할 때 사용합니다.
+        호출자의 params는 바꾸지 않으므로, 오류로 끝난 뒤 같은 params로 다시 호출해 이어서 조회할 수 있습니다.
+        """
+        store = None
         tr_cont = "N"
         tr_cont_key = ""
+        page = 0
+        # 연속 키는 복사본의 InBlock에만 갱신합니다.
+        params = copy.deepcopy(params)
+        if checkpoint is not None:
+            store = self._checkpoint_store
+            if store is None:
+                raise ValueError("checkpoint를 사용하려면 LSTradingAPI에 checkpoint_store를 지정해야 합니다.")
+            # 같은 이름을 다른 조회(다른 종목 등)에 쓰면 저장된 상태를 사용하지 않도록 처음 요청의 params를 함께 저장합니다.
+            _, query, _, _ = make_request_key(tr_code, params, tr_cont, tr_cont_key)
+            saved = store.load(checkpoint)
+            if saved and (saved.get("tr_code"), saved.get("query")) != (tr_code, query):
+                logger.warning(f"[Checkpoint] {checkpoint}: 저장된 상태가 다른 조회({saved.get('tr_code')})의 것이므로 처음부터 조회합니다.")
+                saved = None
+            if saved:
+                params = copy.deepcopy(saved["params"])
+                tr_cont = saved["tr_cont"]
+                tr_cont_key = saved["tr_cont_key"]
+                page = saved.get("pages", 0)
+                logger.info(f"[Checkpoint] {checkpoint}: {tr_code} {page}페이지 다음부터 이어서 조회합니다.")
 
-        while True:
+        pages = self._prefetch_pages(tr_code, params, tr_cont, tr_cont_key, prefetch) if prefetch > 0 else self._pages(tr_code, params, tr_cont, tr_cont_key)
+        try:
+            async for batch, state in pages:
+                yield batch
+                page += 1
+                # 소비자가 페이지를 처리한 뒤에 저장하므로, 미리 받아 둔 페이지는 처리되기 전까지 저장되지 않습니다.
+                if store is not None and state is not None:
+                    store.save(checkpoint, {"tr_code": tr_code, "query": query, "pages": page, **state})
+            if store is not None:
+                store.clear(checkpoint)
+        except APIRequestError as e:
+            logger.error(f"연속 조회 중 오류 발생: {e}")
+            # 진행 상태가 남아 있으므로 호출자가 조회가 끝나지 않았음을 알고 이어서 조회할 수 있도록 합니다.
+            if store is not None:
+                raise
+        finally:
+            await pages.aclose()
+
+    async def continuous_columns(self, tr_code: str, params: Dict[str, Any], *, prefetch: int = 0, fields: List[str] | None = None, checkpoint: str | None = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        continuous_pages와 같지만 페이지마다 OutBlock1 목록을 필드별 열(column)로 바꿔 반환합니다.
+        열의 타입(int, float, str)은 명세에서 생성한 모델을 따르며, NumPy가 있으면 numpy 배열, 없으면 list입니다.
+
+        :param fields: 만들 필드. 생략하면 모든 필드
+        """
+        types = column_types(tr_code)
+        pages = self.continuous_pages(tr_code, params, prefetch=prefetch, checkpoint=checkpoint)
+        try:
+            async for batch in pages:
+                yield to_columns(batch, types, fields)
+        finally:
+            await pages.aclose()
+
+    async def _prefetch_pages(self, tr_code: str, params: Dict[str, Any], tr_cont: str, tr_cont_key: str, prefetch: int) -> AsyncGenerator[tuple, None]:
+        """별도 태스크에서 _pages를 실행하여 최대 prefetch 페이지를 미리 받아 둡니다."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+        async def produce():
+            pages = self._pages(tr_code, params, tr_cont, tr_cont_key)
             try:
-                response = await self.query(tr_code, params, tr_cont=tr_cont, tr_cont_key=tr_cont_key)
-            except APIRequestError as e:
-                logger.error(f"연속 조회 중 오류 발생: {e}")
-                break
+                async for batch in pages:
+                    await queue.put(batch)
+            except Exception as e:
+                # 소비자 쪽에서 다시 발생시킵니다.
+                await queue.put(e)
+                return
+            finally:
+                await pages.aclose()
+            await queue.put(None)
+
+        task = asyncio.create_task(produce())
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                # 소비자가 이벤트 루프를 돌려주지 않고 페이지를 처리하더라도 다음 요청이 먼저 전송되도록 한 번 양보합니다.
+                # (aiohttp는 요청 본문을 별도 태스크에서 전송합니다.)
+                await asyncio.sleep(0)
+                yield batch
+        finally:
+            # 소비자가 중간에 멈추면 미리 받던 요청도 멈춥니다.
+            task.cancel()
+
+    async def _pages(self, tr_code: str, params: Dict[str, Any], tr_cont: str = "N", tr_cont_key: str = "") -> AsyncGenerator[tuple, None]:
+        """
+        연속 조회 TR의 OutBlock1 목록을 페이지 단위로 반환합니다.
+        (목록, 다음 페이지 요청 상태)를 반환하며, params의 InBlock은 다음 페이지 요청을 위해 갱신됩니다.
+        """
+        while True:
+            response = await self._query_page(tr_code, params, tr_cont, tr_cont_key)
 
             out_block_key = f"{tr_code}OutBlock1"
             batch = response.body.get(out_block_key, [])
             if not batch:
                 break
 
-            for item in batch:
-                yield item
+            has_next = response.tr_cont == "Y" and self._update_continuation(tr_code, params, response)
+            if has_next:
+                tr_cont = response.tr_cont
+                tr_cont_key = response.tr_cont_key
+            # 소비자가 이 페이지를 처리한 뒤 체크포인트로 저장할 수 있도록 다음 요청 상태를 함께 넘깁니다. (마지막 페이지이면 None)
+            state = {
+                "tr_cont": tr_cont,
+                "tr_cont_key": tr_cont_key,
+                "params": {block: dict(fields) if isinstance(fields, dict) else fields for block, fields in params.items()},
+            } if has_next else None
+            yield batch, state
 
-            if response.tr_cont != "Y":
+            if not has_next:
                 break
-            
-            tr_cont = response.tr_cont
-            tr_cont_key = response.tr_cont_key
-            
-            continuation_out_block_key = f"{tr_code}OutBlock"
-            continuation_data = response.body.get(continuation_out_block_key)
-            
-            # InBlock 키는 TR 코드와 이름 규칙이 다를 수 있으므로 params에서 직접 찾습니다.
-            in_block_key = next((key for key in params if key.endswith("InBlock")), None)
-            
-            if isinstance(continuation_data, dict) and in_block_key:
-                is_key_updated = False
-                
-                # OutBlock의 모든 키에 대해 반복 (e.g., 'cts_date', 'shcode', ...)
-                for key, next_value in continuation_data.items():
-                    # 해당 키가 InBlock에도 존재한다면, 연속 조회 키로 간주
-                    if key in params[in_block_key]:
-                        
-                        # 값이 비어있으면 연속 조회 종료
-                        if isinstance(next_value, str) and not next_value.strip():
-                            logger.debug(f"연속 조회 키 '{key}'가 비어있어 조회를 종료합니다.")
-                            is_key_updated = False
-                            break
-                            
-                        # 특정 키 'idx'가 0이면 종료 (기존 로직 유지)
-                        if key == 'idx':
-                            try:
-                                if int(float(str(next_value))) == 0:
-                                    logger.debug("다음 idx가 0이므로 조회를 종료합니다.")
-                                    is_key_updated = False
-                                    break
-                            except (ValueError, TypeError):
-                                pass
-
-                        # 다음 요청을 위해 InBlock의 파라미터 업데이트
-                        params[in_block_key][key] = next_value
-                        logger.debug(f"연속 조회를 위해 '{key}'를 '{next_value}'로 업데이트합니다.")
-                        is_key_updated = True
-                        # 가장 처음 발견된 공통 키를 연속 키로 간주하고 루프 탈출
-                        break 
-                
-                if not is_key_updated:
-                    break # 업데이트된 키가 없으면 전체 루프 종료
-            else:
-                break # OutBlock이나 InBlock 구조가 예상과 다르면 종료
 
-            await asyncio.sleep(0.5) # API 부담을 줄이기 위해 0.5초 대기            
+            await self._page_interval()
+
+    async def _query_page(self, tr_code: str, params: Dict[str, Any], tr_cont: str, tr_cont_key: str) -> ResponseValue:
+        """연속 조회 한 페이지를 요청합니다. 일시적인 오류는 retry_policy에 따라 같은 요청을 다시 보냅니다."""
+        policy = self._retry_policy
+        attempt = 0
+        while True:
+            try:
+                return await self.query(tr_code, params, tr_cont=tr_cont, tr_cont_key=tr_cont_key, priority=RequestPriority.BULK)
+            except (NetworkError, RateLimitError) as e:
+                attempt += 1
+                if attempt > policy.max_retries:
+                    raise
+                delay = policy.delay(attempt)
+                logger.warning(f"연속 조회 재시도 {attempt}/{policy.max_retries} ({delay:.2f}초 후): {e}")
+                await asyncio.sleep(delay)
+
+    def _update_continuation(self, tr_code: str, params: Dict[str, Any], response: ResponseValue) -> bool:
+        """응답의 연속 조회 키로 다음 페이지 요청의 InBlock을 갱신합니다. 더 조회할 페이지가 없으면 False."""
+        plan = CONTINUATION_PLANS.get(tr_code)
+        if plan is not None:
+            return self._apply_continuation_plan(plan, params, response)
+        return self._guess_continuation(tr_code, params, response)
+
+    @staticmethod
+    def _apply_continuation_plan(plan: tuple, params: Dict[str, Any], response: ResponseValue) -> bool:
+        """명세에서 생성한 연속 키 계획(generated_continuation)대로 InBlock을 갱신합니다."""
+        in_block_key, out_block_key, fields = plan
+        if not fields:
+            # 연속 키가 없는 TR은 InBlock을 그대로 두고 tr_cont_key 헤더만으로 다음 페이지를 조회합니다.
+            return True
+        continuation_data = response.body.get(out_block_key)
+        in_block = params.get(in_block_key)
+        if not isinstance(continuation_data, dict) or in_block is None:
+            return False
+
+        updates = {}
+        for out_field, in_field, stop in fields:
+            next_value = continuation_data.get(out_field)
+            if next_value is None or _is_last_page(next_value, stop):
+                logger.debug(f"연속 조회 키 '{out_field}'가 '{next_value}'이므로 조회를 종료합니다.")
+                return False
+            updates[in_field] = next_value
+        # 복합 키(cts_date, cts_time 등)는 모두 확인한 뒤 한꺼번에 갱신합니다.
+        return _advance(in_block, updates)
+
+    def _guess_continuation(self, tr_code: str, params: Dict[str, Any], response: ResponseValue) -> bool:
+        """
+        연속 키 계획이 없는 TR은 OutBlock과 InBlock에 함께 있는 연속 키 필드(cts*, idx, date)로 InBlock을 갱신합니다.
+        연속 키 필드가 없으면 처음 발견된 공통 필드를 연속 키로 간주합니다.
+        """
+        continuation_out_block_key = f"{tr_code}OutBlock"
+        continuation_data = response.body.get(continuation_out_block_key)
+        
+        # InBlock 키는 TR 코드와 이름 규칙이 다를 수 있으므로 params에서 직접 찾습니다.
+        in_block_key = next((key for key in params if key.endswith("InBlock")), None)
+        
+        if not isinstance(continuation_data, dict) or not in_block_key:
+            return False # OutBlock이나 InBlock 구조가 예상과 다르면 종료
+
+        in_block = params[in_block_key]
+        # OutBlock과 InBlock에 함께 있는 필드 (e.g., 'cts_date', 'shcode', ...)
+        common = [key for key in continuation_data if key in in_block]
+        keys = [key for key in common if key.startswith("cts")] \
+            or [key for key in common if key in ("idx", "date")] \
+            or common[:1]
+        if not keys:
+            return False # 업데이트할 키가 없으면 종료
+
+        updates = {}
+        for key in keys:
+            next_value = continuation_data[key]
+            # 문자열 키는 비어 있으면, 숫자 키와 idx는 0이면 연속 조회 종료
+            stop = "zero" if key == "idx" or not isinstance(next_value, str) else "blank"
+            if _is_last_page(next_value, stop):
+                logger.debug(f"연속 조회 키 '{key}'가 '{next_value}'이므로 조회를 종료합니다.")
+                return False
+            updates[key] = next_value
+        logger.debug(f"연속 조회를 위해 {updates}로 업데이트합니다.")
+        return _advance(in_block, updates)
+
+    async def _page_interval(self) -> None:
+        """연속 조회 페이지 사이의 대기. 속도 제한기가 있으면 다음 요청이 TR의 TPS에 맞춰 대기하므로 따로 쉬지 않습니다."""
+        if self._rate_limiter is None and not self._client.replaying:
+            await asyncio.sleep(CONTINUOUS_QUERY_INTERVAL) # API 부담을 줄이기 위해 대기
 
     async def subscribe_realtime(self, tr_code: str, tr_key: str) -> bool:
-        return await self._client.add_realtime(tr_code, tr_key)
+        # 참조 카운트로 관리하여 같은 종목을 여러 곳에서 구독해도 한 곳의 해제가 다른 곳에 영향을 주지 않습니다.
+        return await self._client.subscriptions.acquire(tr_code, tr_key)
 
     async def unsubscribe_realtime(self, tr_code: str, tr_key: str) -> bool:
-        return await self._client.remove_realtime(tr_code, tr_key)
+        return await self._client.subscriptions.release(tr_code, tr_key)
+
+    async def apply_realtime_subscriptions(self, owner: Any, desired: List[tuple]) -> Dict[str, List[tuple]]:
+        """owner의 실시간 구독 집합을 desired [(tr_code, tr_key), ...]로 바꾸고, 달라진 부분만 등록/해제합니다."""
+        return await self._client.subscriptions.apply(owner, desired)
@@ -0,0 +1,146 @@
+# lsbase/api_client/rate_limiter.py
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from ..tr_adapter import TrCodeAdapter
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 명세에 transaction_per_sec 값이 없거나 해석할 수 없을 때 사용할 초당 전송 건수
+DEFAULT_TPS = 1.0
+# 서버 측 시간 창(window) 경계에서의 오차를 흡수하기 위해 TPS의 95%만 사용합니다.
+DEFAULT_UTILIZATION = 0.95
+
+
+def parse_tps(value: Any) -> Optional[float]:
+    """TrSpec.tps 값(보통 "10" 같은 문자열)을 float으로 변환합니다. 해석할 수 없으면 None."""
+    if value is None:
+        return None
+    try:
+        tps = float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return tps if tps > 0 else None
+
+
+class TokenBucket:
+    """
+    단일 TR에 대한 토큰 버킷입니다.
+    토큰이 없으면 호출자를 거절하지 않고 대기시키며, asyncio.Lock의 FIFO 특성에 따라
+    도착한 순서대로 토큰을 배분합니다.
+    """
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        # 통계
+        self.queue_depth = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """토큰 하나를 획득할 때까지 대기합니다. 대기한 시간(초)을 반환합니다."""
+        start = time.monotonic()
+        self.queue_depth += 1
+        try:
+            async with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens < 1.0:
+                    await asyncio.sleep((1.0 - self._tokens) / self.rate)
+                    self._refill(time.monotonic())
+                self._tokens -= 1.0
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        if waited > self.max_wait:
+            self.max_wait = waited
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        """버킷의 현재 상태와 누적 대기 통계를 반환합니다."""
+        return {
+            "tps": self.rate,
+            "queue_depth": self.queue_depth,
+            "acquired": self.acquired,
+            "avg_wait_ms": (self.total_wait / self.acquired * 1000) if self.acquired else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+class TrRateLimiter:
+    """
+    TR 코드별 토큰 버킷을 관리하는 속도 제한기입니다.
+    각 버킷의 속도는 TrSpec.tps(명세의 transaction_per_sec)에서 가져오며,
+    명세가 없는 TR은 default_tps를 사용합니다.
+    """
+    def __init__(
+        self,
+        spec: Optional[TrCodeAdapter] = None,
+        default_tps: float = DEFAULT_TPS,
+        utilization: float = DEFAULT_UTILIZATION,
+        overrides: Optional[Dict[str, float]] = None,
+    ):
+        """
+        :param spec: TR 명세 어댑터. TR별 TPS를 조회하는 데 사용합니다.
+        :param default_tps: 명세에서 TPS를 찾지 못한 TR에 적용할 초당 전송 건수
+        :param utilization: 실제 TPS 중 사용할 비율 (0 < utilization <= 1)
+        :param overrides: TR 코드별 TPS를 직접 지정할 때 사용 (e.g., {"t1102": 5})
+        """
+        if not 0 < utilization <= 1:
+            raise ValueError("utilization은 0보다 크고 1 이하여야 합니다.")
+        self._spec = spec
+        self._default_tps = default_tps
+        self._utilization = utilization
+        self._overrides = dict(overrides or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def tps_for(self, tr_code: str) -> float:
+        """TR 코드에 적용되는 (utilization 반영 전) 초당 전송 건수를 반환합니다."""
+        if tr_code in self._overrides:
+            return float(self._overrides[tr_code])
+        if self._spec is not None:
+            tr_spec = self._spec.find_by_code(tr_code)
+            tps = parse_tps(tr_spec.tps) if tr_spec else None
+            if tps:
+                return tps
+        return self._default_tps
+
+    def bucket(self, tr_code: str) -> TokenBucket:
+        """TR 코드에 해당하는 버킷을 반환합니다. 없으면 새로 생성합니다."""
+        bucket = self._buckets.get(tr_code)
+        if bucket is None:
+            tps = self.tps_for(tr_code)
+            bucket = TokenBucket(rate=tps * self._utilization)
+            self._buckets[tr_code] = bucket
+            logger.debug(f"TR({tr_code}) 토큰 버킷 생성: {tps} TPS")
+        return bucket
+
+    async def acquire(self, tr_code: str) -> float:
+        """TR 코드의 전송 허가를 받을 때까지 대기합니다. 대기한 시간(초)을 반환합니다."""
+        return await self.bucket(tr_code).acquire()
+
+    def queue_depth(self, tr_code: str) -> int:
+        """TR 코드의 버킷에서 대기 중인 호출자 수를 반환합니다."""
+        bucket = self._buckets.get(tr_code)
+        return bucket.queue_depth if bucket else 0
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """TR 코드별 버킷 통계를 반환합니다."""
+        return {tr_code: bucket.stats() for tr_code, bucket in self._buckets.items()}
@@ -0,0 +1,271 @@
+# lsbase/api_client/response_cache.py
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from ..openapi_client.codec import JsonCodec, get_codec
+from ..openapi_client.OpenApi import ResponseValue
+from .singleflight import make_request_key
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+# 메모리 캐시가 보관할 응답 본문(JSON bytes)의 총 크기 상한 (바이트)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# 기준정보(종목 마스터, 관리종목 등)가 새 거래일 기준으로 바뀌는 시각. 장 시작 전 시간외/NXT 프리마켓 시작 시각입니다.
+SESSION_RESET = "08:00"
+
+
+class CachePolicy:
+    """TR 하나에 대한 캐시 정책"""
+    def __init__(self, ttl: float, persist: bool = False, reset_at: Optional[str] = None):
+        """
+        :param ttl: 응답을 재사용할 시간(초)
+        :param persist: True이면 디스크 캐시에도 저장하여 프로세스 재시작 후에도 재사용합니다.
+        :param reset_at: "HH:MM"(로컬 시각). 지정하면 ttl이 지나기 전이라도 다음 이 시각에 만료됩니다.
+                         (전날 받은 종목 마스터를 다음 거래일 장 시작 후까지 사용하지 않도록)
+        """
+        self.ttl = ttl
+        self.persist = persist
+        self.reset_at = reset_at
+
+    def expires_at(self, now: float) -> float:
+        """now(epoch 초)에 받은 응답의 만료 시각"""
+        expires_at = now + self.ttl
+        if self.reset_at:
+            hour, minute = map(int, self.reset_at.split(":"))
+            boundary = datetime.fromtimestamp(now).replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if boundary.timestamp() <= now:
+                boundary += timedelta(days=1)
+            expires_at = min(expires_at, boundary.timestamp())
+        return expires_at
+
+    def __repr__(self) -> str:
+        return f"<CachePolicy ttl={self.ttl} persist={self.persist} reset_at={self.reset_at}>"
+
+
+# 하루 동안 바뀌지 않는 기준정보 TR은 다음 거래일 기준정보로 바뀔 때까지 디스크에 보관하고, 시세 TR은 짧게만 재사용합니다.
+DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "t8436": CachePolicy(ttl=DAY, persist=True, reset_at=SESSION_RESET),   # 주식종목조회 (종목 마스터)
+    "t8424": CachePolicy(ttl=DAY, persist=True, reset_at=SESSION_RESET),   # 전체업종
+    "t9945": CachePolicy(ttl=DAY, persist=True, reset_at=SESSION_RESET),   # 주식마스터조회
+    "t1404": CachePolicy(ttl=DAY, persist=True, reset_at=SESSION_RESET),   # 관리/불성실/투자유의조회
+    "t1102": CachePolicy(ttl=1.0),                 # 주식현재가 시세조회
+}
+
+
+class ResponseCache:
+    """
+    TR 응답을 (TR 코드, 정규화된 파라미터, 연속 조회 키) 단위로 보관하는 TTL 캐시입니다.
+    정책(CachePolicy)이 등록된 TR만 캐시하며, 메모리 캐시는 보관 중인 응답 본문(JSON bytes) 크기 기준 max_bytes를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거(LRU)합니다. disk_dir을 지정하면 persist 정책의 응답을 디스크에도 저장합니다.
+
+    응답은 본문을 직렬화한 bytes로 보관하고 get()마다 새 ResponseValue를 만들어 반환하므로,
+    호출자가 받은 body를 바꿔도 캐시나 다른 호출자의 응답에는 영향이 없습니다.
+    """
+    def __init__(
+        self,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: Optional[str] = None,
+        codec: Optional[JsonCodec] = None,
+    ):
+        self._policies: Dict[str, CachePolicy] = dict(DEFAULT_CACHE_POLICIES if policies is None else policies)
+        self._max_bytes = max_bytes
+        self._disk_dir = disk_dir
+        self._codec = codec or get_codec()
+        # key -> (만료 시각, (path, tr_cd, tr_cont, tr_cont_key), 응답 본문 JSON bytes)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Tuple[str, str, str, str], bytes]]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    # --- 정책 ---
+
+    def policy_for(self, tr_code: str) -> Optional[CachePolicy]:
+        """TR 코드에 적용되는 캐시 정책을 반환합니다. 캐시 대상이 아니면 None."""
+        return self._policies.get(tr_code)
+
+    def set_policy(self, tr_code: str, policy: Optional[CachePolicy]) -> None:
+        """TR 코드의 캐시 정책을 등록하거나(policy=None이면) 해제합니다."""
+        if policy is None:
+            self._policies.pop(tr_code, None)
+            self.invalidate(tr_code)
+        else:
+            self._policies[tr_code] = policy
+
+    # --- 조회/저장 ---
+
+    def get(self, key: Tuple[str, str, str, str]) -> Optional[ResponseValue]:
+        """make_request_key()로 만든 키에 해당하는 유효한 응답을 반환합니다. 없으면 None."""
+        tr_code = key[0]
+        policy = self._policies.get(tr_code)
+        if policy is None:
+            return None
+
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, header, data = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._response(key, header, data)
+            self._remove(key)
+
+        if policy.persist and self._disk_dir:
+            header, data, expires_at = self._load_from_disk(key, now)
+            if header is not None:
+                self.disk_hits += 1
+                self._store(key, header, data, expires_at)
+                return self._response(key, header, data)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: Tuple[str, str, str, str], response: ResponseValue) -> None:
+        """정책이 등록된 TR이면 응답을 캐시에 저장합니다."""
+        policy = self._policies.get(key[0])
+        if policy is None:
+            return
+        expires_at = policy.expires_at(time.time())
+        data = response.response_data
+        if data is None:
+            # retain_raw=False이면 원문이 없으므로 파싱된 본문을 다시 직렬화합니다.
+            data = self._codec.dumps(response.body)
+        elif isinstance(data, str):
+            data = data.encode("utf-8")
+        self._store(key, (response.path, response.tr_cd, response.tr_cont, response.tr_cont_key), data, expires_at)
+        if policy.persist and self._disk_dir:
+            self._save_to_disk(key, response, expires_at)
+
+    def invalidate(self, tr_code: Optional[str] = None, params: Any = None) -> int:
+        """
+        캐시 항목을 무효화합니다. 제거한 메모리 항목 수를 반환합니다.
+
+        :param tr_code: 생략하면 모든 항목을 제거합니다.
+        :param params: 지정하면 해당 파라미터의 응답(모든 연속 조회 페이지 포함)만 제거합니다.
+        """
+        normalized = make_request_key(tr_code, params, "", "")[1] if params is not None else None
+        keys = [
+            key for key in self._entries
+            if (tr_code is None or key[0] == tr_code) and (normalized is None or key[1] == normalized)
+        ]
+        for key in keys:
+            self._remove(key)
+
+        if self._disk_dir:
+            prefix = f"{tr_code}-" if tr_code else ""
+            for filename in os.listdir(self._disk_dir):
+                if not filename.startswith(prefix) or not filename.endswith(".json"):
+                    continue
+                path = os.path.join(self._disk_dir, filename)
+                if normalized is not None:
+                    record = self._read_record(path)
+                    if record is None or record.get("params") != normalized:
+                        continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미적중 통계와 메모리 사용량을 반환합니다."""
+        total = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.disk_hits) / total if total else 0.0,
+        }
+
+    # --- 메모리 계층 ---
+
+    def _response(self, key: Tuple[str, str, str, str], header: Tuple[str, str, str, str], data: bytes) -> ResponseValue:
+        """보관 중인 본문으로 새 ResponseValue를 만듭니다. body는 처음 접근할 때 파싱됩니다."""
+        response = ResponseValue(*header, data, self._codec, False)
+        response.in_tr_cont = key[2]
+        response.in_tr_cont_key = key[3]
+        return response
+
+    def _store(self, key: Hashable, header: Tuple[str, str, str, str], data: bytes, expires_at: float) -> None:
+        if key in self._entries:
+            self._remove(key)
+        size = len(data)
+        if size > self._max_bytes:
+            return
+        self._entries[key] = (expires_at, header, data)
+        self._bytes += size
+        while self._bytes > self._max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, data = self._entries.pop(key)
+        self._bytes -= len(data)
+
+    # --- 디스크 계층 ---
+
+    def _disk_path(self, key: Tuple[str, str, str, str]) -> str:
+        digest = hashlib.sha1("\x1f".join(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._disk_dir, f"{key[0]}-{digest}.json")
+
+    def _read_record(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "rb") as f:
+                return self._codec.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _load_from_disk(self, key: Tuple[str, str, str, str], now: float) -> Tuple[Optional[Tuple[str, str, str, str]], bytes, float]:
+        """(header, 응답 본문 JSON bytes, 만료 시각). 없거나 만료되었으면 header가 None"""
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None, b"", 0.0
+        record = self._read_record(path)
+        if record is None or record.get("expires_at", 0) <= now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None, b"", 0.0
+
+        header = (record["path"], record["tr_cd"], record["tr_cont"], record["tr_cont_key"])
+        return header, self._codec.dumps(record["body"]), record["expires_at"]
+
+    def _save_to_disk(self, key: Tuple[str, str, str, str], response: ResponseValue, expires_at: float) -> None:
+        record = {
+            "expires_at": expires_at,
+            "params": key[1],
+            "path": response.path,
+            "tr_cd": response.tr_cd,
+            "tr_cont": response.tr_cont,
+            "tr_cont_key": response.tr_cont_key,
+            "body": response.body,
+        }
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(self._codec.dumps(record))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"응답 캐시를 디스크에 저장하지 못했습니다 ({response.tr_cd}): {e}")
@@ -0,0 +1,150 @@
+# lsbase/api_client/scheduler.py
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Tuple
+
+from ..core.enum import RequestPriority
+from ..openapi_client.tr_code_to_path import tr_code_to_path
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 지연시간 백분위 계산에 사용할 최근 표본 수
+LATENCY_SAMPLES = 1000
+
+
+def classify_tr(tr_code: str) -> RequestPriority:
+    """TR 코드의 REST 경로로 우선순위 클래스를 결정합니다."""
+    path = tr_code_to_path.get(tr_code, "")
+    if path.endswith("/order"):
+        return RequestPriority.ORDER
+    if path.endswith("/accno"):
+        return RequestPriority.ACCOUNT
+    if path.endswith("/chart"):
+        return RequestPriority.BULK
+    return RequestPriority.QUOTE
+
+
+class _LatencyStats:
+    """우선순위 클래스 하나의 대기/처리 시간 통계"""
+    def __init__(self):
+        self.count = 0
+        self.total_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.recent: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, wait: float, latency: float) -> None:
+        self.count += 1
+        self.total_wait += wait
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+        self.recent.append(latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+        def percentile(p: float) -> float:
+            return recent[min(len(recent) - 1, int(len(recent) * p))] * 1000 if recent else 0.0
+        return {
+            "count": self.count,
+            "avg_wait_ms": (self.total_wait / self.count * 1000) if self.count else 0.0,
+            "avg_latency_ms": (self.total_latency / self.count * 1000) if self.count else 0.0,
+            "p50_latency_ms": percentile(0.50),
+            "p95_latency_ms": percentile(0.95),
+            "max_latency_ms": self.max_latency * 1000,
+        }
+
+
+class RequestScheduler:
+    """
+    OpenApi.request 앞단에서 동시에 진행되는 요청 수를 제한하고,
+    빈 슬롯이 생기면 우선순위가 가장 높은 요청부터 실행시키는 스케줄러입니다.
+    같은 우선순위 안에서는 도착 순서를 지킵니다.
+
+    BULK 클래스는 reserved_slots 만큼의 슬롯을 사용할 수 없으므로,
+    대량 조회가 진행 중이어도 주문 요청은 항상 즉시 실행될 자리가 남아 있습니다.
+    """
+    def __init__(self, max_concurrency: int = 4, reserved_slots: int = 1):
+        """
+        :param max_concurrency: 동시에 진행할 수 있는 최대 요청 수
+        :param reserved_slots: BULK 클래스가 사용할 수 없는(상위 클래스 전용) 슬롯 수
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency는 1 이상이어야 합니다.")
+        if not 0 <= reserved_slots < max_concurrency:
+            raise ValueError("reserved_slots는 0 이상, max_concurrency 미만이어야 합니다.")
+        self._max_concurrency = max_concurrency
+        self._reserved_slots = reserved_slots
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._stats: Dict[RequestPriority, _LatencyStats] = {p: _LatencyStats() for p in RequestPriority}
+
+    def _limit(self, priority: int) -> int:
+        if priority >= RequestPriority.BULK:
+            return self._max_concurrency - self._reserved_slots
+        return self._max_concurrency
+
+    def _wake(self) -> None:
+        """남은 슬롯을 우선순위가 높은 대기자부터 배정합니다."""
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._active >= self._limit(priority):
+                break
+            heapq.heappop(self._waiters)
+            self._active += 1
+            future.set_result(None)
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """우선순위에 따라 실행 슬롯을 배정받을 때까지 대기합니다."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 슬롯을 배정받은 직후 취소되었다면 슬롯을 반납합니다.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """사용한 실행 슬롯을 반납합니다."""
+        self._active -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """슬롯을 배정받아 블록을 실행하고, 대기/처리 시간을 우선순위 클래스별로 기록합니다."""
+        start = time.monotonic()
+        await self.acquire(priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release()
+            self._stats[RequestPriority(priority)].record(started - start, time.monotonic() - start)
+
+    def queue_depth(self, priority: RequestPriority | None = None) -> int:
+        """대기 중인 요청 수를 반환합니다. priority를 지정하면 해당 클래스만 셉니다."""
+        return sum(
+            1 for p, _, future in self._waiters
+            if not future.done() and (priority is None or p == priority)
+        )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """우선순위 클래스별 대기/지연시간 통계를 반환합니다."""
+        return {
+            priority.name: {**stats.snapshot(), "queue_depth": self.queue_depth(priority)}
+            for priority, stats in self._stats.items()
+        }
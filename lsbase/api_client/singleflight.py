@@ -0,0 +1,61 @@
+# lsbase/api_client/singleflight.py
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+def make_request_key(tr_code: str, params: Any, tr_cont: str, tr_cont_key: str) -> Tuple[str, str, str, str]:
+    """TR 코드, 요청 파라미터, 연속 조회 키로 요청을 식별하는 키를 만듭니다. 파라미터의 키 순서는 무시합니다."""
+    if isinstance(params, str):
+        normalized = params
+    else:
+        normalized = json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return (tr_code, normalized, tr_cont, tr_cont_key)
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 요청을 하나로 합칩니다.
+    첫 호출자(leader)의 요청만 실제로 실행되고, 그 요청이 끝나기 전에 들어온 호출자들은
+    같은 결과(또는 예외)를 공유합니다. 요청이 끝나면 키는 즉시 제거되므로 결과를 캐시하지는 않습니다.
+    """
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """key에 해당하는 요청이 진행 중이면 그 결과를 기다리고, 없으면 factory()를 실행합니다."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        # 한 호출자가 취소되어도 다른 호출자가 기다리는 요청은 계속 진행되도록 shield로 감쌉니다.
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 호출자가 취소된 경우 "exception was never retrieved" 경고를 막기 위해 예외를 소비합니다.
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def inflight(self) -> int:
+        """현재 진행 중인 (합쳐진) 요청 수"""
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        """합치기 적중/미적중 횟수와 절약한 요청 비율을 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "inflight": self.inflight,
+            "saved_ratio": self.hits / total if total else 0.0,
+        }
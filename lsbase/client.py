@@ -1,10 +1,18 @@
 # lsbase/client.py
 import logging
 import asyncio
+import os
 from datetime import datetime
 from . import config
 from .openapi_client.OpenApi import OpenApi
+from .openapi_client.token_store import TokenStore
+from .openapi_client.cassette import Cassette
+from .openapi_client.realtime_stream import RealtimeStream
 from .api_client.ls_api import LSTradingAPI
+from .api_client.rate_limiter import TrRateLimiter
+from .api_client.scheduler import RequestScheduler
+from .api_client.response_cache import ResponseCache
+from .api_client.checkpoint import CheckpointStore
 from .markets.stock import StockMarket
 from .logger import setup_logger # 로거 설정 함수 임포트
 from .tr_adapter import TrCodeAdapter
@@ -21,8 +29,31 @@ class MarketClient:
         self.spec = TrCodeAdapter(specs_filepath='lsbase/tools/ls_openapi_specs.json')
         logger.info("TR 명세 어댑터(spec)가 성공적으로 로드되었습니다.")
 
-        self._open_api = OpenApi()
-        self._api = LSTradingAPI(self._open_api)
+        cassette = None
+        if config.CASSETTE_PATH:
+            cassette = Cassette(config.CASSETTE_PATH, mode=config.CASSETTE_MODE, latency=config.CASSETTE_LATENCY)
+            logger.info(f"REST 요청/응답 기록 파일을 사용합니다: {config.CASSETTE_PATH} ({config.CASSETTE_MODE})")
+
+        # 접근토큰을 디스크에 캐시하여 재시작 시 토큰 발급/모의투자 확인 과정을 생략합니다.
+        self._open_api = OpenApi(
+            token_store=TokenStore(os.path.join(config.CACHE_DIR, "tokens")),
+            base_url=config.LS_BASE_URL,
+            wss_url_real=config.LS_WSS_URL_REAL,
+            wss_url_simulation=config.LS_WSS_URL_SIMULATION,
+            cassette=cassette,
+        )
+        # TR별 TPS(transaction_per_sec)에 맞춰 요청 속도를 제한하고,
+        # 주문 > 계좌 > 시세 > 대량조회 순으로 요청을 처리합니다.
+        self._api = LSTradingAPI(
+            self._open_api,
+            rate_limiter=TrRateLimiter(self.spec),
+            scheduler=RequestScheduler(),
+            # 종목 마스터 등 기준정보 TR은 디스크에 캐시하여 재시작 후에도 재사용합니다.
+            # 기록 파일을 사용할 때는 캐시된 응답 때문에 기록이 빠지지 않도록 디스크 캐시를 쓰지 않습니다.
+            response_cache=ResponseCache(disk_dir=os.path.join(config.CACHE_DIR, "responses")) if cassette is None else None,
+            # continuous_query(..., checkpoint="이름")으로 긴 연속 조회를 중단된 페이지부터 이어서 조회합니다.
+            checkpoint_store=CheckpointStore(os.path.join(config.CACHE_DIR, "checkpoints")),
+        )
         
         # <-- 3. StockMarket에 spec 객체 주입
         self.stock = StockMarket(
@@ -41,11 +72,13 @@ class MarketClient:
             "8": MarketState(market_name="KRX야간파생"),
             "9": MarketState(market_name="미국주식"),
         }
+        # 시장 상태가 바뀔 때 호출할 콜백 (market_code, MarketState)
+        self._market_state_listeners: list = []
 
         self._open_api.on_message.connect(self.on_message_received)
         # JIF와 NWS 핸들러를 분리하여 관리
         if self._monitor_market_state:
-            self._open_api.on_realtime.connect(self._internal_jif_handler)
+            self._open_api.on_realtime.connect(self._internal_jif_handler, trcode="JIF")
         self._open_api.on_realtime.connect(self.on_realtime_data_received)
 
     async def connect(self) -> bool:
@@ -84,6 +117,19 @@ class MarketClient:
     def on_realtime_data_received(self, sender, trcode, key, realtimedata):
         logger.debug(f"[Realtime Data] TR: {trcode}, Key: {key}, Data: {realtimedata}")
 
+    def stream(self, trcode: str, keys, maxsize: int = 10000, overflow: str = "drop_oldest", decode: bool = False) -> RealtimeStream:
+        """
+        실시간 데이터를 async for로 받는 스트림을 만듭니다. 반복이 끝나면 구독이 자동으로 해제됩니다.
+
+            async for tick in client.stream("S3_", ["005930", "000660"]):
+                print(tick.key, tick.data["price"])
+
+        :param maxsize: 스트림 버퍼 크기
+        :param overflow: 버퍼가 가득 찼을 때의 처리 방식 ("block", "drop_oldest", "conflate")
+        :param decode: True이면 tick.data로 dict 대신 타입 변환된 디코더 객체(generated_decoders)를 받습니다.
+        """
+        return RealtimeStream(self._open_api, trcode, keys, maxsize=maxsize, overflow=overflow, decode=decode)
+
     @property
     def server_time(self) -> datetime | None:
         """가장 최근에 동기화된 서버 시간을 반환합니다."""
@@ -98,6 +144,18 @@ class MarketClient:
         state = self.get_market_state(market_code)
         return state.status == MarketStatus.OPEN if state else False
 
+    def add_market_state_listener(self, callback) -> None:
+        """
+        시장 상태(JIF)가 바뀔 때 호출할 콜백을 등록합니다. callback(market_code, state: MarketState)
+        BarAggregator.bind_market()처럼 장 시작/마감에 맞춰 상태를 정리해야 하는 구성요소가 사용합니다.
+        """
+        if callback not in self._market_state_listeners:
+            self._market_state_listeners.append(callback)
+
+    def remove_market_state_listener(self, callback) -> None:
+        if callback in self._market_state_listeners:
+            self._market_state_listeners.remove(callback)
+
     async def _subscribe_all_jif(self):
         """지원하는 모든 시장의 JIF를 구독합니다."""
         for key in self.market_states.keys():
@@ -117,9 +175,6 @@ class MarketClient:
 
     def _internal_jif_handler(self, sender, trcode, key, realtimedata):
         """수신된 JIF 데이터를 해석하여 내부 market_states를 업데이트합니다."""
-        if trcode != "JIF":
-            return
-
         state = self.market_states.get(key)
         if not state:
             return
@@ -132,6 +187,11 @@ class MarketClient:
             state.status = new_status
             state.last_updated = datetime.now()
             state.raw_jstatus_code = status_code
+            for callback in list(self._market_state_listeners):
+                try:
+                    callback(key, state)
+                except Exception:
+                    logger.exception(f"시장 상태 콜백 처리 중 예외가 발생했습니다 ({state.market_name})")
 
     def _convert_jstatus_to_marketstatus(self, jstatus: str) -> MarketStatus:
         """JIF 상태 코드를 내부 MarketStatus Enum으로 변환합니다."""
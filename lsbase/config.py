@@ -12,6 +12,19 @@ APP_SECRET = os.getenv("APP_SECRET")
 ACCOUNT_NO = os.getenv("ACCOUNT_NO")
 ACCOUNT_PASSWORD = os.getenv("ACCOUNT_PASSWORD")
 
+# --- LS Securities Server ---
+# 로컬 대체 서버(lsbase.tools.local_server) 등 다른 서버로 접속할 때만 설정합니다. 설정이 없으면 LS증권 서버를 사용합니다.
+LS_BASE_URL = os.getenv("LS_BASE_URL")
+LS_WSS_URL_REAL = os.getenv("LS_WSS_URL_REAL")
+LS_WSS_URL_SIMULATION = os.getenv("LS_WSS_URL_SIMULATION")
+
+# --- Cassette (REST 요청/응답 기록) ---
+# 설정하면 REST 요청/응답을 파일에 기록하거나(record), 기록된 응답만으로 서버 없이 실행합니다(replay).
+# auto는 기록된 응답이 있으면 사용하고 없으면 서버에 요청하여 기록합니다.
+CASSETTE_PATH = os.getenv("CASSETTE_PATH")
+CASSETTE_MODE = os.getenv("CASSETTE_MODE", "auto")
+CASSETTE_LATENCY = float(os.getenv("CASSETTE_LATENCY", "0"))
+
 # --- Email for Reporting ---
 EMAIL_SENDER = os.getenv("EMAIL_SENDER")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
@@ -23,6 +36,10 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 
+# --- Cache Settings ---
+# 응답 캐시 등 디스크에 저장하는 캐시 파일의 위치입니다.
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "lsbase"))
+
 # --- Logger Settings ---
 # .env 파일에서 로그 레벨을 읽어오되, 설정이 없으면 'INFO'를 기본값으로 사용합니다.
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
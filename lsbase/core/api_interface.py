@@ -10,7 +10,15 @@ class TradingAPI(ABC):
         pass
 
     @abstractmethod
-    async def continuous_query(self, tr_code: str, params: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+    async def continuous_query(self, tr_code: str, params: Dict[str, Any], *, prefetch: int = 0, checkpoint: str | None = None) -> AsyncGenerator[Dict[str, Any], None]:
+        pass
+
+    @abstractmethod
+    async def continuous_pages(self, tr_code: str, params: Dict[str, Any], *, prefetch: int = 0, checkpoint: str | None = None) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        pass
+
+    @abstractmethod
+    async def continuous_columns(self, tr_code: str, params: Dict[str, Any], *, prefetch: int = 0, fields: List[str] | None = None, checkpoint: str | None = None) -> AsyncGenerator[Dict[str, Any], None]:
         pass
 
     @abstractmethod
@@ -20,3 +28,7 @@ class TradingAPI(ABC):
     @abstractmethod
     async def unsubscribe_realtime(self, tr_code: str, tr_key: str) -> bool:
         pass
+
+    @abstractmethod
+    async def apply_realtime_subscriptions(self, owner: Any, desired: List[tuple]) -> Dict[str, List[tuple]]:
+        pass
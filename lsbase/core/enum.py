@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 class OrderSide(str, Enum):
     BUY = "BUY"
@@ -14,3 +14,10 @@ class RealtimeType(str, Enum):
     ORDER_STATUS = "ORDER_STATUS"
     MARKET_STATUS = "MARKET_STATUS" # 장운영 상태 (JIF)
     NEWS_HEADLINE = "NEWS_HEADLINE" # 장운영 상태 (JIF)
+
+class RequestPriority(IntEnum):
+    """REST 요청 우선순위 (값이 작을수록 먼저 처리)"""
+    ORDER = 0    # 주문/정정/취소
+    ACCOUNT = 1  # 계좌/잔고 조회
+    QUOTE = 2    # 시세 조회
+    BULK = 3     # 차트/기간별 시세 등 대량 조회
@@ -1,6 +1,6 @@
 # lsbase/core/models.py (수정된 버전)
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from enum import Enum
 from datetime import datetime
@@ -62,3 +62,16 @@ class HistoricalPrice(BaseModel):
     volume: int = Field(description="누적거래량")
     value: int = Field(description="누적거래대금(단위:백만)")
     change_rate: float = Field(alias="diff", description="등락율")
+
+class ChartBar(BaseModel):
+    """분/틱 차트(t8412, t8411)의 봉 하나를 담는 모델. 실시간 집계(BarAggregator)도 같은 모델을 사용합니다."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    date: str = Field(description="날짜 (YYYYMMDD)")
+    time: str = Field(description="시간 (HHMMSS). 분봉은 봉의 종료 시각, 틱봉은 마지막 체결 시각")
+    open: int = Field(description="시가")
+    high: int = Field(description="고가")
+    low: int = Field(description="저가")
+    close: int = Field(description="종가")
+    volume: int = Field(alias="jdiff_vol", description="거래량")
+    value: int = Field(default=0, description="거래대금(원). t8412의 백만원 단위 값은 원으로 환산합니다. t8411은 제공하지 않음(0)")
@@ -0,0 +1,529 @@
+# -*- coding: utf-8 -*-
+# 이 파일은 generate_code.py에 의해 자동으로 생성되었습니다. 수동으로 수정하지 마세요.
+#
+# 연속 조회 TR의 연속 키 계획입니다. LSTradingAPI.continuous_query가 페이지마다 그대로 적용합니다.
+#
+#   tr_code: (InBlock 이름, OutBlock 이름, ((OutBlock 필드, InBlock 필드, 종료 조건), ...))
+#
+# 종료 조건: "blank" - 값이 빈 문자열이면 종료, "zero" - 값이 0이면 종료
+# 연속 키 중 하나라도 종료 조건에 해당하면 더 조회하지 않습니다.
+# 연속 키가 없는 TR(None, None, ())은 InBlock을 바꾸지 않고 tr_cont_key 헤더만으로 다음 페이지를 조회합니다.
+# 명세/모델에 연속 키 OutBlock이 없는 TR은 계획이 없으며, 응답에서 연속 키를 찾습니다. (LSTradingAPI._guess_continuation)
+
+CONTINUATION_PLANS = {
+    # [t1514] 업종기간별추이
+    "t1514": ("t1514InBlock", "t1514OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+    )),
+    # [t8424] 전체업종
+    "t8424": (None, None, ()),
+    # [t1485] 예상지수
+    "t1485": (None, None, ()),
+    # [t1511] 업종현재가
+    "t1511": (None, None, ()),
+    # [t1516] 업종별종목시세
+    "t1516": (None, None, ()),
+    # [t4203] 업종차트(종합)
+    "t4203": ("t4203InBlock", "t4203OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+        ("cts_daygb", "cts_daygb", "blank"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t8417] 업종차트(틱/n틱)
+    "t8417": ("t8417InBlock", "t8417OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t8418] 업종차트(N분)
+    "t8418": ("t8418InBlock", "t8418OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t8419] 업종차트(일주월)
+    "t8419": ("t8419InBlock", "t8419OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+    )),
+    # [t1101] 주식현재가호가조회
+    "t1101": (None, None, ()),
+    # [t1102] 주식현재가(시세)조회
+    "t1102": (None, None, ()),
+    # [t1104] 주식현재가시세메모
+    "t1104": (None, None, ()),
+    # [t1105] 주식피봇/디마크조회
+    "t1105": (None, None, ()),
+    # [t1109] 시간외체결량
+    "t1109": ("t1109InBlock", "t1109OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1301] 주식시간대별체결조회
+    "t1301": ("t1301InBlock", "t1301OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1302] 주식분별주가조회
+    "t1302": (None, None, ()),
+    # [t1305] 기간별주가
+    "t1305": ("t1305InBlock", "t1305OutBlock", (
+        ("date", "date", "blank"),
+        ("idx", "idx", "zero"),
+    )),
+    # [t1308] 주식시간대별체결조회챠트
+    "t1308": (None, None, ()),
+    # [t1310] 주식당일전일분틱조회
+    "t1310": ("t1310InBlock", "t1310OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1404] 관리/불성실/투자유의조회
+    "t1404": ("t1404InBlock", "t1404OutBlock", (
+        ("cts_shcode", "cts_shcode", "blank"),
+    )),
+    # [t1405] 투자경고/매매정지/정리매매조회
+    "t1405": ("t1405InBlock", "t1405OutBlock", (
+        ("cts_shcode", "cts_shcode", "blank"),
+    )),
+    # [t1410] 초저유동성조회
+    "t1410": ("t1410InBlock", "t1410OutBlock", (
+        ("cts_shcode", "cts_shcode", "blank"),
+    )),
+    # [t1422] 상/하한
+    "t1422": ("t1422InBlock", "t1422OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1427] 상/하한가직전
+    "t1427": ("t1427InBlock", "t1427OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1442] 신고/신저가
+    "t1442": ("t1442InBlock", "t1442OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1449] 가격대별매매비중조회
+    "t1449": (None, None, ()),
+    # [t1471] 시간대별호가잔량추이
+    "t1471": (None, None, ()),
+    # [t1475] 체결강도추이
+    "t1475": ("t1475InBlock", "t1475OutBlock", (
+        ("date", "date", "zero"),
+    )),
+    # [t1486] 시간별예상체결가
+    "t1486": ("t1486InBlock", "t1486OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1488] 예상체결가등락율상위조회
+    "t1488": ("t1488InBlock", "t1488OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t8407] API용주식멀티현재가조회
+    "t8407": (None, None, ()),
+    # [t9945] 주식마스터조회API용
+    "t9945": (None, None, ()),
+    # [t1752] 종목별상위회원사
+    "t1752": ("t1752InBlock", "t1752OutBlock", (
+        ("cts_idx", "cts_idx", "zero"),
+    )),
+    # [t1764] 회원사리스트
+    "t1764": (None, None, ()),
+    # [t1771] 종목별회원사추이
+    "t1771": ("t1771InBlock", "t1771OutBlock", (
+        ("cts_idx", "cts_idx", "zero"),
+    )),
+    # [t3102] 뉴스본문
+    "t3102": (None, None, ()),
+    # [t3202] 종목별증시일정
+    "t3202": (None, None, ()),
+    # [t3320] FNG_요약
+    "t3320": (None, None, ()),
+    # [t3341] 재무순위종합
+    "t3341": ("t3341InBlock", "t3341OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t3401] 투자의견
+    "t3401": ("t3401InBlock", "t3401OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+    )),
+    # [t3521] 해외지수조회(API용)
+    "t3521": (None, None, ()),
+    # [t8428] 증시주변자금추이
+    "t8428": (None, None, ()),
+    # [t1631] 프로그램매매종합조회
+    "t1631": (None, None, ()),
+    # [t1632] 시간대별프로그램매매추이
+    "t1632": ("t1632InBlock", "t1632OutBlock", (
+        ("date", "date", "blank"),
+    )),
+    # [t1633] 기간별프로그램매매추이
+    "t1633": ("t1633InBlock", "t1633OutBlock", (
+        ("date", "date", "blank"),
+    )),
+    # [t1636] 종목별프로그램매매동향
+    "t1636": ("t1636InBlock", "t1636OutBlock", (
+        ("cts_idx", "cts_idx", "zero"),
+    )),
+    # [t1637] 종목별프로그램매매추이
+    "t1637": ("t1637InBlock", "t1637OutBlock", (
+        ("cts_idx", "cts_idx", "zero"),
+    )),
+    # [t1640] 프로그램매매종합조회(미니)
+    "t1640": (None, None, ()),
+    # [t1662] 시간대별프로그램매매추이(차트)
+    "t1662": (None, None, ()),
+    # [t1601] 투자자별종합
+    "t1601": (None, None, ()),
+    # [t1602] 시간대별투자자매매추이
+    "t1602": ("t1602InBlock", "t1602OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1603] 시간대별투자자매매추이상세
+    "t1603": ("t1603InBlock", "t1603OutBlock", (
+        ("cts_idx", "cts_idx", "zero"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1615] 투자자매매종합1
+    "t1615": (None, None, ()),
+    # [t1617] 투자자매매종합2
+    "t1617": ("t1617InBlock", "t1617OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1621] 업종별분별투자자매매동향(챠트용)
+    "t1621": (None, None, ()),
+    # [t1664] 투자자매매종합(챠트)
+    "t1664": (None, None, ()),
+    # [t1702] 외인기관종목별동향
+    "t1702": (None, None, ()),
+    # [t1716] 외인기관종목별동향
+    "t1716": (None, None, ()),
+    # [t1717] 외인기관종목별동향
+    "t1717": (None, None, ()),
+    # [t1950] ELW현재가(시세)조회
+    "t1950": (None, None, ()),
+    # [t1951] ELW시간대별체결조회
+    "t1951": ("t1951InBlock", "t1951OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1954] ELW일별주가
+    "t1954": (None, None, ()),
+    # [t1956] ELW현재가(확정지급액)조회
+    "t1956": (None, None, ()),
+    # [t1958] ELW종목비교
+    "t1958": (None, None, ()),
+    # [t1959] LP대상종목정보조회
+    "t1959": (None, None, ()),
+    # [t1960] ELW등락율상위
+    "t1960": ("t1960InBlock", "t1960OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1961] ELW거래량상위
+    "t1961": ("t1961InBlock", "t1961OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1964] ELW전광판
+    "t1964": (None, None, ()),
+    # [t1966] ELW거래대금상위
+    "t1966": ("t1966InBlock", "t1966OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1969] ELW지표검색
+    "t1969": (None, None, ()),
+    # [t1971] ELW현재가호가조회
+    "t1971": (None, None, ()),
+    # [t1972] ELW현재가(거래원)조회
+    "t1972": (None, None, ()),
+    # [t1973] ELW시간대별예상체결조회
+    "t1973": ("t1973InBlock", "t1973OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t1974] ELW기초자산동일종목
+    "t1974": (None, None, ()),
+    # [t1988] 기초자산리스트조회
+    "t1988": (None, None, ()),
+    # [t8431] ELW종목조회
+    "t8431": (None, None, ()),
+    # [t9905] 기초자산리스트조회
+    "t9905": (None, None, ()),
+    # [t9907] 만기월조회
+    "t9907": (None, None, ()),
+    # [t9942] ELW마스터조회API용
+    "t9942": (None, None, ()),
+    # [t1901] ETF현재가(시세)조회
+    "t1901": (None, None, ()),
+    # [t1902] ETF시간별추이
+    "t1902": (None, None, ()),
+    # [t1903] ETF일별추이
+    "t1903": ("t1903InBlock", "t1903OutBlock", (
+        ("date", "date", "blank"),
+    )),
+    # [t1904] ETF구성종목조회
+    "t1904": ("t1904InBlock", "t1904OutBlock", (
+        ("date", "date", "blank"),
+    )),
+    # [t1906] ETFLP호가
+    "t1906": (None, None, ()),
+    # [t1531] 테마별종목
+    "t1531": (None, None, ()),
+    # [t1532] 종목별테마
+    "t1532": (None, None, ()),
+    # [t1533] 특이테마
+    "t1533": (None, None, ()),
+    # [t1537] 테마종목별시세조회
+    "t1537": (None, None, ()),
+    # [t8425] 전체테마
+    "t8425": (None, None, ()),
+    # [t1809] 신호조회
+    "t1809": ("t1809InBlock", "t1809OutBlock", (
+        ("cts", "cts", "blank"),
+    )),
+    # [t1825] 종목Q클릭검색(씽큐스마트)
+    "t1825": (None, None, ()),
+    # [t1826] 종목Q클릭검색리스트조회(씽큐스마트)
+    "t1826": (None, None, ()),
+    # [t1866] 서버저장조건 리스트조회
+    "t1866": (None, None, ()),
+    # [t1859] 서버저장조건 조건검색
+    "t1859": (None, None, ()),
+    # [t1860] 서버저장조건 실시간검색
+    "t1860": (None, None, ()),
+    # [t1441] 등락율상위
+    "t1441": ("t1441InBlock", "t1441OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1444] 시가총액상위
+    "t1444": ("t1444InBlock", "t1444OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1452] 거래량상위
+    "t1452": ("t1452InBlock", "t1452OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1463] 거래대금상위
+    "t1463": ("t1463InBlock", "t1463OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1466] 전일동시간대비거래급증
+    "t1466": ("t1466InBlock", "t1466OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1481] 시간외등락율상위
+    "t1481": ("t1481InBlock", "t1481OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1489] 예상체결량상위조회
+    "t1489": ("t1489InBlock", "t1489OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1492] 단일가예상등락율상위
+    "t1492": ("t1492InBlock", "t1492OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1665] 기간별투자자매매추이(차트)
+    "t1665": (None, None, ()),
+    # [t8410] API전용주식차트(일주월년)
+    "t8410": ("t8410InBlock", "t8410OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+    )),
+    # [t8412] 주식차트(N분)
+    "t8412": ("t8412InBlock", "t8412OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [CLNAQ00100] 예탁담보융자가능종목현황조회
+    "CLNAQ00100": (None, None, ()),
+    # [t1403] 신규상장종목조회
+    "t1403": ("t1403InBlock", "t1403OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1411] 증거금율별종목조회
+    "t1411": ("t1411InBlock", "t1411OutBlock", (
+        ("idx", "idx", "zero"),
+    )),
+    # [t1638] 종목별잔량/사전공시
+    "t1638": (None, None, ()),
+    # [t1921] 신용거래동향
+    "t1921": ("t1921InBlock", "t1921OutBlock", (
+        ("date", "date", "blank"),
+        ("idx", "idx", "zero"),
+    )),
+    # [t1926] 종목별신용정보
+    "t1926": (None, None, ()),
+    # [t1927] 공매도일별추이
+    "t1927": ("t1927InBlock", "t1927OutBlock", (
+        ("date", "date", "blank"),
+    )),
+    # [t1941] 종목별대차거래일간추이
+    "t1941": (None, None, ()),
+    # [t8430] 주식종목조회
+    "t8430": (None, None, ()),
+    # [t8436] 주식종목조회 API용
+    "t8436": (None, None, ()),
+    # [CDPCQ04700] 계좌 거래내역
+    "CDPCQ04700": (None, None, ()),
+    # [CSPAQ00600] 계좌별신용한도조회
+    "CSPAQ00600": (None, None, ()),
+    # [CSPAQ12200] 현물계좌예수금 주문가능금액 총평가 조회
+    "CSPAQ12200": (None, None, ()),
+    # [CSPAQ12300] BEP단가조회
+    "CSPAQ12300": (None, None, ()),
+    # [CSPAQ13700] 현물계좌 주문체결내역 조회(API)
+    "CSPAQ13700": (None, None, ()),
+    # [CSPAQ22200] 현물계좌예수금 주문가능금액 총평가2
+    "CSPAQ22200": (None, None, ()),
+    # [CSPBQ00200] 현물계좌증거금률별주문가능수량조회
+    "CSPBQ00200": (None, None, ()),
+    # [FOCCQ33600] 주식계좌 기간별수익률 상세
+    "FOCCQ33600": (None, None, ()),
+    # [t0151] 주식당일매매일지/수수료(전일)
+    "t0151": ("t0151InBlock", "t0151OutBlock", (
+        ("cts_price", "cts_price", "blank"),
+        ("cts_middiv", "cts_middiv", "blank"),
+        ("cts_expcode", "cts_expcode", "blank"),
+        ("cts_medosu", "cts_medosu", "blank"),
+    )),
+    # [t0424] 주식잔고2
+    "t0424": ("t0424InBlock", "t0424OutBlock", (
+        ("cts_expcode", "cts_expcode", "blank"),
+    )),
+    # [t0425] 주식체결/미체결
+    "t0425": ("t0425InBlock", "t0425OutBlock", (
+        ("cts_ordno", "cts_ordno", "blank"),
+    )),
+    # [t2101] 선물/옵션현재가(시세)조회
+    "t2101": (None, None, ()),
+    # [t2105] 선물/옵션현재가호가조회
+    "t2105": (None, None, ()),
+    # [t2106] 선물/옵션현재가시세메모
+    "t2106": (None, None, ()),
+    # [t2201] 선물옵션시간대별체결조회
+    "t2201": ("t2201InBlock", "t2201OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t2203] 기간별주가
+    "t2203": ("t2203InBlock", "t2203OutBlock", (
+        ("cts_code", "cts_code", "blank"),
+    )),
+    # [t2210] 선물옵션시간대별체결조회(단일출력용)
+    "t2210": (None, None, ()),
+    # [t2301] 옵션전광판
+    "t2301": (None, None, ()),
+    # [t2405] 선물옵션호가잔량비율챠트
+    "t2405": ("t2405InBlock", "t2405OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t2421] 미결제약정추이
+    "t2421": (None, None, ()),
+    # [t8401] 주식선물마스터조회(API용)
+    "t8401": (None, None, ()),
+    # [t8402] 주식선물현재가조회(API용)
+    "t8402": (None, None, ()),
+    # [t8403] 주식선물호가조회(API용)
+    "t8403": (None, None, ()),
+    # [t8404] 주식선물시간대별체결조회(API용)
+    "t8404": ("t8404InBlock", "t8404OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t8405] 주식선물기간별주가(API용)
+    "t8405": ("t8405InBlock", "t8405OutBlock", (
+        ("cts_code", "cts_code", "blank"),
+    )),
+    # [t8406] 주식선물틱분별체결조회(API용)
+    "t8406": (None, None, ()),
+    # [t8426] 상품선물마스터조회(API용)
+    "t8426": (None, None, ()),
+    # [t8427] 과거데이터시간대별조회
+    "t8427": ("t8427InBlock", "t8427OutBlock", (
+        ("date", "date", "blank"),
+    )),
+    # [t8432] 지수선물마스터조회API용
+    "t8432": (None, None, ()),
+    # [t8433] 지수옵션마스터조회API용
+    "t8433": (None, None, ()),
+    # [t8434] 선물/옵션멀티현재가조회
+    "t8434": (None, None, ()),
+    # [t8435] 파생종목마스터조회API용
+    "t8435": (None, None, ()),
+    # [t9943] 지수선물마스터조회API용
+    "t9943": (None, None, ()),
+    # [t9944] 지수옵션마스터조회API용
+    "t9944": (None, None, ()),
+    # [t2541] 상품선물투자자매매동향(실시간)
+    "t2541": ("t2541InBlock", "t2541OutBlock", (
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t2545] 상품선물투자자매매동향(챠트용)
+    "t2545": (None, None, ()),
+    # [t2209] 선물옵션틱분별체결조회차트
+    "t2209": (None, None, ()),
+    # [t8414] 선물옵션차트(틱/n틱)
+    "t8414": ("t8414InBlock", "t8414OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t8415] 선물/옵션차트(N분)
+    "t8415": ("t8415InBlock", "t8415OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+        ("cts_time", "cts_time", "blank"),
+    )),
+    # [t8416] 선물/옵션차트(일주월)
+    "t8416": ("t8416InBlock", "t8416OutBlock", (
+        ("cts_date", "cts_date", "blank"),
+    )),
+    # [CFOAQ00600] 선물옵션 계좌 주문체결내역 조회
+    "CFOAQ00600": (None, None, ()),
+    # [CFOAQ50600] 선물옵션 계좌잔고 및 평가현황3
+    "CFOAQ50600": (None, None, ()),
+    # [CFOAQ10100] 선물옵션 주문가능수량조회
+    "CFOAQ10100": (None, None, ()),
+    # [CFOBQ10500] 선물옵션 계좌예탁금증거금조회
+    "CFOBQ10500": (None, None, ()),
+    # [CFOEQ11100] 선물옵션가정산예탁금상세
+    "CFOEQ11100": (None, None, ()),
+    # [CFOEQ82600] 선물옵션 일별 계좌손익내역
+    "CFOEQ82600": (None, None, ()),
+    # [CFOFQ02400] 계좌 미결제 약정현황(평균가)
+    "CFOFQ02400": (None, None, ()),
+    # [t0434] 선물/옵션체결/미체결
+    "t0434": ("t0434InBlock", "t0434OutBlock", (
+        ("cts_ordno", "cts_ordno", "blank"),
+    )),
+    # [t0441] 선물/옵션잔고평가(이동평균)
+    "t0441": ("t0441InBlock", "t0441OutBlock", (
+        ("cts_expcode", "cts_expcode", "blank"),
+        ("cts_medocd", "cts_medocd", "blank"),
+    )),
+    # [FOCCQ33700] 선물옵션 기간별 계좌 수익률 현황
+    "FOCCQ33700": (None, None, ()),
+    # [MMDAQ91200] 파생상품증거금율조회
+    "MMDAQ91200": (None, None, ()),
+    # [o3101] 해외선물마스터조회
+    "o3101": (None, None, ()),
+    # [o3104] 해외선물 일별체결 조회
+    "o3104": (None, None, ()),
+    # [o3105] 해외선물 현재가(종목정보) 조회
+    "o3105": (None, None, ()),
+    # [o3106] 해외선물 현재가호가 조회
+    "o3106": (None, None, ()),
+    # [o3107] 해외선물 관심종목 조회
+    "o3107": (None, None, ()),
+    # [o3121] 해외선물옵션 마스터 조회
+    "o3121": (None, None, ()),
+    # [o3125] 해외선물옵션 현재가(종목정보) 조회
+    "o3125": (None, None, ()),
+    # [o3126] 해외선물옵션 현재가호가 조회
+    "o3126": (None, None, ()),
+    # [o3127] 해외선물옵션 관심종목 조회
+    "o3127": (None, None, ()),
+    # [CIDBQ01400] 해외선물 체결내역개별 조회(주문가능수량)
+    "CIDBQ01400": (None, None, ()),
+    # [CIDBQ01500] 해외선물 미결제잔고내역 조회
+    "CIDBQ01500": (None, None, ()),
+    # [CIDBQ01800] 해외선물 주문내역 조회
+    "CIDBQ01800": (None, None, ()),
+    # [CIDBQ02400] 해외선물 주문체결내역 상세 조회
+    "CIDBQ02400": (None, None, ()),
+    # [CIDBQ03000] 해외선물 예수금/잔고현황
+    "CIDBQ03000": (None, None, ()),
+    # [CIDBQ05300] 해외선물 예탁자산 조회
+    "CIDBQ05300": (None, None, ()),
+    # [CIDEQ00800] 일자별 미결제 잔고내역
+    "CIDEQ00800": (None, None, ()),
+    # [t0167] 서버시간조회
+    "t0167": (None, None, ()),
+}
@@ -0,0 +1,20204 @@
+# -*- coding: utf-8 -*-
+# 이 파일은 generate_code.py에 의해 자동으로 생성되었습니다. 수동으로 수정하지 마세요.
+#
+# 실시간 TR 본문(문자열 dict)을 감싸는 __slots__ 디코더입니다.
+# pydantic 검증 없이 접근한 필드만 타입을 변환하므로 tick마다 사용할 수 있습니다.
+#
+#   tick = decode("S3_", realtimedata)
+#   tick.price  # int
+
+
+def to_number(value):
+    """'00012345', '-120', ' 7 ' -> int, '12.5' -> float, 빈 값 -> None. 변환할 수 없으면 원래 값을 그대로 반환합니다."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        if not value or (isinstance(value, str) and not value.strip()):
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return value
+
+
+def to_float(value):
+    """'6.25', '-0.50' -> float, 빈 값 -> None. 변환할 수 없으면 원래 값을 그대로 반환합니다."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        if not value or (isinstance(value, str) and not value.strip()):
+            return None
+        return value
+
+
+class RealtimeRecord:
+    """실시간 디코더 객체의 기반 클래스
+
+    수신한 dict를 그대로 보관하고, 필드에 접근할 때 해당 필드만 변환합니다.
+    tick마다 모든 필드를 변환하지 않으므로 일부 필드만 사용하는 경우 비용이 가장 작습니다.
+    """
+    __slots__ = ("_data",)
+    TR_CODE = ""
+    FIELDS = ()
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    @property
+    def raw(self) -> dict:
+        """수신한 원본 dict"""
+        return self._data
+
+    def as_tuple(self) -> tuple:
+        """모든 필드를 변환하여 FIELDS 순서의 tuple로 반환합니다."""
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def as_dict(self) -> dict:
+        """모든 필드를 변환하여 dict로 반환합니다."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._data == other._data
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+
+class BMTick(RealtimeRecord):
+    """[BM_] 업종별투자자별매매현황"""
+    __slots__ = ()
+    TR_CODE = "BM_"
+    FIELDS = ("tjjcode", "tjjtime", "msvolume", "mdvolume", "msvol", "p_msvol", "msvalue", "mdvalue", "msval", "p_msval", "upcode")
+
+    @property
+    def tjjcode(self):
+        """투자자코드"""
+        return self._data.get("tjjcode")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def msvolume(self):
+        """매수거래량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mdvolume(self):
+        """매도거래량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def msvol(self):
+        """거래량순매수"""
+        return to_number(self._data.get("msvol"))
+
+    @property
+    def p_msvol(self):
+        """거래량순매수직전대비"""
+        return to_number(self._data.get("p_msvol"))
+
+    @property
+    def msvalue(self):
+        """매수거래대금"""
+        return to_number(self._data.get("msvalue"))
+
+    @property
+    def mdvalue(self):
+        """매도거래대금"""
+        return to_number(self._data.get("mdvalue"))
+
+    @property
+    def msval(self):
+        """거래대금순매수"""
+        return to_number(self._data.get("msval"))
+
+    @property
+    def p_msval(self):
+        """거래대금순매수직전대비"""
+        return to_number(self._data.get("p_msval"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+
+class B7Tick(RealtimeRecord):
+    """[B7_] ETF호가잔량"""
+    __slots__ = ()
+    TR_CODE = "B7_"
+    FIELDS = ("hotime", "lp_offerho1", "lp_bidho1", "lp_offerho2", "lp_bidho2", "lp_offerho3", "lp_bidho3", "lp_offerho4", "lp_bidho4", "lp_offerho5", "lp_bidho5", "lp_offerho6", "lp_bidho6", "lp_offerho7", "lp_bidho7", "lp_offerho8", "lp_bidho8", "lp_offerho9", "lp_bidho9", "lp_offerho10", "lp_bidho10", "shcode", "offerho1", "bidho1", "offerrem1", "bidrem1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offerho6", "bidho6", "offerrem6", "bidrem6", "offerho7", "bidho7", "offerrem7", "bidrem7", "offerho8", "bidho8", "offerrem8", "bidrem8", "offerho9", "bidho9", "offerrem9", "bidrem9", "offerho10", "bidho10", "offerrem10", "bidrem10", "totofferrem", "totbidrem", "donsigubun", "alloc_gubun", "midprice", "offermidsumrem", "bidmidsumrem")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def lp_offerho1(self):
+        """LP매도호가수량1"""
+        return to_number(self._data.get("lp_offerho1"))
+
+    @property
+    def lp_bidho1(self):
+        """LP매수호가수량1"""
+        return to_number(self._data.get("lp_bidho1"))
+
+    @property
+    def lp_offerho2(self):
+        """LP매도호가수량2"""
+        return to_number(self._data.get("lp_offerho2"))
+
+    @property
+    def lp_bidho2(self):
+        """LP매수호가수량2"""
+        return to_number(self._data.get("lp_bidho2"))
+
+    @property
+    def lp_offerho3(self):
+        """LP매도호가수량3"""
+        return to_number(self._data.get("lp_offerho3"))
+
+    @property
+    def lp_bidho3(self):
+        """LP매수호가수량3"""
+        return to_number(self._data.get("lp_bidho3"))
+
+    @property
+    def lp_offerho4(self):
+        """LP매도호가수량4"""
+        return to_number(self._data.get("lp_offerho4"))
+
+    @property
+    def lp_bidho4(self):
+        """LP매수호가수량4"""
+        return to_number(self._data.get("lp_bidho4"))
+
+    @property
+    def lp_offerho5(self):
+        """LP매도호가수량5"""
+        return to_number(self._data.get("lp_offerho5"))
+
+    @property
+    def lp_bidho5(self):
+        """LP매수호가수량5"""
+        return to_number(self._data.get("lp_bidho5"))
+
+    @property
+    def lp_offerho6(self):
+        """LP매도호가수량6"""
+        return to_number(self._data.get("lp_offerho6"))
+
+    @property
+    def lp_bidho6(self):
+        """LP매수호가수량6"""
+        return to_number(self._data.get("lp_bidho6"))
+
+    @property
+    def lp_offerho7(self):
+        """LP매도호가수량7"""
+        return to_number(self._data.get("lp_offerho7"))
+
+    @property
+    def lp_bidho7(self):
+        """LP매수호가수량7"""
+        return to_number(self._data.get("lp_bidho7"))
+
+    @property
+    def lp_offerho8(self):
+        """LP매도호가수량8"""
+        return to_number(self._data.get("lp_offerho8"))
+
+    @property
+    def lp_bidho8(self):
+        """LP매수호가수량8"""
+        return to_number(self._data.get("lp_bidho8"))
+
+    @property
+    def lp_offerho9(self):
+        """LP매도호가수량9"""
+        return to_number(self._data.get("lp_offerho9"))
+
+    @property
+    def lp_bidho9(self):
+        """LP매수호가수량9"""
+        return to_number(self._data.get("lp_bidho9"))
+
+    @property
+    def lp_offerho10(self):
+        """LP매도호가수량10"""
+        return to_number(self._data.get("lp_offerho10"))
+
+    @property
+    def lp_bidho10(self):
+        """LP매수호가수량10"""
+        return to_number(self._data.get("lp_bidho10"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가잔량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가잔량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_number(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_number(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가잔량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가잔량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_number(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_number(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가잔량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가잔량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_number(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_number(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가잔량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가잔량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_number(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_number(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가잔량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가잔량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_number(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_number(self._data.get("bidho6"))
+
+    @property
+    def offerrem6(self):
+        """매도호가잔량6"""
+        return to_number(self._data.get("offerrem6"))
+
+    @property
+    def bidrem6(self):
+        """매수호가잔량6"""
+        return to_number(self._data.get("bidrem6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_number(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_number(self._data.get("bidho7"))
+
+    @property
+    def offerrem7(self):
+        """매도호가잔량7"""
+        return to_number(self._data.get("offerrem7"))
+
+    @property
+    def bidrem7(self):
+        """매수호가잔량7"""
+        return to_number(self._data.get("bidrem7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_number(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_number(self._data.get("bidho8"))
+
+    @property
+    def offerrem8(self):
+        """매도호가잔량8"""
+        return to_number(self._data.get("offerrem8"))
+
+    @property
+    def bidrem8(self):
+        """매수호가잔량8"""
+        return to_number(self._data.get("bidrem8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_number(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_number(self._data.get("bidho9"))
+
+    @property
+    def offerrem9(self):
+        """매도호가잔량9"""
+        return to_number(self._data.get("offerrem9"))
+
+    @property
+    def bidrem9(self):
+        """매수호가잔량9"""
+        return to_number(self._data.get("bidrem9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_number(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_number(self._data.get("bidho10"))
+
+    @property
+    def offerrem10(self):
+        """매도호가잔량10"""
+        return to_number(self._data.get("offerrem10"))
+
+    @property
+    def bidrem10(self):
+        """매수호가잔량10"""
+        return to_number(self._data.get("bidrem10"))
+
+    @property
+    def totofferrem(self):
+        """총매도호가잔량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """총매수호가잔량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def donsigubun(self):
+        """동시호가구분"""
+        return self._data.get("donsigubun")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+    @property
+    def midprice(self):
+        """중간가격"""
+        return to_number(self._data.get("midprice"))
+
+    @property
+    def offermidsumrem(self):
+        """매도중간가잔량합계수량"""
+        return to_number(self._data.get("offermidsumrem"))
+
+    @property
+    def bidmidsumrem(self):
+        """매수중간가잔량합계수량"""
+        return to_number(self._data.get("bidmidsumrem"))
+
+
+class DH1Tick(RealtimeRecord):
+    """[DH1] KOSPI시간외단일가호가잔량"""
+    __slots__ = ()
+    TR_CODE = "DH1"
+    FIELDS = ("dan_hotime", "dan_hstatus", "dan_offerho1", "dan_bidho1", "dan_offerrem1", "dan_bidrem1", "dan_preoffercha1", "dan_prebidcha1", "dan_offerho2", "dan_bidho2", "dan_offerrem2", "dan_bidrem2", "dan_preoffercha2", "dan_prebidcha2", "dan_offerho3", "dan_bidho3", "dan_offerrem3", "dan_bidrem3", "dan_preoffercha3", "dan_prebidcha3", "dan_offerho4", "dan_bidho4", "dan_offerrem4", "dan_bidrem4", "dan_preoffercha4", "dan_prebidcha4", "dan_offerho5", "dan_bidho5", "dan_offerrem5", "dan_bidrem5", "dan_preoffercha5", "dan_prebidcha5", "dan_totofferrem", "dan_totbidrem", "dan_preoffercha", "dan_prebidcha", "dan_yeprice", "dan_yevolume", "dan_preysign", "dan_preychange", "dan_jnilysign", "dan_jnilychange", "shcode", "volume")
+
+    @property
+    def dan_hotime(self):
+        """시간외단일가호가시간"""
+        return self._data.get("dan_hotime")
+
+    @property
+    def dan_hstatus(self):
+        """시간외단일가장구분"""
+        return self._data.get("dan_hstatus")
+
+    @property
+    def dan_offerho1(self):
+        """시간외단일가매도호가1"""
+        return to_number(self._data.get("dan_offerho1"))
+
+    @property
+    def dan_bidho1(self):
+        """시간외단일가매수호가1"""
+        return to_number(self._data.get("dan_bidho1"))
+
+    @property
+    def dan_offerrem1(self):
+        """시간외단일가매도호가잔량1"""
+        return to_number(self._data.get("dan_offerrem1"))
+
+    @property
+    def dan_bidrem1(self):
+        """시간외단일가매수호가잔량1"""
+        return to_number(self._data.get("dan_bidrem1"))
+
+    @property
+    def dan_preoffercha1(self):
+        """시간외단일가직전매도대비수량1"""
+        return to_number(self._data.get("dan_preoffercha1"))
+
+    @property
+    def dan_prebidcha1(self):
+        """시간외단일가직전매수대비수량1"""
+        return to_number(self._data.get("dan_prebidcha1"))
+
+    @property
+    def dan_offerho2(self):
+        """시간외단일가매도호가2"""
+        return to_number(self._data.get("dan_offerho2"))
+
+    @property
+    def dan_bidho2(self):
+        """시간외단일가매수호가2"""
+        return to_number(self._data.get("dan_bidho2"))
+
+    @property
+    def dan_offerrem2(self):
+        """시간외단일가매도호가잔량2"""
+        return to_number(self._data.get("dan_offerrem2"))
+
+    @property
+    def dan_bidrem2(self):
+        """시간외단일가매수호가잔량2"""
+        return to_number(self._data.get("dan_bidrem2"))
+
+    @property
+    def dan_preoffercha2(self):
+        """시간외단일가직전매도대비수량2"""
+        return to_number(self._data.get("dan_preoffercha2"))
+
+    @property
+    def dan_prebidcha2(self):
+        """시간외단일가직전매수대비수량2"""
+        return to_number(self._data.get("dan_prebidcha2"))
+
+    @property
+    def dan_offerho3(self):
+        """시간외단일가매도호가3"""
+        return to_number(self._data.get("dan_offerho3"))
+
+    @property
+    def dan_bidho3(self):
+        """시간외단일가매수호가3"""
+        return to_number(self._data.get("dan_bidho3"))
+
+    @property
+    def dan_offerrem3(self):
+        """시간외단일가매도호가잔량3"""
+        return to_number(self._data.get("dan_offerrem3"))
+
+    @property
+    def dan_bidrem3(self):
+        """시간외단일가매수호가잔량3"""
+        return to_number(self._data.get("dan_bidrem3"))
+
+    @property
+    def dan_preoffercha3(self):
+        """시간외단일가직전매도대비수량3"""
+        return to_number(self._data.get("dan_preoffercha3"))
+
+    @property
+    def dan_prebidcha3(self):
+        """시간외단일가직전매수대비수량3"""
+        return to_number(self._data.get("dan_prebidcha3"))
+
+    @property
+    def dan_offerho4(self):
+        """시간외단일가매도호가4"""
+        return to_number(self._data.get("dan_offerho4"))
+
+    @property
+    def dan_bidho4(self):
+        """시간외단일가매수호가4"""
+        return to_number(self._data.get("dan_bidho4"))
+
+    @property
+    def dan_offerrem4(self):
+        """시간외단일가매도호가잔량4"""
+        return to_number(self._data.get("dan_offerrem4"))
+
+    @property
+    def dan_bidrem4(self):
+        """시간외단일가매수호가잔량4"""
+        return to_number(self._data.get("dan_bidrem4"))
+
+    @property
+    def dan_preoffercha4(self):
+        """시간외단일가직전매도대비수량4"""
+        return to_number(self._data.get("dan_preoffercha4"))
+
+    @property
+    def dan_prebidcha4(self):
+        """시간외단일가직전매수대비수량4"""
+        return to_number(self._data.get("dan_prebidcha4"))
+
+    @property
+    def dan_offerho5(self):
+        """시간외단일가매도호가5"""
+        return to_number(self._data.get("dan_offerho5"))
+
+    @property
+    def dan_bidho5(self):
+        """시간외단일가매수호가5"""
+        return to_number(self._data.get("dan_bidho5"))
+
+    @property
+    def dan_offerrem5(self):
+        """시간외단일가매도호가잔량5"""
+        return to_number(self._data.get("dan_offerrem5"))
+
+    @property
+    def dan_bidrem5(self):
+        """시간외단일가매수호가잔량5"""
+        return to_number(self._data.get("dan_bidrem5"))
+
+    @property
+    def dan_preoffercha5(self):
+        """시간외단일가직전매도대비수량5"""
+        return to_number(self._data.get("dan_preoffercha5"))
+
+    @property
+    def dan_prebidcha5(self):
+        """시간외단일가직전매수대비수량5"""
+        return to_number(self._data.get("dan_prebidcha5"))
+
+    @property
+    def dan_totofferrem(self):
+        """시간외단일가총매도호가잔량"""
+        return to_number(self._data.get("dan_totofferrem"))
+
+    @property
+    def dan_totbidrem(self):
+        """시간외단일가총매수호가잔량"""
+        return to_number(self._data.get("dan_totbidrem"))
+
+    @property
+    def dan_preoffercha(self):
+        """시간외단일가직전매도호가총대비수량"""
+        return to_number(self._data.get("dan_preoffercha"))
+
+    @property
+    def dan_prebidcha(self):
+        """시간외단일가직전매수호가총대비수량"""
+        return to_number(self._data.get("dan_prebidcha"))
+
+    @property
+    def dan_yeprice(self):
+        """시간외단일가예상체결가격"""
+        return to_number(self._data.get("dan_yeprice"))
+
+    @property
+    def dan_yevolume(self):
+        """시간외단일가예상체결수량"""
+        return to_number(self._data.get("dan_yevolume"))
+
+    @property
+    def dan_preysign(self):
+        """시간외단일가예상가직전가대비구분"""
+        return self._data.get("dan_preysign")
+
+    @property
+    def dan_preychange(self):
+        """시간외단일가예상가직전가대비"""
+        return to_number(self._data.get("dan_preychange"))
+
+    @property
+    def dan_jnilysign(self):
+        """시간외단일가예상가전일가대비구분"""
+        return self._data.get("dan_jnilysign")
+
+    @property
+    def dan_jnilychange(self):
+        """시간외단일가예상가전일가대비"""
+        return to_number(self._data.get("dan_jnilychange"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+
+class DHATick(RealtimeRecord):
+    """[DHA] KOSDAQ시간외단일가호가잔량"""
+    __slots__ = ()
+    TR_CODE = "DHA"
+    FIELDS = ("dan_hotime", "dan_hstatus", "dan_offerho1", "dan_bidho1", "dan_offerrem1", "dan_bidrem1", "dan_preoffercha1", "dan_prebidcha1", "dan_offerho2", "dan_bidho2", "dan_offerrem2", "dan_bidrem2", "dan_preoffercha2", "dan_prebidcha2", "dan_offerho3", "dan_bidho3", "dan_offerrem3", "dan_bidrem3", "dan_preoffercha3", "dan_prebidcha3", "dan_offerho4", "dan_bidho4", "dan_offerrem4", "dan_bidrem4", "dan_preoffercha4", "dan_prebidcha4", "dan_offerho5", "dan_bidho5", "dan_offerrem5", "dan_bidrem5", "dan_preoffercha5", "dan_prebidcha5", "dan_totofferrem", "dan_totbidrem", "dan_preoffercha", "dan_prebidcha", "dan_yeprice", "dan_yevolume", "dan_preysign", "dan_preychange", "dan_jnilysign", "dan_jnilychange", "shcode", "volume")
+
+    @property
+    def dan_hotime(self):
+        """시간외단일가호가시간"""
+        return self._data.get("dan_hotime")
+
+    @property
+    def dan_hstatus(self):
+        """시간외단일가장구분"""
+        return self._data.get("dan_hstatus")
+
+    @property
+    def dan_offerho1(self):
+        """시간외단일가매도호가1"""
+        return to_number(self._data.get("dan_offerho1"))
+
+    @property
+    def dan_bidho1(self):
+        """시간외단일가매수호가1"""
+        return to_number(self._data.get("dan_bidho1"))
+
+    @property
+    def dan_offerrem1(self):
+        """시간외단일가매도호가잔량1"""
+        return to_number(self._data.get("dan_offerrem1"))
+
+    @property
+    def dan_bidrem1(self):
+        """시간외단일가매수호가잔량1"""
+        return to_number(self._data.get("dan_bidrem1"))
+
+    @property
+    def dan_preoffercha1(self):
+        """시간외단일가직전매도대비수량1"""
+        return to_number(self._data.get("dan_preoffercha1"))
+
+    @property
+    def dan_prebidcha1(self):
+        """시간외단일가직전매수대비수량1"""
+        return to_number(self._data.get("dan_prebidcha1"))
+
+    @property
+    def dan_offerho2(self):
+        """시간외단일가매도호가2"""
+        return to_number(self._data.get("dan_offerho2"))
+
+    @property
+    def dan_bidho2(self):
+        """시간외단일가매수호가2"""
+        return to_number(self._data.get("dan_bidho2"))
+
+    @property
+    def dan_offerrem2(self):
+        """시간외단일가매도호가잔량2"""
+        return to_number(self._data.get("dan_offerrem2"))
+
+    @property
+    def dan_bidrem2(self):
+        """시간외단일가매수호가잔량2"""
+        return to_number(self._data.get("dan_bidrem2"))
+
+    @property
+    def dan_preoffercha2(self):
+        """시간외단일가직전매도대비수량2"""
+        return to_number(self._data.get("dan_preoffercha2"))
+
+    @property
+    def dan_prebidcha2(self):
+        """시간외단일가직전매수대비수량2"""
+        return to_number(self._data.get("dan_prebidcha2"))
+
+    @property
+    def dan_offerho3(self):
+        """시간외단일가매도호가3"""
+        return to_number(self._data.get("dan_offerho3"))
+
+    @property
+    def dan_bidho3(self):
+        """시간외단일가매수호가3"""
+        return to_number(self._data.get("dan_bidho3"))
+
+    @property
+    def dan_offerrem3(self):
+        """시간외단일가매도호가잔량3"""
+        return to_number(self._data.get("dan_offerrem3"))
+
+    @property
+    def dan_bidrem3(self):
+        """시간외단일가매수호가잔량3"""
+        return to_number(self._data.get("dan_bidrem3"))
+
+    @property
+    def dan_preoffercha3(self):
+        """시간외단일가직전매도대비수량3"""
+        return to_number(self._data.get("dan_preoffercha3"))
+
+    @property
+    def dan_prebidcha3(self):
+        """시간외단일가직전매수대비수량3"""
+        return to_number(self._data.get("dan_prebidcha3"))
+
+    @property
+    def dan_offerho4(self):
+        """시간외단일가매도호가4"""
+        return to_number(self._data.get("dan_offerho4"))
+
+    @property
+    def dan_bidho4(self):
+        """시간외단일가매수호가4"""
+        return to_number(self._data.get("dan_bidho4"))
+
+    @property
+    def dan_offerrem4(self):
+        """시간외단일가매도호가잔량4"""
+        return to_number(self._data.get("dan_offerrem4"))
+
+    @property
+    def dan_bidrem4(self):
+        """시간외단일가매수호가잔량4"""
+        return to_number(self._data.get("dan_bidrem4"))
+
+    @property
+    def dan_preoffercha4(self):
+        """시간외단일가직전매도대비수량4"""
+        return to_number(self._data.get("dan_preoffercha4"))
+
+    @property
+    def dan_prebidcha4(self):
+        """시간외단일가직전매수대비수량4"""
+        return to_number(self._data.get("dan_prebidcha4"))
+
+    @property
+    def dan_offerho5(self):
+        """시간외단일가매도호가5"""
+        return to_number(self._data.get("dan_offerho5"))
+
+    @property
+    def dan_bidho5(self):
+        """시간외단일가매수호가5"""
+        return to_number(self._data.get("dan_bidho5"))
+
+    @property
+    def dan_offerrem5(self):
+        """시간외단일가매도호가잔량5"""
+        return to_number(self._data.get("dan_offerrem5"))
+
+    @property
+    def dan_bidrem5(self):
+        """시간외단일가매수호가잔량5"""
+        return to_number(self._data.get("dan_bidrem5"))
+
+    @property
+    def dan_preoffercha5(self):
+        """시간외단일가직전매도대비수량5"""
+        return to_number(self._data.get("dan_preoffercha5"))
+
+    @property
+    def dan_prebidcha5(self):
+        """시간외단일가직전매수대비수량5"""
+        return to_number(self._data.get("dan_prebidcha5"))
+
+    @property
+    def dan_totofferrem(self):
+        """시간외단일가총매도호가잔량"""
+        return to_number(self._data.get("dan_totofferrem"))
+
+    @property
+    def dan_totbidrem(self):
+        """시간외단일가총매수호가잔량"""
+        return to_number(self._data.get("dan_totbidrem"))
+
+    @property
+    def dan_preoffercha(self):
+        """시간외단일가직전매도호가총대비수량"""
+        return to_number(self._data.get("dan_preoffercha"))
+
+    @property
+    def dan_prebidcha(self):
+        """시간외단일가직전매수호가총대비수량"""
+        return to_number(self._data.get("dan_prebidcha"))
+
+    @property
+    def dan_yeprice(self):
+        """시간외단일가예상체결가격"""
+        return to_number(self._data.get("dan_yeprice"))
+
+    @property
+    def dan_yevolume(self):
+        """시간외단일가예상체결수량"""
+        return to_number(self._data.get("dan_yevolume"))
+
+    @property
+    def dan_preysign(self):
+        """시간외단일가예상가직전가대비구분"""
+        return self._data.get("dan_preysign")
+
+    @property
+    def dan_preychange(self):
+        """시간외단일가예상가직전가대비"""
+        return to_number(self._data.get("dan_preychange"))
+
+    @property
+    def dan_jnilysign(self):
+        """시간외단일가예상가전일가대비구분"""
+        return self._data.get("dan_jnilysign")
+
+    @property
+    def dan_jnilychange(self):
+        """시간외단일가예상가전일가대비"""
+        return to_number(self._data.get("dan_jnilychange"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+
+class DK3Tick(RealtimeRecord):
+    """[DK3] KOSDAQ시간외단일가체결"""
+    __slots__ = ()
+    TR_CODE = "DK3"
+    FIELDS = ("dan_chetime", "dan_sign", "dan_change", "dan_drate", "dan_price", "dan_opentime", "dan_open", "dan_hightime", "dan_high", "dan_lowtime", "dan_low", "dan_cgubun", "dan_cvolume", "dan_volume", "dan_value", "dan_mdvolume", "dan_mdchecnt", "dan_msvolume", "dan_mschecnt", "dan_prevolume", "dan_precvolume", "dan_cpower", "dan_status", "shcode")
+
+    @property
+    def dan_chetime(self):
+        """시간외단일가체결시간"""
+        return self._data.get("dan_chetime")
+
+    @property
+    def dan_sign(self):
+        """시간외단일가전일대비구분"""
+        return self._data.get("dan_sign")
+
+    @property
+    def dan_change(self):
+        """시간외단일가전일대비"""
+        return to_number(self._data.get("dan_change"))
+
+    @property
+    def dan_drate(self):
+        """시간외단일가등락율"""
+        return to_float(self._data.get("dan_drate"))
+
+    @property
+    def dan_price(self):
+        """시간외단일가현재가"""
+        return to_number(self._data.get("dan_price"))
+
+    @property
+    def dan_opentime(self):
+        """시간외단일가시가시간"""
+        return self._data.get("dan_opentime")
+
+    @property
+    def dan_open(self):
+        """시간외단일가시가"""
+        return to_number(self._data.get("dan_open"))
+
+    @property
+    def dan_hightime(self):
+        """시간외단일가고가시간"""
+        return self._data.get("dan_hightime")
+
+    @property
+    def dan_high(self):
+        """시간외단일가고가"""
+        return to_number(self._data.get("dan_high"))
+
+    @property
+    def dan_lowtime(self):
+        """시간외단일가저가시간"""
+        return self._data.get("dan_lowtime")
+
+    @property
+    def dan_low(self):
+        """시간외단일가저가"""
+        return to_number(self._data.get("dan_low"))
+
+    @property
+    def dan_cgubun(self):
+        """시간외단일가체결구분"""
+        return self._data.get("dan_cgubun")
+
+    @property
+    def dan_cvolume(self):
+        """시간외단일가체결량"""
+        return to_number(self._data.get("dan_cvolume"))
+
+    @property
+    def dan_volume(self):
+        """시간외단일가누적거래량"""
+        return to_number(self._data.get("dan_volume"))
+
+    @property
+    def dan_value(self):
+        """시간외단일가누적거래대금"""
+        return to_number(self._data.get("dan_value"))
+
+    @property
+    def dan_mdvolume(self):
+        """시간외단일가매도누적체결량"""
+        return to_number(self._data.get("dan_mdvolume"))
+
+    @property
+    def dan_mdchecnt(self):
+        """시간외단일가매도누적체결건수"""
+        return to_number(self._data.get("dan_mdchecnt"))
+
+    @property
+    def dan_msvolume(self):
+        """시간외단일가매수누적체결량"""
+        return to_number(self._data.get("dan_msvolume"))
+
+    @property
+    def dan_mschecnt(self):
+        """시간외단일가매수누적체결건수"""
+        return to_number(self._data.get("dan_mschecnt"))
+
+    @property
+    def dan_prevolume(self):
+        """시간외단일가직전거래량"""
+        return to_number(self._data.get("dan_prevolume"))
+
+    @property
+    def dan_precvolume(self):
+        """시간외단일가직전체결수량"""
+        return to_number(self._data.get("dan_precvolume"))
+
+    @property
+    def dan_cpower(self):
+        """시간외단일가체결강도"""
+        return to_float(self._data.get("dan_cpower"))
+
+    @property
+    def dan_status(self):
+        """시간외단일가장정보"""
+        return self._data.get("dan_status")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class DS3Tick(RealtimeRecord):
+    """[DS3] KOSPI시간외단일가체결"""
+    __slots__ = ()
+    TR_CODE = "DS3"
+    FIELDS = ("dan_chetime", "dan_sign", "dan_change", "dan_drate", "dan_price", "dan_opentime", "dan_open", "dan_hightime", "dan_high", "dan_lowtime", "dan_low", "dan_cgubun", "dan_cvolume", "dan_volume", "dan_value", "dan_mdvolume", "dan_mdchecnt", "dan_msvolume", "dan_mschecnt", "dan_prevolume", "dan_precvolume", "dan_cpower", "dan_status", "shcode")
+
+    @property
+    def dan_chetime(self):
+        """시간외단일가체결시간"""
+        return self._data.get("dan_chetime")
+
+    @property
+    def dan_sign(self):
+        """시간외단일가전일대비구분"""
+        return self._data.get("dan_sign")
+
+    @property
+    def dan_change(self):
+        """시간외단일가전일대비"""
+        return to_number(self._data.get("dan_change"))
+
+    @property
+    def dan_drate(self):
+        """시간외단일가등락율"""
+        return to_float(self._data.get("dan_drate"))
+
+    @property
+    def dan_price(self):
+        """시간외단일가현재가"""
+        return to_number(self._data.get("dan_price"))
+
+    @property
+    def dan_opentime(self):
+        """시간외단일가시가시간"""
+        return self._data.get("dan_opentime")
+
+    @property
+    def dan_open(self):
+        """시간외단일가시가"""
+        return to_number(self._data.get("dan_open"))
+
+    @property
+    def dan_hightime(self):
+        """시간외단일가고가시간"""
+        return self._data.get("dan_hightime")
+
+    @property
+    def dan_high(self):
+        """시간외단일가고가"""
+        return to_number(self._data.get("dan_high"))
+
+    @property
+    def dan_lowtime(self):
+        """시간외단일가저가시간"""
+        return self._data.get("dan_lowtime")
+
+    @property
+    def dan_low(self):
+        """시간외단일가저가"""
+        return to_number(self._data.get("dan_low"))
+
+    @property
+    def dan_cgubun(self):
+        """시간외단일가체결구분"""
+        return self._data.get("dan_cgubun")
+
+    @property
+    def dan_cvolume(self):
+        """시간외단일가체결량"""
+        return to_number(self._data.get("dan_cvolume"))
+
+    @property
+    def dan_volume(self):
+        """시간외단일가누적거래량"""
+        return to_number(self._data.get("dan_volume"))
+
+    @property
+    def dan_value(self):
+        """시간외단일가누적거래대금"""
+        return to_number(self._data.get("dan_value"))
+
+    @property
+    def dan_mdvolume(self):
+        """시간외단일가매도누적체결량"""
+        return to_number(self._data.get("dan_mdvolume"))
+
+    @property
+    def dan_mdchecnt(self):
+        """시간외단일가매도누적체결건수"""
+        return to_number(self._data.get("dan_mdchecnt"))
+
+    @property
+    def dan_msvolume(self):
+        """시간외단일가매수누적체결량"""
+        return to_number(self._data.get("dan_msvolume"))
+
+    @property
+    def dan_mschecnt(self):
+        """시간외단일가매수누적체결건수"""
+        return to_number(self._data.get("dan_mschecnt"))
+
+    @property
+    def dan_prevolume(self):
+        """시간외단일가직전거래량"""
+        return to_number(self._data.get("dan_prevolume"))
+
+    @property
+    def dan_precvolume(self):
+        """시간외단일가직전체결수량"""
+        return to_number(self._data.get("dan_precvolume"))
+
+    @property
+    def dan_cpower(self):
+        """시간외단일가체결강도"""
+        return to_float(self._data.get("dan_cpower"))
+
+    @property
+    def dan_status(self):
+        """시간외단일가장정보"""
+        return self._data.get("dan_status")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class DVITick(RealtimeRecord):
+    """[DVI] 시간외단일가VI발동해제"""
+    __slots__ = ()
+    TR_CODE = "DVI"
+    FIELDS = ("vi_gubun", "svi_recprice", "dvi_recprice", "vi_trgprice", "shcode", "ref_shcode", "time", "exchname")
+
+    @property
+    def vi_gubun(self):
+        """구분(0:해제 1:정적발동 2:동적발동 3:정적&동적)"""
+        return self._data.get("vi_gubun")
+
+    @property
+    def svi_recprice(self):
+        """정적VI발동기준가격"""
+        return to_number(self._data.get("svi_recprice"))
+
+    @property
+    def dvi_recprice(self):
+        """동적VI발동기준가격"""
+        return to_number(self._data.get("dvi_recprice"))
+
+    @property
+    def vi_trgprice(self):
+        """VI발동가격"""
+        return to_number(self._data.get("vi_trgprice"))
+
+    @property
+    def shcode(self):
+        """단축코드(KEY)"""
+        return self._data.get("shcode")
+
+    @property
+    def ref_shcode(self):
+        """참조코드(미사용)"""
+        return self._data.get("ref_shcode")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+
+class H1Tick(RealtimeRecord):
+    """[H1_] KOSPI호가잔량"""
+    __slots__ = ()
+    TR_CODE = "H1_"
+    FIELDS = ("hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offerho6", "bidho6", "offerrem6", "bidrem6", "offerho7", "bidho7", "offerrem7", "bidrem7", "offerho8", "bidho8", "offerrem8", "bidrem8", "offerho9", "bidho9", "offerrem9", "bidrem9", "offerho10", "bidho10", "offerrem10", "bidrem10", "totofferrem", "totbidrem", "donsigubun", "shcode", "alloc_gubun", "volume", "midprice", "offermidsumrem", "bidmidsumrem", "midsumrem", "midsumremgubun")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가잔량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가잔량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_number(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_number(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가잔량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가잔량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_number(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_number(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가잔량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가잔량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_number(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_number(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가잔량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가잔량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_number(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_number(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가잔량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가잔량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_number(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_number(self._data.get("bidho6"))
+
+    @property
+    def offerrem6(self):
+        """매도호가잔량6"""
+        return to_number(self._data.get("offerrem6"))
+
+    @property
+    def bidrem6(self):
+        """매수호가잔량6"""
+        return to_number(self._data.get("bidrem6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_number(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_number(self._data.get("bidho7"))
+
+    @property
+    def offerrem7(self):
+        """매도호가잔량7"""
+        return to_number(self._data.get("offerrem7"))
+
+    @property
+    def bidrem7(self):
+        """매수호가잔량7"""
+        return to_number(self._data.get("bidrem7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_number(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_number(self._data.get("bidho8"))
+
+    @property
+    def offerrem8(self):
+        """매도호가잔량8"""
+        return to_number(self._data.get("offerrem8"))
+
+    @property
+    def bidrem8(self):
+        """매수호가잔량8"""
+        return to_number(self._data.get("bidrem8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_number(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_number(self._data.get("bidho9"))
+
+    @property
+    def offerrem9(self):
+        """매도호가잔량9"""
+        return to_number(self._data.get("offerrem9"))
+
+    @property
+    def bidrem9(self):
+        """매수호가잔량9"""
+        return to_number(self._data.get("bidrem9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_number(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_number(self._data.get("bidho10"))
+
+    @property
+    def offerrem10(self):
+        """매도호가잔량10"""
+        return to_number(self._data.get("offerrem10"))
+
+    @property
+    def bidrem10(self):
+        """매수호가잔량10"""
+        return to_number(self._data.get("bidrem10"))
+
+    @property
+    def totofferrem(self):
+        """총매도호가잔량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """총매수호가잔량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def donsigubun(self):
+        """동시호가구분"""
+        return self._data.get("donsigubun")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def midprice(self):
+        """중간가격  """
+        return to_number(self._data.get("midprice"))
+
+    @property
+    def offermidsumrem(self):
+        """매도중간가잔량합계수량"""
+        return to_number(self._data.get("offermidsumrem"))
+
+    @property
+    def bidmidsumrem(self):
+        """매수중간가잔량합계수량"""
+        return to_number(self._data.get("bidmidsumrem"))
+
+    @property
+    def midsumrem(self):
+        """중간가잔량합계수량"""
+        return to_number(self._data.get("midsumrem"))
+
+    @property
+    def midsumremgubun(self):
+        """중간가잔량구분"""
+        return self._data.get("midsumremgubun")
+
+
+class H2Tick(RealtimeRecord):
+    """[H2_] KOSPI장전시간외호가잔량"""
+    __slots__ = ()
+    TR_CODE = "H2_"
+    FIELDS = ("hotime", "tmofferrem", "tmbidrem", "pretmoffercha", "pretmbidcha", "shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def tmofferrem(self):
+        """시간외매도잔량"""
+        return to_number(self._data.get("tmofferrem"))
+
+    @property
+    def tmbidrem(self):
+        """시간외매수잔량"""
+        return to_number(self._data.get("tmbidrem"))
+
+    @property
+    def pretmoffercha(self):
+        """시간외매도수량직전대비"""
+        return to_number(self._data.get("pretmoffercha"))
+
+    @property
+    def pretmbidcha(self):
+        """시간외매수수량직전대비"""
+        return to_number(self._data.get("pretmbidcha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class HATick(RealtimeRecord):
+    """[HA_] KOSDAQ호가잔량"""
+    __slots__ = ()
+    TR_CODE = "HA_"
+    FIELDS = ("hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offerho6", "bidho6", "offerrem6", "bidrem6", "offerho7", "bidho7", "offerrem7", "bidrem7", "offerho8", "bidho8", "offerrem8", "bidrem8", "offerho9", "bidho9", "offerrem9", "bidrem9", "offerho10", "bidho10", "offerrem10", "bidrem10", "totofferrem", "totbidrem", "donsigubun", "shcode", "alloc_gubun", "volume", "midprice", "offermidsumrem", "bidmidsumrem", "midsumrem", "midsumremgubun")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가잔량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가잔량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_number(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_number(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가잔량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가잔량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_number(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_number(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가잔량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가잔량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_number(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_number(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가잔량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가잔량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_number(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_number(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가잔량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가잔량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_number(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_number(self._data.get("bidho6"))
+
+    @property
+    def offerrem6(self):
+        """매도호가잔량6"""
+        return to_number(self._data.get("offerrem6"))
+
+    @property
+    def bidrem6(self):
+        """매수호가잔량6"""
+        return to_number(self._data.get("bidrem6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_number(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_number(self._data.get("bidho7"))
+
+    @property
+    def offerrem7(self):
+        """매도호가잔량7"""
+        return to_number(self._data.get("offerrem7"))
+
+    @property
+    def bidrem7(self):
+        """매수호가잔량7"""
+        return to_number(self._data.get("bidrem7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_number(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_number(self._data.get("bidho8"))
+
+    @property
+    def offerrem8(self):
+        """매도호가잔량8"""
+        return to_number(self._data.get("offerrem8"))
+
+    @property
+    def bidrem8(self):
+        """매수호가잔량8"""
+        return to_number(self._data.get("bidrem8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_number(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_number(self._data.get("bidho9"))
+
+    @property
+    def offerrem9(self):
+        """매도호가잔량9"""
+        return to_number(self._data.get("offerrem9"))
+
+    @property
+    def bidrem9(self):
+        """매수호가잔량9"""
+        return to_number(self._data.get("bidrem9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_number(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_number(self._data.get("bidho10"))
+
+    @property
+    def offerrem10(self):
+        """매도호가잔량10"""
+        return to_number(self._data.get("offerrem10"))
+
+    @property
+    def bidrem10(self):
+        """매수호가잔량10"""
+        return to_number(self._data.get("bidrem10"))
+
+    @property
+    def totofferrem(self):
+        """총매도호가잔량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """총매수호가잔량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def donsigubun(self):
+        """동시호가구분"""
+        return self._data.get("donsigubun")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def midprice(self):
+        """중간가격 """
+        return to_number(self._data.get("midprice"))
+
+    @property
+    def offermidsumrem(self):
+        """매도중간가잔량합계수량"""
+        return to_number(self._data.get("offermidsumrem"))
+
+    @property
+    def bidmidsumrem(self):
+        """매수중간가잔량합계수량"""
+        return to_number(self._data.get("bidmidsumrem"))
+
+    @property
+    def midsumrem(self):
+        """중간가잔량합계수량"""
+        return to_number(self._data.get("midsumrem"))
+
+    @property
+    def midsumremgubun(self):
+        """중간가잔량구분"""
+        return self._data.get("midsumremgubun")
+
+
+class HBTick(RealtimeRecord):
+    """[HB_] KOSDAQ장전시간외호가잔량"""
+    __slots__ = ()
+    TR_CODE = "HB_"
+    FIELDS = ("hotime", "tmofferrem", "tmbidrem", "pretmoffercha", "pretmbidcha", "shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def tmofferrem(self):
+        """시간외매도잔량"""
+        return to_number(self._data.get("tmofferrem"))
+
+    @property
+    def tmbidrem(self):
+        """시간외매수잔량"""
+        return to_number(self._data.get("tmbidrem"))
+
+    @property
+    def pretmoffercha(self):
+        """시간외매도수량직전대비"""
+        return to_number(self._data.get("pretmoffercha"))
+
+    @property
+    def pretmbidcha(self):
+        """시간외매수수량직전대비"""
+        return to_number(self._data.get("pretmbidcha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class I5Tick(RealtimeRecord):
+    """[I5_] 코스피ETF종목실시간NAV"""
+    __slots__ = ()
+    TR_CODE = "I5_"
+    FIELDS = ("time", "price", "sign", "change", "volume", "navdiff", "nav", "navchange", "crate", "grate", "jisu", "jichange", "jirate", "shcode")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def navdiff(self):
+        """NAV대비"""
+        return to_float(self._data.get("navdiff"))
+
+    @property
+    def nav(self):
+        """NAV"""
+        return to_float(self._data.get("nav"))
+
+    @property
+    def navchange(self):
+        """전일대비"""
+        return to_float(self._data.get("navchange"))
+
+    @property
+    def crate(self):
+        """추적오차"""
+        return to_float(self._data.get("crate"))
+
+    @property
+    def grate(self):
+        """괴리"""
+        return to_float(self._data.get("grate"))
+
+    @property
+    def jisu(self):
+        """지수"""
+        return to_float(self._data.get("jisu"))
+
+    @property
+    def jichange(self):
+        """전일대비"""
+        return to_float(self._data.get("jichange"))
+
+    @property
+    def jirate(self):
+        """전일대비율"""
+        return to_float(self._data.get("jirate"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class IJTick(RealtimeRecord):
+    """[IJ_] 지수"""
+    __slots__ = ()
+    TR_CODE = "IJ_"
+    FIELDS = ("time", "jisu", "sign", "change", "drate", "cvolume", "volume", "value", "upjo", "highjo", "unchgjo", "lowjo", "downjo", "upjrate", "openjisu", "opentime", "highjisu", "hightime", "lowjisu", "lowtime", "frgsvolume", "orgsvolume", "frgsvalue", "orgsvalue", "upcode")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def jisu(self):
+        """지수"""
+        return to_float(self._data.get("jisu"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def upjo(self):
+        """상한종목수"""
+        return to_number(self._data.get("upjo"))
+
+    @property
+    def highjo(self):
+        """상승종목수"""
+        return to_number(self._data.get("highjo"))
+
+    @property
+    def unchgjo(self):
+        """보합종목수"""
+        return to_number(self._data.get("unchgjo"))
+
+    @property
+    def lowjo(self):
+        """하락종목수"""
+        return to_number(self._data.get("lowjo"))
+
+    @property
+    def downjo(self):
+        """하한종목수"""
+        return to_number(self._data.get("downjo"))
+
+    @property
+    def upjrate(self):
+        """상승종목비율"""
+        return to_float(self._data.get("upjrate"))
+
+    @property
+    def openjisu(self):
+        """시가지수"""
+        return to_float(self._data.get("openjisu"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return self._data.get("opentime")
+
+    @property
+    def highjisu(self):
+        """고가지수"""
+        return to_float(self._data.get("highjisu"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return self._data.get("hightime")
+
+    @property
+    def lowjisu(self):
+        """저가지수"""
+        return to_float(self._data.get("lowjisu"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def frgsvolume(self):
+        """외인순매수수량"""
+        return to_number(self._data.get("frgsvolume"))
+
+    @property
+    def orgsvolume(self):
+        """기관순매수수량"""
+        return to_number(self._data.get("orgsvolume"))
+
+    @property
+    def frgsvalue(self):
+        """외인순매수금액"""
+        return to_number(self._data.get("frgsvalue"))
+
+    @property
+    def orgsvalue(self):
+        """기관순매수금액"""
+        return to_number(self._data.get("orgsvalue"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+
+class K1Tick(RealtimeRecord):
+    """[K1_] KOSPI거래원"""
+    __slots__ = ()
+    TR_CODE = "K1_"
+    FIELDS = ("offerno1", "bidno1", "offertrad1", "bidtrad1", "tradmdvol1", "tradmsvol1", "tradmdrate1", "tradmsrate1", "tradmdcha1", "tradmscha1", "offerno2", "bidno2", "offertrad2", "bidtrad2", "tradmdvol2", "tradmsvol2", "tradmdrate2", "tradmsrate2", "tradmdcha2", "tradmscha2", "offerno3", "bidno3", "offertrad3", "bidtrad3", "tradmdvol3", "tradmsvol3", "tradmdrate3", "tradmsrate3", "tradmdcha3", "tradmscha3", "offerno4", "bidno4", "offertrad4", "bidtrad4", "tradmdvol4", "tradmsvol4", "tradmdrate4", "tradmsrate4", "tradmdcha4", "tradmscha4", "offerno5", "bidno5", "offertrad5", "bidtrad5", "tradmdvol5", "tradmsvol5", "tradmdrate5", "tradmsrate5", "tradmdcha5", "tradmscha5", "ftradmdvol", "ftradmsvol", "ftradmdrate", "ftradmsrate", "ftradmdcha", "ftradmscha", "shcode", "tradmdval1", "tradmsval1", "tradmdavg1", "tradmsavg1", "tradmdval2", "tradmsval2", "tradmdavg2", "tradmsavg2", "tradmdval3", "tradmsval3", "tradmdavg3", "tradmsavg3", "tradmdval4", "tradmsval4", "tradmdavg4", "tradmsavg4", "tradmdval5", "tradmsval5", "tradmdavg5", "tradmsavg5", "ftradmdval", "ftradmsval", "ftradmdavg", "ftradmsavg")
+
+    @property
+    def offerno1(self):
+        """매도증권사코드1"""
+        return self._data.get("offerno1")
+
+    @property
+    def bidno1(self):
+        """매수증권사코드1"""
+        return self._data.get("bidno1")
+
+    @property
+    def offertrad1(self):
+        """매도회원사명1"""
+        return self._data.get("offertrad1")
+
+    @property
+    def bidtrad1(self):
+        """매수회원사명1"""
+        return self._data.get("bidtrad1")
+
+    @property
+    def tradmdvol1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("tradmdvol1"))
+
+    @property
+    def tradmsvol1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("tradmsvol1"))
+
+    @property
+    def tradmdrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmdrate1"))
+
+    @property
+    def tradmsrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmsrate1"))
+
+    @property
+    def tradmdcha1(self):
+        """매도거래량직전대비1"""
+        return to_number(self._data.get("tradmdcha1"))
+
+    @property
+    def tradmscha1(self):
+        """매수거래량직전대비1"""
+        return to_number(self._data.get("tradmscha1"))
+
+    @property
+    def offerno2(self):
+        """매도증권사코드2"""
+        return self._data.get("offerno2")
+
+    @property
+    def bidno2(self):
+        """매수증권사코드2"""
+        return self._data.get("bidno2")
+
+    @property
+    def offertrad2(self):
+        """매도회원사명2"""
+        return self._data.get("offertrad2")
+
+    @property
+    def bidtrad2(self):
+        """매수회원사명2"""
+        return self._data.get("bidtrad2")
+
+    @property
+    def tradmdvol2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("tradmdvol2"))
+
+    @property
+    def tradmsvol2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("tradmsvol2"))
+
+    @property
+    def tradmdrate2(self):
+        """매도거래량비중2"""
+        return to_float(self._data.get("tradmdrate2"))
+
+    @property
+    def tradmsrate2(self):
+        """매수거래량비중2"""
+        return to_float(self._data.get("tradmsrate2"))
+
+    @property
+    def tradmdcha2(self):
+        """매도거래량직전대비2"""
+        return to_number(self._data.get("tradmdcha2"))
+
+    @property
+    def tradmscha2(self):
+        """매수거래량직전대비2"""
+        return to_number(self._data.get("tradmscha2"))
+
+    @property
+    def offerno3(self):
+        """매도증권사코드3"""
+        return self._data.get("offerno3")
+
+    @property
+    def bidno3(self):
+        """매수증권사코드3"""
+        return self._data.get("bidno3")
+
+    @property
+    def offertrad3(self):
+        """매도회원사명3"""
+        return self._data.get("offertrad3")
+
+    @property
+    def bidtrad3(self):
+        """매수회원사명3"""
+        return self._data.get("bidtrad3")
+
+    @property
+    def tradmdvol3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("tradmdvol3"))
+
+    @property
+    def tradmsvol3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("tradmsvol3"))
+
+    @property
+    def tradmdrate3(self):
+        """매도거래량비중3"""
+        return to_float(self._data.get("tradmdrate3"))
+
+    @property
+    def tradmsrate3(self):
+        """매수거래량비중3"""
+        return to_float(self._data.get("tradmsrate3"))
+
+    @property
+    def tradmdcha3(self):
+        """매도거래량직전대비3"""
+        return to_number(self._data.get("tradmdcha3"))
+
+    @property
+    def tradmscha3(self):
+        """매수거래량직전대비3"""
+        return to_number(self._data.get("tradmscha3"))
+
+    @property
+    def offerno4(self):
+        """매도증권사코드4"""
+        return self._data.get("offerno4")
+
+    @property
+    def bidno4(self):
+        """매수증권사코드4"""
+        return self._data.get("bidno4")
+
+    @property
+    def offertrad4(self):
+        """매도회원사명4"""
+        return self._data.get("offertrad4")
+
+    @property
+    def bidtrad4(self):
+        """매수회원사명4"""
+        return self._data.get("bidtrad4")
+
+    @property
+    def tradmdvol4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("tradmdvol4"))
+
+    @property
+    def tradmsvol4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("tradmsvol4"))
+
+    @property
+    def tradmdrate4(self):
+        """매도거래량비중4"""
+        return to_float(self._data.get("tradmdrate4"))
+
+    @property
+    def tradmsrate4(self):
+        """매수거래량비중4"""
+        return to_float(self._data.get("tradmsrate4"))
+
+    @property
+    def tradmdcha4(self):
+        """매도거래량직전대비4"""
+        return to_number(self._data.get("tradmdcha4"))
+
+    @property
+    def tradmscha4(self):
+        """매수거래량직전대비4"""
+        return to_number(self._data.get("tradmscha4"))
+
+    @property
+    def offerno5(self):
+        """매도증권사코드5"""
+        return self._data.get("offerno5")
+
+    @property
+    def bidno5(self):
+        """매수증권사코드5"""
+        return self._data.get("bidno5")
+
+    @property
+    def offertrad5(self):
+        """매도회원사명5"""
+        return self._data.get("offertrad5")
+
+    @property
+    def bidtrad5(self):
+        """매수회원사명5"""
+        return self._data.get("bidtrad5")
+
+    @property
+    def tradmdvol5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("tradmdvol5"))
+
+    @property
+    def tradmsvol5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("tradmsvol5"))
+
+    @property
+    def tradmdrate5(self):
+        """매도거래량비중5"""
+        return to_float(self._data.get("tradmdrate5"))
+
+    @property
+    def tradmsrate5(self):
+        """매수거래량비중5"""
+        return to_float(self._data.get("tradmsrate5"))
+
+    @property
+    def tradmdcha5(self):
+        """매도거래량직전대비5"""
+        return to_number(self._data.get("tradmdcha5"))
+
+    @property
+    def tradmscha5(self):
+        """매수거래량직전대비5"""
+        return to_number(self._data.get("tradmscha5"))
+
+    @property
+    def ftradmdvol(self):
+        """외국계증권사매도합계"""
+        return to_number(self._data.get("ftradmdvol"))
+
+    @property
+    def ftradmsvol(self):
+        """외국계증권사매수합계"""
+        return to_number(self._data.get("ftradmsvol"))
+
+    @property
+    def ftradmdrate(self):
+        """외국계증권사매도거래량비중"""
+        return to_float(self._data.get("ftradmdrate"))
+
+    @property
+    def ftradmsrate(self):
+        """외국계증권사매수거래량비중"""
+        return to_float(self._data.get("ftradmsrate"))
+
+    @property
+    def ftradmdcha(self):
+        """외국계증권사매도거래량직전대비"""
+        return to_number(self._data.get("ftradmdcha"))
+
+    @property
+    def ftradmscha(self):
+        """외국계증권사매수거래량직전대비"""
+        return to_number(self._data.get("ftradmscha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def tradmdval1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("tradmdval1"))
+
+    @property
+    def tradmsval1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("tradmsval1"))
+
+    @property
+    def tradmdavg1(self):
+        """매도평균단가1"""
+        return to_number(self._data.get("tradmdavg1"))
+
+    @property
+    def tradmsavg1(self):
+        """매수평균단가1"""
+        return to_number(self._data.get("tradmsavg1"))
+
+    @property
+    def tradmdval2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("tradmdval2"))
+
+    @property
+    def tradmsval2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("tradmsval2"))
+
+    @property
+    def tradmdavg2(self):
+        """매도평균단가2"""
+        return to_number(self._data.get("tradmdavg2"))
+
+    @property
+    def tradmsavg2(self):
+        """매수평균단가2"""
+        return to_number(self._data.get("tradmsavg2"))
+
+    @property
+    def tradmdval3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("tradmdval3"))
+
+    @property
+    def tradmsval3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("tradmsval3"))
+
+    @property
+    def tradmdavg3(self):
+        """매도평균단가3"""
+        return to_number(self._data.get("tradmdavg3"))
+
+    @property
+    def tradmsavg3(self):
+        """매수평균단가3"""
+        return to_number(self._data.get("tradmsavg3"))
+
+    @property
+    def tradmdval4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("tradmdval4"))
+
+    @property
+    def tradmsval4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("tradmsval4"))
+
+    @property
+    def tradmdavg4(self):
+        """매도평균단가4"""
+        return to_number(self._data.get("tradmdavg4"))
+
+    @property
+    def tradmsavg4(self):
+        """매수평균단가4"""
+        return to_number(self._data.get("tradmsavg4"))
+
+    @property
+    def tradmdval5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("tradmdval5"))
+
+    @property
+    def tradmsval5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("tradmsval5"))
+
+    @property
+    def tradmdavg5(self):
+        """매도평균단가5"""
+        return to_number(self._data.get("tradmdavg5"))
+
+    @property
+    def tradmsavg5(self):
+        """매수평균단가5"""
+        return to_number(self._data.get("tradmsavg5"))
+
+    @property
+    def ftradmdval(self):
+        """외국계증권사매도거래대금"""
+        return to_number(self._data.get("ftradmdval"))
+
+    @property
+    def ftradmsval(self):
+        """외국계증권사매수거래대금"""
+        return to_number(self._data.get("ftradmsval"))
+
+    @property
+    def ftradmdavg(self):
+        """외국계증권사매도평균단가"""
+        return to_number(self._data.get("ftradmdavg"))
+
+    @property
+    def ftradmsavg(self):
+        """외국계증권사매수평균단가"""
+        return to_number(self._data.get("ftradmsavg"))
+
+
+class K3Tick(RealtimeRecord):
+    """[K3_] KOSDAQ체결"""
+    __slots__ = ()
+    TR_CODE = "K3_"
+    FIELDS = ("chetime", "sign", "change", "drate", "price", "opentime", "open", "hightime", "high", "lowtime", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "w_avrg", "offerho", "bidho", "status", "jnilvolume", "shcode", "exchname")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return self._data.get("opentime")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return self._data.get("hightime")
+
+    @property
+    def high(self):
+        """고가"""
+        return to_number(self._data.get("high"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def w_avrg(self):
+        """가중평균가"""
+        return to_number(self._data.get("w_avrg"))
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def status(self):
+        """장정보"""
+        return self._data.get("status")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+
+class KHTick(RealtimeRecord):
+    """[KH_] KOSDAQ프로그램매매종목별"""
+    __slots__ = ()
+    TR_CODE = "KH_"
+    FIELDS = ("time", "price", "sign", "change", "volume", "drate", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "dwcvolume", "swcvolume", "djcvolume", "sjcvolume", "tdvolume", "tsvolume", "tvol", "dwcvalue", "swcvalue", "djcvalue", "sjcvalue", "tdvalue", "tsvalue", "tval", "pdgvolume", "psgvolume", "shcode")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def cdhrem(self):
+        """차익매도호가 잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가 잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가 잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가 잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가 수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가 수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가 수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가 수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def dwcvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwcvolume"))
+
+    @property
+    def swcvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swcvolume"))
+
+    @property
+    def djcvolume(self):
+        """전체매도자기체결수량"""
+        return to_number(self._data.get("djcvolume"))
+
+    @property
+    def sjcvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjcvolume"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수 수량"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def dwcvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwcvalue"))
+
+    @property
+    def swcvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swcvalue"))
+
+    @property
+    def djcvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djcvalue"))
+
+    @property
+    def sjcvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjcvalue"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수 금액"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def pdgvolume(self):
+        """매도 사전공시수량"""
+        return to_number(self._data.get("pdgvolume"))
+
+    @property
+    def psgvolume(self):
+        """매수 사전공시수량"""
+        return to_number(self._data.get("psgvolume"))
+
+    @property
+    def shcode(self):
+        """종목코드"""
+        return self._data.get("shcode")
+
+
+class KMTick(RealtimeRecord):
+    """[KM_] KOSDAQ프로그램매매전체집계"""
+    __slots__ = ()
+    TR_CODE = "KM_"
+    FIELDS = ("time", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "cdwvolume", "cdjvolume", "cswvolume", "csjvolume", "cwvol", "cjvol", "bdwvolume", "bdjvolume", "bswvolume", "bsjvolume", "bwvol", "bjvol", "dwvolume", "swvolume", "wvol", "djvolume", "sjvolume", "jvol", "cdwvalue", "cdjvalue", "cswvalue", "csjvalue", "cwval", "cjval", "bdwvalue", "bdjvalue", "bswvalue", "bsjvalue", "bwval", "bjval", "dwvalue", "swvalue", "wval", "djvalue", "sjvalue", "jval", "k50jisu", "k50sign", "change", "k50basis", "cdvolume", "csvolume", "cvol", "bdvolume", "bsvolume", "bvol", "tdvolume", "tsvolume", "tvol", "cdvalue", "csvalue", "cval", "bdvalue", "bsvalue", "bval", "tdvalue", "tsvalue", "tval", "p_cdvolcha", "p_csvolcha", "p_cvolcha", "p_bdvolcha", "p_bsvolcha", "p_bvolcha", "p_tdvolcha", "p_tsvolcha", "p_tvolcha", "p_cdvalcha", "p_csvalcha", "p_cvalcha", "p_bdvalcha", "p_bsvalcha", "p_bvalcha", "p_tdvalcha", "p_tsvalcha", "p_tvalcha", "gubun")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def cdhrem(self):
+        """차익매도호가 잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가 잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가 잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가 잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가 수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가 수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가 수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가 수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def cdwvolume(self):
+        """차익매도위탁체결수량"""
+        return to_number(self._data.get("cdwvolume"))
+
+    @property
+    def cdjvolume(self):
+        """차익매도자기체결수량"""
+        return to_number(self._data.get("cdjvolume"))
+
+    @property
+    def cswvolume(self):
+        """차익매수위탁체결수량"""
+        return to_number(self._data.get("cswvolume"))
+
+    @property
+    def csjvolume(self):
+        """차익매수자기체결수량"""
+        return to_number(self._data.get("csjvolume"))
+
+    @property
+    def cwvol(self):
+        """차익위탁순매수 수량"""
+        return to_number(self._data.get("cwvol"))
+
+    @property
+    def cjvol(self):
+        """차익자기순매수 수량"""
+        return to_number(self._data.get("cjvol"))
+
+    @property
+    def bdwvolume(self):
+        """비차익매도위탁체결수량"""
+        return to_number(self._data.get("bdwvolume"))
+
+    @property
+    def bdjvolume(self):
+        """비차익매도자기체결수량"""
+        return to_number(self._data.get("bdjvolume"))
+
+    @property
+    def bswvolume(self):
+        """비차익매수위탁체결수량"""
+        return to_number(self._data.get("bswvolume"))
+
+    @property
+    def bsjvolume(self):
+        """비차익매수자기체결수량"""
+        return to_number(self._data.get("bsjvolume"))
+
+    @property
+    def bwvol(self):
+        """비차익위탁순매수 수량"""
+        return to_number(self._data.get("bwvol"))
+
+    @property
+    def bjvol(self):
+        """비차익자기순매수 수량"""
+        return to_number(self._data.get("bjvol"))
+
+    @property
+    def dwvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwvolume"))
+
+    @property
+    def swvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swvolume"))
+
+    @property
+    def wvol(self):
+        """전체위탁순매수 수량"""
+        return to_number(self._data.get("wvol"))
+
+    @property
+    def djvolume(self):
+        """전체매도자기체결수량"""
+        return to_number(self._data.get("djvolume"))
+
+    @property
+    def sjvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjvolume"))
+
+    @property
+    def jvol(self):
+        """전체자기순매수 수량"""
+        return to_number(self._data.get("jvol"))
+
+    @property
+    def cdwvalue(self):
+        """차익매도위탁체결금액"""
+        return to_number(self._data.get("cdwvalue"))
+
+    @property
+    def cdjvalue(self):
+        """차익매도자기체결금액"""
+        return to_number(self._data.get("cdjvalue"))
+
+    @property
+    def cswvalue(self):
+        """차익매수위탁체결금액"""
+        return to_number(self._data.get("cswvalue"))
+
+    @property
+    def csjvalue(self):
+        """차익매수자기체결금액"""
+        return to_number(self._data.get("csjvalue"))
+
+    @property
+    def cwval(self):
+        """차익위탁순매수 금액"""
+        return to_number(self._data.get("cwval"))
+
+    @property
+    def cjval(self):
+        """차익자기순매수 금액"""
+        return to_number(self._data.get("cjval"))
+
+    @property
+    def bdwvalue(self):
+        """비차익매도위탁체결금액"""
+        return to_number(self._data.get("bdwvalue"))
+
+    @property
+    def bdjvalue(self):
+        """비차익매도자기체결금액"""
+        return to_number(self._data.get("bdjvalue"))
+
+    @property
+    def bswvalue(self):
+        """비차익매수위탁체결금액"""
+        return to_number(self._data.get("bswvalue"))
+
+    @property
+    def bsjvalue(self):
+        """비차익매수자기체결금액"""
+        return to_number(self._data.get("bsjvalue"))
+
+    @property
+    def bwval(self):
+        """비차익위탁순매수 금액"""
+        return to_number(self._data.get("bwval"))
+
+    @property
+    def bjval(self):
+        """비차익자기순매수 금액"""
+        return to_number(self._data.get("bjval"))
+
+    @property
+    def dwvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwvalue"))
+
+    @property
+    def swvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swvalue"))
+
+    @property
+    def wval(self):
+        """전체위탁순매수 금액"""
+        return to_number(self._data.get("wval"))
+
+    @property
+    def djvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djvalue"))
+
+    @property
+    def sjvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjvalue"))
+
+    @property
+    def jval(self):
+        """전체자기순매수 금액"""
+        return to_number(self._data.get("jval"))
+
+    @property
+    def k50jisu(self):
+        """KOSDAQ50 지수"""
+        return to_float(self._data.get("k50jisu"))
+
+    @property
+    def k50sign(self):
+        """KOSDAQ50 전일대비구분"""
+        return self._data.get("k50sign")
+
+    @property
+    def change(self):
+        """KOSDAQ50 전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def k50basis(self):
+        """KOSDAQ50 베이시스"""
+        return to_float(self._data.get("k50basis"))
+
+    @property
+    def cdvolume(self):
+        """차익매도체결수량합계"""
+        return to_number(self._data.get("cdvolume"))
+
+    @property
+    def csvolume(self):
+        """차익매수체결수량합계"""
+        return to_number(self._data.get("csvolume"))
+
+    @property
+    def cvol(self):
+        """차익순매수 수량합계"""
+        return to_number(self._data.get("cvol"))
+
+    @property
+    def bdvolume(self):
+        """비차익매도체결수량합계"""
+        return to_number(self._data.get("bdvolume"))
+
+    @property
+    def bsvolume(self):
+        """비차익매수체결수량합계"""
+        return to_number(self._data.get("bsvolume"))
+
+    @property
+    def bvol(self):
+        """비차익순매수 수량합계"""
+        return to_number(self._data.get("bvol"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량합계"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량합계"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수 수량합계"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def cdvalue(self):
+        """차익매도체결금액합계"""
+        return to_number(self._data.get("cdvalue"))
+
+    @property
+    def csvalue(self):
+        """차익매수체결금액합계"""
+        return to_number(self._data.get("csvalue"))
+
+    @property
+    def cval(self):
+        """차익순매수 금액합계"""
+        return to_number(self._data.get("cval"))
+
+    @property
+    def bdvalue(self):
+        """비차익매도체결금액합계"""
+        return to_number(self._data.get("bdvalue"))
+
+    @property
+    def bsvalue(self):
+        """비차익매수체결금액합계"""
+        return to_number(self._data.get("bsvalue"))
+
+    @property
+    def bval(self):
+        """비차익순매수 금액합계"""
+        return to_number(self._data.get("bval"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액합계"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액합계"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수 금액합계"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def p_cdvolcha(self):
+        """차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_cdvolcha"))
+
+    @property
+    def p_csvolcha(self):
+        """차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_csvolcha"))
+
+    @property
+    def p_cvolcha(self):
+        """차익순매수 수량직전대비"""
+        return to_number(self._data.get("p_cvolcha"))
+
+    @property
+    def p_bdvolcha(self):
+        """비차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_bdvolcha"))
+
+    @property
+    def p_bsvolcha(self):
+        """비차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_bsvolcha"))
+
+    @property
+    def p_bvolcha(self):
+        """비차익순매수 수량직전대비"""
+        return to_number(self._data.get("p_bvolcha"))
+
+    @property
+    def p_tdvolcha(self):
+        """전체매도체결수량직전대비"""
+        return to_number(self._data.get("p_tdvolcha"))
+
+    @property
+    def p_tsvolcha(self):
+        """전체매수체결수량직전대비"""
+        return to_number(self._data.get("p_tsvolcha"))
+
+    @property
+    def p_tvolcha(self):
+        """전체순매수 수량직전대비"""
+        return to_number(self._data.get("p_tvolcha"))
+
+    @property
+    def p_cdvalcha(self):
+        """차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_cdvalcha"))
+
+    @property
+    def p_csvalcha(self):
+        """차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_csvalcha"))
+
+    @property
+    def p_cvalcha(self):
+        """차익순매수 금액직전대비"""
+        return to_number(self._data.get("p_cvalcha"))
+
+    @property
+    def p_bdvalcha(self):
+        """비차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_bdvalcha"))
+
+    @property
+    def p_bsvalcha(self):
+        """비차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_bsvalcha"))
+
+    @property
+    def p_bvalcha(self):
+        """비차익순매수 금액직전대비"""
+        return to_number(self._data.get("p_bvalcha"))
+
+    @property
+    def p_tdvalcha(self):
+        """전체매도체결금액직전대비"""
+        return to_number(self._data.get("p_tdvalcha"))
+
+    @property
+    def p_tsvalcha(self):
+        """전체매수체결금액직전대비"""
+        return to_number(self._data.get("p_tsvalcha"))
+
+    @property
+    def p_tvalcha(self):
+        """전체순매수 금액직전대비"""
+        return to_number(self._data.get("p_tvalcha"))
+
+    @property
+    def gubun(self):
+        """구분값"""
+        return self._data.get("gubun")
+
+
+class KSTick(RealtimeRecord):
+    """[KS_] KOSDAQ우선호가"""
+    __slots__ = ()
+    TR_CODE = "KS_"
+    FIELDS = ("offerho", "bidho", "shcode")
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class OKTick(RealtimeRecord):
+    """[OK_] KOSDAQ거래원"""
+    __slots__ = ()
+    TR_CODE = "OK_"
+    FIELDS = ("offerno1", "bidno1", "offertrad1", "bidtrad1", "tradmdvol1", "tradmsvol1", "tradmdrate1", "tradmsrate1", "tradmdcha1", "tradmscha1", "offerno2", "bidno2", "offertrad2", "bidtrad2", "tradmdvol2", "tradmsvol2", "tradmdrate2", "tradmsrate2", "tradmdcha2", "tradmscha2", "offerno3", "bidno3", "offertrad3", "bidtrad3", "tradmdvol3", "tradmsvol3", "tradmdrate3", "tradmsrate3", "tradmdcha3", "tradmscha3", "offerno4", "bidno4", "offertrad4", "bidtrad4", "tradmdvol4", "tradmsvol4", "tradmdrate4", "tradmsrate4", "tradmdcha4", "tradmscha4", "offerno5", "bidno5", "offertrad5", "bidtrad5", "tradmdvol5", "tradmsvol5", "tradmdrate5", "tradmsrate5", "tradmdcha5", "tradmscha5", "ftradmdvol", "ftradmsvol", "ftradmdrate", "ftradmsrate", "ftradmdcha", "ftradmscha", "shcode", "tradmdval1", "tradmsval1", "tradmdavg1", "tradmsavg1", "tradmdval2", "tradmsval2", "tradmdavg2", "tradmsavg2", "tradmdval3", "tradmsval3", "tradmdavg3", "tradmsavg3", "tradmdval4", "tradmsval4", "tradmdavg4", "tradmsavg4", "tradmdval5", "tradmsval5", "tradmdavg5", "tradmsavg5", "ftradmdval", "ftradmsval", "ftradmdavg", "ftradmsavg")
+
+    @property
+    def offerno1(self):
+        """매도증권사코드1"""
+        return self._data.get("offerno1")
+
+    @property
+    def bidno1(self):
+        """매수증권사코드1"""
+        return self._data.get("bidno1")
+
+    @property
+    def offertrad1(self):
+        """매도회원사명1"""
+        return self._data.get("offertrad1")
+
+    @property
+    def bidtrad1(self):
+        """매수회원사명1"""
+        return self._data.get("bidtrad1")
+
+    @property
+    def tradmdvol1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("tradmdvol1"))
+
+    @property
+    def tradmsvol1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("tradmsvol1"))
+
+    @property
+    def tradmdrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmdrate1"))
+
+    @property
+    def tradmsrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmsrate1"))
+
+    @property
+    def tradmdcha1(self):
+        """매도거래량직전대비1"""
+        return to_number(self._data.get("tradmdcha1"))
+
+    @property
+    def tradmscha1(self):
+        """매수거래량직전대비1"""
+        return to_number(self._data.get("tradmscha1"))
+
+    @property
+    def offerno2(self):
+        """매도증권사코드2"""
+        return self._data.get("offerno2")
+
+    @property
+    def bidno2(self):
+        """매수증권사코드2"""
+        return self._data.get("bidno2")
+
+    @property
+    def offertrad2(self):
+        """매도회원사명2"""
+        return self._data.get("offertrad2")
+
+    @property
+    def bidtrad2(self):
+        """매수회원사명2"""
+        return self._data.get("bidtrad2")
+
+    @property
+    def tradmdvol2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("tradmdvol2"))
+
+    @property
+    def tradmsvol2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("tradmsvol2"))
+
+    @property
+    def tradmdrate2(self):
+        """매도거래량비중2"""
+        return to_float(self._data.get("tradmdrate2"))
+
+    @property
+    def tradmsrate2(self):
+        """매수거래량비중2"""
+        return to_float(self._data.get("tradmsrate2"))
+
+    @property
+    def tradmdcha2(self):
+        """매도거래량직전대비2"""
+        return to_number(self._data.get("tradmdcha2"))
+
+    @property
+    def tradmscha2(self):
+        """매수거래량직전대비2"""
+        return to_number(self._data.get("tradmscha2"))
+
+    @property
+    def offerno3(self):
+        """매도증권사코드3"""
+        return self._data.get("offerno3")
+
+    @property
+    def bidno3(self):
+        """매수증권사코드3"""
+        return self._data.get("bidno3")
+
+    @property
+    def offertrad3(self):
+        """매도회원사명3"""
+        return self._data.get("offertrad3")
+
+    @property
+    def bidtrad3(self):
+        """매수회원사명3"""
+        return self._data.get("bidtrad3")
+
+    @property
+    def tradmdvol3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("tradmdvol3"))
+
+    @property
+    def tradmsvol3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("tradmsvol3"))
+
+    @property
+    def tradmdrate3(self):
+        """매도거래량비중3"""
+        return to_float(self._data.get("tradmdrate3"))
+
+    @property
+    def tradmsrate3(self):
+        """매수거래량비중3"""
+        return to_float(self._data.get("tradmsrate3"))
+
+    @property
+    def tradmdcha3(self):
+        """매도거래량직전대비3"""
+        return to_number(self._data.get("tradmdcha3"))
+
+    @property
+    def tradmscha3(self):
+        """매수거래량직전대비3"""
+        return to_number(self._data.get("tradmscha3"))
+
+    @property
+    def offerno4(self):
+        """매도증권사코드4"""
+        return self._data.get("offerno4")
+
+    @property
+    def bidno4(self):
+        """매수증권사코드4"""
+        return self._data.get("bidno4")
+
+    @property
+    def offertrad4(self):
+        """매도회원사명4"""
+        return self._data.get("offertrad4")
+
+    @property
+    def bidtrad4(self):
+        """매수회원사명4"""
+        return self._data.get("bidtrad4")
+
+    @property
+    def tradmdvol4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("tradmdvol4"))
+
+    @property
+    def tradmsvol4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("tradmsvol4"))
+
+    @property
+    def tradmdrate4(self):
+        """매도거래량비중4"""
+        return to_float(self._data.get("tradmdrate4"))
+
+    @property
+    def tradmsrate4(self):
+        """매수거래량비중4"""
+        return to_float(self._data.get("tradmsrate4"))
+
+    @property
+    def tradmdcha4(self):
+        """매도거래량직전대비4"""
+        return to_number(self._data.get("tradmdcha4"))
+
+    @property
+    def tradmscha4(self):
+        """매수거래량직전대비4"""
+        return to_number(self._data.get("tradmscha4"))
+
+    @property
+    def offerno5(self):
+        """매도증권사코드5"""
+        return self._data.get("offerno5")
+
+    @property
+    def bidno5(self):
+        """매수증권사코드5"""
+        return self._data.get("bidno5")
+
+    @property
+    def offertrad5(self):
+        """매도회원사명5"""
+        return self._data.get("offertrad5")
+
+    @property
+    def bidtrad5(self):
+        """매수회원사명5"""
+        return self._data.get("bidtrad5")
+
+    @property
+    def tradmdvol5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("tradmdvol5"))
+
+    @property
+    def tradmsvol5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("tradmsvol5"))
+
+    @property
+    def tradmdrate5(self):
+        """매도거래량비중5"""
+        return to_float(self._data.get("tradmdrate5"))
+
+    @property
+    def tradmsrate5(self):
+        """매수거래량비중5"""
+        return to_float(self._data.get("tradmsrate5"))
+
+    @property
+    def tradmdcha5(self):
+        """매도거래량직전대비5"""
+        return to_number(self._data.get("tradmdcha5"))
+
+    @property
+    def tradmscha5(self):
+        """매수거래량직전대비5"""
+        return to_number(self._data.get("tradmscha5"))
+
+    @property
+    def ftradmdvol(self):
+        """외국계증권사매도합계"""
+        return to_number(self._data.get("ftradmdvol"))
+
+    @property
+    def ftradmsvol(self):
+        """외국계증권사매수합계"""
+        return to_number(self._data.get("ftradmsvol"))
+
+    @property
+    def ftradmdrate(self):
+        """외국계증권사매도거래량비중"""
+        return to_float(self._data.get("ftradmdrate"))
+
+    @property
+    def ftradmsrate(self):
+        """외국계증권사매수거래량비중"""
+        return to_float(self._data.get("ftradmsrate"))
+
+    @property
+    def ftradmdcha(self):
+        """외국계증권사매도거래량직전대비"""
+        return to_number(self._data.get("ftradmdcha"))
+
+    @property
+    def ftradmscha(self):
+        """외국계증권사매수거래량직전대비"""
+        return to_number(self._data.get("ftradmscha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def tradmdval1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("tradmdval1"))
+
+    @property
+    def tradmsval1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("tradmsval1"))
+
+    @property
+    def tradmdavg1(self):
+        """매도평균단가1"""
+        return to_number(self._data.get("tradmdavg1"))
+
+    @property
+    def tradmsavg1(self):
+        """매수평균단가1"""
+        return to_number(self._data.get("tradmsavg1"))
+
+    @property
+    def tradmdval2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("tradmdval2"))
+
+    @property
+    def tradmsval2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("tradmsval2"))
+
+    @property
+    def tradmdavg2(self):
+        """매도평균단가2"""
+        return to_number(self._data.get("tradmdavg2"))
+
+    @property
+    def tradmsavg2(self):
+        """매수평균단가2"""
+        return to_number(self._data.get("tradmsavg2"))
+
+    @property
+    def tradmdval3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("tradmdval3"))
+
+    @property
+    def tradmsval3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("tradmsval3"))
+
+    @property
+    def tradmdavg3(self):
+        """매도평균단가3"""
+        return to_number(self._data.get("tradmdavg3"))
+
+    @property
+    def tradmsavg3(self):
+        """매수평균단가3"""
+        return to_number(self._data.get("tradmsavg3"))
+
+    @property
+    def tradmdval4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("tradmdval4"))
+
+    @property
+    def tradmsval4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("tradmsval4"))
+
+    @property
+    def tradmdavg4(self):
+        """매도평균단가4"""
+        return to_number(self._data.get("tradmdavg4"))
+
+    @property
+    def tradmsavg4(self):
+        """매수평균단가4"""
+        return to_number(self._data.get("tradmsavg4"))
+
+    @property
+    def tradmdval5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("tradmdval5"))
+
+    @property
+    def tradmsval5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("tradmsval5"))
+
+    @property
+    def tradmdavg5(self):
+        """매도평균단가5"""
+        return to_number(self._data.get("tradmdavg5"))
+
+    @property
+    def tradmsavg5(self):
+        """매수평균단가5"""
+        return to_number(self._data.get("tradmsavg5"))
+
+    @property
+    def ftradmdval(self):
+        """외국계증권사매도거래대금"""
+        return to_number(self._data.get("ftradmdval"))
+
+    @property
+    def ftradmsval(self):
+        """외국계증권사매수거래대금"""
+        return to_number(self._data.get("ftradmsval"))
+
+    @property
+    def ftradmdavg(self):
+        """외국계증권사매도평균단가"""
+        return to_number(self._data.get("ftradmdavg"))
+
+    @property
+    def ftradmsavg(self):
+        """외국계증권사매수평균단가"""
+        return to_number(self._data.get("ftradmsavg"))
+
+
+class PHTick(RealtimeRecord):
+    """[PH_] KOSPI프로그램매매종목별"""
+    __slots__ = ()
+    TR_CODE = "PH_"
+    FIELDS = ("time", "price", "sign", "change", "volume", "drate", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "dwcvolume", "swcvolume", "djcvolume", "sjcvolume", "tdvolume", "tsvolume", "tvol", "dwcvalue", "swcvalue", "djcvalue", "sjcvalue", "tdvalue", "tsvalue", "tval", "pdgvolume", "psgvolume", "shcode")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def cdhrem(self):
+        """차익매도호가 잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가 잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가 잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가 잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가 수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가 수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가 수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가 수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def dwcvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwcvolume"))
+
+    @property
+    def swcvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swcvolume"))
+
+    @property
+    def djcvolume(self):
+        """전체매도자기체결수량"""
+        return to_number(self._data.get("djcvolume"))
+
+    @property
+    def sjcvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjcvolume"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수 수량"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def dwcvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwcvalue"))
+
+    @property
+    def swcvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swcvalue"))
+
+    @property
+    def djcvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djcvalue"))
+
+    @property
+    def sjcvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjcvalue"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수 금액"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def pdgvolume(self):
+        """매도 사전공시수량"""
+        return to_number(self._data.get("pdgvolume"))
+
+    @property
+    def psgvolume(self):
+        """매수 사전공시수량"""
+        return to_number(self._data.get("psgvolume"))
+
+    @property
+    def shcode(self):
+        """종목코드"""
+        return self._data.get("shcode")
+
+
+class PMTick(RealtimeRecord):
+    """[PM_] KOSPI프로그램매매전체집계"""
+    __slots__ = ()
+    TR_CODE = "PM_"
+    FIELDS = ("time", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "cdwvolume", "cdjvolume", "cswvolume", "csjvolume", "cwvol", "cjvol", "bdwvolume", "bdjvolume", "bswvolume", "bsjvolume", "bwvol", "bjvol", "dwvolume", "swvolume", "wvol", "djvolume", "sjvolume", "jvol", "cdwvalue", "cdjvalue", "cswvalue", "csjvalue", "cwval", "cjval", "bdwvalue", "bdjvalue", "bswvalue", "bsjvalue", "bwval", "bjval", "dwvalue", "swvalue", "wval", "djvalue", "sjvalue", "jval", "k200jisu", "k200sign", "change", "k200basis", "cdvolume", "csvolume", "cvol", "bdvolume", "bsvolume", "bvol", "tdvolume", "tsvolume", "tvol", "cdvalue", "csvalue", "cval", "bdvalue", "bsvalue", "bval", "tdvalue", "tsvalue", "tval", "p_cdvolcha", "p_csvolcha", "p_cvolcha", "p_bdvolcha", "p_bsvolcha", "p_bvolcha", "p_tdvolcha", "p_tsvolcha", "p_tvolcha", "p_cdvalcha", "p_csvalcha", "p_cvalcha", "p_bdvalcha", "p_bsvalcha", "p_bvalcha", "p_tdvalcha", "p_tsvalcha", "p_tvalcha", "gubun")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def cdhrem(self):
+        """차익매도호가잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def cdwvolume(self):
+        """차익매도위탁체결수량"""
+        return to_number(self._data.get("cdwvolume"))
+
+    @property
+    def cdjvolume(self):
+        """차익매도자기체결수량"""
+        return to_number(self._data.get("cdjvolume"))
+
+    @property
+    def cswvolume(self):
+        """차익매수위탁체결수량"""
+        return to_number(self._data.get("cswvolume"))
+
+    @property
+    def csjvolume(self):
+        """차익매수자기체결수량"""
+        return to_number(self._data.get("csjvolume"))
+
+    @property
+    def cwvol(self):
+        """차익위탁순매수수량"""
+        return to_number(self._data.get("cwvol"))
+
+    @property
+    def cjvol(self):
+        """차익자기순매수수량"""
+        return to_number(self._data.get("cjvol"))
+
+    @property
+    def bdwvolume(self):
+        """비차익매도위탁체결수량"""
+        return to_number(self._data.get("bdwvolume"))
+
+    @property
+    def bdjvolume(self):
+        """비차익매도자기체결수량"""
+        return to_number(self._data.get("bdjvolume"))
+
+    @property
+    def bswvolume(self):
+        """비차익매수위탁체결수량"""
+        return to_number(self._data.get("bswvolume"))
+
+    @property
+    def bsjvolume(self):
+        """비차익매수자기체결수량"""
+        return to_number(self._data.get("bsjvolume"))
+
+    @property
+    def bwvol(self):
+        """비차익위탁순매수수량"""
+        return to_number(self._data.get("bwvol"))
+
+    @property
+    def bjvol(self):
+        """비차익자기순매수수량"""
+        return to_number(self._data.get("bjvol"))
+
+    @property
+    def dwvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwvolume"))
+
+    @property
+    def swvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swvolume"))
+
+    @property
+    def wvol(self):
+        """전체위탁순매수수량"""
+        return to_number(self._data.get("wvol"))
+
+    @property
+    def djvolume(self):
+        """전체매도자기체결수량"""
+        return to_number(self._data.get("djvolume"))
+
+    @property
+    def sjvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjvolume"))
+
+    @property
+    def jvol(self):
+        """전체자기순매수수량"""
+        return to_number(self._data.get("jvol"))
+
+    @property
+    def cdwvalue(self):
+        """차익매도위탁체결금액"""
+        return to_number(self._data.get("cdwvalue"))
+
+    @property
+    def cdjvalue(self):
+        """차익매도자기체결금액"""
+        return to_number(self._data.get("cdjvalue"))
+
+    @property
+    def cswvalue(self):
+        """차익매수위탁체결금액"""
+        return to_number(self._data.get("cswvalue"))
+
+    @property
+    def csjvalue(self):
+        """차익매수자기체결금액"""
+        return to_number(self._data.get("csjvalue"))
+
+    @property
+    def cwval(self):
+        """차익위탁순매수금액"""
+        return to_number(self._data.get("cwval"))
+
+    @property
+    def cjval(self):
+        """차익자기순매수금액"""
+        return to_number(self._data.get("cjval"))
+
+    @property
+    def bdwvalue(self):
+        """비차익매도위탁체결금액"""
+        return to_number(self._data.get("bdwvalue"))
+
+    @property
+    def bdjvalue(self):
+        """비차익매도자기체결금액"""
+        return to_number(self._data.get("bdjvalue"))
+
+    @property
+    def bswvalue(self):
+        """비차익매수위탁체결금액"""
+        return to_number(self._data.get("bswvalue"))
+
+    @property
+    def bsjvalue(self):
+        """비차익매수자기체결금액"""
+        return to_number(self._data.get("bsjvalue"))
+
+    @property
+    def bwval(self):
+        """비차익위탁순매수금액"""
+        return to_number(self._data.get("bwval"))
+
+    @property
+    def bjval(self):
+        """비차익자기순매수금액"""
+        return to_number(self._data.get("bjval"))
+
+    @property
+    def dwvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwvalue"))
+
+    @property
+    def swvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swvalue"))
+
+    @property
+    def wval(self):
+        """전체위탁순매수금액"""
+        return to_number(self._data.get("wval"))
+
+    @property
+    def djvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djvalue"))
+
+    @property
+    def sjvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjvalue"))
+
+    @property
+    def jval(self):
+        """전체자기순매수금액"""
+        return to_number(self._data.get("jval"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def k200sign(self):
+        """KOSPI200전일대비구분"""
+        return self._data.get("k200sign")
+
+    @property
+    def change(self):
+        """KOSPI200전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def k200basis(self):
+        """KOSPI200베이시스"""
+        return to_float(self._data.get("k200basis"))
+
+    @property
+    def cdvolume(self):
+        """차익매도체결수량합계"""
+        return to_number(self._data.get("cdvolume"))
+
+    @property
+    def csvolume(self):
+        """차익매수체결수량합계"""
+        return to_number(self._data.get("csvolume"))
+
+    @property
+    def cvol(self):
+        """차익순매수수량합계"""
+        return to_number(self._data.get("cvol"))
+
+    @property
+    def bdvolume(self):
+        """비차익매도체결수량합계"""
+        return to_number(self._data.get("bdvolume"))
+
+    @property
+    def bsvolume(self):
+        """비차익매수체결수량합계"""
+        return to_number(self._data.get("bsvolume"))
+
+    @property
+    def bvol(self):
+        """비차익순매수수량합계"""
+        return to_number(self._data.get("bvol"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량합계"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량합계"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수수량합계"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def cdvalue(self):
+        """차익매도체결금액합계"""
+        return to_number(self._data.get("cdvalue"))
+
+    @property
+    def csvalue(self):
+        """차익매수체결금액합계"""
+        return to_number(self._data.get("csvalue"))
+
+    @property
+    def cval(self):
+        """차익순매수금액합계"""
+        return to_number(self._data.get("cval"))
+
+    @property
+    def bdvalue(self):
+        """비차익매도체결금액합계"""
+        return to_number(self._data.get("bdvalue"))
+
+    @property
+    def bsvalue(self):
+        """비차익매수체결금액합계"""
+        return to_number(self._data.get("bsvalue"))
+
+    @property
+    def bval(self):
+        """비차익순매수금액합계"""
+        return to_number(self._data.get("bval"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액합계"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액합계"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수금액합계"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def p_cdvolcha(self):
+        """차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_cdvolcha"))
+
+    @property
+    def p_csvolcha(self):
+        """차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_csvolcha"))
+
+    @property
+    def p_cvolcha(self):
+        """차익순매수수량직전대비"""
+        return to_number(self._data.get("p_cvolcha"))
+
+    @property
+    def p_bdvolcha(self):
+        """비차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_bdvolcha"))
+
+    @property
+    def p_bsvolcha(self):
+        """비차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_bsvolcha"))
+
+    @property
+    def p_bvolcha(self):
+        """비차익순매수수량직전대비"""
+        return to_number(self._data.get("p_bvolcha"))
+
+    @property
+    def p_tdvolcha(self):
+        """전체매도체결수량직전대비"""
+        return to_number(self._data.get("p_tdvolcha"))
+
+    @property
+    def p_tsvolcha(self):
+        """전체매수체결수량직전대비"""
+        return to_number(self._data.get("p_tsvolcha"))
+
+    @property
+    def p_tvolcha(self):
+        """전체순매수수량직전대비"""
+        return to_number(self._data.get("p_tvolcha"))
+
+    @property
+    def p_cdvalcha(self):
+        """차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_cdvalcha"))
+
+    @property
+    def p_csvalcha(self):
+        """차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_csvalcha"))
+
+    @property
+    def p_cvalcha(self):
+        """차익순매수금액직전대비"""
+        return to_number(self._data.get("p_cvalcha"))
+
+    @property
+    def p_bdvalcha(self):
+        """비차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_bdvalcha"))
+
+    @property
+    def p_bsvalcha(self):
+        """비차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_bsvalcha"))
+
+    @property
+    def p_bvalcha(self):
+        """비차익순매수금액직전대비"""
+        return to_number(self._data.get("p_bvalcha"))
+
+    @property
+    def p_tdvalcha(self):
+        """전체매도체결금액직전대비"""
+        return to_number(self._data.get("p_tdvalcha"))
+
+    @property
+    def p_tsvalcha(self):
+        """전체매수체결금액직전대비"""
+        return to_number(self._data.get("p_tsvalcha"))
+
+    @property
+    def p_tvalcha(self):
+        """전체순매수금액직전대비"""
+        return to_number(self._data.get("p_tvalcha"))
+
+    @property
+    def gubun(self):
+        """구분값"""
+        return self._data.get("gubun")
+
+
+class S2Tick(RealtimeRecord):
+    """[S2_] KOSPI우선호가"""
+    __slots__ = ()
+    TR_CODE = "S2_"
+    FIELDS = ("offerho", "bidho", "shcode")
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class S3Tick(RealtimeRecord):
+    """[S3_] KOSPI체결"""
+    __slots__ = ()
+    TR_CODE = "S3_"
+    FIELDS = ("chetime", "sign", "change", "drate", "price", "opentime", "open", "hightime", "high", "lowtime", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "w_avrg", "offerho", "bidho", "status", "jnilvolume", "shcode", "exchname")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return self._data.get("opentime")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return self._data.get("hightime")
+
+    @property
+    def high(self):
+        """고가"""
+        return to_number(self._data.get("high"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def w_avrg(self):
+        """가중평균가"""
+        return to_number(self._data.get("w_avrg"))
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def status(self):
+        """장정보"""
+        return self._data.get("status")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+
+class S4Tick(RealtimeRecord):
+    """[S4_] KOSPI기세"""
+    __slots__ = ()
+    TR_CODE = "S4_"
+    FIELDS = ("sign", "change", "drate", "price", "opentime", "open", "hightime", "high", "lowtime", "low", "shcode")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return self._data.get("opentime")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return self._data.get("hightime")
+
+    @property
+    def high(self):
+        """고가"""
+        return to_number(self._data.get("high"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class SC0Tick(RealtimeRecord):
+    """[SC0] 주식주문접수"""
+    __slots__ = ()
+    TR_CODE = "SC0"
+    FIELDS = ("lineseq", "accno", "user", "len", "gubun", "compress", "encrypt", "offset", "trcode", "compid", "userid", "media", "ifid", "seq", "trid", "pubip", "prvip", "pcbpno", "bpno", "termno", "lang", "proctm", "msgcode", "outgu", "compreq", "funckey", "reqcnt", "filler", "cont", "contkey", "varlen", "varhdlen", "varmsglen", "trsrc", "eventid", "ifinfo", "filler1", "ordchegb", "marketgb", "ordgb", "orgordno", "accno1", "accno2", "passwd", "expcode", "shtcode", "hname", "ordqty", "ordprice", "hogagb", "etfhogagb", "pgmtype", "gmhogagb", "gmhogayn", "singb", "loandt", "cvrgordtp", "strtgcode", "groupid", "ordseqno", "prtno", "basketno", "trchno", "itemno", "brwmgmyn", "mbrno", "procgb", "admbrchno", "futaccno", "futmarketgb", "tongsingb", "lpgb", "dummy", "ordno", "ordtm", "prntordno", "mgempno", "orgordundrqty", "orgordmdfyqty", "ordordcancelqty", "nmcpysndno", "ordamt", "bnstp", "spareordno", "cvrgseqno", "rsvordno", "mtordseqno", "spareordqty", "orduserid", "spotordqty", "ordruseqty", "mnyordamt", "ordsubstamt", "ruseordamt", "ordcmsnamt", "crdtuseamt", "secbalqty", "spotordableqty", "ordableruseqty", "flctqty", "secbalqtyd2", "sellableqty", "unercsellordqty", "avrpchsprc", "pchsamt", "deposit", "substamt", "csgnmnymgn", "csgnsubstmgn", "crdtpldgruseamt", "ordablemny", "ordablesubstamt", "ruseableamt")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def accno(self):
+        """Push키"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return self._data.get("len")
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return self._data.get("offset")
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def compid(self):
+        """이용사번호"""
+        return self._data.get("compid")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return self._data.get("proctm")
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return self._data.get("varlen")
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return self._data.get("varhdlen")
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return self._data.get("varmsglen")
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def ordchegb(self):
+        """주문체결구분"""
+        return self._data.get("ordchegb")
+
+    @property
+    def marketgb(self):
+        """시장구분"""
+        return self._data.get("marketgb")
+
+    @property
+    def ordgb(self):
+        """주문구분"""
+        return self._data.get("ordgb")
+
+    @property
+    def orgordno(self):
+        """원주문번호"""
+        return self._data.get("orgordno")
+
+    @property
+    def accno1(self):
+        """계좌번호"""
+        return self._data.get("accno1")
+
+    @property
+    def accno2(self):
+        """계좌번호"""
+        return self._data.get("accno2")
+
+    @property
+    def passwd(self):
+        """비밀번호"""
+        return self._data.get("passwd")
+
+    @property
+    def expcode(self):
+        """종목번호"""
+        return self._data.get("expcode")
+
+    @property
+    def shtcode(self):
+        """단축종목번호"""
+        return self._data.get("shtcode")
+
+    @property
+    def hname(self):
+        """종목명"""
+        return self._data.get("hname")
+
+    @property
+    def ordqty(self):
+        """주문수량"""
+        return to_number(self._data.get("ordqty"))
+
+    @property
+    def ordprice(self):
+        """주문가격"""
+        return to_number(self._data.get("ordprice"))
+
+    @property
+    def hogagb(self):
+        """주문조건"""
+        return self._data.get("hogagb")
+
+    @property
+    def etfhogagb(self):
+        """호가유형코드"""
+        return self._data.get("etfhogagb")
+
+    @property
+    def pgmtype(self):
+        """프로그램호가구분"""
+        return self._data.get("pgmtype")
+
+    @property
+    def gmhogagb(self):
+        """공매도호가구분"""
+        return self._data.get("gmhogagb")
+
+    @property
+    def gmhogayn(self):
+        """공매도가능여부"""
+        return self._data.get("gmhogayn")
+
+    @property
+    def singb(self):
+        """신용구분"""
+        return self._data.get("singb")
+
+    @property
+    def loandt(self):
+        """대출일"""
+        return self._data.get("loandt")
+
+    @property
+    def cvrgordtp(self):
+        """반대매매주문구분"""
+        return self._data.get("cvrgordtp")
+
+    @property
+    def strtgcode(self):
+        """전략코드"""
+        return self._data.get("strtgcode")
+
+    @property
+    def groupid(self):
+        """그룹ID"""
+        return self._data.get("groupid")
+
+    @property
+    def ordseqno(self):
+        """주문회차"""
+        return self._data.get("ordseqno")
+
+    @property
+    def prtno(self):
+        """포트폴리오번호"""
+        return self._data.get("prtno")
+
+    @property
+    def basketno(self):
+        """바스켓번호"""
+        return self._data.get("basketno")
+
+    @property
+    def trchno(self):
+        """트렌치번호"""
+        return self._data.get("trchno")
+
+    @property
+    def itemno(self):
+        """아아템번호"""
+        return self._data.get("itemno")
+
+    @property
+    def brwmgmyn(self):
+        """차입구분"""
+        return self._data.get("brwmgmyn")
+
+    @property
+    def mbrno(self):
+        """회원사번호"""
+        return self._data.get("mbrno")
+
+    @property
+    def procgb(self):
+        """처리구분"""
+        return self._data.get("procgb")
+
+    @property
+    def admbrchno(self):
+        """관리지점번호"""
+        return self._data.get("admbrchno")
+
+    @property
+    def futaccno(self):
+        """선물계좌번호"""
+        return self._data.get("futaccno")
+
+    @property
+    def futmarketgb(self):
+        """선물상품구분"""
+        return self._data.get("futmarketgb")
+
+    @property
+    def tongsingb(self):
+        """통신매체구분"""
+        return self._data.get("tongsingb")
+
+    @property
+    def lpgb(self):
+        """유동성공급자구분"""
+        return self._data.get("lpgb")
+
+    @property
+    def dummy(self):
+        """DUMMY"""
+        return self._data.get("dummy")
+
+    @property
+    def ordno(self):
+        """주문번호"""
+        return self._data.get("ordno")
+
+    @property
+    def ordtm(self):
+        """주문시각"""
+        return self._data.get("ordtm")
+
+    @property
+    def prntordno(self):
+        """모주문번호"""
+        return self._data.get("prntordno")
+
+    @property
+    def mgempno(self):
+        """관리사원번호"""
+        return self._data.get("mgempno")
+
+    @property
+    def orgordundrqty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("orgordundrqty"))
+
+    @property
+    def orgordmdfyqty(self):
+        """원주문정정수량"""
+        return to_number(self._data.get("orgordmdfyqty"))
+
+    @property
+    def ordordcancelqty(self):
+        """원주문취소수량"""
+        return to_number(self._data.get("ordordcancelqty"))
+
+    @property
+    def nmcpysndno(self):
+        """비회원사송신번호"""
+        return self._data.get("nmcpysndno")
+
+    @property
+    def ordamt(self):
+        """주문금액"""
+        return to_number(self._data.get("ordamt"))
+
+    @property
+    def bnstp(self):
+        """매매구분"""
+        return self._data.get("bnstp")
+
+    @property
+    def spareordno(self):
+        """예비주문번호"""
+        return self._data.get("spareordno")
+
+    @property
+    def cvrgseqno(self):
+        """반대매매일련번호"""
+        return self._data.get("cvrgseqno")
+
+    @property
+    def rsvordno(self):
+        """예약주문번호"""
+        return self._data.get("rsvordno")
+
+    @property
+    def mtordseqno(self):
+        """복수주문일련번호"""
+        return self._data.get("mtordseqno")
+
+    @property
+    def spareordqty(self):
+        """예비주문수량"""
+        return to_number(self._data.get("spareordqty"))
+
+    @property
+    def orduserid(self):
+        """주문사원번호"""
+        return self._data.get("orduserid")
+
+    @property
+    def spotordqty(self):
+        """실물주문수량"""
+        return to_number(self._data.get("spotordqty"))
+
+    @property
+    def ordruseqty(self):
+        """재사용주문수량"""
+        return to_number(self._data.get("ordruseqty"))
+
+    @property
+    def mnyordamt(self):
+        """현금주문금액"""
+        return to_number(self._data.get("mnyordamt"))
+
+    @property
+    def ordsubstamt(self):
+        """주문대용금액"""
+        return to_number(self._data.get("ordsubstamt"))
+
+    @property
+    def ruseordamt(self):
+        """재사용주문금액"""
+        return to_number(self._data.get("ruseordamt"))
+
+    @property
+    def ordcmsnamt(self):
+        """수수료주문금액"""
+        return to_number(self._data.get("ordcmsnamt"))
+
+    @property
+    def crdtuseamt(self):
+        """사용신용담보재사용금"""
+        return to_number(self._data.get("crdtuseamt"))
+
+    @property
+    def secbalqty(self):
+        """잔고수량"""
+        return to_number(self._data.get("secbalqty"))
+
+    @property
+    def spotordableqty(self):
+        """실물가능수량"""
+        return to_number(self._data.get("spotordableqty"))
+
+    @property
+    def ordableruseqty(self):
+        """재사용가능수량(매도)"""
+        return self._data.get("ordableruseqty")
+
+    @property
+    def flctqty(self):
+        """변동수량"""
+        return to_number(self._data.get("flctqty"))
+
+    @property
+    def secbalqtyd2(self):
+        """잔고수량(D2)"""
+        return self._data.get("secbalqtyd2")
+
+    @property
+    def sellableqty(self):
+        """매도주문가능수량"""
+        return to_number(self._data.get("sellableqty"))
+
+    @property
+    def unercsellordqty(self):
+        """미체결매도주문수량"""
+        return to_number(self._data.get("unercsellordqty"))
+
+    @property
+    def avrpchsprc(self):
+        """평균매입가"""
+        return to_number(self._data.get("avrpchsprc"))
+
+    @property
+    def pchsamt(self):
+        """매입금액"""
+        return to_number(self._data.get("pchsamt"))
+
+    @property
+    def deposit(self):
+        """예수금"""
+        return to_number(self._data.get("deposit"))
+
+    @property
+    def substamt(self):
+        """대용금"""
+        return to_number(self._data.get("substamt"))
+
+    @property
+    def csgnmnymgn(self):
+        """위탁증거금현금"""
+        return to_number(self._data.get("csgnmnymgn"))
+
+    @property
+    def csgnsubstmgn(self):
+        """위탁증거금대용"""
+        return self._data.get("csgnsubstmgn")
+
+    @property
+    def crdtpldgruseamt(self):
+        """신용담보재사용금"""
+        return to_number(self._data.get("crdtpldgruseamt"))
+
+    @property
+    def ordablemny(self):
+        """주문가능현금"""
+        return to_number(self._data.get("ordablemny"))
+
+    @property
+    def ordablesubstamt(self):
+        """주문가능대용"""
+        return self._data.get("ordablesubstamt")
+
+    @property
+    def ruseableamt(self):
+        """재사용가능금액"""
+        return to_number(self._data.get("ruseableamt"))
+
+
+class SC1Tick(RealtimeRecord):
+    """[SC1] 주식주문체결"""
+    __slots__ = ()
+    TR_CODE = "SC1"
+    FIELDS = ("grpId", "trchno", "trtzxLevytp", "ordtrxptncode", "acntnm", "trcode", "userid", "agrgbrnno", "regmktcode", "len", "opdrtnno", "orgordmdfyqty", "avrpchsprc", "exectime", "cont", "mnymgnrat", "mdfycnfqty", "orgordcancqty", "compress", "execprc", "mdfycnfprc", "unercsellordqty", "cmsnamtexecamt", "ruseableamt", "gubun", "trid", "flctqty", "execno", "lptp", "varmsglen", "ordno", "futsmkttp", "crdtexecamt", "deposit", "frgrunqno", "crdayruseexecval", "trsrc", "ordacntno", "reqcnt", "shtnIsuno", "accno1", "strtgcode", "ordseqno", "Isunm", "ordablesubstamt", "encrypt", "Isuno", "accno2", "contkey", "Loandt", "seq", "lineseq", "varlen", "orduserId", "mgmtbrnno", "rjtqty", "ordprcptncode", "stdIsuno", "pchsant", "filler", "secbalqty", "ordxctptncode", "canccnfqty", "ordablemny", "pubip", "prvip", "funckey", "accno", "compreq", "crdtpldgruseamt", "ordamt", "termno", "crdtpldgexecamt", "ordcndi", "rmndLoanamt", "bpno", "substamt", "mgempno", "csgnsubstmgn", "offset", "rcptexectime", "sellableqty", "spotexecqty", "varhdlen", "substmgnrat", "ordavrexecprc", "itemno", "mgntrncode", "nsavtrdqty", "ifinfo", "ordableruseqty", "ptflno", "secbalqtyd2", "brwmgmtYn", "eventid", "csgnmnymgn", "pcbpno", "orgordno", "ifid", "media", "mtiordseqno", "filler1", "orgordunercqty", "mbrnmbrno", "futsLnkbrnno", "commdacode", "stslexecqty", "proctm", "bfstdIsuno", "futsLnkacntno", "lang", "unercqty", "execqty", "adduptp", "bskno", "spotordableqty", "ubstexecamt", "cvrgordtp", "ordqty", "mnyexecamt", "outgu", "msgcode", "ordtrdptncode", "ordmktcode", "ordptncode", "prdayruseexecval", "comid", "bnstp", "user", "ordprc")
+
+    @property
+    def grpId(self):
+        """ 그룹Id"""
+        return self._data.get("grpId")
+
+    @property
+    def trchno(self):
+        """트렌치번호"""
+        return self._data.get("trchno")
+
+    @property
+    def trtzxLevytp(self):
+        """거래세징수구분"""
+        return self._data.get("trtzxLevytp")
+
+    @property
+    def ordtrxptncode(self):
+        """ 주문처리유형코드"""
+        return self._data.get("ordtrxptncode")
+
+    @property
+    def acntnm(self):
+        """계좌명"""
+        return self._data.get("acntnm")
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def agrgbrnno(self):
+        """집계지점번호"""
+        return self._data.get("agrgbrnno")
+
+    @property
+    def regmktcode(self):
+        """등록시장코드"""
+        return self._data.get("regmktcode")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return self._data.get("len")
+
+    @property
+    def opdrtnno(self):
+        """운용지시번호"""
+        return self._data.get("opdrtnno")
+
+    @property
+    def orgordmdfyqty(self):
+        """원주문정정수량"""
+        return to_number(self._data.get("orgordmdfyqty"))
+
+    @property
+    def avrpchsprc(self):
+        """평균매입가"""
+        return to_number(self._data.get("avrpchsprc"))
+
+    @property
+    def exectime(self):
+        """체결시각"""
+        return self._data.get("exectime")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def mnymgnrat(self):
+        """현금증거금률"""
+        return to_float(self._data.get("mnymgnrat"))
+
+    @property
+    def mdfycnfqty(self):
+        """정정확인수량"""
+        return to_number(self._data.get("mdfycnfqty"))
+
+    @property
+    def orgordcancqty(self):
+        """원주문취소수량"""
+        return to_number(self._data.get("orgordcancqty"))
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def execprc(self):
+        """체결가격"""
+        return to_number(self._data.get("execprc"))
+
+    @property
+    def mdfycnfprc(self):
+        """정정확인가격"""
+        return to_number(self._data.get("mdfycnfprc"))
+
+    @property
+    def unercsellordqty(self):
+        """미체결매도주문수량"""
+        return to_number(self._data.get("unercsellordqty"))
+
+    @property
+    def cmsnamtexecamt(self):
+        """수수료체결금액"""
+        return to_number(self._data.get("cmsnamtexecamt"))
+
+    @property
+    def ruseableamt(self):
+        """재사용가능금액"""
+        return to_number(self._data.get("ruseableamt"))
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def flctqty(self):
+        """변동수량"""
+        return to_number(self._data.get("flctqty"))
+
+    @property
+    def execno(self):
+        """체결번호"""
+        return self._data.get("execno")
+
+    @property
+    def lptp(self):
+        """유동성공급자구분"""
+        return self._data.get("lptp")
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return self._data.get("varmsglen")
+
+    @property
+    def ordno(self):
+        """주문번호"""
+        return self._data.get("ordno")
+
+    @property
+    def futsmkttp(self):
+        """선물시장구분"""
+        return self._data.get("futsmkttp")
+
+    @property
+    def crdtexecamt(self):
+        """신용체결금액"""
+        return to_number(self._data.get("crdtexecamt"))
+
+    @property
+    def deposit(self):
+        """예수금"""
+        return to_number(self._data.get("deposit"))
+
+    @property
+    def frgrunqno(self):
+        """외국인고유번호"""
+        return self._data.get("frgrunqno")
+
+    @property
+    def crdayruseexecval(self):
+        """금일재사용체결금액"""
+        return to_number(self._data.get("crdayruseexecval"))
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def ordacntno(self):
+        """주문계좌번호"""
+        return self._data.get("ordacntno")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def shtnIsuno(self):
+        """단축종목번호"""
+        return self._data.get("shtnIsuno")
+
+    @property
+    def accno1(self):
+        """계좌번호"""
+        return self._data.get("accno1")
+
+    @property
+    def strtgcode(self):
+        """전략코드"""
+        return self._data.get("strtgcode")
+
+    @property
+    def ordseqno(self):
+        """주문회차"""
+        return self._data.get("ordseqno")
+
+    @property
+    def Isunm(self):
+        """종목명"""
+        return self._data.get("Isunm")
+
+    @property
+    def ordablesubstamt(self):
+        """주문가능대용"""
+        return self._data.get("ordablesubstamt")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def Isuno(self):
+        """종목번호"""
+        return self._data.get("Isuno")
+
+    @property
+    def accno2(self):
+        """계좌번호"""
+        return self._data.get("accno2")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def Loandt(self):
+        """대출일"""
+        return self._data.get("Loandt")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return self._data.get("varlen")
+
+    @property
+    def orduserId(self):
+        """주문자Id"""
+        return self._data.get("orduserId")
+
+    @property
+    def mgmtbrnno(self):
+        """관리지점번호"""
+        return self._data.get("mgmtbrnno")
+
+    @property
+    def rjtqty(self):
+        """거부수량"""
+        return to_number(self._data.get("rjtqty"))
+
+    @property
+    def ordprcptncode(self):
+        """호가유형코드"""
+        return self._data.get("ordprcptncode")
+
+    @property
+    def stdIsuno(self):
+        """표준종목번호"""
+        return self._data.get("stdIsuno")
+
+    @property
+    def pchsant(self):
+        """매입금액"""
+        return to_number(self._data.get("pchsant"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def secbalqty(self):
+        """잔고수량"""
+        return to_number(self._data.get("secbalqty"))
+
+    @property
+    def ordxctptncode(self):
+        """주문체결유형코드"""
+        return self._data.get("ordxctptncode")
+
+    @property
+    def canccnfqty(self):
+        """취소확인수량"""
+        return to_number(self._data.get("canccnfqty"))
+
+    @property
+    def ordablemny(self):
+        """주문가능현금"""
+        return to_number(self._data.get("ordablemny"))
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def crdtpldgruseamt(self):
+        """신용담보재사용금"""
+        return to_number(self._data.get("crdtpldgruseamt"))
+
+    @property
+    def ordamt(self):
+        """주문금액"""
+        return to_number(self._data.get("ordamt"))
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def crdtpldgexecamt(self):
+        """신용담보체결금액"""
+        return to_number(self._data.get("crdtpldgexecamt"))
+
+    @property
+    def ordcndi(self):
+        """주문조건"""
+        return self._data.get("ordcndi")
+
+    @property
+    def rmndLoanamt(self):
+        """잔여대출금액"""
+        return to_number(self._data.get("rmndLoanamt"))
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def substamt(self):
+        """대용금"""
+        return to_number(self._data.get("substamt"))
+
+    @property
+    def mgempno(self):
+        """관리사원번호"""
+        return self._data.get("mgempno")
+
+    @property
+    def csgnsubstmgn(self):
+        """위탁증거금대용"""
+        return self._data.get("csgnsubstmgn")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return self._data.get("offset")
+
+    @property
+    def rcptexectime(self):
+        """거래소수신체결시각"""
+        return self._data.get("rcptexectime")
+
+    @property
+    def sellableqty(self):
+        """매도주문가능수량"""
+        return to_number(self._data.get("sellableqty"))
+
+    @property
+    def spotexecqty(self):
+        """실물체결수량"""
+        return to_number(self._data.get("spotexecqty"))
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return self._data.get("varhdlen")
+
+    @property
+    def substmgnrat(self):
+        """대용증거금률"""
+        return to_float(self._data.get("substmgnrat"))
+
+    @property
+    def ordavrexecprc(self):
+        """주문평균체결가격"""
+        return to_number(self._data.get("ordavrexecprc"))
+
+    @property
+    def itemno(self):
+        """아이템번호"""
+        return self._data.get("itemno")
+
+    @property
+    def mgntrncode(self):
+        """신용거래코드"""
+        return self._data.get("mgntrncode")
+
+    @property
+    def nsavtrdqty(self):
+        """비저축체결수량"""
+        return to_number(self._data.get("nsavtrdqty"))
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def ordableruseqty(self):
+        """재사용가능수량(매도)"""
+        return self._data.get("ordableruseqty")
+
+    @property
+    def ptflno(self):
+        """포트폴리오번호"""
+        return self._data.get("ptflno")
+
+    @property
+    def secbalqtyd2(self):
+        """잔고수량(d2)"""
+        return self._data.get("secbalqtyd2")
+
+    @property
+    def brwmgmtYn(self):
+        """차입관리여부"""
+        return self._data.get("brwmgmtYn")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def csgnmnymgn(self):
+        """위탁증거금현금"""
+        return to_number(self._data.get("csgnmnymgn"))
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def orgordno(self):
+        """원주문번호"""
+        return self._data.get("orgordno")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def mtiordseqno(self):
+        """복수주문일련번호"""
+        return self._data.get("mtiordseqno")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def orgordunercqty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("orgordunercqty"))
+
+    @property
+    def mbrnmbrno(self):
+        """회원/비회원사번호"""
+        return self._data.get("mbrnmbrno")
+
+    @property
+    def futsLnkbrnno(self):
+        """선물연계지점번호"""
+        return self._data.get("futsLnkbrnno")
+
+    @property
+    def commdacode(self):
+        """통신매체코드"""
+        return self._data.get("commdacode")
+
+    @property
+    def stslexecqty(self):
+        """공매도체결수량"""
+        return to_number(self._data.get("stslexecqty"))
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return self._data.get("proctm")
+
+    @property
+    def bfstdIsuno(self):
+        """전표준종목번호"""
+        return self._data.get("bfstdIsuno")
+
+    @property
+    def futsLnkacntno(self):
+        """선물연계계좌번호"""
+        return self._data.get("futsLnkacntno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def unercqty(self):
+        """미체결수량(주문)"""
+        return self._data.get("unercqty")
+
+    @property
+    def execqty(self):
+        """체결수량"""
+        return to_number(self._data.get("execqty"))
+
+    @property
+    def adduptp(self):
+        """수수료합산코드"""
+        return self._data.get("adduptp")
+
+    @property
+    def bskno(self):
+        """바스켓번호"""
+        return self._data.get("bskno")
+
+    @property
+    def spotordableqty(self):
+        """실물가능수량"""
+        return to_number(self._data.get("spotordableqty"))
+
+    @property
+    def ubstexecamt(self):
+        """대용체결금액"""
+        return to_number(self._data.get("ubstexecamt"))
+
+    @property
+    def cvrgordtp(self):
+        """반대매매주문구분"""
+        return self._data.get("cvrgordtp")
+
+    @property
+    def ordqty(self):
+        """주문수량"""
+        return to_number(self._data.get("ordqty"))
+
+    @property
+    def mnyexecamt(self):
+        """현금체결금액"""
+        return to_number(self._data.get("mnyexecamt"))
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def ordtrdptncode(self):
+        """주문거래유형코드"""
+        return self._data.get("ordtrdptncode")
+
+    @property
+    def ordmktcode(self):
+        """주문시장코드"""
+        return self._data.get("ordmktcode")
+
+    @property
+    def ordptncode(self):
+        """주문유형코드"""
+        return self._data.get("ordptncode")
+
+    @property
+    def prdayruseexecval(self):
+        """전일재사용체결금액"""
+        return to_number(self._data.get("prdayruseexecval"))
+
+    @property
+    def comid(self):
+        """COM ID"""
+        return self._data.get("comid")
+
+    @property
+    def bnstp(self):
+        """매매구분"""
+        return self._data.get("bnstp")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def ordprc(self):
+        """주문가격"""
+        return to_number(self._data.get("ordprc"))
+
+
+class SHCTick(RealtimeRecord):
+    """[SHC] 상/하한가근접진입"""
+    __slots__ = ()
+    TR_CODE = "SHC"
+    FIELDS = ("sijanggubun", "hname", "price", "sign", "change", "drate", "volume", "volincrate", "updnlmtprice", "updnlmtdrate", "jnilvolume", "shcode", "gwangubun", "undergubun", "tgubun", "wgubun", "dishonest", "jkrate", "updnlmtdaycnt")
+
+    @property
+    def sijanggubun(self):
+        """거래소/코스닥구분"""
+        return self._data.get("sijanggubun")
+
+    @property
+    def hname(self):
+        """종목명"""
+        return self._data.get("hname")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def volincrate(self):
+        """거래증가율"""
+        return to_float(self._data.get("volincrate"))
+
+    @property
+    def updnlmtprice(self):
+        """상/하한가"""
+        return to_number(self._data.get("updnlmtprice"))
+
+    @property
+    def updnlmtdrate(self):
+        """상/하한가대비율"""
+        return to_float(self._data.get("updnlmtdrate"))
+
+    @property
+    def jnilvolume(self):
+        """전일거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def gwangubun(self):
+        """관리구분"""
+        return self._data.get("gwangubun")
+
+    @property
+    def undergubun(self):
+        """이상급등구분"""
+        return self._data.get("undergubun")
+
+    @property
+    def tgubun(self):
+        """투자유의구분"""
+        return self._data.get("tgubun")
+
+    @property
+    def wgubun(self):
+        """우선주구분"""
+        return self._data.get("wgubun")
+
+    @property
+    def dishonest(self):
+        """불성실구분"""
+        return self._data.get("dishonest")
+
+    @property
+    def jkrate(self):
+        """증거금률"""
+        return to_float(self._data.get("jkrate"))
+
+    @property
+    def updnlmtdaycnt(self):
+        """상한가/하한가연속일수"""
+        return to_number(self._data.get("updnlmtdaycnt"))
+
+
+class SHDTick(RealtimeRecord):
+    """[SHD] 상/하한가근접이탈"""
+    __slots__ = ()
+    TR_CODE = "SHD"
+    FIELDS = ("sijanggubun", "hname", "price", "sign", "change", "drate", "volume", "volincrate", "updnlmtprice", "updnlmtdrate", "jnilvolume", "shcode", "gwangubun", "undergubun", "tgubun", "wgubun", "dishonest", "jkrate")
+
+    @property
+    def sijanggubun(self):
+        """거래소/코스닥구분"""
+        return self._data.get("sijanggubun")
+
+    @property
+    def hname(self):
+        """종목명"""
+        return self._data.get("hname")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def volincrate(self):
+        """거래증가율"""
+        return to_float(self._data.get("volincrate"))
+
+    @property
+    def updnlmtprice(self):
+        """상/하한가"""
+        return to_number(self._data.get("updnlmtprice"))
+
+    @property
+    def updnlmtdrate(self):
+        """상/하한가대비율"""
+        return to_float(self._data.get("updnlmtdrate"))
+
+    @property
+    def jnilvolume(self):
+        """전일거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def gwangubun(self):
+        """관리구분"""
+        return self._data.get("gwangubun")
+
+    @property
+    def undergubun(self):
+        """이상급등구분"""
+        return self._data.get("undergubun")
+
+    @property
+    def tgubun(self):
+        """투자유의구분"""
+        return self._data.get("tgubun")
+
+    @property
+    def wgubun(self):
+        """우선주구분"""
+        return self._data.get("wgubun")
+
+    @property
+    def dishonest(self):
+        """불성실구분"""
+        return self._data.get("dishonest")
+
+    @property
+    def jkrate(self):
+        """증거금률"""
+        return to_float(self._data.get("jkrate"))
+
+
+class SHITick(RealtimeRecord):
+    """[SHI] 상/하한가진입"""
+    __slots__ = ()
+    TR_CODE = "SHI"
+    FIELDS = ("sijanggubun", "hname", "price", "sign", "change", "drate", "volume", "volincrate", "totofferrem", "totbidrem", "updnlmtstime", "updnlmtdaycnt", "jnilvolume", "shcode", "gwangubun", "undergubun", "tgubun", "wgubun", "dishonest", "jkrate")
+
+    @property
+    def sijanggubun(self):
+        """거래소/코스닥구분"""
+        return self._data.get("sijanggubun")
+
+    @property
+    def hname(self):
+        """종목명"""
+        return self._data.get("hname")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def volincrate(self):
+        """거래증가율"""
+        return to_float(self._data.get("volincrate"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def updnlmtstime(self):
+        """상한가/하한가최종진입시간"""
+        return self._data.get("updnlmtstime")
+
+    @property
+    def updnlmtdaycnt(self):
+        """상한가/하한가연속일수"""
+        return to_number(self._data.get("updnlmtdaycnt"))
+
+    @property
+    def jnilvolume(self):
+        """전일거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def gwangubun(self):
+        """관리구분"""
+        return self._data.get("gwangubun")
+
+    @property
+    def undergubun(self):
+        """이상급등구분"""
+        return self._data.get("undergubun")
+
+    @property
+    def tgubun(self):
+        """투자유의구분"""
+        return self._data.get("tgubun")
+
+    @property
+    def wgubun(self):
+        """우선주구분"""
+        return self._data.get("wgubun")
+
+    @property
+    def dishonest(self):
+        """불성실구분"""
+        return self._data.get("dishonest")
+
+    @property
+    def jkrate(self):
+        """증거금률"""
+        return to_float(self._data.get("jkrate"))
+
+
+class SHOTick(RealtimeRecord):
+    """[SHO] 상/하한가이탈"""
+    __slots__ = ()
+    TR_CODE = "SHO"
+    FIELDS = ("sijanggubun", "hname", "price", "sign", "change", "drate", "volume", "volincrate", "updnlmtprice", "updnlmtchange", "updnlmtdrate", "jnilvolume", "shcode", "gwangubun", "undergubun", "tgubun", "wgubun", "dishonest", "jkrate")
+
+    @property
+    def sijanggubun(self):
+        """거래소/코스닥구분"""
+        return self._data.get("sijanggubun")
+
+    @property
+    def hname(self):
+        """종목명"""
+        return self._data.get("hname")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def volincrate(self):
+        """거래증가율"""
+        return to_float(self._data.get("volincrate"))
+
+    @property
+    def updnlmtprice(self):
+        """상/하한가"""
+        return to_number(self._data.get("updnlmtprice"))
+
+    @property
+    def updnlmtchange(self):
+        """상/하한가대비"""
+        return to_number(self._data.get("updnlmtchange"))
+
+    @property
+    def updnlmtdrate(self):
+        """상/하한가대비율"""
+        return to_float(self._data.get("updnlmtdrate"))
+
+    @property
+    def jnilvolume(self):
+        """전일거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def gwangubun(self):
+        """관리구분"""
+        return self._data.get("gwangubun")
+
+    @property
+    def undergubun(self):
+        """이상급등구분"""
+        return self._data.get("undergubun")
+
+    @property
+    def tgubun(self):
+        """투자유의구분"""
+        return self._data.get("tgubun")
+
+    @property
+    def wgubun(self):
+        """우선주구분"""
+        return self._data.get("wgubun")
+
+    @property
+    def dishonest(self):
+        """불성실구분"""
+        return self._data.get("dishonest")
+
+    @property
+    def jkrate(self):
+        """증거금률"""
+        return to_float(self._data.get("jkrate"))
+
+
+class VITick(RealtimeRecord):
+    """[VI_] VI발동해제"""
+    __slots__ = ()
+    TR_CODE = "VI_"
+    FIELDS = ("vi_gubun", "svi_recprice", "dvi_recprice", "vi_trgprice", "shcode", "ref_shcode", "time", "exchname")
+
+    @property
+    def vi_gubun(self):
+        """구분(0:해제1:정적발동2:동적발동3:정적&동적)"""
+        return self._data.get("vi_gubun")
+
+    @property
+    def svi_recprice(self):
+        """정적VI발동기준가격"""
+        return to_number(self._data.get("svi_recprice"))
+
+    @property
+    def dvi_recprice(self):
+        """동적VI발동기준가격"""
+        return to_number(self._data.get("dvi_recprice"))
+
+    @property
+    def vi_trgprice(self):
+        """VI발동가격"""
+        return to_number(self._data.get("vi_trgprice"))
+
+    @property
+    def shcode(self):
+        """단축코드(KEY)"""
+        return self._data.get("shcode")
+
+    @property
+    def ref_shcode(self):
+        """참조코드"""
+        return self._data.get("ref_shcode")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+
+class YJTick(RealtimeRecord):
+    """[YJ_] 예상지수"""
+    __slots__ = ()
+    TR_CODE = "YJ_"
+    FIELDS = ("time", "jisu", "sign", "change", "drate", "cvolume", "volume", "value", "upcode")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def jisu(self):
+        """예상지수"""
+        return to_float(self._data.get("jisu"))
+
+    @property
+    def sign(self):
+        """예상전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """예상전일비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """예상등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def cvolume(self):
+        """예상체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """예상거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+
+class YK3Tick(RealtimeRecord):
+    """[YK3] KOSDAQ예상체결"""
+    __slots__ = ()
+    TR_CODE = "YK3"
+    FIELDS = ("hotime", "yeprice", "yevolume", "jnilysign", "jnilchange", "jnilydrate", "yofferho0", "ybidho0", "yofferrem0", "ybidrem0", "shcode", "exchname")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_number(self._data.get("yeprice"))
+
+    @property
+    def yevolume(self):
+        """예상체결수량"""
+        return to_number(self._data.get("yevolume"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_number(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def yofferho0(self):
+        """예상매도호가"""
+        return to_number(self._data.get("yofferho0"))
+
+    @property
+    def ybidho0(self):
+        """예상매수호가"""
+        return to_number(self._data.get("ybidho0"))
+
+    @property
+    def yofferrem0(self):
+        """예상매도호가수량"""
+        return to_number(self._data.get("yofferrem0"))
+
+    @property
+    def ybidrem0(self):
+        """예상매수호가수량"""
+        return to_number(self._data.get("ybidrem0"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+
+class YS3Tick(RealtimeRecord):
+    """[YS3] KOSPI예상체결"""
+    __slots__ = ()
+    TR_CODE = "YS3"
+    FIELDS = ("hotime", "yeprice", "yevolume", "jnilysign", "jnilchange", "jnilydrate", "yofferho0", "ybidho0", "yofferrem0", "ybidrem0", "shcode", "exchname")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_number(self._data.get("yeprice"))
+
+    @property
+    def yevolume(self):
+        """예상체결수량"""
+        return to_number(self._data.get("yevolume"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_number(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def yofferho0(self):
+        """예상매도호가"""
+        return to_number(self._data.get("yofferho0"))
+
+    @property
+    def ybidho0(self):
+        """예상매수호가"""
+        return to_number(self._data.get("ybidho0"))
+
+    @property
+    def yofferrem0(self):
+        """예상매도호가수량"""
+        return to_number(self._data.get("yofferrem0"))
+
+    @property
+    def ybidrem0(self):
+        """예상매수호가수량"""
+        return to_number(self._data.get("ybidrem0"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+
+class ESNTick(RealtimeRecord):
+    """[ESN] 뉴ELW투자지표민감도"""
+    __slots__ = ()
+    TR_CODE = "ESN"
+    FIELDS = ("time", "theoryprice", "delt", "gama", "ceta", "vega", "rhox", "impv", "egearing", "shcode", "elwclose", "sign", "change", "date", "tickvalue", "lp_impv")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def theoryprice(self):
+        """장중이론가"""
+        return to_float(self._data.get("theoryprice"))
+
+    @property
+    def delt(self):
+        """델타"""
+        return to_float(self._data.get("delt"))
+
+    @property
+    def gama(self):
+        """감마"""
+        return to_float(self._data.get("gama"))
+
+    @property
+    def ceta(self):
+        """세타"""
+        return to_float(self._data.get("ceta"))
+
+    @property
+    def vega(self):
+        """베가"""
+        return to_float(self._data.get("vega"))
+
+    @property
+    def rhox(self):
+        """로우"""
+        return to_float(self._data.get("rhox"))
+
+    @property
+    def impv(self):
+        """내재변동성"""
+        return to_float(self._data.get("impv"))
+
+    @property
+    def egearing(self):
+        """E.기어링"""
+        return to_float(self._data.get("egearing"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def elwclose(self):
+        """ELW현재가"""
+        return to_number(self._data.get("elwclose"))
+
+    @property
+    def sign(self):
+        """ELW전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """ELW전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def date(self):
+        """일자"""
+        return self._data.get("date")
+
+    @property
+    def tickvalue(self):
+        """틱환산"""
+        return to_float(self._data.get("tickvalue"))
+
+    @property
+    def lp_impv(self):
+        """LP내재변동성"""
+        return to_float(self._data.get("lp_impv"))
+
+
+class h2Tick(RealtimeRecord):
+    """[h2_] ELW장전시간외호가잔량"""
+    __slots__ = ()
+    TR_CODE = "h2_"
+    FIELDS = ("hotime", "tmofferrem", "tmbidrem", "pretmoffercha", "pretmbidcha", "shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def tmofferrem(self):
+        """시간외매도잔량"""
+        return to_number(self._data.get("tmofferrem"))
+
+    @property
+    def tmbidrem(self):
+        """시간외매수잔량"""
+        return to_number(self._data.get("tmbidrem"))
+
+    @property
+    def pretmoffercha(self):
+        """시간외매도수량직전대비"""
+        return to_number(self._data.get("pretmoffercha"))
+
+    @property
+    def pretmbidcha(self):
+        """시간외매수수량직전대비"""
+        return to_number(self._data.get("pretmbidcha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class h3Tick(RealtimeRecord):
+    """[h3_] ELW호가잔량"""
+    __slots__ = ()
+    TR_CODE = "h3_"
+    FIELDS = ("hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "lp_offerho1", "lp_bidho1", "offerho2", "bidho2", "offerrem2", "bidrem2", "lp_offerho2", "lp_bidho2", "offerho3", "bidho3", "offerrem3", "bidrem3", "lp_offerho3", "lp_bidho3", "offerho4", "bidho4", "offerrem4", "bidrem4", "lp_offerho4", "lp_bidho4", "offerho5", "bidho5", "offerrem5", "bidrem5", "lp_offerho5", "lp_bidho5", "offerho6", "bidho6", "offerrem6", "bidrem6", "lp_offerho6", "lp_bidho6", "offerho7", "bidho7", "offerrem7", "bidrem7", "lp_offerho7", "lp_bidho7", "offerho8", "bidho8", "offerrem8", "bidrem8", "lp_offerho8", "lp_bidho8", "offerho9", "bidho9", "offerrem9", "bidrem9", "lp_offerho9", "lp_bidho9", "offerho10", "bidho10", "offerrem10", "bidrem10", "lp_offerho10", "lp_bidho10", "totofferrem", "totbidrem", "donsigubun", "spread", "shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가잔량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가잔량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def lp_offerho1(self):
+        """LP매도호가수량1"""
+        return to_number(self._data.get("lp_offerho1"))
+
+    @property
+    def lp_bidho1(self):
+        """LP매수호가수량1"""
+        return to_number(self._data.get("lp_bidho1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_number(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_number(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가잔량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가잔량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def lp_offerho2(self):
+        """LP매도호가수량2"""
+        return to_number(self._data.get("lp_offerho2"))
+
+    @property
+    def lp_bidho2(self):
+        """LP매수호가수량2"""
+        return to_number(self._data.get("lp_bidho2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_number(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_number(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가잔량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가잔량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def lp_offerho3(self):
+        """LP매도호가수량3"""
+        return to_number(self._data.get("lp_offerho3"))
+
+    @property
+    def lp_bidho3(self):
+        """LP매수호가수량3"""
+        return to_number(self._data.get("lp_bidho3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_number(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_number(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가잔량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가잔량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def lp_offerho4(self):
+        """LP매도호가수량4"""
+        return to_number(self._data.get("lp_offerho4"))
+
+    @property
+    def lp_bidho4(self):
+        """LP매수호가수량4"""
+        return to_number(self._data.get("lp_bidho4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_number(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_number(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가잔량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가잔량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def lp_offerho5(self):
+        """LP매도호가수량5"""
+        return to_number(self._data.get("lp_offerho5"))
+
+    @property
+    def lp_bidho5(self):
+        """LP매수호가수량5"""
+        return to_number(self._data.get("lp_bidho5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_number(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_number(self._data.get("bidho6"))
+
+    @property
+    def offerrem6(self):
+        """매도호가잔량6"""
+        return to_number(self._data.get("offerrem6"))
+
+    @property
+    def bidrem6(self):
+        """매수호가잔량6"""
+        return to_number(self._data.get("bidrem6"))
+
+    @property
+    def lp_offerho6(self):
+        """LP매도호가수량6"""
+        return to_number(self._data.get("lp_offerho6"))
+
+    @property
+    def lp_bidho6(self):
+        """LP매수호가수량6"""
+        return to_number(self._data.get("lp_bidho6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_number(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_number(self._data.get("bidho7"))
+
+    @property
+    def offerrem7(self):
+        """매도호가잔량7"""
+        return to_number(self._data.get("offerrem7"))
+
+    @property
+    def bidrem7(self):
+        """매수호가잔량7"""
+        return to_number(self._data.get("bidrem7"))
+
+    @property
+    def lp_offerho7(self):
+        """LP매도호가수량7"""
+        return to_number(self._data.get("lp_offerho7"))
+
+    @property
+    def lp_bidho7(self):
+        """LP매수호가수량7"""
+        return to_number(self._data.get("lp_bidho7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_number(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_number(self._data.get("bidho8"))
+
+    @property
+    def offerrem8(self):
+        """매도호가잔량8"""
+        return to_number(self._data.get("offerrem8"))
+
+    @property
+    def bidrem8(self):
+        """매수호가잔량8"""
+        return to_number(self._data.get("bidrem8"))
+
+    @property
+    def lp_offerho8(self):
+        """LP매도호가수량8"""
+        return to_number(self._data.get("lp_offerho8"))
+
+    @property
+    def lp_bidho8(self):
+        """LP매수호가수량8"""
+        return to_number(self._data.get("lp_bidho8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_number(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_number(self._data.get("bidho9"))
+
+    @property
+    def offerrem9(self):
+        """매도호가잔량9"""
+        return to_number(self._data.get("offerrem9"))
+
+    @property
+    def bidrem9(self):
+        """매수호가잔량9"""
+        return to_number(self._data.get("bidrem9"))
+
+    @property
+    def lp_offerho9(self):
+        """LP매도호가수량9"""
+        return to_number(self._data.get("lp_offerho9"))
+
+    @property
+    def lp_bidho9(self):
+        """LP매수호가수량9"""
+        return to_number(self._data.get("lp_bidho9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_number(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_number(self._data.get("bidho10"))
+
+    @property
+    def offerrem10(self):
+        """매도호가잔량10"""
+        return to_number(self._data.get("offerrem10"))
+
+    @property
+    def bidrem10(self):
+        """매수호가잔량10"""
+        return to_number(self._data.get("bidrem10"))
+
+    @property
+    def lp_offerho10(self):
+        """LP매도호가수량10"""
+        return to_number(self._data.get("lp_offerho10"))
+
+    @property
+    def lp_bidho10(self):
+        """LP매수호가수량10"""
+        return to_number(self._data.get("lp_bidho10"))
+
+    @property
+    def totofferrem(self):
+        """총매도호가잔량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """총매수호가잔량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def donsigubun(self):
+        """동시호가구분"""
+        return self._data.get("donsigubun")
+
+    @property
+    def spread(self):
+        """스프레드"""
+        return to_float(self._data.get("spread"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class k1Tick(RealtimeRecord):
+    """[k1_] ELW거래원"""
+    __slots__ = ()
+    TR_CODE = "k1_"
+    FIELDS = ("offerno1", "bidno1", "offertrad1", "bidtrad1", "tradmdvol1", "tradmsvol1", "tradmdrate1", "tradmsrate1", "tradmdcha1", "tradmscha1", "offerno2", "bidno2", "offertrad2", "bidtrad2", "tradmdvol2", "tradmsvol2", "tradmdrate2", "tradmsrate2", "tradmdcha2", "tradmscha2", "offerno3", "bidno3", "offertrad3", "bidtrad3", "tradmdvol3", "tradmsvol3", "tradmdrate3", "tradmsrate3", "tradmdcha3", "tradmscha3", "offerno4", "bidno4", "offertrad4", "bidtrad4", "tradmdvol4", "tradmsvol4", "tradmdrate4", "tradmsrate4", "tradmdcha4", "tradmscha4", "offerno5", "bidno5", "offertrad5", "bidtrad5", "tradmdvol5", "tradmsvol5", "tradmdrate5", "tradmsrate5", "tradmdcha5", "tradmscha5", "ftradmdvol", "ftradmsvol", "ftradmdrate", "ftradmsrate", "ftradmdcha", "ftradmscha", "shcode")
+
+    @property
+    def offerno1(self):
+        """매도증권사코드1"""
+        return self._data.get("offerno1")
+
+    @property
+    def bidno1(self):
+        """매수증권사코드1"""
+        return self._data.get("bidno1")
+
+    @property
+    def offertrad1(self):
+        """매도회원사명1"""
+        return self._data.get("offertrad1")
+
+    @property
+    def bidtrad1(self):
+        """매수회원사명1"""
+        return self._data.get("bidtrad1")
+
+    @property
+    def tradmdvol1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("tradmdvol1"))
+
+    @property
+    def tradmsvol1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("tradmsvol1"))
+
+    @property
+    def tradmdrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmdrate1"))
+
+    @property
+    def tradmsrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmsrate1"))
+
+    @property
+    def tradmdcha1(self):
+        """매도거래량직전대비1"""
+        return to_number(self._data.get("tradmdcha1"))
+
+    @property
+    def tradmscha1(self):
+        """매수거래량직전대비1"""
+        return to_number(self._data.get("tradmscha1"))
+
+    @property
+    def offerno2(self):
+        """매도증권사코드2"""
+        return self._data.get("offerno2")
+
+    @property
+    def bidno2(self):
+        """매수증권사코드2"""
+        return self._data.get("bidno2")
+
+    @property
+    def offertrad2(self):
+        """매도회원사명2"""
+        return self._data.get("offertrad2")
+
+    @property
+    def bidtrad2(self):
+        """매수회원사명2"""
+        return self._data.get("bidtrad2")
+
+    @property
+    def tradmdvol2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("tradmdvol2"))
+
+    @property
+    def tradmsvol2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("tradmsvol2"))
+
+    @property
+    def tradmdrate2(self):
+        """매도거래량비중2"""
+        return to_float(self._data.get("tradmdrate2"))
+
+    @property
+    def tradmsrate2(self):
+        """매수거래량비중2"""
+        return to_float(self._data.get("tradmsrate2"))
+
+    @property
+    def tradmdcha2(self):
+        """매도거래량직전대비2"""
+        return to_number(self._data.get("tradmdcha2"))
+
+    @property
+    def tradmscha2(self):
+        """매수거래량직전대비2"""
+        return to_number(self._data.get("tradmscha2"))
+
+    @property
+    def offerno3(self):
+        """매도증권사코드3"""
+        return self._data.get("offerno3")
+
+    @property
+    def bidno3(self):
+        """매수증권사코드3"""
+        return self._data.get("bidno3")
+
+    @property
+    def offertrad3(self):
+        """매도회원사명3"""
+        return self._data.get("offertrad3")
+
+    @property
+    def bidtrad3(self):
+        """매수회원사명3"""
+        return self._data.get("bidtrad3")
+
+    @property
+    def tradmdvol3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("tradmdvol3"))
+
+    @property
+    def tradmsvol3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("tradmsvol3"))
+
+    @property
+    def tradmdrate3(self):
+        """매도거래량비중3"""
+        return to_float(self._data.get("tradmdrate3"))
+
+    @property
+    def tradmsrate3(self):
+        """매수거래량비중3"""
+        return to_float(self._data.get("tradmsrate3"))
+
+    @property
+    def tradmdcha3(self):
+        """매도거래량직전대비3"""
+        return to_number(self._data.get("tradmdcha3"))
+
+    @property
+    def tradmscha3(self):
+        """매수거래량직전대비3"""
+        return to_number(self._data.get("tradmscha3"))
+
+    @property
+    def offerno4(self):
+        """매도증권사코드4"""
+        return self._data.get("offerno4")
+
+    @property
+    def bidno4(self):
+        """매수증권사코드4"""
+        return self._data.get("bidno4")
+
+    @property
+    def offertrad4(self):
+        """매도회원사명4"""
+        return self._data.get("offertrad4")
+
+    @property
+    def bidtrad4(self):
+        """매수회원사명4"""
+        return self._data.get("bidtrad4")
+
+    @property
+    def tradmdvol4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("tradmdvol4"))
+
+    @property
+    def tradmsvol4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("tradmsvol4"))
+
+    @property
+    def tradmdrate4(self):
+        """매도거래량비중4"""
+        return to_float(self._data.get("tradmdrate4"))
+
+    @property
+    def tradmsrate4(self):
+        """매수거래량비중4"""
+        return to_float(self._data.get("tradmsrate4"))
+
+    @property
+    def tradmdcha4(self):
+        """매도거래량직전대비4"""
+        return to_number(self._data.get("tradmdcha4"))
+
+    @property
+    def tradmscha4(self):
+        """매수거래량직전대비4"""
+        return to_number(self._data.get("tradmscha4"))
+
+    @property
+    def offerno5(self):
+        """매도증권사코드5"""
+        return self._data.get("offerno5")
+
+    @property
+    def bidno5(self):
+        """매수증권사코드5"""
+        return self._data.get("bidno5")
+
+    @property
+    def offertrad5(self):
+        """매도회원사명5"""
+        return self._data.get("offertrad5")
+
+    @property
+    def bidtrad5(self):
+        """매수회원사명5"""
+        return self._data.get("bidtrad5")
+
+    @property
+    def tradmdvol5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("tradmdvol5"))
+
+    @property
+    def tradmsvol5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("tradmsvol5"))
+
+    @property
+    def tradmdrate5(self):
+        """매도거래량비중5"""
+        return to_float(self._data.get("tradmdrate5"))
+
+    @property
+    def tradmsrate5(self):
+        """매수거래량비중5"""
+        return to_float(self._data.get("tradmsrate5"))
+
+    @property
+    def tradmdcha5(self):
+        """매도거래량직전대비5"""
+        return to_number(self._data.get("tradmdcha5"))
+
+    @property
+    def tradmscha5(self):
+        """매수거래량직전대비5"""
+        return to_number(self._data.get("tradmscha5"))
+
+    @property
+    def ftradmdvol(self):
+        """외국계증권사매도합계"""
+        return to_number(self._data.get("ftradmdvol"))
+
+    @property
+    def ftradmsvol(self):
+        """외국계증권사매수합계"""
+        return to_number(self._data.get("ftradmsvol"))
+
+    @property
+    def ftradmdrate(self):
+        """외국계증권사매도거래량비중"""
+        return to_float(self._data.get("ftradmdrate"))
+
+    @property
+    def ftradmsrate(self):
+        """외국계증권사매수거래량비중"""
+        return to_float(self._data.get("ftradmsrate"))
+
+    @property
+    def ftradmdcha(self):
+        """외국계증권사매도거래량직전대비"""
+        return to_number(self._data.get("ftradmdcha"))
+
+    @property
+    def ftradmscha(self):
+        """외국계증권사매수거래량직전대비"""
+        return to_number(self._data.get("ftradmscha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class s2Tick(RealtimeRecord):
+    """[s2_] ELW우선호가"""
+    __slots__ = ()
+    TR_CODE = "s2_"
+    FIELDS = ("offerho", "bidho", "shcode")
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class s3Tick(RealtimeRecord):
+    """[s3_] ELW체결"""
+    __slots__ = ()
+    TR_CODE = "s3_"
+    FIELDS = ("chetime", "sign", "change", "drate", "price", "opentime", "open", "hightime", "high", "lowtime", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "w_avrg", "offerho", "bidho", "status", "jnilvolume", "premium", "moneyness", "shcode", "lpvolume")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return self._data.get("opentime")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return self._data.get("hightime")
+
+    @property
+    def high(self):
+        """고가"""
+        return to_number(self._data.get("high"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def w_avrg(self):
+        """가중평균가"""
+        return to_number(self._data.get("w_avrg"))
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def status(self):
+        """장정보"""
+        return self._data.get("status")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def premium(self):
+        """프리미엄"""
+        return to_float(self._data.get("premium"))
+
+    @property
+    def moneyness(self):
+        """ATM구분"""
+        return self._data.get("moneyness")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def lpvolume(self):
+        """LP보유수량"""
+        return to_number(self._data.get("lpvolume"))
+
+
+class s4Tick(RealtimeRecord):
+    """[s4_] ELW기세"""
+    __slots__ = ()
+    TR_CODE = "s4_"
+    FIELDS = ("sign", "change", "drate", "price", "opentime", "open", "hightime", "high", "lowtime", "low", "shcode")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return self._data.get("opentime")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return self._data.get("hightime")
+
+    @property
+    def high(self):
+        """고가"""
+        return to_number(self._data.get("high"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class Ys3Tick(RealtimeRecord):
+    """[Ys3] ELW예상체결"""
+    __slots__ = ()
+    TR_CODE = "Ys3"
+    FIELDS = ("hotime", "yeprice", "yevolume", "jnilysign", "jnilchange", "jnilydrate", "yofferho0", "ybidho0", "yofferrem0", "ybidrem0", "shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_number(self._data.get("yeprice"))
+
+    @property
+    def yevolume(self):
+        """예상체결수량"""
+        return to_number(self._data.get("yevolume"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_number(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def yofferho0(self):
+        """예상매도호가"""
+        return to_number(self._data.get("yofferho0"))
+
+    @property
+    def ybidho0(self):
+        """예상매수호가"""
+        return to_number(self._data.get("ybidho0"))
+
+    @property
+    def yofferrem0(self):
+        """예상매도호가수량"""
+        return to_number(self._data.get("yofferrem0"))
+
+    @property
+    def ybidrem0(self):
+        """예상매수호가수량"""
+        return to_number(self._data.get("ybidrem0"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class NS3Tick(RealtimeRecord):
+    """[NS3] (NXT)체결"""
+    __slots__ = ()
+    TR_CODE = "NS3"
+    FIELDS = ("chetime", "sign", "change", "drate", "price", "opentime", "open", "hightime", "lowtime", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "w_avrg", "offerho", "bidho", "status", "jnilvolume", "shcode", "exchname", "ex_shcode")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return self._data.get("opentime")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return to_number(self._data.get("hightime"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def w_avrg(self):
+        """가중평균가"""
+        return to_number(self._data.get("w_avrg"))
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def status(self):
+        """장정보"""
+        return self._data.get("status")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class NH1Tick(RealtimeRecord):
+    """[NH1] (NXT)호가잔량"""
+    __slots__ = ()
+    TR_CODE = "NH1"
+    FIELDS = ("hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offerho6", "bidho6", "offerrem6", "bidrem6", "offerho7", "bidho7", "offerrem7", "bidrem7", "offerho8", "bidho8", "offerrem8", "bidrem8", "offerho9", "bidho9", "offerrem9", "bidrem9", "offerho10", "bidho10", "offerrem10", "bidrem10", "totofferrem", "totbidrem", "donsigubun", "shcode", "alloc_gubun", "volume", "midprice", "offermidsumrem", "bidmidsumrem", "midsumrem", "midsumremgubun", "ex_shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가잔량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가잔량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_number(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_number(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가잔량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가잔량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_number(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_number(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가잔량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가잔량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_number(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_number(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가잔량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가잔량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_number(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_number(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가잔량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가잔량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_number(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_number(self._data.get("bidho6"))
+
+    @property
+    def offerrem6(self):
+        """매도호가잔량6"""
+        return to_number(self._data.get("offerrem6"))
+
+    @property
+    def bidrem6(self):
+        """매수호가잔량6"""
+        return to_number(self._data.get("bidrem6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_number(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_number(self._data.get("bidho7"))
+
+    @property
+    def offerrem7(self):
+        """매도호가잔량7"""
+        return to_number(self._data.get("offerrem7"))
+
+    @property
+    def bidrem7(self):
+        """매수호가잔량7"""
+        return to_number(self._data.get("bidrem7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_number(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_number(self._data.get("bidho8"))
+
+    @property
+    def offerrem8(self):
+        """매도호가잔량8"""
+        return to_number(self._data.get("offerrem8"))
+
+    @property
+    def bidrem8(self):
+        """매수호가잔량8"""
+        return to_number(self._data.get("bidrem8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_number(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_number(self._data.get("bidho9"))
+
+    @property
+    def offerrem9(self):
+        """매도호가잔량9"""
+        return to_number(self._data.get("offerrem9"))
+
+    @property
+    def bidrem9(self):
+        """매수호가잔량9"""
+        return to_number(self._data.get("bidrem9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_number(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_number(self._data.get("bidho10"))
+
+    @property
+    def offerrem10(self):
+        """매도호가잔량10"""
+        return to_number(self._data.get("offerrem10"))
+
+    @property
+    def bidrem10(self):
+        """매수호가잔량10"""
+        return to_number(self._data.get("bidrem10"))
+
+    @property
+    def totofferrem(self):
+        """총매도호가잔량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """총매수호가잔량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def donsigubun(self):
+        """동시호가구분"""
+        return self._data.get("donsigubun")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def midprice(self):
+        """중간가격"""
+        return to_number(self._data.get("midprice"))
+
+    @property
+    def offermidsumrem(self):
+        """매도중간가잔량합계수량"""
+        return to_number(self._data.get("offermidsumrem"))
+
+    @property
+    def bidmidsumrem(self):
+        """매수중간가잔량합계수량"""
+        return to_number(self._data.get("bidmidsumrem"))
+
+    @property
+    def midsumrem(self):
+        """중간가잔량합계수량"""
+        return to_number(self._data.get("midsumrem"))
+
+    @property
+    def midsumremgubun(self):
+        """중간가잔량구분(''없음'1'매도'2'매수)"""
+        return self._data.get("midsumremgubun")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class NS2Tick(RealtimeRecord):
+    """[NS2] (NXT)우선호가"""
+    __slots__ = ()
+    TR_CODE = "NS2"
+    FIELDS = ("offerho", "bidho", "shcode", "ex_shcode")
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class NYSTick(RealtimeRecord):
+    """[NYS] (NXT)예상체결"""
+    __slots__ = ()
+    TR_CODE = "NYS"
+    FIELDS = ("hotime", "yeprice", "yevolume", "jnilysign", "jnilchange", "jnilydrate", "yofferho0", "ybidho0", "yofferrem0", "ybidrem0", "shcode", "exchname", "ex_shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_number(self._data.get("yeprice"))
+
+    @property
+    def yevolume(self):
+        """예상체결수량"""
+        return to_number(self._data.get("yevolume"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_number(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def yofferho0(self):
+        """예상매도호가"""
+        return to_number(self._data.get("yofferho0"))
+
+    @property
+    def ybidho0(self):
+        """예상매수호가"""
+        return to_number(self._data.get("ybidho0"))
+
+    @property
+    def yofferrem0(self):
+        """예상매도호가수량"""
+        return to_number(self._data.get("yofferrem0"))
+
+    @property
+    def ybidrem0(self):
+        """예상매수호가수량"""
+        return to_number(self._data.get("ybidrem0"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class NVITick(RealtimeRecord):
+    """[NVI] (NXT)VI 발동 해제"""
+    __slots__ = ()
+    TR_CODE = "NVI"
+    FIELDS = ("vi_gubun", "svi_recprice", "dvi_recprice", "vi_trgprice", "shcode", "ref_shcode", "time", "exchname", "ex_shcode")
+
+    @property
+    def vi_gubun(self):
+        """구분"""
+        return self._data.get("vi_gubun")
+
+    @property
+    def svi_recprice(self):
+        """정적VI발동기준가격"""
+        return to_number(self._data.get("svi_recprice"))
+
+    @property
+    def dvi_recprice(self):
+        """동적VI발동기준가격"""
+        return to_number(self._data.get("dvi_recprice"))
+
+    @property
+    def vi_trgprice(self):
+        """VI발동가격"""
+        return to_number(self._data.get("vi_trgprice"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def ref_shcode(self):
+        """참조코드(미사용)"""
+        return self._data.get("ref_shcode")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class NK1Tick(RealtimeRecord):
+    """[NK1] (NXT)거래원"""
+    __slots__ = ()
+    TR_CODE = "NK1"
+    FIELDS = ("offerno1", "bidno1", "offertrad1", "bidtrad1", "tradmdvol1", "tradmsvol1", "tradmdrate1", "tradmsrate1", "tradmdcha1", "tradmscha1", "offerno2", "bidno2", "offertrad2", "bidtrad2", "tradmdvol2", "tradmsvol2", "tradmdrate2", "tradmsrate2", "tradmdcha2", "tradmscha2", "offerno3", "bidno3", "offertrad3", "bidtrad3", "tradmdvol3", "tradmsvol3", "tradmdrate3", "tradmsrate3", "tradmdcha3", "tradmscha3", "offerno4", "bidno4", "offertrad4", "bidtrad4", "tradmdvol4", "tradmsvol4", "tradmdrate4", "tradmsrate4", "tradmdcha4", "tradmscha4", "offerno5", "bidno5", "offertrad5", "bidtrad5", "tradmdvol5", "tradmsvol5", "tradmdrate5", "tradmsrate5", "tradmdcha5", "tradmscha5", "ftradmdvol", "ftradmsvol", "ftradmdrate", "ftradmsrate", "ftradmdcha", "ftradmscha", "shcode", "tradmdval1", "tradmsval1", "tradmdavg1", "tradmsavg1", "tradmdval2", "tradmsval2", "tradmdavg2", "tradmsavg2", "tradmdval3", "tradmsval3", "tradmdavg3", "tradmsavg3", "tradmdval4", "tradmsval4", "tradmdavg4", "tradmsavg4", "tradmdval5", "tradmsval5", "tradmdavg5", "tradmsavg5", "ftradmdval", "ftradmsval", "ftradmdavg", "ftradmsavg", "time", "exchname", "ex_shcode")
+
+    @property
+    def offerno1(self):
+        """매도증권사코드1"""
+        return self._data.get("offerno1")
+
+    @property
+    def bidno1(self):
+        """매수증권사코드1"""
+        return self._data.get("bidno1")
+
+    @property
+    def offertrad1(self):
+        """매도회원사명1"""
+        return self._data.get("offertrad1")
+
+    @property
+    def bidtrad1(self):
+        """매수회원사명1"""
+        return self._data.get("bidtrad1")
+
+    @property
+    def tradmdvol1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("tradmdvol1"))
+
+    @property
+    def tradmsvol1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("tradmsvol1"))
+
+    @property
+    def tradmdrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmdrate1"))
+
+    @property
+    def tradmsrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmsrate1"))
+
+    @property
+    def tradmdcha1(self):
+        """매도거래량직전대비1"""
+        return to_number(self._data.get("tradmdcha1"))
+
+    @property
+    def tradmscha1(self):
+        """매수거래량직전대비1"""
+        return to_number(self._data.get("tradmscha1"))
+
+    @property
+    def offerno2(self):
+        """매도증권사코드2"""
+        return self._data.get("offerno2")
+
+    @property
+    def bidno2(self):
+        """매수증권사코드2"""
+        return self._data.get("bidno2")
+
+    @property
+    def offertrad2(self):
+        """매도회원사명2"""
+        return self._data.get("offertrad2")
+
+    @property
+    def bidtrad2(self):
+        """매수회원사명2"""
+        return self._data.get("bidtrad2")
+
+    @property
+    def tradmdvol2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("tradmdvol2"))
+
+    @property
+    def tradmsvol2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("tradmsvol2"))
+
+    @property
+    def tradmdrate2(self):
+        """매도거래량비중2"""
+        return to_float(self._data.get("tradmdrate2"))
+
+    @property
+    def tradmsrate2(self):
+        """매수거래량비중2"""
+        return to_float(self._data.get("tradmsrate2"))
+
+    @property
+    def tradmdcha2(self):
+        """매도거래량직전대비2"""
+        return to_number(self._data.get("tradmdcha2"))
+
+    @property
+    def tradmscha2(self):
+        """매수거래량직전대비2"""
+        return to_number(self._data.get("tradmscha2"))
+
+    @property
+    def offerno3(self):
+        """매도증권사코드3"""
+        return self._data.get("offerno3")
+
+    @property
+    def bidno3(self):
+        """매수증권사코드3"""
+        return self._data.get("bidno3")
+
+    @property
+    def offertrad3(self):
+        """매도회원사명3"""
+        return self._data.get("offertrad3")
+
+    @property
+    def bidtrad3(self):
+        """매수회원사명3"""
+        return self._data.get("bidtrad3")
+
+    @property
+    def tradmdvol3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("tradmdvol3"))
+
+    @property
+    def tradmsvol3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("tradmsvol3"))
+
+    @property
+    def tradmdrate3(self):
+        """매도거래량비중3"""
+        return to_float(self._data.get("tradmdrate3"))
+
+    @property
+    def tradmsrate3(self):
+        """매수거래량비중3"""
+        return to_float(self._data.get("tradmsrate3"))
+
+    @property
+    def tradmdcha3(self):
+        """매도거래량직전대비3"""
+        return to_number(self._data.get("tradmdcha3"))
+
+    @property
+    def tradmscha3(self):
+        """매수거래량직전대비3"""
+        return to_number(self._data.get("tradmscha3"))
+
+    @property
+    def offerno4(self):
+        """매도증권사코드4"""
+        return self._data.get("offerno4")
+
+    @property
+    def bidno4(self):
+        """매수증권사코드4"""
+        return self._data.get("bidno4")
+
+    @property
+    def offertrad4(self):
+        """매도회원사명4"""
+        return self._data.get("offertrad4")
+
+    @property
+    def bidtrad4(self):
+        """매수회원사명4"""
+        return self._data.get("bidtrad4")
+
+    @property
+    def tradmdvol4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("tradmdvol4"))
+
+    @property
+    def tradmsvol4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("tradmsvol4"))
+
+    @property
+    def tradmdrate4(self):
+        """매도거래량비중4"""
+        return to_float(self._data.get("tradmdrate4"))
+
+    @property
+    def tradmsrate4(self):
+        """매수거래량비중4"""
+        return to_float(self._data.get("tradmsrate4"))
+
+    @property
+    def tradmdcha4(self):
+        """매도거래량직전대비4"""
+        return to_number(self._data.get("tradmdcha4"))
+
+    @property
+    def tradmscha4(self):
+        """매수거래량직전대비4"""
+        return to_number(self._data.get("tradmscha4"))
+
+    @property
+    def offerno5(self):
+        """매도증권사코드5"""
+        return self._data.get("offerno5")
+
+    @property
+    def bidno5(self):
+        """매수증권사코드5"""
+        return self._data.get("bidno5")
+
+    @property
+    def offertrad5(self):
+        """매도회원사명5"""
+        return self._data.get("offertrad5")
+
+    @property
+    def bidtrad5(self):
+        """매수회원사명5"""
+        return self._data.get("bidtrad5")
+
+    @property
+    def tradmdvol5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("tradmdvol5"))
+
+    @property
+    def tradmsvol5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("tradmsvol5"))
+
+    @property
+    def tradmdrate5(self):
+        """매도거래량비중5"""
+        return to_float(self._data.get("tradmdrate5"))
+
+    @property
+    def tradmsrate5(self):
+        """매수거래량비중5"""
+        return to_float(self._data.get("tradmsrate5"))
+
+    @property
+    def tradmdcha5(self):
+        """매도거래량직전대비5"""
+        return to_number(self._data.get("tradmdcha5"))
+
+    @property
+    def tradmscha5(self):
+        """매수거래량직전대비5"""
+        return to_number(self._data.get("tradmscha5"))
+
+    @property
+    def ftradmdvol(self):
+        """외국계증권사매도합계"""
+        return to_number(self._data.get("ftradmdvol"))
+
+    @property
+    def ftradmsvol(self):
+        """외국계증권사매수합계"""
+        return to_number(self._data.get("ftradmsvol"))
+
+    @property
+    def ftradmdrate(self):
+        """외국계증권사매도거래량비중"""
+        return to_float(self._data.get("ftradmdrate"))
+
+    @property
+    def ftradmsrate(self):
+        """외국계증권사매수거래량비중"""
+        return to_float(self._data.get("ftradmsrate"))
+
+    @property
+    def ftradmdcha(self):
+        """외국계증권사매도거래량직전대비"""
+        return to_number(self._data.get("ftradmdcha"))
+
+    @property
+    def ftradmscha(self):
+        """외국계증권사매수거래량직전대비"""
+        return to_number(self._data.get("ftradmscha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return to_number(self._data.get("shcode"))
+
+    @property
+    def tradmdval1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("tradmdval1"))
+
+    @property
+    def tradmsval1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("tradmsval1"))
+
+    @property
+    def tradmdavg1(self):
+        """매도평균단가1"""
+        return to_number(self._data.get("tradmdavg1"))
+
+    @property
+    def tradmsavg1(self):
+        """매수평균단가1"""
+        return to_number(self._data.get("tradmsavg1"))
+
+    @property
+    def tradmdval2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("tradmdval2"))
+
+    @property
+    def tradmsval2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("tradmsval2"))
+
+    @property
+    def tradmdavg2(self):
+        """매도평균단가2"""
+        return to_number(self._data.get("tradmdavg2"))
+
+    @property
+    def tradmsavg2(self):
+        """매수평균단가2"""
+        return to_number(self._data.get("tradmsavg2"))
+
+    @property
+    def tradmdval3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("tradmdval3"))
+
+    @property
+    def tradmsval3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("tradmsval3"))
+
+    @property
+    def tradmdavg3(self):
+        """매도평균단가3"""
+        return to_number(self._data.get("tradmdavg3"))
+
+    @property
+    def tradmsavg3(self):
+        """매수평균단가3"""
+        return to_number(self._data.get("tradmsavg3"))
+
+    @property
+    def tradmdval4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("tradmdval4"))
+
+    @property
+    def tradmsval4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("tradmsval4"))
+
+    @property
+    def tradmdavg4(self):
+        """매도평균단가4"""
+        return to_number(self._data.get("tradmdavg4"))
+
+    @property
+    def tradmsavg4(self):
+        """매수평균단가4"""
+        return to_number(self._data.get("tradmsavg4"))
+
+    @property
+    def tradmdval5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("tradmdval5"))
+
+    @property
+    def tradmsval5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("tradmsval5"))
+
+    @property
+    def tradmdavg5(self):
+        """매도평균단가5"""
+        return to_number(self._data.get("tradmdavg5"))
+
+    @property
+    def tradmsavg5(self):
+        """매수평균단가5"""
+        return to_number(self._data.get("tradmsavg5"))
+
+    @property
+    def ftradmdval(self):
+        """외국계증권사매도거래대금"""
+        return to_number(self._data.get("ftradmdval"))
+
+    @property
+    def ftradmsval(self):
+        """외국계증권사매수거래대금"""
+        return to_number(self._data.get("ftradmsval"))
+
+    @property
+    def ftradmdavg(self):
+        """외국계증권사매도평균단가"""
+        return to_number(self._data.get("ftradmdavg"))
+
+    @property
+    def ftradmsavg(self):
+        """외국계증권사매수평균단가"""
+        return to_number(self._data.get("ftradmsavg"))
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class NPHTick(RealtimeRecord):
+    """[NPH] (NXT)프로그램매매종목별"""
+    __slots__ = ()
+    TR_CODE = "NPH"
+    FIELDS = ("time", "price", "sign", "change", "volume", "drate", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "dwcvolume", "swcvolume", "djcvolume", "sjcvolume", "tdvolume", "tsvolume", "tvol", "dwcvalue", "swcvalue", "djcvalue", "sjcvalue", "tdvalue", "tsvalue", "tval", "pdgvolume", "psgvolume", "shcode", "ex_shcode")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return to_number(self._data.get("sign"))
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def cdhrem(self):
+        """차익매도호가잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def dwcvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwcvolume"))
+
+    @property
+    def swcvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swcvolume"))
+
+    @property
+    def djcvolume(self):
+        """전체매도자기체결수량"""
+        return to_number(self._data.get("djcvolume"))
+
+    @property
+    def sjcvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjcvolume"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수수량"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def dwcvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwcvalue"))
+
+    @property
+    def swcvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swcvalue"))
+
+    @property
+    def djcvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djcvalue"))
+
+    @property
+    def sjcvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjcvalue"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수금액"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def pdgvolume(self):
+        """매도사전공시수량"""
+        return to_number(self._data.get("pdgvolume"))
+
+    @property
+    def psgvolume(self):
+        """매수사전공시수량"""
+        return to_number(self._data.get("psgvolume"))
+
+    @property
+    def shcode(self):
+        """종목코드"""
+        return to_number(self._data.get("shcode"))
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return to_number(self._data.get("ex_shcode"))
+
+
+class NPMTick(RealtimeRecord):
+    """[NPM] (NXT)프로그램매매전체집계"""
+    __slots__ = ()
+    TR_CODE = "NPM"
+    FIELDS = ("time", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "cdwvolume", "cdjvolume", "cswvolume", "csjvolume", "cwvol", "cjvol", "bdwvolume", "bdjvolume", "bswvolume", "bsjvolume", "bwvol", "bjvol", "dwvolume", "swvolume", "wvol", "djvolume", "sjvolume", "jvol", "cdwvalue", "cdjvalue", "cswvalue", "csjvalue", "cwval", "cjval", "bdwvalue", "bdjvalue", "bswvalue", "bsjvalue", "bwval", "bjval", "dwvalue", "swvalue", "wval", "djvalue", "sjvalue", "jval", "k200jisu", "k200sign", "change", "k200basis", "cdvolume", "csvolume", "cvol", "bdvolume", "bsvolume", "bvol", "tdvolume", "tsvolume", "tvol", "cdvalue", "csvalue", "cval", "bdvalue", "bsvalue", "bval", "tdvalue", "tsvalue", "tval", "p_cdvolcha", "p_csvolcha", "p_cvolcha", "p_bdvolcha", "p_bsvolcha", "p_bvolcha", "p_tdvolcha", "p_tsvolcha", "p_tvolcha", "p_cdvalcha", "p_csvalcha", "p_cvalcha", "p_bdvalcha", "p_bsvalcha", "p_bvalcha", "p_tdvalcha", "p_tsvalcha", "p_tvalcha", "gubun", "ex_gubun")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def cdhrem(self):
+        """차익매도호가잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def cdwvolume(self):
+        """차익매도위탁체결수량"""
+        return to_number(self._data.get("cdwvolume"))
+
+    @property
+    def cdjvolume(self):
+        """차익매도자기체결수량"""
+        return to_number(self._data.get("cdjvolume"))
+
+    @property
+    def cswvolume(self):
+        """차익매수위탁체결수량"""
+        return to_number(self._data.get("cswvolume"))
+
+    @property
+    def csjvolume(self):
+        """차익매수자기체결수량"""
+        return to_number(self._data.get("csjvolume"))
+
+    @property
+    def cwvol(self):
+        """차익위탁순매수수량"""
+        return to_number(self._data.get("cwvol"))
+
+    @property
+    def cjvol(self):
+        """차익자기순매수수량"""
+        return to_number(self._data.get("cjvol"))
+
+    @property
+    def bdwvolume(self):
+        """비차익매도위탁체결수량"""
+        return to_number(self._data.get("bdwvolume"))
+
+    @property
+    def bdjvolume(self):
+        """비차익매도자기체결수량"""
+        return to_number(self._data.get("bdjvolume"))
+
+    @property
+    def bswvolume(self):
+        """비차익매수위탁체결수량"""
+        return to_number(self._data.get("bswvolume"))
+
+    @property
+    def bsjvolume(self):
+        """비차익매수자기체결수량"""
+        return to_number(self._data.get("bsjvolume"))
+
+    @property
+    def bwvol(self):
+        """비차익위탁순매수수량"""
+        return to_number(self._data.get("bwvol"))
+
+    @property
+    def bjvol(self):
+        """비차익자기순매수수량"""
+        return to_number(self._data.get("bjvol"))
+
+    @property
+    def dwvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwvolume"))
+
+    @property
+    def swvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swvolume"))
+
+    @property
+    def wvol(self):
+        """전체위탁순매수수량"""
+        return to_number(self._data.get("wvol"))
+
+    @property
+    def djvolume(self):
+        """전체매도자기체결수량"""
+        return to_number(self._data.get("djvolume"))
+
+    @property
+    def sjvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjvolume"))
+
+    @property
+    def jvol(self):
+        """전체자기순매수수량"""
+        return to_number(self._data.get("jvol"))
+
+    @property
+    def cdwvalue(self):
+        """차익매도위탁체결금액"""
+        return to_number(self._data.get("cdwvalue"))
+
+    @property
+    def cdjvalue(self):
+        """차익매도자기체결금액"""
+        return to_number(self._data.get("cdjvalue"))
+
+    @property
+    def cswvalue(self):
+        """차익매수위탁체결금액"""
+        return to_number(self._data.get("cswvalue"))
+
+    @property
+    def csjvalue(self):
+        """차익매수자기체결금액"""
+        return to_number(self._data.get("csjvalue"))
+
+    @property
+    def cwval(self):
+        """차익위탁순매수금액"""
+        return to_number(self._data.get("cwval"))
+
+    @property
+    def cjval(self):
+        """차익자기순매수금액"""
+        return to_number(self._data.get("cjval"))
+
+    @property
+    def bdwvalue(self):
+        """비차익매도위탁체결금액"""
+        return to_number(self._data.get("bdwvalue"))
+
+    @property
+    def bdjvalue(self):
+        """비차익매도자기체결금액"""
+        return to_number(self._data.get("bdjvalue"))
+
+    @property
+    def bswvalue(self):
+        """비차익매수위탁체결금액"""
+        return to_number(self._data.get("bswvalue"))
+
+    @property
+    def bsjvalue(self):
+        """비차익매수자기체결금액"""
+        return to_number(self._data.get("bsjvalue"))
+
+    @property
+    def bwval(self):
+        """비차익위탁순매수금액"""
+        return to_number(self._data.get("bwval"))
+
+    @property
+    def bjval(self):
+        """비차익자기순매수금액"""
+        return to_number(self._data.get("bjval"))
+
+    @property
+    def dwvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwvalue"))
+
+    @property
+    def swvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swvalue"))
+
+    @property
+    def wval(self):
+        """전체위탁순매수금액"""
+        return to_number(self._data.get("wval"))
+
+    @property
+    def djvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djvalue"))
+
+    @property
+    def sjvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjvalue"))
+
+    @property
+    def jval(self):
+        """전체자기순매수금액"""
+        return to_number(self._data.get("jval"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def k200sign(self):
+        """KOSPI200전일대비구분"""
+        return self._data.get("k200sign")
+
+    @property
+    def change(self):
+        """KOSPI200전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def k200basis(self):
+        """KOSPI200베이시스"""
+        return to_float(self._data.get("k200basis"))
+
+    @property
+    def cdvolume(self):
+        """차익매도체결수량합계"""
+        return to_number(self._data.get("cdvolume"))
+
+    @property
+    def csvolume(self):
+        """차익매수체결수량합계"""
+        return to_number(self._data.get("csvolume"))
+
+    @property
+    def cvol(self):
+        """차익순매수수량합계"""
+        return to_number(self._data.get("cvol"))
+
+    @property
+    def bdvolume(self):
+        """비차익매도체결수량합계"""
+        return to_number(self._data.get("bdvolume"))
+
+    @property
+    def bsvolume(self):
+        """비차익매수체결수량합계"""
+        return to_number(self._data.get("bsvolume"))
+
+    @property
+    def bvol(self):
+        """비차익순매수수량합계"""
+        return to_number(self._data.get("bvol"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량합계"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량합계"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수수량합계"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def cdvalue(self):
+        """차익매도체결금액합계"""
+        return to_number(self._data.get("cdvalue"))
+
+    @property
+    def csvalue(self):
+        """차익매수체결금액합계"""
+        return to_number(self._data.get("csvalue"))
+
+    @property
+    def cval(self):
+        """차익순매수금액합계"""
+        return to_number(self._data.get("cval"))
+
+    @property
+    def bdvalue(self):
+        """비차익매도체결금액합계"""
+        return to_number(self._data.get("bdvalue"))
+
+    @property
+    def bsvalue(self):
+        """비차익매수체결금액합계"""
+        return to_number(self._data.get("bsvalue"))
+
+    @property
+    def bval(self):
+        """비차익순매수금액합계"""
+        return to_number(self._data.get("bval"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액합계"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액합계"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수금액합계"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def p_cdvolcha(self):
+        """차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_cdvolcha"))
+
+    @property
+    def p_csvolcha(self):
+        """차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_csvolcha"))
+
+    @property
+    def p_cvolcha(self):
+        """차익순매수수량직전대비"""
+        return to_number(self._data.get("p_cvolcha"))
+
+    @property
+    def p_bdvolcha(self):
+        """비차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_bdvolcha"))
+
+    @property
+    def p_bsvolcha(self):
+        """비차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_bsvolcha"))
+
+    @property
+    def p_bvolcha(self):
+        """비차익순매수수량직전대비"""
+        return to_number(self._data.get("p_bvolcha"))
+
+    @property
+    def p_tdvolcha(self):
+        """전체매도체결수량직전대비"""
+        return to_number(self._data.get("p_tdvolcha"))
+
+    @property
+    def p_tsvolcha(self):
+        """전체매수체결수량직전대비"""
+        return to_number(self._data.get("p_tsvolcha"))
+
+    @property
+    def p_tvolcha(self):
+        """전체순매수수량직전대비"""
+        return to_number(self._data.get("p_tvolcha"))
+
+    @property
+    def p_cdvalcha(self):
+        """차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_cdvalcha"))
+
+    @property
+    def p_csvalcha(self):
+        """차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_csvalcha"))
+
+    @property
+    def p_cvalcha(self):
+        """차익순매수금액직전대비"""
+        return to_number(self._data.get("p_cvalcha"))
+
+    @property
+    def p_bdvalcha(self):
+        """비차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_bdvalcha"))
+
+    @property
+    def p_bsvalcha(self):
+        """비차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_bsvalcha"))
+
+    @property
+    def p_bvalcha(self):
+        """비차익순매수금액직전대비"""
+        return to_number(self._data.get("p_bvalcha"))
+
+    @property
+    def p_tdvalcha(self):
+        """전체매도체결금액직전대비"""
+        return to_number(self._data.get("p_tdvalcha"))
+
+    @property
+    def p_tsvalcha(self):
+        """전체매수체결금액직전대비"""
+        return to_number(self._data.get("p_tsvalcha"))
+
+    @property
+    def p_tvalcha(self):
+        """전체순매수금액직전대비"""
+        return to_number(self._data.get("p_tvalcha"))
+
+    @property
+    def gubun(self):
+        """구분값"""
+        return self._data.get("gubun")
+
+    @property
+    def ex_gubun(self):
+        """거래소별구분값"""
+        return self._data.get("ex_gubun")
+
+
+class NBTTick(RealtimeRecord):
+    """[NBT] (NXT)시간대별투자자매매추이"""
+    __slots__ = ()
+    TR_CODE = "NBT"
+    FIELDS = ("tjjtime", "tjjcode1", "msvolume1", "mdvolume1", "msvol1", "msvalue1", "mdvalue1", "msval1", "tjjcode2", "msvolume2", "mdvolume2", "msvol2", "msvalue2", "mdvalue2", "msval2", "tjjcode3", "msvolume3", "mdvolume3", "msvol3", "msvalue3", "mdvalue3", "msval3", "tjjcode4", "msvolume4", "mdvolume4", "msvol4", "msvalue4", "mdvalue4", "msval4", "tjjcode5", "msvolume5", "mdvolume5", "msvol5", "msvalue5", "mdvalue5", "msval5", "tjjcode6", "msvolume6", "mdvolume6", "msvol6", "msvalue6", "mdvalue6", "msval6", "tjjcode7", "msvolume7", "mdvolume7", "msvol7", "msvalue7", "mdvalue7", "msval7", "tjjcode8", "msvolume8", "mdvolume8", "msvol8", "msvalue8", "mdvalue8", "msval8", "tjjcode9", "msvolume9", "mdvolume9", "msvol9", "msvalue9", "mdvalue9", "msval9", "tjjcode10", "msvolume10", "mdvolume10", "msvol10", "msvalue10", "mdvalue10", "msval10", "tjjcode11", "msvolume11", "mdvolume11", "msvol11", "msvalue11", "mdvalue11", "msval11", "upcode", "tjjcode0", "msvolume0", "mdvolume0", "msvol0", "msvalue0", "mdvalue0", "msval0", "ex_upcode")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def tjjcode1(self):
+        """투자자코드1(개인)"""
+        return self._data.get("tjjcode1")
+
+    @property
+    def msvolume1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("msvolume1"))
+
+    @property
+    def mdvolume1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("mdvolume1"))
+
+    @property
+    def msvol1(self):
+        """거래량순매수1"""
+        return to_number(self._data.get("msvol1"))
+
+    @property
+    def msvalue1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("msvalue1"))
+
+    @property
+    def mdvalue1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("mdvalue1"))
+
+    @property
+    def msval1(self):
+        """거래대금순매수1"""
+        return to_number(self._data.get("msval1"))
+
+    @property
+    def tjjcode2(self):
+        """투자자코드2(외국인)"""
+        return self._data.get("tjjcode2")
+
+    @property
+    def msvolume2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("msvolume2"))
+
+    @property
+    def mdvolume2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("mdvolume2"))
+
+    @property
+    def msvol2(self):
+        """거래량순매수2"""
+        return to_number(self._data.get("msvol2"))
+
+    @property
+    def msvalue2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("msvalue2"))
+
+    @property
+    def mdvalue2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("mdvalue2"))
+
+    @property
+    def msval2(self):
+        """거래대금순매수2"""
+        return to_number(self._data.get("msval2"))
+
+    @property
+    def tjjcode3(self):
+        """투자자코드3(기관계)"""
+        return self._data.get("tjjcode3")
+
+    @property
+    def msvolume3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("msvolume3"))
+
+    @property
+    def mdvolume3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("mdvolume3"))
+
+    @property
+    def msvol3(self):
+        """거래량순매수3"""
+        return to_number(self._data.get("msvol3"))
+
+    @property
+    def msvalue3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("msvalue3"))
+
+    @property
+    def mdvalue3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("mdvalue3"))
+
+    @property
+    def msval3(self):
+        """거래대금순매수3"""
+        return to_number(self._data.get("msval3"))
+
+    @property
+    def tjjcode4(self):
+        """투자자코드4(증권)"""
+        return self._data.get("tjjcode4")
+
+    @property
+    def msvolume4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("msvolume4"))
+
+    @property
+    def mdvolume4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("mdvolume4"))
+
+    @property
+    def msvol4(self):
+        """거래량순매수4"""
+        return to_number(self._data.get("msvol4"))
+
+    @property
+    def msvalue4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("msvalue4"))
+
+    @property
+    def mdvalue4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("mdvalue4"))
+
+    @property
+    def msval4(self):
+        """거래대금순매수4"""
+        return to_number(self._data.get("msval4"))
+
+    @property
+    def tjjcode5(self):
+        """투자자코드5(투신)"""
+        return self._data.get("tjjcode5")
+
+    @property
+    def msvolume5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("msvolume5"))
+
+    @property
+    def mdvolume5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("mdvolume5"))
+
+    @property
+    def msvol5(self):
+        """거래량순매수5"""
+        return to_number(self._data.get("msvol5"))
+
+    @property
+    def msvalue5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("msvalue5"))
+
+    @property
+    def mdvalue5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("mdvalue5"))
+
+    @property
+    def msval5(self):
+        """거래대금순매수5"""
+        return to_number(self._data.get("msval5"))
+
+    @property
+    def tjjcode6(self):
+        """투자자코드6(은행)"""
+        return self._data.get("tjjcode6")
+
+    @property
+    def msvolume6(self):
+        """매수거래량6"""
+        return to_number(self._data.get("msvolume6"))
+
+    @property
+    def mdvolume6(self):
+        """매도거래량6"""
+        return to_number(self._data.get("mdvolume6"))
+
+    @property
+    def msvol6(self):
+        """거래량순매수6"""
+        return to_number(self._data.get("msvol6"))
+
+    @property
+    def msvalue6(self):
+        """매수거래대금6"""
+        return to_number(self._data.get("msvalue6"))
+
+    @property
+    def mdvalue6(self):
+        """매도거래대금6"""
+        return to_number(self._data.get("mdvalue6"))
+
+    @property
+    def msval6(self):
+        """거래대금순매수6"""
+        return to_number(self._data.get("msval6"))
+
+    @property
+    def tjjcode7(self):
+        """투자자코드7(보험)"""
+        return self._data.get("tjjcode7")
+
+    @property
+    def msvolume7(self):
+        """매수거래량7"""
+        return to_number(self._data.get("msvolume7"))
+
+    @property
+    def mdvolume7(self):
+        """매도거래량7"""
+        return to_number(self._data.get("mdvolume7"))
+
+    @property
+    def msvol7(self):
+        """거래량순매수7"""
+        return to_number(self._data.get("msvol7"))
+
+    @property
+    def msvalue7(self):
+        """매수거래대금7"""
+        return to_number(self._data.get("msvalue7"))
+
+    @property
+    def mdvalue7(self):
+        """매도거래대금7"""
+        return to_number(self._data.get("mdvalue7"))
+
+    @property
+    def msval7(self):
+        """거래대금순매수7"""
+        return to_number(self._data.get("msval7"))
+
+    @property
+    def tjjcode8(self):
+        """투자자코드8(종금)"""
+        return self._data.get("tjjcode8")
+
+    @property
+    def msvolume8(self):
+        """매수거래량8"""
+        return to_number(self._data.get("msvolume8"))
+
+    @property
+    def mdvolume8(self):
+        """매도거래량8"""
+        return to_number(self._data.get("mdvolume8"))
+
+    @property
+    def msvol8(self):
+        """거래량순매수8"""
+        return to_number(self._data.get("msvol8"))
+
+    @property
+    def msvalue8(self):
+        """매수거래대금8"""
+        return to_number(self._data.get("msvalue8"))
+
+    @property
+    def mdvalue8(self):
+        """매도거래대금8"""
+        return to_number(self._data.get("mdvalue8"))
+
+    @property
+    def msval8(self):
+        """거래대금순매수8"""
+        return to_number(self._data.get("msval8"))
+
+    @property
+    def tjjcode9(self):
+        """투자자코드9(기금)"""
+        return to_number(self._data.get("tjjcode9"))
+
+    @property
+    def msvolume9(self):
+        """매수거래량9"""
+        return to_number(self._data.get("msvolume9"))
+
+    @property
+    def mdvolume9(self):
+        """매도거래량9"""
+        return to_number(self._data.get("mdvolume9"))
+
+    @property
+    def msvol9(self):
+        """거래량순매수9"""
+        return to_number(self._data.get("msvol9"))
+
+    @property
+    def msvalue9(self):
+        """매수거래대금9"""
+        return to_number(self._data.get("msvalue9"))
+
+    @property
+    def mdvalue9(self):
+        """매도거래대금9"""
+        return to_number(self._data.get("mdvalue9"))
+
+    @property
+    def msval9(self):
+        """거래대금순매수9"""
+        return to_number(self._data.get("msval9"))
+
+    @property
+    def tjjcode10(self):
+        """투자자코드10(선물업자)"""
+        return self._data.get("tjjcode10")
+
+    @property
+    def msvolume10(self):
+        """매수거래량10"""
+        return to_number(self._data.get("msvolume10"))
+
+    @property
+    def mdvolume10(self):
+        """매도거래량10"""
+        return to_number(self._data.get("mdvolume10"))
+
+    @property
+    def msvol10(self):
+        """거래량순매수10"""
+        return to_number(self._data.get("msvol10"))
+
+    @property
+    def msvalue10(self):
+        """매수거래대금10"""
+        return to_number(self._data.get("msvalue10"))
+
+    @property
+    def mdvalue10(self):
+        """매도거래대금10"""
+        return to_number(self._data.get("mdvalue10"))
+
+    @property
+    def msval10(self):
+        """거래대금순매수10"""
+        return to_number(self._data.get("msval10"))
+
+    @property
+    def tjjcode11(self):
+        """투자자코드11(기타)"""
+        return self._data.get("tjjcode11")
+
+    @property
+    def msvolume11(self):
+        """매수거래량11"""
+        return to_number(self._data.get("msvolume11"))
+
+    @property
+    def mdvolume11(self):
+        """매도거래량11"""
+        return to_number(self._data.get("mdvolume11"))
+
+    @property
+    def msvol11(self):
+        """거래량순매수11"""
+        return to_number(self._data.get("msvol11"))
+
+    @property
+    def msvalue11(self):
+        """매수거래대금11"""
+        return to_number(self._data.get("msvalue11"))
+
+    @property
+    def mdvalue11(self):
+        """매도거래대금11"""
+        return to_number(self._data.get("mdvalue11"))
+
+    @property
+    def msval11(self):
+        """거래대금순매수11"""
+        return to_number(self._data.get("msval11"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+    @property
+    def tjjcode0(self):
+        """투자자코드0(사모펀드)"""
+        return self._data.get("tjjcode0")
+
+    @property
+    def msvolume0(self):
+        """매수거래량0"""
+        return to_number(self._data.get("msvolume0"))
+
+    @property
+    def mdvolume0(self):
+        """매도거래량0"""
+        return to_number(self._data.get("mdvolume0"))
+
+    @property
+    def msvol0(self):
+        """거래량순매수0"""
+        return to_number(self._data.get("msvol0"))
+
+    @property
+    def msvalue0(self):
+        """매수거래대금0"""
+        return to_number(self._data.get("msvalue0"))
+
+    @property
+    def mdvalue0(self):
+        """매도거래대금0"""
+        return to_number(self._data.get("mdvalue0"))
+
+    @property
+    def msval0(self):
+        """거래대금순매수0"""
+        return to_number(self._data.get("msval0"))
+
+    @property
+    def ex_upcode(self):
+        """거래소별업종코드"""
+        return self._data.get("ex_upcode")
+
+
+class NBMTick(RealtimeRecord):
+    """[NBM] (NXT)업종별투자자별매매현황"""
+    __slots__ = ()
+    TR_CODE = "NBM"
+    FIELDS = ("tjjcode", "tjjtime", "msvolume", "mdvolume", "msvol", "p_msvol", "msvalue", "매도거래대금", "msval", "p_msval", "upcode", "ex_upcode")
+
+    @property
+    def tjjcode(self):
+        """투자자코드"""
+        return self._data.get("tjjcode")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def msvolume(self):
+        """매수거래량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mdvolume(self):
+        """매도거래량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def msvol(self):
+        """거래량순매수"""
+        return to_number(self._data.get("msvol"))
+
+    @property
+    def p_msvol(self):
+        """거래량순매수직전대비"""
+        return to_number(self._data.get("p_msvol"))
+
+    @property
+    def msvalue(self):
+        """매수거래대금"""
+        return to_number(self._data.get("msvalue"))
+
+    @property
+    def 매도거래대금(self):
+        """매도거래대금"""
+        return to_number(self._data.get("매도거래대금"))
+
+    @property
+    def msval(self):
+        """거래대금순매수"""
+        return to_number(self._data.get("msval"))
+
+    @property
+    def p_msval(self):
+        """거래대금순매수직전대비"""
+        return to_number(self._data.get("p_msval"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+    @property
+    def ex_upcode(self):
+        """거래소별업종코드"""
+        return self._data.get("ex_upcode")
+
+
+class US3Tick(RealtimeRecord):
+    """[US3] (통합)체결"""
+    __slots__ = ()
+    TR_CODE = "US3"
+    FIELDS = ("chetime", "sign", "change", "drate", "price", "opentime", "open", "hightime", "high", "lowtime", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "w_avrg", "offerho", "bidho", "status", "jnilvolume", "shcode", "exchname", "ex_shcode")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def opentime(self):
+        """시가시간"""
+        return to_number(self._data.get("opentime"))
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def hightime(self):
+        """고가시간"""
+        return self._data.get("hightime")
+
+    @property
+    def high(self):
+        """고가"""
+        return to_number(self._data.get("high"))
+
+    @property
+    def lowtime(self):
+        """저가시간"""
+        return self._data.get("lowtime")
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def w_avrg(self):
+        """가중평균가"""
+        return to_number(self._data.get("w_avrg"))
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def status(self):
+        """장정보"""
+        return self._data.get("status")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return to_number(self._data.get("ex_shcode"))
+
+
+class UH1Tick(RealtimeRecord):
+    """[UH1] (통합)호가잔량"""
+    __slots__ = ()
+    TR_CODE = "UH1"
+    FIELDS = ("hotime", "offerho1", "bidho1", "krx_offerrem1", "nxt_offerrem1", "unt_offerrem1", "krx_bidrem1", "nxt_bidrem1", "unt_bidrem1", "offerho2", "bidho2", "krx_offerrem2", "nxt_offerrem2", "unt_offerrem2", "krx_bidrem2", "nxt_bidrem2", "unt_bidrem2", "offerho3", "bidho3", "krx_offerrem3", "nxt_offerrem3", "unt_offerrem3", "krx_bidrem3", "nxt_bidrem3", "unt_bidrem3", "offerho4", "bidho4", "krx_offerrem4", "nxt_offerrem4", "unt_offerrem4", "krx_bidrem4", "nxt_bidrem4", "unt_bidrem4", "offerho5", "bidho5", "krx_offerrem5", "nxt_offerrem5", "unt_offerrem5", "krx_bidrem5", "nxt_bidrem5", "unt_bidrem5", "offerho6", "bidho6", "krx_offerrem6", "nxt_offerrem6", "unt_offerrem6", "krx_bidrem6", "nxt_bidrem6", "unt_bidrem6", "offerho7", "bidho7", "krx_offerrem7", "nxt_offerrem7", "unt_offerrem7", "krx_bidrem7", "nxt_bidrem7", "unt_bidrem7", "offerho8", "bidho8", "krx_offerrem8", "nxt_offerrem8", "unt_offerrem8", "krx_bidrem8", "nxt_bidrem8", "unt_bidrem8", "offerho9", "bidho9", "krx_offerrem9", "nxt_offerrem9", "unt_offerrem9", "krx_bidrem9", "nxt_bidrem9", "unt_bidrem9", "offerho10", "bidho10", "krx_offerrem10", "nxt_offerrem10", "unt_offerrem10", "krx_bidrem10", "nxt_bidrem10", "unt_bidrem10", "krx_totofferrem", "nxt_totofferrem", "unt_totofferrem", "krx_totbidrem", "nxt_totbidrem", "unt_totbidrem", "krx_donsigubun", "nxt_donsigubun", "shcode", "alloc_gubun", "volume", "krx_midprice", "krx_offermidsumrem", "krx_bidmidsumrem", "nxt_midprice", "nxt_offermidsumrem", "nxt_bidmidsumrem", "krx_midsumrem", "krx_midsumremgubun", "nxt_midsumrem", "nxt_midsumremgubun", "ex_shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def krx_offerrem1(self):
+        """KRX매도호가잔량1"""
+        return to_number(self._data.get("krx_offerrem1"))
+
+    @property
+    def nxt_offerrem1(self):
+        """NXT매도호가잔량1"""
+        return to_number(self._data.get("nxt_offerrem1"))
+
+    @property
+    def unt_offerrem1(self):
+        """통합매도호가잔량1"""
+        return to_number(self._data.get("unt_offerrem1"))
+
+    @property
+    def krx_bidrem1(self):
+        """KRX매수호가잔량1"""
+        return to_number(self._data.get("krx_bidrem1"))
+
+    @property
+    def nxt_bidrem1(self):
+        """NXT매수호가잔량1"""
+        return to_number(self._data.get("nxt_bidrem1"))
+
+    @property
+    def unt_bidrem1(self):
+        """통합매수호가잔량1"""
+        return to_number(self._data.get("unt_bidrem1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_number(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_number(self._data.get("bidho2"))
+
+    @property
+    def krx_offerrem2(self):
+        """KRX매도호가잔량2"""
+        return to_number(self._data.get("krx_offerrem2"))
+
+    @property
+    def nxt_offerrem2(self):
+        """NXT매도호가잔량2"""
+        return to_number(self._data.get("nxt_offerrem2"))
+
+    @property
+    def unt_offerrem2(self):
+        """통합매도호가잔량2"""
+        return to_number(self._data.get("unt_offerrem2"))
+
+    @property
+    def krx_bidrem2(self):
+        """KRX매수호가잔량2"""
+        return to_number(self._data.get("krx_bidrem2"))
+
+    @property
+    def nxt_bidrem2(self):
+        """NXT매수호가잔량2"""
+        return to_number(self._data.get("nxt_bidrem2"))
+
+    @property
+    def unt_bidrem2(self):
+        """통합매수호가잔량2"""
+        return to_number(self._data.get("unt_bidrem2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_number(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_number(self._data.get("bidho3"))
+
+    @property
+    def krx_offerrem3(self):
+        """KRX매도호가잔량3"""
+        return to_number(self._data.get("krx_offerrem3"))
+
+    @property
+    def nxt_offerrem3(self):
+        """NXT매도호가잔량3"""
+        return to_number(self._data.get("nxt_offerrem3"))
+
+    @property
+    def unt_offerrem3(self):
+        """통합매도호가잔량3"""
+        return to_number(self._data.get("unt_offerrem3"))
+
+    @property
+    def krx_bidrem3(self):
+        """KRX매수호가잔량3"""
+        return to_number(self._data.get("krx_bidrem3"))
+
+    @property
+    def nxt_bidrem3(self):
+        """NXT매수호가잔량3"""
+        return to_number(self._data.get("nxt_bidrem3"))
+
+    @property
+    def unt_bidrem3(self):
+        """통합매수호가잔량3"""
+        return to_number(self._data.get("unt_bidrem3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_number(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_number(self._data.get("bidho4"))
+
+    @property
+    def krx_offerrem4(self):
+        """KRX매도호가잔량4"""
+        return to_number(self._data.get("krx_offerrem4"))
+
+    @property
+    def nxt_offerrem4(self):
+        """NXT매도호가잔량4"""
+        return to_number(self._data.get("nxt_offerrem4"))
+
+    @property
+    def unt_offerrem4(self):
+        """통합매도호가잔량4"""
+        return to_number(self._data.get("unt_offerrem4"))
+
+    @property
+    def krx_bidrem4(self):
+        """KRX매수호가잔량4"""
+        return to_number(self._data.get("krx_bidrem4"))
+
+    @property
+    def nxt_bidrem4(self):
+        """NXT매수호가잔량4"""
+        return to_number(self._data.get("nxt_bidrem4"))
+
+    @property
+    def unt_bidrem4(self):
+        """통합매수호가잔량4"""
+        return to_number(self._data.get("unt_bidrem4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_number(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_number(self._data.get("bidho5"))
+
+    @property
+    def krx_offerrem5(self):
+        """KRX매도호가잔량5"""
+        return to_number(self._data.get("krx_offerrem5"))
+
+    @property
+    def nxt_offerrem5(self):
+        """NXT매도호가잔량5"""
+        return to_number(self._data.get("nxt_offerrem5"))
+
+    @property
+    def unt_offerrem5(self):
+        """통합매도호가잔량5"""
+        return to_number(self._data.get("unt_offerrem5"))
+
+    @property
+    def krx_bidrem5(self):
+        """KRX매수호가잔량5"""
+        return to_number(self._data.get("krx_bidrem5"))
+
+    @property
+    def nxt_bidrem5(self):
+        """NXT매수호가잔량5"""
+        return to_number(self._data.get("nxt_bidrem5"))
+
+    @property
+    def unt_bidrem5(self):
+        """통합매수호가잔량5"""
+        return to_number(self._data.get("unt_bidrem5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_number(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_number(self._data.get("bidho6"))
+
+    @property
+    def krx_offerrem6(self):
+        """KRX매도호가잔량6"""
+        return to_number(self._data.get("krx_offerrem6"))
+
+    @property
+    def nxt_offerrem6(self):
+        """NXT매도호가잔량6"""
+        return to_number(self._data.get("nxt_offerrem6"))
+
+    @property
+    def unt_offerrem6(self):
+        """통합매도호가잔량6"""
+        return to_number(self._data.get("unt_offerrem6"))
+
+    @property
+    def krx_bidrem6(self):
+        """KRX매수호가잔량6"""
+        return to_number(self._data.get("krx_bidrem6"))
+
+    @property
+    def nxt_bidrem6(self):
+        """NXT매수호가잔량6"""
+        return to_number(self._data.get("nxt_bidrem6"))
+
+    @property
+    def unt_bidrem6(self):
+        """통합매수호가잔량6"""
+        return to_number(self._data.get("unt_bidrem6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_number(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_number(self._data.get("bidho7"))
+
+    @property
+    def krx_offerrem7(self):
+        """KRX매도호가잔량7"""
+        return to_number(self._data.get("krx_offerrem7"))
+
+    @property
+    def nxt_offerrem7(self):
+        """NXT매도호가잔량7"""
+        return to_number(self._data.get("nxt_offerrem7"))
+
+    @property
+    def unt_offerrem7(self):
+        """통합매도호가잔량7"""
+        return to_number(self._data.get("unt_offerrem7"))
+
+    @property
+    def krx_bidrem7(self):
+        """KRX매수호가잔량7"""
+        return to_number(self._data.get("krx_bidrem7"))
+
+    @property
+    def nxt_bidrem7(self):
+        """NXT매수호가잔량7"""
+        return to_number(self._data.get("nxt_bidrem7"))
+
+    @property
+    def unt_bidrem7(self):
+        """통합매수호가잔량7"""
+        return to_number(self._data.get("unt_bidrem7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_number(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_number(self._data.get("bidho8"))
+
+    @property
+    def krx_offerrem8(self):
+        """KRX매도호가잔량8"""
+        return to_number(self._data.get("krx_offerrem8"))
+
+    @property
+    def nxt_offerrem8(self):
+        """NXT매도호가잔량8"""
+        return to_number(self._data.get("nxt_offerrem8"))
+
+    @property
+    def unt_offerrem8(self):
+        """통합매도호가잔량8"""
+        return to_number(self._data.get("unt_offerrem8"))
+
+    @property
+    def krx_bidrem8(self):
+        """KRX매수호가잔량8"""
+        return to_number(self._data.get("krx_bidrem8"))
+
+    @property
+    def nxt_bidrem8(self):
+        """NXT매수호가잔량8"""
+        return to_number(self._data.get("nxt_bidrem8"))
+
+    @property
+    def unt_bidrem8(self):
+        """통합매수호가잔량8"""
+        return to_number(self._data.get("unt_bidrem8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_number(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_number(self._data.get("bidho9"))
+
+    @property
+    def krx_offerrem9(self):
+        """KRX매도호가잔량9"""
+        return to_number(self._data.get("krx_offerrem9"))
+
+    @property
+    def nxt_offerrem9(self):
+        """NXT매도호가잔량9"""
+        return to_number(self._data.get("nxt_offerrem9"))
+
+    @property
+    def unt_offerrem9(self):
+        """통합매도호가잔량9"""
+        return to_number(self._data.get("unt_offerrem9"))
+
+    @property
+    def krx_bidrem9(self):
+        """KRX매수호가잔량9"""
+        return to_number(self._data.get("krx_bidrem9"))
+
+    @property
+    def nxt_bidrem9(self):
+        """NXT매수호가잔량9"""
+        return to_number(self._data.get("nxt_bidrem9"))
+
+    @property
+    def unt_bidrem9(self):
+        """통합매수호가잔량9"""
+        return to_number(self._data.get("unt_bidrem9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_number(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_number(self._data.get("bidho10"))
+
+    @property
+    def krx_offerrem10(self):
+        """KRX매도호가잔량10"""
+        return to_number(self._data.get("krx_offerrem10"))
+
+    @property
+    def nxt_offerrem10(self):
+        """NXT매도호가잔량10"""
+        return to_number(self._data.get("nxt_offerrem10"))
+
+    @property
+    def unt_offerrem10(self):
+        """통합매도호가잔량10"""
+        return to_number(self._data.get("unt_offerrem10"))
+
+    @property
+    def krx_bidrem10(self):
+        """KRX매수호가잔량10"""
+        return to_number(self._data.get("krx_bidrem10"))
+
+    @property
+    def nxt_bidrem10(self):
+        """NXT매수호가잔량10"""
+        return to_number(self._data.get("nxt_bidrem10"))
+
+    @property
+    def unt_bidrem10(self):
+        """통합매수호가잔량10"""
+        return to_number(self._data.get("unt_bidrem10"))
+
+    @property
+    def krx_totofferrem(self):
+        """KRX총매도호가잔량"""
+        return to_number(self._data.get("krx_totofferrem"))
+
+    @property
+    def nxt_totofferrem(self):
+        """NXT총매도호가잔량"""
+        return to_number(self._data.get("nxt_totofferrem"))
+
+    @property
+    def unt_totofferrem(self):
+        """통합총매도호가잔량"""
+        return to_number(self._data.get("unt_totofferrem"))
+
+    @property
+    def krx_totbidrem(self):
+        """KRX총매수호가잔량"""
+        return to_number(self._data.get("krx_totbidrem"))
+
+    @property
+    def nxt_totbidrem(self):
+        """NXT총매수호가잔량"""
+        return to_number(self._data.get("nxt_totbidrem"))
+
+    @property
+    def unt_totbidrem(self):
+        """통합총매수호가잔량"""
+        return to_number(self._data.get("unt_totbidrem"))
+
+    @property
+    def krx_donsigubun(self):
+        """KRX동시호가구분"""
+        return self._data.get("krx_donsigubun")
+
+    @property
+    def nxt_donsigubun(self):
+        """NXT동시호가구분"""
+        return self._data.get("nxt_donsigubun")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def krx_midprice(self):
+        """KRX중간가격"""
+        return to_number(self._data.get("krx_midprice"))
+
+    @property
+    def krx_offermidsumrem(self):
+        """KRX매도중간가잔량합계수량"""
+        return to_number(self._data.get("krx_offermidsumrem"))
+
+    @property
+    def krx_bidmidsumrem(self):
+        """KRX매수중간가잔량합계수량"""
+        return to_number(self._data.get("krx_bidmidsumrem"))
+
+    @property
+    def nxt_midprice(self):
+        """NXT중간가격"""
+        return to_number(self._data.get("nxt_midprice"))
+
+    @property
+    def nxt_offermidsumrem(self):
+        """NXT매도중간가잔량합계수량"""
+        return to_number(self._data.get("nxt_offermidsumrem"))
+
+    @property
+    def nxt_bidmidsumrem(self):
+        """NXT매수중간가잔량합계수량"""
+        return to_number(self._data.get("nxt_bidmidsumrem"))
+
+    @property
+    def krx_midsumrem(self):
+        """KRX중간가잔량합계수량"""
+        return to_number(self._data.get("krx_midsumrem"))
+
+    @property
+    def krx_midsumremgubun(self):
+        """KRX중간가잔량구분(''없음'1'매도'2'매수)"""
+        return to_number(self._data.get("krx_midsumremgubun"))
+
+    @property
+    def nxt_midsumrem(self):
+        """NXT중간가잔량합계수량"""
+        return to_number(self._data.get("nxt_midsumrem"))
+
+    @property
+    def nxt_midsumremgubun(self):
+        """NXT중간가잔량구분(''없음'1'매도'2'매수)"""
+        return self._data.get("nxt_midsumremgubun")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class US2Tick(RealtimeRecord):
+    """[US2] (통합)우선호가"""
+    __slots__ = ()
+    TR_CODE = "US2"
+    FIELDS = ("offerho", "bidho", "shcode", "ex_shcode")
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_number(self._data.get("offerho"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_number(self._data.get("bidho"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class UYSTick(RealtimeRecord):
+    """[UYS] (통합)예상체결"""
+    __slots__ = ()
+    TR_CODE = "UYS"
+    FIELDS = ("hotime", "yeprice", "yevolume", "jnilysign", "jnilchange", "jnilydrate", "yofferho0", "ybidho0", "yofferrem0", "ybidrem0", "shcode", "exchname", "ex_shcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_number(self._data.get("yeprice"))
+
+    @property
+    def yevolume(self):
+        """예상체결수량"""
+        return to_number(self._data.get("yevolume"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_number(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def yofferho0(self):
+        """예상매도호가"""
+        return to_number(self._data.get("yofferho0"))
+
+    @property
+    def ybidho0(self):
+        """예상매수호가"""
+        return to_number(self._data.get("ybidho0"))
+
+    @property
+    def yofferrem0(self):
+        """예상매도호가수량"""
+        return to_number(self._data.get("yofferrem0"))
+
+    @property
+    def ybidrem0(self):
+        """예상매수호가수량"""
+        return to_number(self._data.get("ybidrem0"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return to_number(self._data.get("shcode"))
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class UPHTick(RealtimeRecord):
+    """[UPH] (통합)프로그램매매종목별"""
+    __slots__ = ()
+    TR_CODE = "UPH"
+    FIELDS = ("time", "price", "sign", "change", "volume", "drate", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "dwcvolume", "swcvolume", "djcvolume", "sjcvolume", "tdvolume", "tsvolume", "tvol", "dwcvalue", "swcvalue", "djcvalue", "sjcvalue", "tdvalue", "tsvalue", "tval", "pdgvolume", "psgvolume", "shcode", "ex_shcode")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def cdhrem(self):
+        """차익매도호가잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def dwcvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwcvolume"))
+
+    @property
+    def swcvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swcvolume"))
+
+    @property
+    def djcvolume(self):
+        """전체매도자기체결수량"""
+        return to_number(self._data.get("djcvolume"))
+
+    @property
+    def sjcvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjcvolume"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수수량"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def dwcvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwcvalue"))
+
+    @property
+    def swcvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swcvalue"))
+
+    @property
+    def djcvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djcvalue"))
+
+    @property
+    def sjcvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjcvalue"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수금액"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def pdgvolume(self):
+        """매도사전공시수량"""
+        return to_number(self._data.get("pdgvolume"))
+
+    @property
+    def psgvolume(self):
+        """매수사전공시수량"""
+        return to_number(self._data.get("psgvolume"))
+
+    @property
+    def shcode(self):
+        """종목코드"""
+        return self._data.get("shcode")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class UK1Tick(RealtimeRecord):
+    """[UK1] (통합)거래원"""
+    __slots__ = ()
+    TR_CODE = "UK1"
+    FIELDS = ("offerno1", "bidno1", "offertrad1", "bidtrad1", "tradmdvol1", "tradmsvol1", "tradmdrate1", "tradmsrate1", "tradmdcha1", "tradmscha1", "offerno2", "bidno2", "offertrad2", "bidtrad2", "tradmdvol2", "tradmsvol2", "tradmdrate2", "tradmsrate2", "tradmdcha2", "tradmscha2", "offerno3", "bidno3", "offertrad3", "bidtrad3", "tradmdvol3", "tradmsvol3", "tradmdrate3", "tradmsrate3", "tradmdcha3", "tradmscha3", "offerno4", "bidno4", "offertrad4", "bidtrad4", "tradmdvol4", "tradmsvol4", "tradmdrate4", "tradmsrate4", "tradmdcha4", "tradmscha4", "offerno5", "bidno5", "offertrad5", "bidtrad5", "tradmdvol5", "tradmsvol5", "tradmdrate5", "tradmsrate5", "tradmdcha5", "tradmscha5", "ftradmdvol", "ftradmsvol", "ftradmdrate", "ftradmsrate", "ftradmdcha", "ftradmscha", "shcode", "tradmdval1", "tradmsval1", "tradmdavg1", "tradmsavg1", "tradmdval2", "tradmsval2", "tradmdavg2", "tradmsavg2", "tradmdval3", "tradmsval3", "tradmdavg3", "tradmsavg3", "tradmdval4", "tradmsval4", "tradmdavg4", "tradmsavg4", "tradmdval5", "tradmsval5", "tradmdavg5", "tradmsavg5", "ftradmdval", "ftradmsval", "ftradmdavg", "ftradmsavg", "time", "exchname", "ex_shcode")
+
+    @property
+    def offerno1(self):
+        """매도증권사코드1"""
+        return self._data.get("offerno1")
+
+    @property
+    def bidno1(self):
+        """매수증권사코드1"""
+        return self._data.get("bidno1")
+
+    @property
+    def offertrad1(self):
+        """매도회원사명1"""
+        return self._data.get("offertrad1")
+
+    @property
+    def bidtrad1(self):
+        """매수회원사명1"""
+        return self._data.get("bidtrad1")
+
+    @property
+    def tradmdvol1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("tradmdvol1"))
+
+    @property
+    def tradmsvol1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("tradmsvol1"))
+
+    @property
+    def tradmdrate1(self):
+        """매도거래량비중1"""
+        return to_float(self._data.get("tradmdrate1"))
+
+    @property
+    def tradmsrate1(self):
+        """매수거래량비중1"""
+        return to_float(self._data.get("tradmsrate1"))
+
+    @property
+    def tradmdcha1(self):
+        """매도거래량직전대비1"""
+        return to_number(self._data.get("tradmdcha1"))
+
+    @property
+    def tradmscha1(self):
+        """매수거래량직전대비1"""
+        return to_number(self._data.get("tradmscha1"))
+
+    @property
+    def offerno2(self):
+        """매도증권사코드2"""
+        return self._data.get("offerno2")
+
+    @property
+    def bidno2(self):
+        """매수증권사코드2"""
+        return self._data.get("bidno2")
+
+    @property
+    def offertrad2(self):
+        """매도회원사명2"""
+        return self._data.get("offertrad2")
+
+    @property
+    def bidtrad2(self):
+        """매수회원사명2"""
+        return self._data.get("bidtrad2")
+
+    @property
+    def tradmdvol2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("tradmdvol2"))
+
+    @property
+    def tradmsvol2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("tradmsvol2"))
+
+    @property
+    def tradmdrate2(self):
+        """매도거래량비중2"""
+        return to_float(self._data.get("tradmdrate2"))
+
+    @property
+    def tradmsrate2(self):
+        """매수거래량비중2"""
+        return to_float(self._data.get("tradmsrate2"))
+
+    @property
+    def tradmdcha2(self):
+        """매도거래량직전대비2"""
+        return to_number(self._data.get("tradmdcha2"))
+
+    @property
+    def tradmscha2(self):
+        """매수거래량직전대비2"""
+        return to_number(self._data.get("tradmscha2"))
+
+    @property
+    def offerno3(self):
+        """매도증권사코드3"""
+        return self._data.get("offerno3")
+
+    @property
+    def bidno3(self):
+        """매수증권사코드3"""
+        return self._data.get("bidno3")
+
+    @property
+    def offertrad3(self):
+        """매도회원사명3"""
+        return self._data.get("offertrad3")
+
+    @property
+    def bidtrad3(self):
+        """매수회원사명3"""
+        return self._data.get("bidtrad3")
+
+    @property
+    def tradmdvol3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("tradmdvol3"))
+
+    @property
+    def tradmsvol3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("tradmsvol3"))
+
+    @property
+    def tradmdrate3(self):
+        """매도거래량비중3"""
+        return to_float(self._data.get("tradmdrate3"))
+
+    @property
+    def tradmsrate3(self):
+        """매수거래량비중3"""
+        return to_float(self._data.get("tradmsrate3"))
+
+    @property
+    def tradmdcha3(self):
+        """매도거래량직전대비3"""
+        return to_number(self._data.get("tradmdcha3"))
+
+    @property
+    def tradmscha3(self):
+        """매수거래량직전대비3"""
+        return to_number(self._data.get("tradmscha3"))
+
+    @property
+    def offerno4(self):
+        """매도증권사코드4"""
+        return self._data.get("offerno4")
+
+    @property
+    def bidno4(self):
+        """매수증권사코드4"""
+        return self._data.get("bidno4")
+
+    @property
+    def offertrad4(self):
+        """매도회원사명4"""
+        return self._data.get("offertrad4")
+
+    @property
+    def bidtrad4(self):
+        """매수회원사명4"""
+        return self._data.get("bidtrad4")
+
+    @property
+    def tradmdvol4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("tradmdvol4"))
+
+    @property
+    def tradmsvol4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("tradmsvol4"))
+
+    @property
+    def tradmdrate4(self):
+        """매도거래량비중4"""
+        return to_float(self._data.get("tradmdrate4"))
+
+    @property
+    def tradmsrate4(self):
+        """매수거래량비중4"""
+        return to_float(self._data.get("tradmsrate4"))
+
+    @property
+    def tradmdcha4(self):
+        """매도거래량직전대비4"""
+        return to_number(self._data.get("tradmdcha4"))
+
+    @property
+    def tradmscha4(self):
+        """매수거래량직전대비4"""
+        return to_number(self._data.get("tradmscha4"))
+
+    @property
+    def offerno5(self):
+        """매도증권사코드5"""
+        return self._data.get("offerno5")
+
+    @property
+    def bidno5(self):
+        """매수증권사코드5"""
+        return self._data.get("bidno5")
+
+    @property
+    def offertrad5(self):
+        """매도회원사명5"""
+        return self._data.get("offertrad5")
+
+    @property
+    def bidtrad5(self):
+        """매수회원사명5"""
+        return self._data.get("bidtrad5")
+
+    @property
+    def tradmdvol5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("tradmdvol5"))
+
+    @property
+    def tradmsvol5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("tradmsvol5"))
+
+    @property
+    def tradmdrate5(self):
+        """매도거래량비중5"""
+        return to_float(self._data.get("tradmdrate5"))
+
+    @property
+    def tradmsrate5(self):
+        """매수거래량비중5"""
+        return to_float(self._data.get("tradmsrate5"))
+
+    @property
+    def tradmdcha5(self):
+        """매도거래량직전대비5"""
+        return to_number(self._data.get("tradmdcha5"))
+
+    @property
+    def tradmscha5(self):
+        """매수거래량직전대비5"""
+        return to_number(self._data.get("tradmscha5"))
+
+    @property
+    def ftradmdvol(self):
+        """외국계증권사매도합계"""
+        return to_number(self._data.get("ftradmdvol"))
+
+    @property
+    def ftradmsvol(self):
+        """외국계증권사매수합계"""
+        return to_number(self._data.get("ftradmsvol"))
+
+    @property
+    def ftradmdrate(self):
+        """외국계증권사매도거래량비중"""
+        return to_float(self._data.get("ftradmdrate"))
+
+    @property
+    def ftradmsrate(self):
+        """외국계증권사매수거래량비중"""
+        return to_float(self._data.get("ftradmsrate"))
+
+    @property
+    def ftradmdcha(self):
+        """외국계증권사매도거래량직전대비"""
+        return to_number(self._data.get("ftradmdcha"))
+
+    @property
+    def ftradmscha(self):
+        """외국계증권사매수거래량직전대비"""
+        return to_number(self._data.get("ftradmscha"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def tradmdval1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("tradmdval1"))
+
+    @property
+    def tradmsval1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("tradmsval1"))
+
+    @property
+    def tradmdavg1(self):
+        """매도평균단가1"""
+        return to_number(self._data.get("tradmdavg1"))
+
+    @property
+    def tradmsavg1(self):
+        """매수평균단가1"""
+        return to_number(self._data.get("tradmsavg1"))
+
+    @property
+    def tradmdval2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("tradmdval2"))
+
+    @property
+    def tradmsval2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("tradmsval2"))
+
+    @property
+    def tradmdavg2(self):
+        """매도평균단가2"""
+        return to_number(self._data.get("tradmdavg2"))
+
+    @property
+    def tradmsavg2(self):
+        """매수평균단가2"""
+        return to_number(self._data.get("tradmsavg2"))
+
+    @property
+    def tradmdval3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("tradmdval3"))
+
+    @property
+    def tradmsval3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("tradmsval3"))
+
+    @property
+    def tradmdavg3(self):
+        """매도평균단가3"""
+        return to_number(self._data.get("tradmdavg3"))
+
+    @property
+    def tradmsavg3(self):
+        """매수평균단가3"""
+        return to_number(self._data.get("tradmsavg3"))
+
+    @property
+    def tradmdval4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("tradmdval4"))
+
+    @property
+    def tradmsval4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("tradmsval4"))
+
+    @property
+    def tradmdavg4(self):
+        """매도평균단가4"""
+        return to_number(self._data.get("tradmdavg4"))
+
+    @property
+    def tradmsavg4(self):
+        """매수평균단가4"""
+        return to_number(self._data.get("tradmsavg4"))
+
+    @property
+    def tradmdval5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("tradmdval5"))
+
+    @property
+    def tradmsval5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("tradmsval5"))
+
+    @property
+    def tradmdavg5(self):
+        """매도평균단가5"""
+        return to_number(self._data.get("tradmdavg5"))
+
+    @property
+    def tradmsavg5(self):
+        """매수평균단가5"""
+        return to_number(self._data.get("tradmsavg5"))
+
+    @property
+    def ftradmdval(self):
+        """외국계증권사매도거래대금"""
+        return to_number(self._data.get("ftradmdval"))
+
+    @property
+    def ftradmsval(self):
+        """외국계증권사매수거래대금"""
+        return to_number(self._data.get("ftradmsval"))
+
+    @property
+    def ftradmdavg(self):
+        """외국계증권사매도평균단가"""
+        return to_number(self._data.get("ftradmdavg"))
+
+    @property
+    def ftradmsavg(self):
+        """외국계증권사매수평균단가"""
+        return to_number(self._data.get("ftradmsavg"))
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class UBTTick(RealtimeRecord):
+    """[UBT] (통합)시간대별투자자매매추이"""
+    __slots__ = ()
+    TR_CODE = "UBT"
+    FIELDS = ("tjjtime", "tjjcode1", "msvolume1", "mdvolume1", "msvol1", "msvalue1", "mdvalue1", "msval1", "tjjcode2", "msvolume2", "mdvolume2", "msvol2", "msvalue2", "mdvalue2", "msval2", "tjjcode3", "msvolume3", "mdvolume3", "msvol3", "msvalue3", "mdvalue3", "msval3", "tjjcode4", "msvolume4", "mdvolume4", "msvol4", "msvalue4", "mdvalue4", "msval4", "tjjcode5", "msvolume5", "mdvolume5", "msvol5", "msvalue5", "mdvalue5", "msval5", "tjjcode6", "msvolume6", "mdvolume6", "msvol6", "msvalue6", "mdvalue6", "msval6", "tjjcode7", "msvolume7", "mdvolume7", "msvol7", "msvalue7", "mdvalue7", "msval7", "tjjcode8", "msvolume8", "mdvolume8", "msvol8", "msvalue8", "mdvalue8", "msval8", "tjjcode9", "msvolume9", "mdvolume9", "msvol9", "msvalue9", "mdvalue9", "msval9", "tjjcode10", "msvolume10", "mdvolume10", "msvol10", "msvalue10", "mdvalue10", "msval10", "tjjcode11", "msvolume11", "mdvolume11", "msvol11", "msvalue11", "mdvalue11", "msval11", "upcode", "tjjcode0", "msvolume0", "mdvolume0", "msvol0", "msvalue0", "mdvalue0", "msval0", "ex_upcode")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def tjjcode1(self):
+        """투자자코드1(개인)"""
+        return self._data.get("tjjcode1")
+
+    @property
+    def msvolume1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("msvolume1"))
+
+    @property
+    def mdvolume1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("mdvolume1"))
+
+    @property
+    def msvol1(self):
+        """거래량순매수1"""
+        return to_number(self._data.get("msvol1"))
+
+    @property
+    def msvalue1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("msvalue1"))
+
+    @property
+    def mdvalue1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("mdvalue1"))
+
+    @property
+    def msval1(self):
+        """거래대금순매수1"""
+        return to_number(self._data.get("msval1"))
+
+    @property
+    def tjjcode2(self):
+        """투자자코드2(외국인)"""
+        return self._data.get("tjjcode2")
+
+    @property
+    def msvolume2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("msvolume2"))
+
+    @property
+    def mdvolume2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("mdvolume2"))
+
+    @property
+    def msvol2(self):
+        """거래량순매수2"""
+        return to_number(self._data.get("msvol2"))
+
+    @property
+    def msvalue2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("msvalue2"))
+
+    @property
+    def mdvalue2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("mdvalue2"))
+
+    @property
+    def msval2(self):
+        """거래대금순매수2"""
+        return to_number(self._data.get("msval2"))
+
+    @property
+    def tjjcode3(self):
+        """투자자코드3(기관계)"""
+        return self._data.get("tjjcode3")
+
+    @property
+    def msvolume3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("msvolume3"))
+
+    @property
+    def mdvolume3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("mdvolume3"))
+
+    @property
+    def msvol3(self):
+        """거래량순매수3"""
+        return to_number(self._data.get("msvol3"))
+
+    @property
+    def msvalue3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("msvalue3"))
+
+    @property
+    def mdvalue3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("mdvalue3"))
+
+    @property
+    def msval3(self):
+        """거래대금순매수3"""
+        return to_number(self._data.get("msval3"))
+
+    @property
+    def tjjcode4(self):
+        """투자자코드4(증권)"""
+        return self._data.get("tjjcode4")
+
+    @property
+    def msvolume4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("msvolume4"))
+
+    @property
+    def mdvolume4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("mdvolume4"))
+
+    @property
+    def msvol4(self):
+        """거래량순매수4"""
+        return to_number(self._data.get("msvol4"))
+
+    @property
+    def msvalue4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("msvalue4"))
+
+    @property
+    def mdvalue4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("mdvalue4"))
+
+    @property
+    def msval4(self):
+        """거래대금순매수4"""
+        return to_number(self._data.get("msval4"))
+
+    @property
+    def tjjcode5(self):
+        """투자자코드5(투신)"""
+        return self._data.get("tjjcode5")
+
+    @property
+    def msvolume5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("msvolume5"))
+
+    @property
+    def mdvolume5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("mdvolume5"))
+
+    @property
+    def msvol5(self):
+        """거래량순매수5"""
+        return to_number(self._data.get("msvol5"))
+
+    @property
+    def msvalue5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("msvalue5"))
+
+    @property
+    def mdvalue5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("mdvalue5"))
+
+    @property
+    def msval5(self):
+        """거래대금순매수5"""
+        return to_number(self._data.get("msval5"))
+
+    @property
+    def tjjcode6(self):
+        """투자자코드6(은행)"""
+        return self._data.get("tjjcode6")
+
+    @property
+    def msvolume6(self):
+        """매수거래량6"""
+        return to_number(self._data.get("msvolume6"))
+
+    @property
+    def mdvolume6(self):
+        """매도거래량6"""
+        return to_number(self._data.get("mdvolume6"))
+
+    @property
+    def msvol6(self):
+        """거래량순매수6"""
+        return to_number(self._data.get("msvol6"))
+
+    @property
+    def msvalue6(self):
+        """매수거래대금6"""
+        return to_number(self._data.get("msvalue6"))
+
+    @property
+    def mdvalue6(self):
+        """매도거래대금6"""
+        return to_number(self._data.get("mdvalue6"))
+
+    @property
+    def msval6(self):
+        """거래대금순매수6"""
+        return to_number(self._data.get("msval6"))
+
+    @property
+    def tjjcode7(self):
+        """투자자코드7(보험)"""
+        return self._data.get("tjjcode7")
+
+    @property
+    def msvolume7(self):
+        """매수거래량7"""
+        return to_number(self._data.get("msvolume7"))
+
+    @property
+    def mdvolume7(self):
+        """매도거래량7"""
+        return to_number(self._data.get("mdvolume7"))
+
+    @property
+    def msvol7(self):
+        """거래량순매수7"""
+        return to_number(self._data.get("msvol7"))
+
+    @property
+    def msvalue7(self):
+        """매수거래대금7"""
+        return to_number(self._data.get("msvalue7"))
+
+    @property
+    def mdvalue7(self):
+        """매도거래대금7"""
+        return to_number(self._data.get("mdvalue7"))
+
+    @property
+    def msval7(self):
+        """거래대금순매수7"""
+        return to_number(self._data.get("msval7"))
+
+    @property
+    def tjjcode8(self):
+        """투자자코드8(종금)"""
+        return self._data.get("tjjcode8")
+
+    @property
+    def msvolume8(self):
+        """매수거래량8"""
+        return to_number(self._data.get("msvolume8"))
+
+    @property
+    def mdvolume8(self):
+        """매도거래량8"""
+        return to_number(self._data.get("mdvolume8"))
+
+    @property
+    def msvol8(self):
+        """거래량순매수8"""
+        return to_number(self._data.get("msvol8"))
+
+    @property
+    def msvalue8(self):
+        """매수거래대금8"""
+        return to_number(self._data.get("msvalue8"))
+
+    @property
+    def mdvalue8(self):
+        """매도거래대금8"""
+        return to_number(self._data.get("mdvalue8"))
+
+    @property
+    def msval8(self):
+        """거래대금순매수8"""
+        return to_number(self._data.get("msval8"))
+
+    @property
+    def tjjcode9(self):
+        """투자자코드9(기금)"""
+        return self._data.get("tjjcode9")
+
+    @property
+    def msvolume9(self):
+        """매수거래량9"""
+        return to_number(self._data.get("msvolume9"))
+
+    @property
+    def mdvolume9(self):
+        """매도거래량9"""
+        return to_number(self._data.get("mdvolume9"))
+
+    @property
+    def msvol9(self):
+        """거래량순매수9"""
+        return to_number(self._data.get("msvol9"))
+
+    @property
+    def msvalue9(self):
+        """매수거래대금9"""
+        return to_number(self._data.get("msvalue9"))
+
+    @property
+    def mdvalue9(self):
+        """매도거래대금9"""
+        return to_number(self._data.get("mdvalue9"))
+
+    @property
+    def msval9(self):
+        """거래대금순매수9"""
+        return to_number(self._data.get("msval9"))
+
+    @property
+    def tjjcode10(self):
+        """투자자코드10(선물업자)"""
+        return self._data.get("tjjcode10")
+
+    @property
+    def msvolume10(self):
+        """매수거래량10"""
+        return to_number(self._data.get("msvolume10"))
+
+    @property
+    def mdvolume10(self):
+        """매도거래량10"""
+        return to_number(self._data.get("mdvolume10"))
+
+    @property
+    def msvol10(self):
+        """거래량순매수10"""
+        return to_number(self._data.get("msvol10"))
+
+    @property
+    def msvalue10(self):
+        """매수거래대금10"""
+        return to_number(self._data.get("msvalue10"))
+
+    @property
+    def mdvalue10(self):
+        """매도거래대금10"""
+        return to_number(self._data.get("mdvalue10"))
+
+    @property
+    def msval10(self):
+        """거래대금순매수10"""
+        return to_number(self._data.get("msval10"))
+
+    @property
+    def tjjcode11(self):
+        """투자자코드11(기타)"""
+        return self._data.get("tjjcode11")
+
+    @property
+    def msvolume11(self):
+        """매수거래량11"""
+        return to_number(self._data.get("msvolume11"))
+
+    @property
+    def mdvolume11(self):
+        """매도거래량11"""
+        return to_number(self._data.get("mdvolume11"))
+
+    @property
+    def msvol11(self):
+        """거래량순매수11"""
+        return to_number(self._data.get("msvol11"))
+
+    @property
+    def msvalue11(self):
+        """매수거래대금11"""
+        return to_number(self._data.get("msvalue11"))
+
+    @property
+    def mdvalue11(self):
+        """매도거래대금11"""
+        return to_number(self._data.get("mdvalue11"))
+
+    @property
+    def msval11(self):
+        """거래대금순매수11"""
+        return to_number(self._data.get("msval11"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+    @property
+    def tjjcode0(self):
+        """투자자코드0(사모펀드)"""
+        return self._data.get("tjjcode0")
+
+    @property
+    def msvolume0(self):
+        """매수거래량0"""
+        return to_number(self._data.get("msvolume0"))
+
+    @property
+    def mdvolume0(self):
+        """매도거래량0"""
+        return to_number(self._data.get("mdvolume0"))
+
+    @property
+    def msvol0(self):
+        """거래량순매수0"""
+        return to_number(self._data.get("msvol0"))
+
+    @property
+    def msvalue0(self):
+        """매수거래대금0"""
+        return to_number(self._data.get("msvalue0"))
+
+    @property
+    def mdvalue0(self):
+        """매도거래대금0"""
+        return to_number(self._data.get("mdvalue0"))
+
+    @property
+    def msval0(self):
+        """거래대금순매수0"""
+        return to_number(self._data.get("msval0"))
+
+    @property
+    def ex_upcode(self):
+        """거래소별업종코드"""
+        return self._data.get("ex_upcode")
+
+
+class UBMTick(RealtimeRecord):
+    """[UBM] (통합) 업종별투자자별매매현황"""
+    __slots__ = ()
+    TR_CODE = "UBM"
+    FIELDS = ("tjjcode", "tjjtime", "msvolume", "mdvolume", "msvol", "p_msvol", "msvalue", "mdvalue", "msval", "p_msval", "upcode", "ex_upcode")
+
+    @property
+    def tjjcode(self):
+        """투자자코드"""
+        return self._data.get("tjjcode")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def msvolume(self):
+        """매수거래량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mdvolume(self):
+        """매도거래량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def msvol(self):
+        """거래량순매수"""
+        return to_number(self._data.get("msvol"))
+
+    @property
+    def p_msvol(self):
+        """거래량순매수직전대비"""
+        return to_number(self._data.get("p_msvol"))
+
+    @property
+    def msvalue(self):
+        """매수거래대금"""
+        return to_number(self._data.get("msvalue"))
+
+    @property
+    def mdvalue(self):
+        """매도거래대금"""
+        return to_number(self._data.get("mdvalue"))
+
+    @property
+    def msval(self):
+        """거래대금순매수"""
+        return to_number(self._data.get("msval"))
+
+    @property
+    def p_msval(self):
+        """거래대금순매수직전대비"""
+        return to_number(self._data.get("p_msval"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+    @property
+    def ex_upcode(self):
+        """거래소별업종코드"""
+        return self._data.get("ex_upcode")
+
+
+class UPMTick(RealtimeRecord):
+    """[UPM] (통합)프로그램매매전체집계"""
+    __slots__ = ()
+    TR_CODE = "UPM"
+    FIELDS = ("time", "cdhrem", "cshrem", "bdhrem", "bshrem", "cdhvolume", "cshvolume", "bdhvolume", "bshvolume", "cdwvolume", "cdjvolume", "cswvolume", "csjvolume", "cwvol", "cjvol", "bdwvolume", "bdjvolume", "bswvolume", "bsjvolume", "bwvol", "bjvol", "dwvolume", "swvolume", "전체매도자기체결수량", "sjvolume", "jvol", "cdwvalue", "cdjvalue", "cswvalue", "csjvalue", "cwval", "cjval", "bdwvalue", "bdjvalue", "bswvalue", "bsjvalue", "bwval", "bjval", "dwvalue", "swvalue", "wval", "djvalue", "sjvalue", "jval", "k200jisu", "k200sign", "change", "k200basis", "cdvolume", "csvolume", "cvol", "bdvolume", "bsvolume", "bvol", "tdvolume", "tsvolume", "tvol", "cdvalue", "csvalue", "cval", "bdvalue", "bsvalue", "bval", "tdvalue", "tsvalue", "tval", "p_cdvolcha", "p_csvolcha", "p_cvolcha", "p_bdvolcha", "p_bsvolcha", "p_bvolcha", "p_tdvolcha", "p_tsvolcha", "p_tvolcha", "p_cdvalcha", "p_csvalcha", "p_cvalcha", "p_bdvalcha", "p_bsvalcha", "p_bvalcha", "p_tdvalcha", "p_tsvalcha", "p_tvalcha", "gubun", "ex_gubun")
+
+    @property
+    def time(self):
+        """수신시간"""
+        return self._data.get("time")
+
+    @property
+    def cdhrem(self):
+        """차익매도호가잔량"""
+        return to_number(self._data.get("cdhrem"))
+
+    @property
+    def cshrem(self):
+        """차익매수호가잔량"""
+        return to_number(self._data.get("cshrem"))
+
+    @property
+    def bdhrem(self):
+        """비차익매도호가잔량"""
+        return to_number(self._data.get("bdhrem"))
+
+    @property
+    def bshrem(self):
+        """비차익매수호가잔량"""
+        return to_number(self._data.get("bshrem"))
+
+    @property
+    def cdhvolume(self):
+        """차익매도호가수량"""
+        return to_number(self._data.get("cdhvolume"))
+
+    @property
+    def cshvolume(self):
+        """차익매수호가수량"""
+        return to_number(self._data.get("cshvolume"))
+
+    @property
+    def bdhvolume(self):
+        """비차익매도호가수량"""
+        return to_number(self._data.get("bdhvolume"))
+
+    @property
+    def bshvolume(self):
+        """비차익매수호가수량"""
+        return to_number(self._data.get("bshvolume"))
+
+    @property
+    def cdwvolume(self):
+        """차익매도위탁체결수량"""
+        return to_number(self._data.get("cdwvolume"))
+
+    @property
+    def cdjvolume(self):
+        """차익매도자기체결수량"""
+        return to_number(self._data.get("cdjvolume"))
+
+    @property
+    def cswvolume(self):
+        """차익매수위탁체결수량"""
+        return to_number(self._data.get("cswvolume"))
+
+    @property
+    def csjvolume(self):
+        """차익매수자기체결수량"""
+        return to_number(self._data.get("csjvolume"))
+
+    @property
+    def cwvol(self):
+        """차익위탁순매수수량"""
+        return to_number(self._data.get("cwvol"))
+
+    @property
+    def cjvol(self):
+        """차익자기순매수수량"""
+        return to_number(self._data.get("cjvol"))
+
+    @property
+    def bdwvolume(self):
+        """비차익매도위탁체결수량"""
+        return to_number(self._data.get("bdwvolume"))
+
+    @property
+    def bdjvolume(self):
+        """비차익매도자기체결수량"""
+        return to_number(self._data.get("bdjvolume"))
+
+    @property
+    def bswvolume(self):
+        """비차익매수위탁체결수량"""
+        return to_number(self._data.get("bswvolume"))
+
+    @property
+    def bsjvolume(self):
+        """비차익매수자기체결수량"""
+        return to_number(self._data.get("bsjvolume"))
+
+    @property
+    def bwvol(self):
+        """비차익위탁순매수수량"""
+        return to_number(self._data.get("bwvol"))
+
+    @property
+    def bjvol(self):
+        """비차익자기순매수수량"""
+        return to_number(self._data.get("bjvol"))
+
+    @property
+    def dwvolume(self):
+        """전체매도위탁체결수량"""
+        return to_number(self._data.get("dwvolume"))
+
+    @property
+    def swvolume(self):
+        """전체매수위탁체결수량"""
+        return to_number(self._data.get("swvolume"))
+
+    @property
+    def 전체매도자기체결수량(self):
+        """전체위탁순매수수량"""
+        return to_number(self._data.get("전체매도자기체결수량"))
+
+    @property
+    def sjvolume(self):
+        """전체매수자기체결수량"""
+        return to_number(self._data.get("sjvolume"))
+
+    @property
+    def jvol(self):
+        """전체자기순매수수량"""
+        return to_number(self._data.get("jvol"))
+
+    @property
+    def cdwvalue(self):
+        """차익매도위탁체결금액"""
+        return to_number(self._data.get("cdwvalue"))
+
+    @property
+    def cdjvalue(self):
+        """차익매도자기체결금액"""
+        return to_number(self._data.get("cdjvalue"))
+
+    @property
+    def cswvalue(self):
+        """차익매수위탁체결금액"""
+        return to_number(self._data.get("cswvalue"))
+
+    @property
+    def csjvalue(self):
+        """차익매수자기체결금액"""
+        return to_number(self._data.get("csjvalue"))
+
+    @property
+    def cwval(self):
+        """차익위탁순매수금액"""
+        return to_number(self._data.get("cwval"))
+
+    @property
+    def cjval(self):
+        """차익자기순매수금액"""
+        return to_number(self._data.get("cjval"))
+
+    @property
+    def bdwvalue(self):
+        """비차익매도위탁체결금액"""
+        return to_number(self._data.get("bdwvalue"))
+
+    @property
+    def bdjvalue(self):
+        """비차익매도자기체결금액"""
+        return to_number(self._data.get("bdjvalue"))
+
+    @property
+    def bswvalue(self):
+        """비차익매수위탁체결금액"""
+        return to_number(self._data.get("bswvalue"))
+
+    @property
+    def bsjvalue(self):
+        """비차익매수자기체결금액"""
+        return to_number(self._data.get("bsjvalue"))
+
+    @property
+    def bwval(self):
+        """비차익위탁순매수금액"""
+        return to_number(self._data.get("bwval"))
+
+    @property
+    def bjval(self):
+        """비차익자기순매수금액"""
+        return to_number(self._data.get("bjval"))
+
+    @property
+    def dwvalue(self):
+        """전체매도위탁체결금액"""
+        return to_number(self._data.get("dwvalue"))
+
+    @property
+    def swvalue(self):
+        """전체매수위탁체결금액"""
+        return to_number(self._data.get("swvalue"))
+
+    @property
+    def wval(self):
+        """전체위탁순매수금액"""
+        return to_number(self._data.get("wval"))
+
+    @property
+    def djvalue(self):
+        """전체매도자기체결금액"""
+        return to_number(self._data.get("djvalue"))
+
+    @property
+    def sjvalue(self):
+        """전체매수자기체결금액"""
+        return to_number(self._data.get("sjvalue"))
+
+    @property
+    def jval(self):
+        """전체자기순매수금액"""
+        return to_number(self._data.get("jval"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def k200sign(self):
+        """KOSPI200전일대비구분"""
+        return self._data.get("k200sign")
+
+    @property
+    def change(self):
+        """KOSPI200전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def k200basis(self):
+        """KOSPI200베이시스"""
+        return to_float(self._data.get("k200basis"))
+
+    @property
+    def cdvolume(self):
+        """차익매도체결수량합계"""
+        return to_number(self._data.get("cdvolume"))
+
+    @property
+    def csvolume(self):
+        """차익매수체결수량합계"""
+        return to_number(self._data.get("csvolume"))
+
+    @property
+    def cvol(self):
+        """차익순매수수량합계"""
+        return to_number(self._data.get("cvol"))
+
+    @property
+    def bdvolume(self):
+        """비차익매도체결수량합계"""
+        return to_number(self._data.get("bdvolume"))
+
+    @property
+    def bsvolume(self):
+        """비차익매수체결수량합계"""
+        return to_number(self._data.get("bsvolume"))
+
+    @property
+    def bvol(self):
+        """비차익순매수수량합계"""
+        return to_number(self._data.get("bvol"))
+
+    @property
+    def tdvolume(self):
+        """전체매도체결수량합계"""
+        return to_number(self._data.get("tdvolume"))
+
+    @property
+    def tsvolume(self):
+        """전체매수체결수량합계"""
+        return to_number(self._data.get("tsvolume"))
+
+    @property
+    def tvol(self):
+        """전체순매수수량합계"""
+        return to_number(self._data.get("tvol"))
+
+    @property
+    def cdvalue(self):
+        """차익매도체결금액합계"""
+        return to_number(self._data.get("cdvalue"))
+
+    @property
+    def csvalue(self):
+        """차익매수체결금액합계"""
+        return to_number(self._data.get("csvalue"))
+
+    @property
+    def cval(self):
+        """차익순매수금액합계"""
+        return to_number(self._data.get("cval"))
+
+    @property
+    def bdvalue(self):
+        """비차익매도체결금액합계"""
+        return to_number(self._data.get("bdvalue"))
+
+    @property
+    def bsvalue(self):
+        """비차익매수체결금액합계"""
+        return to_number(self._data.get("bsvalue"))
+
+    @property
+    def bval(self):
+        """비차익순매수금액합계"""
+        return to_number(self._data.get("bval"))
+
+    @property
+    def tdvalue(self):
+        """전체매도체결금액합계"""
+        return to_number(self._data.get("tdvalue"))
+
+    @property
+    def tsvalue(self):
+        """전체매수체결금액합계"""
+        return to_number(self._data.get("tsvalue"))
+
+    @property
+    def tval(self):
+        """전체순매수금액합계"""
+        return to_number(self._data.get("tval"))
+
+    @property
+    def p_cdvolcha(self):
+        """차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_cdvolcha"))
+
+    @property
+    def p_csvolcha(self):
+        """차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_csvolcha"))
+
+    @property
+    def p_cvolcha(self):
+        """차익순매수수량직전대비"""
+        return to_number(self._data.get("p_cvolcha"))
+
+    @property
+    def p_bdvolcha(self):
+        """비차익매도체결수량직전대비"""
+        return to_number(self._data.get("p_bdvolcha"))
+
+    @property
+    def p_bsvolcha(self):
+        """비차익매수체결수량직전대비"""
+        return to_number(self._data.get("p_bsvolcha"))
+
+    @property
+    def p_bvolcha(self):
+        """비차익순매수수량직전대비"""
+        return to_number(self._data.get("p_bvolcha"))
+
+    @property
+    def p_tdvolcha(self):
+        """전체매도체결수량직전대비"""
+        return to_number(self._data.get("p_tdvolcha"))
+
+    @property
+    def p_tsvolcha(self):
+        """전체매수체결수량직전대비"""
+        return to_number(self._data.get("p_tsvolcha"))
+
+    @property
+    def p_tvolcha(self):
+        """전체순매수수량직전대비"""
+        return to_number(self._data.get("p_tvolcha"))
+
+    @property
+    def p_cdvalcha(self):
+        """차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_cdvalcha"))
+
+    @property
+    def p_csvalcha(self):
+        """차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_csvalcha"))
+
+    @property
+    def p_cvalcha(self):
+        """차익순매수금액직전대비"""
+        return to_number(self._data.get("p_cvalcha"))
+
+    @property
+    def p_bdvalcha(self):
+        """비차익매도체결금액직전대비"""
+        return to_number(self._data.get("p_bdvalcha"))
+
+    @property
+    def p_bsvalcha(self):
+        """비차익매수체결금액직전대비"""
+        return to_number(self._data.get("p_bsvalcha"))
+
+    @property
+    def p_bvalcha(self):
+        """비차익순매수금액직전대비"""
+        return to_number(self._data.get("p_bvalcha"))
+
+    @property
+    def p_tdvalcha(self):
+        """전체매도체결금액직전대비"""
+        return to_number(self._data.get("p_tdvalcha"))
+
+    @property
+    def p_tsvalcha(self):
+        """전체매수체결금액직전대비"""
+        return to_number(self._data.get("p_tsvalcha"))
+
+    @property
+    def p_tvalcha(self):
+        """전체순매수금액직전대비"""
+        return to_number(self._data.get("p_tvalcha"))
+
+    @property
+    def gubun(self):
+        """구분값"""
+        return self._data.get("gubun")
+
+    @property
+    def ex_gubun(self):
+        """거래소별구분값"""
+        return self._data.get("ex_gubun")
+
+
+class UVITick(RealtimeRecord):
+    """[UVI] (통합)VI발동해제"""
+    __slots__ = ()
+    TR_CODE = "UVI"
+    FIELDS = ("krx_vi_gubun", "krx_svi_recprice", "krx_dvi_recprice", "krx_vi_trgprice", "krx_time", "nxt_vi_gubun", "nxt_svi_recprice", "nxt_dvi_recprice", "nxt_vi_trgprice", "nxt_time", "shcode", "ref_shcode", "exchname", "ex_shcode")
+
+    @property
+    def krx_vi_gubun(self):
+        """KRXVI구분 (0:해제1:정적발동2:동적발동3:정적&동적)"""
+        return self._data.get("krx_vi_gubun")
+
+    @property
+    def krx_svi_recprice(self):
+        """KRX정적VI발동기준가격"""
+        return to_number(self._data.get("krx_svi_recprice"))
+
+    @property
+    def krx_dvi_recprice(self):
+        """KRX동적VI발동기준가격"""
+        return to_number(self._data.get("krx_dvi_recprice"))
+
+    @property
+    def krx_vi_trgprice(self):
+        """KRXVI발동가격"""
+        return to_number(self._data.get("krx_vi_trgprice"))
+
+    @property
+    def krx_time(self):
+        """KRX시간"""
+        return self._data.get("krx_time")
+
+    @property
+    def nxt_vi_gubun(self):
+        """NXTVI구분(0:해제1:정적발동2:동적발동3:정적&동적)"""
+        return self._data.get("nxt_vi_gubun")
+
+    @property
+    def nxt_svi_recprice(self):
+        """NXT정적VI발동기준가격"""
+        return to_number(self._data.get("nxt_svi_recprice"))
+
+    @property
+    def nxt_dvi_recprice(self):
+        """NXT동적VI발동기준가격"""
+        return to_number(self._data.get("nxt_dvi_recprice"))
+
+    @property
+    def nxt_vi_trgprice(self):
+        """NXTVI발동가격"""
+        return to_number(self._data.get("nxt_vi_trgprice"))
+
+    @property
+    def nxt_time(self):
+        """NXT시간"""
+        return self._data.get("nxt_time")
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+    @property
+    def ref_shcode(self):
+        """참조코드(미사용)"""
+        return self._data.get("ref_shcode")
+
+    @property
+    def exchname(self):
+        """거래소명"""
+        return self._data.get("exchname")
+
+    @property
+    def ex_shcode(self):
+        """거래소별단축코드"""
+        return self._data.get("ex_shcode")
+
+
+class AFRTick(RealtimeRecord):
+    """[AFR] API사용자조건검색실시간"""
+    __slots__ = ()
+    TR_CODE = "AFR"
+    FIELDS = ("gsCode", "gshname", "gsPrice", "gsSign", "gsChange", "gsChgRate", "gsVolume", "gsJobFlag")
+
+    @property
+    def gsCode(self):
+        """종목코드"""
+        return self._data.get("gsCode")
+
+    @property
+    def gshname(self):
+        """종목명"""
+        return self._data.get("gshname")
+
+    @property
+    def gsPrice(self):
+        """현재가"""
+        return to_number(self._data.get("gsPrice"))
+
+    @property
+    def gsSign(self):
+        """전일대비구분"""
+        return self._data.get("gsSign")
+
+    @property
+    def gsChange(self):
+        """전일대비"""
+        return to_number(self._data.get("gsChange"))
+
+    @property
+    def gsChgRate(self):
+        """등락율"""
+        return to_float(self._data.get("gsChgRate"))
+
+    @property
+    def gsVolume(self):
+        """거래량"""
+        return to_number(self._data.get("gsVolume"))
+
+    @property
+    def gsJobFlag(self):
+        """종목상태"""
+        return self._data.get("gsJobFlag")
+
+
+class FC0Tick(RealtimeRecord):
+    """[FC0] KOSPI200선물체결"""
+    __slots__ = ()
+    TR_CODE = "FC0"
+    FIELDS = ("chetime", "sign", "change", "drate", "price", "open", "high", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "offerho1", "bidho1", "openyak", "k200jisu", "theoryprice", "kasis", "sbasis", "ibasis", "openyakcha", "jgubun", "jnilvolume", "futcode")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_float(self._data.get("price"))
+
+    @property
+    def open(self):
+        """시가"""
+        return to_float(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_float(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_float(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def openyak(self):
+        """미결제약정수량"""
+        return to_number(self._data.get("openyak"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def theoryprice(self):
+        """이론가"""
+        return to_float(self._data.get("theoryprice"))
+
+    @property
+    def kasis(self):
+        """괴리율"""
+        return to_float(self._data.get("kasis"))
+
+    @property
+    def sbasis(self):
+        """시장BASIS"""
+        return to_float(self._data.get("sbasis"))
+
+    @property
+    def ibasis(self):
+        """이론BASIS"""
+        return to_float(self._data.get("ibasis"))
+
+    @property
+    def openyakcha(self):
+        """미결제약정증감"""
+        return self._data.get("openyakcha")
+
+    @property
+    def jgubun(self):
+        """장운영정보"""
+        return self._data.get("jgubun")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+
+class FD0Tick(RealtimeRecord):
+    """[FD0] KOSPI200선물실시간상하한가"""
+    __slots__ = ()
+    TR_CODE = "FD0"
+    FIELDS = ("gubun", "dy_gubun", "dy_uplmtprice", "dy_dnlmtprice", "futcode")
+
+    @property
+    def gubun(self):
+        """접속매매여부"""
+        return self._data.get("gubun")
+
+    @property
+    def dy_gubun(self):
+        """실시간가격제한여부"""
+        return self._data.get("dy_gubun")
+
+    @property
+    def dy_uplmtprice(self):
+        """실시간상한가"""
+        return to_float(self._data.get("dy_uplmtprice"))
+
+    @property
+    def dy_dnlmtprice(self):
+        """실시간하한가"""
+        return to_float(self._data.get("dy_dnlmtprice"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+
+class FH0Tick(RealtimeRecord):
+    """[FH0] KOSPI200선물호가"""
+    __slots__ = ()
+    TR_CODE = "FH0"
+    FIELDS = ("hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offercnt1", "bidcnt1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offercnt2", "bidcnt2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offercnt3", "bidcnt3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offercnt4", "bidcnt4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offercnt5", "bidcnt5", "totofferrem", "totbidrem", "totoffercnt", "totbidcnt", "futcode", "danhochk", "alloc_gubun")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가수량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가수량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offercnt1(self):
+        """매도호가건수1"""
+        return to_number(self._data.get("offercnt1"))
+
+    @property
+    def bidcnt1(self):
+        """매수호가건수1"""
+        return to_number(self._data.get("bidcnt1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_float(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_float(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가수량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가수량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offercnt2(self):
+        """매도호가건수2"""
+        return to_number(self._data.get("offercnt2"))
+
+    @property
+    def bidcnt2(self):
+        """매수호가건수2"""
+        return to_number(self._data.get("bidcnt2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_float(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_float(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가수량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가수량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offercnt3(self):
+        """매도호가건수3"""
+        return to_number(self._data.get("offercnt3"))
+
+    @property
+    def bidcnt3(self):
+        """매수호가건수3"""
+        return to_number(self._data.get("bidcnt3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_float(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_float(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가수량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가수량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offercnt4(self):
+        """매도호가건수4"""
+        return to_number(self._data.get("offercnt4"))
+
+    @property
+    def bidcnt4(self):
+        """매수호가건수4"""
+        return to_number(self._data.get("bidcnt4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_float(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_float(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가수량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가수량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offercnt5(self):
+        """매도호가건수5"""
+        return to_number(self._data.get("offercnt5"))
+
+    @property
+    def bidcnt5(self):
+        """매수호가건수5"""
+        return to_number(self._data.get("bidcnt5"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def totoffercnt(self):
+        """매도호가총건수"""
+        return to_number(self._data.get("totoffercnt"))
+
+    @property
+    def totbidcnt(self):
+        """매수호가총건수"""
+        return to_number(self._data.get("totbidcnt"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def danhochk(self):
+        """단일가호가여부"""
+        return self._data.get("danhochk")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+
+class FX0Tick(RealtimeRecord):
+    """[FX0] KOSPI200선물가격제한폭확대"""
+    __slots__ = ()
+    TR_CODE = "FX0"
+    FIELDS = ("upstep", "dnstep", "uplmtprice", "dnlmtprice", "futcode")
+
+    @property
+    def upstep(self):
+        """적용상한단계"""
+        return self._data.get("upstep")
+
+    @property
+    def dnstep(self):
+        """적용하한단계"""
+        return self._data.get("dnstep")
+
+    @property
+    def uplmtprice(self):
+        """적용상한가"""
+        return to_float(self._data.get("uplmtprice"))
+
+    @property
+    def dnlmtprice(self):
+        """적용하한가"""
+        return to_float(self._data.get("dnlmtprice"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+
+class JC0Tick(RealtimeRecord):
+    """[JC0] 주식선물체결"""
+    __slots__ = ()
+    TR_CODE = "JC0"
+    FIELDS = ("futcode", "chetime", "sign", "change", "drate", "price", "open", "high", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "offerho1", "bidho1", "openyak", "k200jisu", "theoryprice", "kasis", "sbasis", "ibasis", "openyakcha", "jgubun", "jnilvolume", "basprice")
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """대비기호"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_number(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_number(self._data.get("price"))
+
+    @property
+    def open(self):
+        """시가"""
+        return to_number(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_number(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_number(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def openyak(self):
+        """미결제약정수량"""
+        return to_number(self._data.get("openyak"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def theoryprice(self):
+        """이론가"""
+        return to_number(self._data.get("theoryprice"))
+
+    @property
+    def kasis(self):
+        """괴리율"""
+        return to_float(self._data.get("kasis"))
+
+    @property
+    def sbasis(self):
+        """시장BASIS"""
+        return self._data.get("sbasis")
+
+    @property
+    def ibasis(self):
+        """이론BASIS"""
+        return self._data.get("ibasis")
+
+    @property
+    def openyakcha(self):
+        """미결제약정증감"""
+        return self._data.get("openyakcha")
+
+    @property
+    def jgubun(self):
+        """장운영정보"""
+        return self._data.get("jgubun")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def basprice(self):
+        """기초자산현재가"""
+        return to_number(self._data.get("basprice"))
+
+
+class JD0Tick(RealtimeRecord):
+    """[JD0] 주식선물실시간상하한가"""
+    __slots__ = ()
+    TR_CODE = "JD0"
+    FIELDS = ("gubun", "dy_gubun", "dy_uplmtprice", "dy_dnlmtprice", "futcode")
+
+    @property
+    def gubun(self):
+        """접속매매여부"""
+        return self._data.get("gubun")
+
+    @property
+    def dy_gubun(self):
+        """실시간가격제한여부"""
+        return self._data.get("dy_gubun")
+
+    @property
+    def dy_uplmtprice(self):
+        """실시간상한가"""
+        return to_number(self._data.get("dy_uplmtprice"))
+
+    @property
+    def dy_dnlmtprice(self):
+        """실시간하한가"""
+        return to_number(self._data.get("dy_dnlmtprice"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+
+class JH0Tick(RealtimeRecord):
+    """[JH0] 주식선물호가"""
+    __slots__ = ()
+    TR_CODE = "JH0"
+    FIELDS = ("futcode", "hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offercnt1", "bidcnt1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offercnt2", "bidcnt2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offercnt3", "bidcnt3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offercnt4", "bidcnt4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offercnt5", "bidcnt5", "offerho6", "bidho6", "offerrem6", "bidrem6", "offercnt6", "bidcnt6", "offerho7", "bidho7", "offerrem7", "bidrem7", "offercnt7", "bidcnt7", "offerho8", "bidho8", "offerrem8", "bidrem8", "offercnt8", "bidcnt8", "offerho9", "bidho9", "offerrem9", "bidrem9", "offercnt9", "bidcnt9", "offerho10", "bidho10", "offerrem10", "bidrem10", "offercnt10", "bidcnt10", "totofferrem", "totbidrem", "totoffercnt", "totbidcnt", "danhochk", "alloc_gubun")
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_number(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_number(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가수량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가수량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offercnt1(self):
+        """매도호가건수1"""
+        return to_number(self._data.get("offercnt1"))
+
+    @property
+    def bidcnt1(self):
+        """매수호가건수1"""
+        return to_number(self._data.get("bidcnt1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_number(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_number(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가수량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가수량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offercnt2(self):
+        """매도호가건수2"""
+        return to_number(self._data.get("offercnt2"))
+
+    @property
+    def bidcnt2(self):
+        """매수호가건수2"""
+        return to_number(self._data.get("bidcnt2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_number(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_number(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가수량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가수량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offercnt3(self):
+        """매도호가건수3"""
+        return to_number(self._data.get("offercnt3"))
+
+    @property
+    def bidcnt3(self):
+        """매수호가건수3"""
+        return to_number(self._data.get("bidcnt3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_number(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_number(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가수량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가수량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offercnt4(self):
+        """매도호가건수4"""
+        return to_number(self._data.get("offercnt4"))
+
+    @property
+    def bidcnt4(self):
+        """매수호가건수4"""
+        return to_number(self._data.get("bidcnt4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_number(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_number(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가수량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가수량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offercnt5(self):
+        """매도호가건수5"""
+        return to_number(self._data.get("offercnt5"))
+
+    @property
+    def bidcnt5(self):
+        """매수호가건수5"""
+        return to_number(self._data.get("bidcnt5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_number(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_number(self._data.get("bidho6"))
+
+    @property
+    def offerrem6(self):
+        """매도호가수량6"""
+        return to_number(self._data.get("offerrem6"))
+
+    @property
+    def bidrem6(self):
+        """매수호가수량6"""
+        return to_number(self._data.get("bidrem6"))
+
+    @property
+    def offercnt6(self):
+        """매도호가건수6"""
+        return to_number(self._data.get("offercnt6"))
+
+    @property
+    def bidcnt6(self):
+        """매수호가건수6"""
+        return to_number(self._data.get("bidcnt6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_number(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_number(self._data.get("bidho7"))
+
+    @property
+    def offerrem7(self):
+        """매도호가수량7"""
+        return to_number(self._data.get("offerrem7"))
+
+    @property
+    def bidrem7(self):
+        """매수호가수량7"""
+        return to_number(self._data.get("bidrem7"))
+
+    @property
+    def offercnt7(self):
+        """매도호가건수7"""
+        return to_number(self._data.get("offercnt7"))
+
+    @property
+    def bidcnt7(self):
+        """매수호가건수7"""
+        return to_number(self._data.get("bidcnt7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_number(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_number(self._data.get("bidho8"))
+
+    @property
+    def offerrem8(self):
+        """매도호가수량8"""
+        return to_number(self._data.get("offerrem8"))
+
+    @property
+    def bidrem8(self):
+        """매수호가수량8"""
+        return to_number(self._data.get("bidrem8"))
+
+    @property
+    def offercnt8(self):
+        """매도호가건수8"""
+        return to_number(self._data.get("offercnt8"))
+
+    @property
+    def bidcnt8(self):
+        """매수호가건수8"""
+        return to_number(self._data.get("bidcnt8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_number(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_number(self._data.get("bidho9"))
+
+    @property
+    def offerrem9(self):
+        """매도호가수량9"""
+        return to_number(self._data.get("offerrem9"))
+
+    @property
+    def bidrem9(self):
+        """매수호가수량9"""
+        return to_number(self._data.get("bidrem9"))
+
+    @property
+    def offercnt9(self):
+        """매도호가건수9"""
+        return to_number(self._data.get("offercnt9"))
+
+    @property
+    def bidcnt9(self):
+        """매수호가건수9"""
+        return to_number(self._data.get("bidcnt9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_number(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_number(self._data.get("bidho10"))
+
+    @property
+    def offerrem10(self):
+        """매도호가수량10"""
+        return to_number(self._data.get("offerrem10"))
+
+    @property
+    def bidrem10(self):
+        """매수호가수량10"""
+        return to_number(self._data.get("bidrem10"))
+
+    @property
+    def offercnt10(self):
+        """매도호가건수10"""
+        return to_number(self._data.get("offercnt10"))
+
+    @property
+    def bidcnt10(self):
+        """매수호가건수10"""
+        return to_number(self._data.get("bidcnt10"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def totoffercnt(self):
+        """매도호가총건수"""
+        return to_number(self._data.get("totoffercnt"))
+
+    @property
+    def totbidcnt(self):
+        """매수호가총건수"""
+        return to_number(self._data.get("totbidcnt"))
+
+    @property
+    def danhochk(self):
+        """단일가호가여부"""
+        return self._data.get("danhochk")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+
+class JX0Tick(RealtimeRecord):
+    """[JX0] 주식선물가격제한폭확대"""
+    __slots__ = ()
+    TR_CODE = "JX0"
+    FIELDS = ("upstep", "dnstep", "uplmtprice", "dnlmtprice", "futcode")
+
+    @property
+    def upstep(self):
+        """적용상한단계"""
+        return self._data.get("upstep")
+
+    @property
+    def dnstep(self):
+        """적용하한단계"""
+        return self._data.get("dnstep")
+
+    @property
+    def uplmtprice(self):
+        """적용상한가"""
+        return to_number(self._data.get("uplmtprice"))
+
+    @property
+    def dnlmtprice(self):
+        """적용하한가"""
+        return to_number(self._data.get("dnlmtprice"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+
+class OC0Tick(RealtimeRecord):
+    """[OC0] KOSPI200옵션체결"""
+    __slots__ = ()
+    TR_CODE = "OC0"
+    FIELDS = ("chetime", "sign", "change", "drate", "price", "open", "high", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "offerho1", "bidho1", "openyak", "k200jisu", "eqva", "theoryprice", "impv", "openyakcha", "timevalue", "jgubun", "jnilvolume", "optcode")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_float(self._data.get("price"))
+
+    @property
+    def open(self):
+        """시가"""
+        return to_float(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_float(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_float(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def openyak(self):
+        """미결제약정수량"""
+        return to_number(self._data.get("openyak"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def eqva(self):
+        """KOSPI등가"""
+        return to_float(self._data.get("eqva"))
+
+    @property
+    def theoryprice(self):
+        """이론가"""
+        return to_float(self._data.get("theoryprice"))
+
+    @property
+    def impv(self):
+        """내재변동성"""
+        return to_float(self._data.get("impv"))
+
+    @property
+    def openyakcha(self):
+        """미결제약정증감"""
+        return self._data.get("openyakcha")
+
+    @property
+    def timevalue(self):
+        """시간가치"""
+        return to_float(self._data.get("timevalue"))
+
+    @property
+    def jgubun(self):
+        """장운영정보"""
+        return self._data.get("jgubun")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def optcode(self):
+        """단축코드"""
+        return self._data.get("optcode")
+
+
+class OD0Tick(RealtimeRecord):
+    """[OD0] KOSPI200옵션실시간상하한가"""
+    __slots__ = ()
+    TR_CODE = "OD0"
+    FIELDS = ("gubun", "dy_gubun", "dy_uplmtprice", "dy_dnlmtprice", "opttcode")
+
+    @property
+    def gubun(self):
+        """접속매매여부"""
+        return self._data.get("gubun")
+
+    @property
+    def dy_gubun(self):
+        """실시간가격제한여부"""
+        return self._data.get("dy_gubun")
+
+    @property
+    def dy_uplmtprice(self):
+        """실시간상한가"""
+        return to_float(self._data.get("dy_uplmtprice"))
+
+    @property
+    def dy_dnlmtprice(self):
+        """실시간하한가"""
+        return to_float(self._data.get("dy_dnlmtprice"))
+
+    @property
+    def opttcode(self):
+        """단축코드"""
+        return self._data.get("opttcode")
+
+
+class OH0Tick(RealtimeRecord):
+    """[OH0] KOSPI200옵션호가"""
+    __slots__ = ()
+    TR_CODE = "OH0"
+    FIELDS = ("hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offercnt1", "bidcnt1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offercnt2", "bidcnt2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offercnt3", "bidcnt3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offercnt4", "bidcnt4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offercnt5", "bidcnt5", "totofferrem", "totbidrem", "totoffercnt", "totbidcnt", "optcode", "danhochk", "alloc_gubun")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가수량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가수량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offercnt1(self):
+        """매도호가건수1"""
+        return to_number(self._data.get("offercnt1"))
+
+    @property
+    def bidcnt1(self):
+        """매수호가건수1"""
+        return to_number(self._data.get("bidcnt1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_float(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_float(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가수량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가수량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offercnt2(self):
+        """매도호가건수2"""
+        return to_number(self._data.get("offercnt2"))
+
+    @property
+    def bidcnt2(self):
+        """매수호가건수2"""
+        return to_number(self._data.get("bidcnt2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_float(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_float(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가수량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가수량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offercnt3(self):
+        """매도호가건수3"""
+        return to_number(self._data.get("offercnt3"))
+
+    @property
+    def bidcnt3(self):
+        """매수호가건수3"""
+        return to_number(self._data.get("bidcnt3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_float(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_float(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가수량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가수량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offercnt4(self):
+        """매도호가건수4"""
+        return to_number(self._data.get("offercnt4"))
+
+    @property
+    def bidcnt4(self):
+        """매수호가건수4"""
+        return to_number(self._data.get("bidcnt4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_float(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_float(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가수량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가수량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offercnt5(self):
+        """매도호가건수5"""
+        return to_number(self._data.get("offercnt5"))
+
+    @property
+    def bidcnt5(self):
+        """매수호가건수5"""
+        return to_number(self._data.get("bidcnt5"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def totoffercnt(self):
+        """매도호가총건수"""
+        return to_number(self._data.get("totoffercnt"))
+
+    @property
+    def totbidcnt(self):
+        """매수호가총건수"""
+        return to_number(self._data.get("totbidcnt"))
+
+    @property
+    def optcode(self):
+        """단축코드"""
+        return self._data.get("optcode")
+
+    @property
+    def danhochk(self):
+        """단일가호가여부"""
+        return self._data.get("danhochk")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+
+class OMGTick(RealtimeRecord):
+    """[OMG] KOSPI200옵션민감도"""
+    __slots__ = ()
+    TR_CODE = "OMG"
+    FIELDS = ("chetime", "actprice", "k200jisu", "fut200jisu", "price", "capimpv", "impv", "delt", "gama", "ceta", "vega", "rhox", "theoryprice", "bimpv", "offerimpv", "bidimpv", "optcode")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def actprice(self):
+        """행사가"""
+        return to_float(self._data.get("actprice"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def fut200jisu(self):
+        """선물가격"""
+        return to_float(self._data.get("fut200jisu"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_float(self._data.get("price"))
+
+    @property
+    def capimpv(self):
+        """대표내재변동성"""
+        return to_float(self._data.get("capimpv"))
+
+    @property
+    def impv(self):
+        """내재변동성"""
+        return to_float(self._data.get("impv"))
+
+    @property
+    def delt(self):
+        """델타(블랙숄즈)"""
+        return to_float(self._data.get("delt"))
+
+    @property
+    def gama(self):
+        """감마(블랙숄즈)"""
+        return to_float(self._data.get("gama"))
+
+    @property
+    def ceta(self):
+        """세타(블랙숄즈)"""
+        return to_float(self._data.get("ceta"))
+
+    @property
+    def vega(self):
+        """베가(블랙숄즈)"""
+        return to_float(self._data.get("vega"))
+
+    @property
+    def rhox(self):
+        """로우(블랙숄즈)"""
+        return to_float(self._data.get("rhox"))
+
+    @property
+    def theoryprice(self):
+        """이론가(블랙숄즈)"""
+        return to_float(self._data.get("theoryprice"))
+
+    @property
+    def bimpv(self):
+        """전일가내재변동성"""
+        return to_float(self._data.get("bimpv"))
+
+    @property
+    def offerimpv(self):
+        """매도가내재변동성"""
+        return to_float(self._data.get("offerimpv"))
+
+    @property
+    def bidimpv(self):
+        """매수가내재변동성"""
+        return to_float(self._data.get("bidimpv"))
+
+    @property
+    def optcode(self):
+        """옵션코드"""
+        return self._data.get("optcode")
+
+
+class OX0Tick(RealtimeRecord):
+    """[OX0] KOSPI200옵션가격제한폭확대"""
+    __slots__ = ()
+    TR_CODE = "OX0"
+    FIELDS = ("upstep", "dnstep", "uplmtprice", "dnlmtprice", "opttcode")
+
+    @property
+    def upstep(self):
+        """적용상한단계"""
+        return self._data.get("upstep")
+
+    @property
+    def dnstep(self):
+        """적용하한단계"""
+        return self._data.get("dnstep")
+
+    @property
+    def uplmtprice(self):
+        """적용상한가"""
+        return to_float(self._data.get("uplmtprice"))
+
+    @property
+    def dnlmtprice(self):
+        """적용하한가"""
+        return to_float(self._data.get("dnlmtprice"))
+
+    @property
+    def opttcode(self):
+        """단축코드"""
+        return self._data.get("opttcode")
+
+
+class YC3Tick(RealtimeRecord):
+    """[YC3] 상품선물예상체결"""
+    __slots__ = ()
+    TR_CODE = "YC3"
+    FIELDS = ("ychetime", "yeprice", "yevolume", "jnilysign", "jnilchange", "jnilydrate", "shcode")
+
+    @property
+    def ychetime(self):
+        """예상체결시간"""
+        return self._data.get("ychetime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_float(self._data.get("yeprice"))
+
+    @property
+    def yevolume(self):
+        """예상체결수량"""
+        return to_number(self._data.get("yevolume"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_float(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def shcode(self):
+        """단축코드"""
+        return self._data.get("shcode")
+
+
+class YFCTick(RealtimeRecord):
+    """[YFC] 지수선물예상체결"""
+    __slots__ = ()
+    TR_CODE = "YFC"
+    FIELDS = ("ychetime", "yeprice", "jnilysign", "jnilchange", "jnilydrate", "futcode", "expct_ccls_q")
+
+    @property
+    def ychetime(self):
+        """예상체결시간"""
+        return self._data.get("ychetime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_float(self._data.get("yeprice"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_float(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def expct_ccls_q(self):
+        """예상체결수량"""
+        return to_number(self._data.get("expct_ccls_q"))
+
+
+class YJCTick(RealtimeRecord):
+    """[YJC] 주식선물예상체결"""
+    __slots__ = ()
+    TR_CODE = "YJC"
+    FIELDS = ("ychetime", "yeprice", "jnilysign", "jnilchange", "jnilydrate", "futcode", "expct_ccls_q")
+
+    @property
+    def ychetime(self):
+        """예상체결시간"""
+        return self._data.get("ychetime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_number(self._data.get("yeprice"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_number(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def expct_ccls_q(self):
+        """예상체결수량"""
+        return to_number(self._data.get("expct_ccls_q"))
+
+
+class YOCTick(RealtimeRecord):
+    """[YOC] 지수옵션예상체결"""
+    __slots__ = ()
+    TR_CODE = "YOC"
+    FIELDS = ("ychetime", "yeprice", "jnilysign", "jnilchange", "jnilydrate", "optcode", "expct_ccls_q")
+
+    @property
+    def ychetime(self):
+        """예상체결시간"""
+        return self._data.get("ychetime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_float(self._data.get("yeprice"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_float(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def optcode(self):
+        """단축코드"""
+        return self._data.get("optcode")
+
+    @property
+    def expct_ccls_q(self):
+        """예상체결수량"""
+        return to_number(self._data.get("expct_ccls_q"))
+
+
+class DC0Tick(RealtimeRecord):
+    """[DC0] KRX야간파생 체결"""
+    __slots__ = ()
+    TR_CODE = "DC0"
+    FIELDS = ("date", "sign", "chetime", "change", "drate", "price", "open", "high", "low", "cgubun", "cvolume", "volume", "value", "mdvolume", "mdchecnt", "msvolume", "mschecnt", "cpower", "offerho1", "bidho1", "openyak", "k200jisu", "theoryprice", "kasis", "sbasis", "ibasis", "openyakcha", "jgubun", "jnilvolume", "futcode", "eqva", "impv", "timevalue")
+
+    @property
+    def date(self):
+        """일자"""
+        return self._data.get("date")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def chetime(self):
+        """체결시간"""
+        return self._data.get("chetime")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def drate(self):
+        """등락율"""
+        return to_float(self._data.get("drate"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_float(self._data.get("price"))
+
+    @property
+    def open(self):
+        """시가"""
+        return to_float(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_float(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_float(self._data.get("low"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def cvolume(self):
+        """체결량"""
+        return to_number(self._data.get("cvolume"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_number(self._data.get("volume"))
+
+    @property
+    def value(self):
+        """누적거래대금"""
+        return to_number(self._data.get("value"))
+
+    @property
+    def mdvolume(self):
+        """매도누적체결량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def mdchecnt(self):
+        """매도누적체결건수"""
+        return to_number(self._data.get("mdchecnt"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mschecnt(self):
+        """매수누적체결건수"""
+        return to_number(self._data.get("mschecnt"))
+
+    @property
+    def cpower(self):
+        """체결강도"""
+        return to_float(self._data.get("cpower"))
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def openyak(self):
+        """미결제약정수량"""
+        return to_number(self._data.get("openyak"))
+
+    @property
+    def k200jisu(self):
+        """KOSPI200지수"""
+        return to_float(self._data.get("k200jisu"))
+
+    @property
+    def theoryprice(self):
+        """이론가"""
+        return to_float(self._data.get("theoryprice"))
+
+    @property
+    def kasis(self):
+        """괴리율"""
+        return to_float(self._data.get("kasis"))
+
+    @property
+    def sbasis(self):
+        """시장BASIS"""
+        return to_float(self._data.get("sbasis"))
+
+    @property
+    def ibasis(self):
+        """이론BASIS"""
+        return to_float(self._data.get("ibasis"))
+
+    @property
+    def openyakcha(self):
+        """미결제약정증감"""
+        return self._data.get("openyakcha")
+
+    @property
+    def jgubun(self):
+        """장운영정보"""
+        return self._data.get("jgubun")
+
+    @property
+    def jnilvolume(self):
+        """전일동시간대거래량"""
+        return to_number(self._data.get("jnilvolume"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def eqva(self):
+        """KOSPI등가"""
+        return to_float(self._data.get("eqva"))
+
+    @property
+    def impv(self):
+        """내재변동성"""
+        return to_float(self._data.get("impv"))
+
+    @property
+    def timevalue(self):
+        """시간가치"""
+        return to_float(self._data.get("timevalue"))
+
+
+class O02Tick(RealtimeRecord):
+    """[O02] KRX야간파생 선물접수"""
+    __slots__ = ()
+    TR_CODE = "O02"
+    FIELDS = ("lineseq", "accno", "user", "len", "gubun", "compress", "encrypt", "offset", "trcode", "compid", "userid", "media", "ifid", "seq", "trid", "pubip", "prvip", "pcbpno", "bpno", "termno", "lang", "proctm", "msgcode", "outgu", "compreq", "funckey", "reqcnt", "filler", "cont", "contkey", "varlen", "varhdlen", "varmsglen", "trsrc", "eventid", "ifinfo", "filler1", "trcode1", "firmno", "acntno", "acntno1", "acntnm", "brnno", "ordmktcode", "ordno1", "ordno", "orgordno1", "orgordno", "prntordno", "prntordno1", "isuno", "fnoIsuno", "fnoIsunm", "pdgrpcode", "fnoIsuptntp", "bnstp", "mrctp", "ordqty", "hogatype", "mmgb", "ordprc", "unercqty", "commdacode", "peeamtcode", "mgempno", "fnotrdunitamt", "trxtime", "strtgcode", "grpId", "ordseqno", "ptflno", "bskno", "trchno", "Itemno", "userId", "opdrtnno", "rjtcode", "mrccnfqty", "orgordunercqty", "orgordmrcqty", "ctrcttime", "ctrctno", "execprc", "execqty", "newqty", "qdtqty", "lastqty", "lallexecqty", "allexecamt", "fnobalevaltp", "bnsplamt", "fnoIsuno1", "bnstp1", "execprc1", "newqty1", "qdtqty1", "allexecamt1", "fnoIsuno2", "bnstp2", "execprc2", "newqty2", "lqdtqty2", "allexecamt2", "dps", "ftsubtdsgnamt", "mgn", "mnymgn", "ordableamt", "mnyordableamt", "fnoIsuno_1", "bnstp_1", "unsttqty_1", "lqdtableqty_1", "avrprc_1", "fnoIsuno_2", "bnstp_2", "unsttqty_2", "lqdtableqty_2", "avrprc_2")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return to_number(self._data.get("lineseq"))
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return to_number(self._data.get("len"))
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return to_number(self._data.get("offset"))
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def compid(self):
+        """이용사번호"""
+        return self._data.get("compid")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return to_number(self._data.get("proctm"))
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return to_number(self._data.get("varlen"))
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return to_number(self._data.get("varhdlen"))
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return to_number(self._data.get("varmsglen"))
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def trcode1(self):
+        """tr코드"""
+        return self._data.get("trcode1")
+
+    @property
+    def firmno(self):
+        """회사번호"""
+        return self._data.get("firmno")
+
+    @property
+    def acntno(self):
+        """계좌번호"""
+        return self._data.get("acntno")
+
+    @property
+    def acntno1(self):
+        """계좌번호"""
+        return self._data.get("acntno1")
+
+    @property
+    def acntnm(self):
+        """계좌명"""
+        return self._data.get("acntnm")
+
+    @property
+    def brnno(self):
+        """지점번호"""
+        return self._data.get("brnno")
+
+    @property
+    def ordmktcode(self):
+        """주문시장코드"""
+        return self._data.get("ordmktcode")
+
+    @property
+    def ordno1(self):
+        """주문번호"""
+        return self._data.get("ordno1")
+
+    @property
+    def ordno(self):
+        """주문번호"""
+        return to_number(self._data.get("ordno"))
+
+    @property
+    def orgordno1(self):
+        """원주문번호"""
+        return self._data.get("orgordno1")
+
+    @property
+    def orgordno(self):
+        """원주문번호"""
+        return to_number(self._data.get("orgordno"))
+
+    @property
+    def prntordno(self):
+        """모주문번호"""
+        return self._data.get("prntordno")
+
+    @property
+    def prntordno1(self):
+        """모주문번호"""
+        return to_number(self._data.get("prntordno1"))
+
+    @property
+    def isuno(self):
+        """종목번호"""
+        return self._data.get("isuno")
+
+    @property
+    def fnoIsuno(self):
+        """선물옵션종목번호"""
+        return self._data.get("fnoIsuno")
+
+    @property
+    def fnoIsunm(self):
+        """선물옵션종목명"""
+        return self._data.get("fnoIsunm")
+
+    @property
+    def pdgrpcode(self):
+        """상품군분류코드"""
+        return self._data.get("pdgrpcode")
+
+    @property
+    def fnoIsuptntp(self):
+        """선물옵션종목유형구분"""
+        return self._data.get("fnoIsuptntp")
+
+    @property
+    def bnstp(self):
+        """매매구분"""
+        return self._data.get("bnstp")
+
+    @property
+    def mrctp(self):
+        """정정취소구분"""
+        return self._data.get("mrctp")
+
+    @property
+    def ordqty(self):
+        """주문수량"""
+        return to_number(self._data.get("ordqty"))
+
+    @property
+    def hogatype(self):
+        """호가유형코드"""
+        return self._data.get("hogatype")
+
+    @property
+    def mmgb(self):
+        """거래유형코드"""
+        return self._data.get("mmgb")
+
+    @property
+    def ordprc(self):
+        """주문가격"""
+        return to_float(self._data.get("ordprc"))
+
+    @property
+    def unercqty(self):
+        """미체결수량"""
+        return to_number(self._data.get("unercqty"))
+
+    @property
+    def commdacode(self):
+        """통신매체"""
+        return self._data.get("commdacode")
+
+    @property
+    def peeamtcode(self):
+        """수수료합산코드"""
+        return self._data.get("peeamtcode")
+
+    @property
+    def mgempno(self):
+        """관리사원"""
+        return self._data.get("mgempno")
+
+    @property
+    def fnotrdunitamt(self):
+        """선물옵션거래단위금액"""
+        return to_float(self._data.get("fnotrdunitamt"))
+
+    @property
+    def trxtime(self):
+        """처리시각"""
+        return self._data.get("trxtime")
+
+    @property
+    def strtgcode(self):
+        """전략코드"""
+        return self._data.get("strtgcode")
+
+    @property
+    def grpId(self):
+        """그룹Id"""
+        return self._data.get("grpId")
+
+    @property
+    def ordseqno(self):
+        """주문회차"""
+        return self._data.get("ordseqno")
+
+    @property
+    def ptflno(self):
+        """포트폴리오번호"""
+        return self._data.get("ptflno")
+
+    @property
+    def bskno(self):
+        """바스켓번호"""
+        return self._data.get("bskno")
+
+    @property
+    def trchno(self):
+        """트렌치번호"""
+        return self._data.get("trchno")
+
+    @property
+    def Itemno(self):
+        """아이템번호"""
+        return self._data.get("Itemno")
+
+    @property
+    def userId(self):
+        """주문자Id"""
+        return self._data.get("userId")
+
+    @property
+    def opdrtnno(self):
+        """운영지시번호"""
+        return self._data.get("opdrtnno")
+
+    @property
+    def rjtcode(self):
+        """부적격코드"""
+        return self._data.get("rjtcode")
+
+    @property
+    def mrccnfqty(self):
+        """정정취소확인수량"""
+        return to_number(self._data.get("mrccnfqty"))
+
+    @property
+    def orgordunercqty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("orgordunercqty"))
+
+    @property
+    def orgordmrcqty(self):
+        """원주문정정취소수량"""
+        return to_number(self._data.get("orgordmrcqty"))
+
+    @property
+    def ctrcttime(self):
+        """약정시각(체결시각)"""
+        return self._data.get("ctrcttime")
+
+    @property
+    def ctrctno(self):
+        """약정번호"""
+        return self._data.get("ctrctno")
+
+    @property
+    def execprc(self):
+        """체결가격"""
+        return to_float(self._data.get("execprc"))
+
+    @property
+    def execqty(self):
+        """체결수량"""
+        return to_number(self._data.get("execqty"))
+
+    @property
+    def newqty(self):
+        """신규체결수량"""
+        return to_number(self._data.get("newqty"))
+
+    @property
+    def qdtqty(self):
+        """청산체결수량"""
+        return to_number(self._data.get("qdtqty"))
+
+    @property
+    def lastqty(self):
+        """최종결제수량"""
+        return to_number(self._data.get("lastqty"))
+
+    @property
+    def lallexecqty(self):
+        """전체체결수량"""
+        return to_number(self._data.get("lallexecqty"))
+
+    @property
+    def allexecamt(self):
+        """전체체결금액"""
+        return to_number(self._data.get("allexecamt"))
+
+    @property
+    def fnobalevaltp(self):
+        """잔고평가구분"""
+        return self._data.get("fnobalevaltp")
+
+    @property
+    def bnsplamt(self):
+        """매매손익금액"""
+        return to_number(self._data.get("bnsplamt"))
+
+    @property
+    def fnoIsuno1(self):
+        """선물옵션종목번호1"""
+        return self._data.get("fnoIsuno1")
+
+    @property
+    def bnstp1(self):
+        """매매구분1"""
+        return self._data.get("bnstp1")
+
+    @property
+    def execprc1(self):
+        """체결가1"""
+        return to_float(self._data.get("execprc1"))
+
+    @property
+    def newqty1(self):
+        """신규체결수량1"""
+        return to_number(self._data.get("newqty1"))
+
+    @property
+    def qdtqty1(self):
+        """청산체결수량1"""
+        return to_number(self._data.get("qdtqty1"))
+
+    @property
+    def allexecamt1(self):
+        """전체체결금액1"""
+        return to_number(self._data.get("allexecamt1"))
+
+    @property
+    def fnoIsuno2(self):
+        """선물옵션종목번호2"""
+        return self._data.get("fnoIsuno2")
+
+    @property
+    def bnstp2(self):
+        """매매구분2"""
+        return self._data.get("bnstp2")
+
+    @property
+    def execprc2(self):
+        """체결가2"""
+        return to_float(self._data.get("execprc2"))
+
+    @property
+    def newqty2(self):
+        """신규체결수량2"""
+        return to_number(self._data.get("newqty2"))
+
+    @property
+    def lqdtqty2(self):
+        """청산체결수량2"""
+        return to_number(self._data.get("lqdtqty2"))
+
+    @property
+    def allexecamt2(self):
+        """전체체결금액2"""
+        return to_number(self._data.get("allexecamt2"))
+
+    @property
+    def dps(self):
+        """예수금"""
+        return to_number(self._data.get("dps"))
+
+    @property
+    def ftsubtdsgnamt(self):
+        """선물대용지정금액"""
+        return to_number(self._data.get("ftsubtdsgnamt"))
+
+    @property
+    def mgn(self):
+        """증거금"""
+        return to_number(self._data.get("mgn"))
+
+    @property
+    def mnymgn(self):
+        """증거금현금"""
+        return to_number(self._data.get("mnymgn"))
+
+    @property
+    def ordableamt(self):
+        """주문가능금액"""
+        return to_number(self._data.get("ordableamt"))
+
+    @property
+    def mnyordableamt(self):
+        """주문가능현금액"""
+        return to_number(self._data.get("mnyordableamt"))
+
+    @property
+    def fnoIsuno_1(self):
+        """잔고종목번호1"""
+        return self._data.get("fnoIsuno_1")
+
+    @property
+    def bnstp_1(self):
+        """잔고매매구분1"""
+        return self._data.get("bnstp_1")
+
+    @property
+    def unsttqty_1(self):
+        """미결제수량1"""
+        return to_number(self._data.get("unsttqty_1"))
+
+    @property
+    def lqdtableqty_1(self):
+        """주문가능수량1"""
+        return to_number(self._data.get("lqdtableqty_1"))
+
+    @property
+    def avrprc_1(self):
+        """평균가1"""
+        return to_float(self._data.get("avrprc_1"))
+
+    @property
+    def fnoIsuno_2(self):
+        """잔고종목번호2"""
+        return self._data.get("fnoIsuno_2")
+
+    @property
+    def bnstp_2(self):
+        """잔고매매구분2"""
+        return self._data.get("bnstp_2")
+
+    @property
+    def unsttqty_2(self):
+        """미결제수량2"""
+        return to_number(self._data.get("unsttqty_2"))
+
+    @property
+    def lqdtableqty_2(self):
+        """주문가능수량2"""
+        return to_number(self._data.get("lqdtableqty_2"))
+
+    @property
+    def avrprc_2(self):
+        """평균가2"""
+        return to_float(self._data.get("avrprc_2"))
+
+
+class DH0Tick(RealtimeRecord):
+    """[DH0] KRX야간파생 호가"""
+    __slots__ = ()
+    TR_CODE = "DH0"
+    FIELDS = ("hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offercnt1", "bidcnt1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offercnt2", "bidcnt2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offercnt3", "bidcnt3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offercnt4", "bidcnt4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offercnt5", "bidcnt5", "totofferrem", "totbidrem", "totoffercnt", "totbidcnt", "futcode", "danhochk", "alloc_gubun")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가수량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가수량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offercnt1(self):
+        """매도호가건수1"""
+        return to_number(self._data.get("offercnt1"))
+
+    @property
+    def bidcnt1(self):
+        """매수호가건수1"""
+        return to_number(self._data.get("bidcnt1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_float(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_float(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가수량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가수량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offercnt2(self):
+        """매도호가건수2"""
+        return to_number(self._data.get("offercnt2"))
+
+    @property
+    def bidcnt2(self):
+        """매수호가건수2"""
+        return to_number(self._data.get("bidcnt2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_float(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_float(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가수량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가수량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offercnt3(self):
+        """매도호가건수3"""
+        return to_number(self._data.get("offercnt3"))
+
+    @property
+    def bidcnt3(self):
+        """매수호가건수3"""
+        return to_number(self._data.get("bidcnt3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_float(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_float(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가수량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가수량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offercnt4(self):
+        """매도호가건수4"""
+        return to_number(self._data.get("offercnt4"))
+
+    @property
+    def bidcnt4(self):
+        """매수호가건수4"""
+        return to_number(self._data.get("bidcnt4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_float(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_float(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가수량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가수량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offercnt5(self):
+        """매도호가건수5"""
+        return to_number(self._data.get("offercnt5"))
+
+    @property
+    def bidcnt5(self):
+        """매수호가건수5"""
+        return to_number(self._data.get("bidcnt5"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+    @property
+    def totoffercnt(self):
+        """매도호가총건수"""
+        return to_number(self._data.get("totoffercnt"))
+
+    @property
+    def totbidcnt(self):
+        """매수호가총건수"""
+        return to_number(self._data.get("totbidcnt"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def danhochk(self):
+        """단일가호가여부"""
+        return self._data.get("danhochk")
+
+    @property
+    def alloc_gubun(self):
+        """배분적용구분"""
+        return self._data.get("alloc_gubun")
+
+
+class H02Tick(RealtimeRecord):
+    """[H02] KRX야간파생 선물정정취소"""
+    __slots__ = ()
+    TR_CODE = "H02"
+    FIELDS = ("lineseq", "accno", "user", "seq", "trcode", "megrpno", "boardid", "memberno", "bpno", "ordno", "orgordno", "expcode", "dosugb", "mocagb", "accno1", "qty2", "price", "ordgb", "hogagb", "sihogagb", "tradid", "treacode", "askcode", "creditcode", "jakigb", "trustnum", "ptgb", "substonum", "accgb", "accmarggb", "nationcode", "investgb", "forecode", "medcode", "ordid", "macid", "orddate", "rcvtime", "mem_filler", "mem_accno", "mem_filler1", "ordacpttm", "qty", "autogb", "rejcode", "prgordde", "trdr_id", "ord_grp_no", "smp_cd", "ord_cond_prc", "trd_mkt_choic_tp_cd", "srtsell_id")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return to_number(self._data.get("lineseq"))
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def seq(self):
+        """일련번호"""
+        return to_number(self._data.get("seq"))
+
+    @property
+    def trcode(self):
+        """trcode"""
+        return self._data.get("trcode")
+
+    @property
+    def megrpno(self):
+        """매칭그룹번호"""
+        return self._data.get("megrpno")
+
+    @property
+    def boardid(self):
+        """보드ID"""
+        return self._data.get("boardid")
+
+    @property
+    def memberno(self):
+        """회원번호"""
+        return self._data.get("memberno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def ordno(self):
+        """주문번호"""
+        return self._data.get("ordno")
+
+    @property
+    def orgordno(self):
+        """원주문번호"""
+        return self._data.get("orgordno")
+
+    @property
+    def expcode(self):
+        """종목코드"""
+        return self._data.get("expcode")
+
+    @property
+    def dosugb(self):
+        """매도수구분"""
+        return self._data.get("dosugb")
+
+    @property
+    def mocagb(self):
+        """정정취소구분"""
+        return self._data.get("mocagb")
+
+    @property
+    def accno1(self):
+        """계좌번호1"""
+        return self._data.get("accno1")
+
+    @property
+    def qty2(self):
+        """호가수량"""
+        return to_number(self._data.get("qty2"))
+
+    @property
+    def price(self):
+        """호가가격"""
+        return to_float(self._data.get("price"))
+
+    @property
+    def ordgb(self):
+        """주문유형"""
+        return self._data.get("ordgb")
+
+    @property
+    def hogagb(self):
+        """호가구분"""
+        return self._data.get("hogagb")
+
+    @property
+    def sihogagb(self):
+        """시장조성호가구분"""
+        return self._data.get("sihogagb")
+
+    @property
+    def tradid(self):
+        """자사주신고서ID"""
+        return self._data.get("tradid")
+
+    @property
+    def treacode(self):
+        """자사주매매방법"""
+        return self._data.get("treacode")
+
+    @property
+    def askcode(self):
+        """매도유형코드"""
+        return self._data.get("askcode")
+
+    @property
+    def creditcode(self):
+        """신용구분코드"""
+        return self._data.get("creditcode")
+
+    @property
+    def jakigb(self):
+        """위탁자기구분"""
+        return self._data.get("jakigb")
+
+    @property
+    def trustnum(self):
+        """위탁사번호"""
+        return self._data.get("trustnum")
+
+    @property
+    def ptgb(self):
+        """프로그램구분"""
+        return self._data.get("ptgb")
+
+    @property
+    def substonum(self):
+        """대용주권계좌번호"""
+        return self._data.get("substonum")
+
+    @property
+    def accgb(self):
+        """계좌구분코드"""
+        return self._data.get("accgb")
+
+    @property
+    def accmarggb(self):
+        """계좌증거금코드"""
+        return self._data.get("accmarggb")
+
+    @property
+    def nationcode(self):
+        """국가코드"""
+        return self._data.get("nationcode")
+
+    @property
+    def investgb(self):
+        """투자자구분"""
+        return self._data.get("investgb")
+
+    @property
+    def forecode(self):
+        """외국인코드"""
+        return self._data.get("forecode")
+
+    @property
+    def medcode(self):
+        """주문매체구분"""
+        return self._data.get("medcode")
+
+    @property
+    def ordid(self):
+        """주문식별자번호"""
+        return self._data.get("ordid")
+
+    @property
+    def macid(self):
+        """MAC주소"""
+        return self._data.get("macid")
+
+    @property
+    def orddate(self):
+        """호가일자"""
+        return self._data.get("orddate")
+
+    @property
+    def rcvtime(self):
+        """회원사주문시각"""
+        return self._data.get("rcvtime")
+
+    @property
+    def mem_filler(self):
+        """mem_filler"""
+        return self._data.get("mem_filler")
+
+    @property
+    def mem_accno(self):
+        """mem_accno"""
+        return self._data.get("mem_accno")
+
+    @property
+    def mem_filler1(self):
+        """mem_filler1"""
+        return self._data.get("mem_filler1")
+
+    @property
+    def ordacpttm(self):
+        """매칭접수시간"""
+        return self._data.get("ordacpttm")
+
+    @property
+    def qty(self):
+        """실정정취소수량"""
+        return to_number(self._data.get("qty"))
+
+    @property
+    def autogb(self):
+        """자동취소구분"""
+        return self._data.get("autogb")
+
+    @property
+    def rejcode(self):
+        """거부사유"""
+        return self._data.get("rejcode")
+
+    @property
+    def prgordde(self):
+        """프로그램호가신고"""
+        return self._data.get("prgordde")
+
+    @property
+    def trdr_id(self):
+        """거래자ID"""
+        return self._data.get("trdr_id")
+
+    @property
+    def ord_grp_no(self):
+        """호가그룹번호"""
+        return self._data.get("ord_grp_no")
+
+    @property
+    def smp_cd(self):
+        """자전거래방지코드"""
+        return self._data.get("smp_cd")
+
+    @property
+    def ord_cond_prc(self):
+        """호가조건가격"""
+        return to_float(self._data.get("ord_cond_prc"))
+
+    @property
+    def trd_mkt_choic_tp_cd(self):
+        """거래시장선택구분코드"""
+        return self._data.get("trd_mkt_choic_tp_cd")
+
+    @property
+    def srtsell_id(self):
+        """공매도ID"""
+        return self._data.get("srtsell_id")
+
+
+class DD0Tick(RealtimeRecord):
+    """[DD0] KRX야간파생 실시간상하한가"""
+    __slots__ = ()
+    TR_CODE = "DD0"
+    FIELDS = ("gubun", "dy_gubun", "dy_uplmtprice", "dy_dnlmtprice", "futcode")
+
+    @property
+    def gubun(self):
+        """접속매매여부"""
+        return self._data.get("gubun")
+
+    @property
+    def dy_gubun(self):
+        """실시간가격제한여부"""
+        return self._data.get("dy_gubun")
+
+    @property
+    def dy_uplmtprice(self):
+        """실시간상한가"""
+        return to_float(self._data.get("dy_uplmtprice"))
+
+    @property
+    def dy_dnlmtprice(self):
+        """실시간하한가"""
+        return to_float(self._data.get("dy_dnlmtprice"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+
+class DX0Tick(RealtimeRecord):
+    """[DX0] KRX야간파생 가격제한폭확대"""
+    __slots__ = ()
+    TR_CODE = "DX0"
+    FIELDS = ("upstep", "dnstep", "uplmtprice", "dnlmtprice", "futcode")
+
+    @property
+    def upstep(self):
+        """적용상한단계"""
+        return self._data.get("upstep")
+
+    @property
+    def dnstep(self):
+        """적용하한단계"""
+        return self._data.get("dnstep")
+
+    @property
+    def uplmtprice(self):
+        """적용상한가"""
+        return to_float(self._data.get("uplmtprice"))
+
+    @property
+    def dnlmtprice(self):
+        """적용하한가"""
+        return to_float(self._data.get("dnlmtprice"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+
+class DYCTick(RealtimeRecord):
+    """[DYC] KRX야간파생 예상체결"""
+    __slots__ = ()
+    TR_CODE = "DYC"
+    FIELDS = ("ychetime", "yeprice", "jnilysign", "jnilchange", "jnilydrate", "futcode", "expct_ccls_q")
+
+    @property
+    def ychetime(self):
+        """예상체결시간"""
+        return self._data.get("ychetime")
+
+    @property
+    def yeprice(self):
+        """예상체결가격"""
+        return to_float(self._data.get("yeprice"))
+
+    @property
+    def jnilysign(self):
+        """예상체결가전일종가대비구분"""
+        return self._data.get("jnilysign")
+
+    @property
+    def jnilchange(self):
+        """예상체결가전일종가대비"""
+        return to_float(self._data.get("jnilchange"))
+
+    @property
+    def jnilydrate(self):
+        """예상체결가전일종가등락율"""
+        return to_float(self._data.get("jnilydrate"))
+
+    @property
+    def futcode(self):
+        """단축코드"""
+        return self._data.get("futcode")
+
+    @property
+    def expct_ccls_q(self):
+        """예상체결수량"""
+        return to_number(self._data.get("expct_ccls_q"))
+
+
+class DBMTick(RealtimeRecord):
+    """[DBM] KRX야간파생 투자자매매현황"""
+    __slots__ = ()
+    TR_CODE = "DBM"
+    FIELDS = ("tjjcode", "tjjtime", "msvolume", "mdvolume", "msvol", "p_msvol", "msvalue", "mdvalue", "msval", "p_msval", "fottjjcode")
+
+    @property
+    def tjjcode(self):
+        """투자자코드"""
+        return self._data.get("tjjcode")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def msvolume(self):
+        """매수거래량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def mdvolume(self):
+        """매도거래량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def msvol(self):
+        """거래량순매수"""
+        return to_number(self._data.get("msvol"))
+
+    @property
+    def p_msvol(self):
+        """거래량순매수직전대비"""
+        return to_number(self._data.get("p_msvol"))
+
+    @property
+    def msvalue(self):
+        """매수거래대금"""
+        return to_number(self._data.get("msvalue"))
+
+    @property
+    def mdvalue(self):
+        """매도거래대금"""
+        return to_number(self._data.get("mdvalue"))
+
+    @property
+    def msval(self):
+        """거래대금순매수"""
+        return to_number(self._data.get("msval"))
+
+    @property
+    def p_msval(self):
+        """거래대금순매수직전대비"""
+        return to_number(self._data.get("p_msval"))
+
+    @property
+    def fottjjcode(self):
+        """파생상품투자자코드"""
+        return self._data.get("fottjjcode")
+
+
+class DBTTick(RealtimeRecord):
+    """[DBT] KRX야간파생 투자자별현황"""
+    __slots__ = ()
+    TR_CODE = "DBT"
+    FIELDS = ("tjjtime", "tjjcode1", "msvolume1", "mdvolume1", "msvol1", "msvalue1", "mdvalue1", "msval1", "tjjcode2", "msvolume2", "mdvolume2", "msvol2", "msvalue2", "mdvalue2", "msval2", "tjjcode3", "msvolume3", "mdvolume3", "msvol3", "msvalue3", "mdvalue3", "msval3", "tjjcode4", "msvolume4", "mdvolume4", "msvol4", "msvalue4", "mdvalue4", "msval4", "tjjcode5", "msvolume5", "mdvolume5", "msvol5", "msvalue5", "mdvalue5", "msval5", "tjjcode6", "msvolume6", "mdvolume6", "msvol6", "msvalue6", "mdvalue6", "msval6", "tjjcode7", "msvolume7", "mdvolume7", "msvol7", "msvalue7", "mdvalue7", "msval7", "tjjcode8", "msvolume8", "mdvolume8", "msvol8", "msvalue8", "mdvalue8", "msval8", "tjjcode9", "msvolume9", "mdvolume9", "msvol9", "msvalue9", "mdvalue9", "msval9", "tjjcode10", "msvolume10", "mdvolume10", "msvol10", "msvalue10", "mdvalue10", "msval10", "tjjcode11", "msvolume11", "mdvolume11", "msvol11", "msvalue11", "mdvalue11", "msval11", "fottjjcode", "tjjcode0", "msvolume0", "mdvolume0", "msvol0", "msvalue0", "mdvalue0", "msval0")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def tjjcode1(self):
+        """투자자코드1(개인)"""
+        return self._data.get("tjjcode1")
+
+    @property
+    def msvolume1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("msvolume1"))
+
+    @property
+    def mdvolume1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("mdvolume1"))
+
+    @property
+    def msvol1(self):
+        """거래량순매수1"""
+        return to_number(self._data.get("msvol1"))
+
+    @property
+    def msvalue1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("msvalue1"))
+
+    @property
+    def mdvalue1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("mdvalue1"))
+
+    @property
+    def msval1(self):
+        """거래대금순매수1"""
+        return to_number(self._data.get("msval1"))
+
+    @property
+    def tjjcode2(self):
+        """투자자코드2(외국인)"""
+        return self._data.get("tjjcode2")
+
+    @property
+    def msvolume2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("msvolume2"))
+
+    @property
+    def mdvolume2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("mdvolume2"))
+
+    @property
+    def msvol2(self):
+        """거래량순매수2"""
+        return to_number(self._data.get("msvol2"))
+
+    @property
+    def msvalue2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("msvalue2"))
+
+    @property
+    def mdvalue2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("mdvalue2"))
+
+    @property
+    def msval2(self):
+        """거래대금순매수2"""
+        return to_number(self._data.get("msval2"))
+
+    @property
+    def tjjcode3(self):
+        """투자자코드3(기관계)"""
+        return self._data.get("tjjcode3")
+
+    @property
+    def msvolume3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("msvolume3"))
+
+    @property
+    def mdvolume3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("mdvolume3"))
+
+    @property
+    def msvol3(self):
+        """거래량순매수3"""
+        return to_number(self._data.get("msvol3"))
+
+    @property
+    def msvalue3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("msvalue3"))
+
+    @property
+    def mdvalue3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("mdvalue3"))
+
+    @property
+    def msval3(self):
+        """거래대금순매수3"""
+        return to_number(self._data.get("msval3"))
+
+    @property
+    def tjjcode4(self):
+        """투자자코드4(증권)"""
+        return self._data.get("tjjcode4")
+
+    @property
+    def msvolume4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("msvolume4"))
+
+    @property
+    def mdvolume4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("mdvolume4"))
+
+    @property
+    def msvol4(self):
+        """거래량순매수4"""
+        return to_number(self._data.get("msvol4"))
+
+    @property
+    def msvalue4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("msvalue4"))
+
+    @property
+    def mdvalue4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("mdvalue4"))
+
+    @property
+    def msval4(self):
+        """거래대금순매수4"""
+        return to_number(self._data.get("msval4"))
+
+    @property
+    def tjjcode5(self):
+        """투자자코드5(투신)"""
+        return self._data.get("tjjcode5")
+
+    @property
+    def msvolume5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("msvolume5"))
+
+    @property
+    def mdvolume5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("mdvolume5"))
+
+    @property
+    def msvol5(self):
+        """거래량순매수5"""
+        return to_number(self._data.get("msvol5"))
+
+    @property
+    def msvalue5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("msvalue5"))
+
+    @property
+    def mdvalue5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("mdvalue5"))
+
+    @property
+    def msval5(self):
+        """거래대금순매수5"""
+        return to_number(self._data.get("msval5"))
+
+    @property
+    def tjjcode6(self):
+        """투자자코드6(은행)"""
+        return self._data.get("tjjcode6")
+
+    @property
+    def msvolume6(self):
+        """매수거래량6"""
+        return to_number(self._data.get("msvolume6"))
+
+    @property
+    def mdvolume6(self):
+        """매도거래량6"""
+        return to_number(self._data.get("mdvolume6"))
+
+    @property
+    def msvol6(self):
+        """거래량순매수6"""
+        return to_number(self._data.get("msvol6"))
+
+    @property
+    def msvalue6(self):
+        """매수거래대금6"""
+        return to_number(self._data.get("msvalue6"))
+
+    @property
+    def mdvalue6(self):
+        """매도거래대금6"""
+        return to_number(self._data.get("mdvalue6"))
+
+    @property
+    def msval6(self):
+        """거래대금순매수6"""
+        return to_number(self._data.get("msval6"))
+
+    @property
+    def tjjcode7(self):
+        """투자자코드7(보험)"""
+        return self._data.get("tjjcode7")
+
+    @property
+    def msvolume7(self):
+        """매수거래량7"""
+        return to_number(self._data.get("msvolume7"))
+
+    @property
+    def mdvolume7(self):
+        """매도거래량7"""
+        return to_number(self._data.get("mdvolume7"))
+
+    @property
+    def msvol7(self):
+        """거래량순매수7"""
+        return to_number(self._data.get("msvol7"))
+
+    @property
+    def msvalue7(self):
+        """매수거래대금7"""
+        return to_number(self._data.get("msvalue7"))
+
+    @property
+    def mdvalue7(self):
+        """매도거래대금7"""
+        return to_number(self._data.get("mdvalue7"))
+
+    @property
+    def msval7(self):
+        """거래대금순매수7"""
+        return to_number(self._data.get("msval7"))
+
+    @property
+    def tjjcode8(self):
+        """투자자코드8(종금)"""
+        return self._data.get("tjjcode8")
+
+    @property
+    def msvolume8(self):
+        """매수거래량8"""
+        return to_number(self._data.get("msvolume8"))
+
+    @property
+    def mdvolume8(self):
+        """매도거래량8"""
+        return to_number(self._data.get("mdvolume8"))
+
+    @property
+    def msvol8(self):
+        """거래량순매수8"""
+        return to_number(self._data.get("msvol8"))
+
+    @property
+    def msvalue8(self):
+        """매수거래대금8"""
+        return to_number(self._data.get("msvalue8"))
+
+    @property
+    def mdvalue8(self):
+        """매도거래대금8"""
+        return to_number(self._data.get("mdvalue8"))
+
+    @property
+    def msval8(self):
+        """거래대금순매수8"""
+        return to_number(self._data.get("msval8"))
+
+    @property
+    def tjjcode9(self):
+        """투자자코드9(기금)"""
+        return self._data.get("tjjcode9")
+
+    @property
+    def msvolume9(self):
+        """매수거래량9"""
+        return to_number(self._data.get("msvolume9"))
+
+    @property
+    def mdvolume9(self):
+        """매도거래량9"""
+        return to_number(self._data.get("mdvolume9"))
+
+    @property
+    def msvol9(self):
+        """거래량순매수9"""
+        return to_number(self._data.get("msvol9"))
+
+    @property
+    def msvalue9(self):
+        """매수거래대금9"""
+        return to_number(self._data.get("msvalue9"))
+
+    @property
+    def mdvalue9(self):
+        """매도거래대금9"""
+        return to_number(self._data.get("mdvalue9"))
+
+    @property
+    def msval9(self):
+        """거래대금순매수9"""
+        return to_number(self._data.get("msval9"))
+
+    @property
+    def tjjcode10(self):
+        """투자자코드10(선물업자)"""
+        return self._data.get("tjjcode10")
+
+    @property
+    def msvolume10(self):
+        """매수거래량10"""
+        return to_number(self._data.get("msvolume10"))
+
+    @property
+    def mdvolume10(self):
+        """매도거래량10"""
+        return to_number(self._data.get("mdvolume10"))
+
+    @property
+    def msvol10(self):
+        """거래량순매수10"""
+        return to_number(self._data.get("msvol10"))
+
+    @property
+    def msvalue10(self):
+        """매수거래대금10"""
+        return to_number(self._data.get("msvalue10"))
+
+    @property
+    def mdvalue10(self):
+        """매도거래대금10"""
+        return to_number(self._data.get("mdvalue10"))
+
+    @property
+    def msval10(self):
+        """거래대금순매수10"""
+        return to_number(self._data.get("msval10"))
+
+    @property
+    def tjjcode11(self):
+        """투자자코드11(기타)"""
+        return self._data.get("tjjcode11")
+
+    @property
+    def msvolume11(self):
+        """매수거래량11"""
+        return to_number(self._data.get("msvolume11"))
+
+    @property
+    def mdvolume11(self):
+        """매도거래량11"""
+        return to_number(self._data.get("mdvolume11"))
+
+    @property
+    def msvol11(self):
+        """거래량순매수11"""
+        return to_number(self._data.get("msvol11"))
+
+    @property
+    def msvalue11(self):
+        """매수거래대금11"""
+        return to_number(self._data.get("msvalue11"))
+
+    @property
+    def mdvalue11(self):
+        """매도거래대금11"""
+        return to_number(self._data.get("mdvalue11"))
+
+    @property
+    def msval11(self):
+        """거래대금순매수11"""
+        return to_number(self._data.get("msval11"))
+
+    @property
+    def fottjjcode(self):
+        """파생상품투자자코드"""
+        return self._data.get("fottjjcode")
+
+    @property
+    def tjjcode0(self):
+        """투자자코드0(사모펀드)"""
+        return self._data.get("tjjcode0")
+
+    @property
+    def msvolume0(self):
+        """매수거래량0"""
+        return to_number(self._data.get("msvolume0"))
+
+    @property
+    def mdvolume0(self):
+        """매도거래량0"""
+        return to_number(self._data.get("mdvolume0"))
+
+    @property
+    def msvol0(self):
+        """거래량순매수0"""
+        return to_number(self._data.get("msvol0"))
+
+    @property
+    def msvalue0(self):
+        """매수거래대금0"""
+        return to_number(self._data.get("msvalue0"))
+
+    @property
+    def mdvalue0(self):
+        """매도거래대금0"""
+        return to_number(self._data.get("mdvalue0"))
+
+    @property
+    def msval0(self):
+        """거래대금순매수0"""
+        return to_number(self._data.get("msval0"))
+
+
+class OVCTick(RealtimeRecord):
+    """[OVC] 해외선물 체결"""
+    __slots__ = ()
+    TR_CODE = "OVC"
+    FIELDS = ("symbol", "ovsdate", "kordate", "trdtm", "kortm", "curpr", "ydiffpr", "ydiffSign", "open", "high", "low", "chgrate", "trdq", "totq", "cgubun", "mdvolume", "msvolume", "ovsmkend")
+
+    @property
+    def symbol(self):
+        """종목코드"""
+        return self._data.get("symbol")
+
+    @property
+    def ovsdate(self):
+        """체결일자(현지)"""
+        return self._data.get("ovsdate")
+
+    @property
+    def kordate(self):
+        """체결일자(한국)"""
+        return self._data.get("kordate")
+
+    @property
+    def trdtm(self):
+        """체결시간(현지)"""
+        return self._data.get("trdtm")
+
+    @property
+    def kortm(self):
+        """체결시간(한국)"""
+        return self._data.get("kortm")
+
+    @property
+    def curpr(self):
+        """체결가격"""
+        return to_float(self._data.get("curpr"))
+
+    @property
+    def ydiffpr(self):
+        """전일대비"""
+        return to_float(self._data.get("ydiffpr"))
+
+    @property
+    def ydiffSign(self):
+        """전일대비기호"""
+        return self._data.get("ydiffSign")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_float(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_float(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_float(self._data.get("low"))
+
+    @property
+    def chgrate(self):
+        """등락율"""
+        return to_float(self._data.get("chgrate"))
+
+    @property
+    def trdq(self):
+        """건별체결수량"""
+        return to_number(self._data.get("trdq"))
+
+    @property
+    def totq(self):
+        """누적체결수량"""
+        return to_number(self._data.get("totq"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def mdvolume(self):
+        """매도누적체결수량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결수량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def ovsmkend(self):
+        """장마감일"""
+        return self._data.get("ovsmkend")
+
+
+class OVHTick(RealtimeRecord):
+    """[OVH] 해외선물 호가"""
+    __slots__ = ()
+    TR_CODE = "OVH"
+    FIELDS = ("symbol", "hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offerno1", "bidno1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offerno2", "bidno2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offerno3", "bidno3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offerno4", "bidno4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offerno5", "bidno5", "totoffercnt", "totbidcnt", "totofferrem", "totbidrem")
+
+    @property
+    def symbol(self):
+        """종목코드"""
+        return self._data.get("symbol")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가 1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가 1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가 잔량 1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가 잔량 1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offerno1(self):
+        """매도호가 건수 1"""
+        return to_number(self._data.get("offerno1"))
+
+    @property
+    def bidno1(self):
+        """매수호가 건수 1"""
+        return to_number(self._data.get("bidno1"))
+
+    @property
+    def offerho2(self):
+        """매도호가 2"""
+        return to_float(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가 2"""
+        return to_float(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가 잔량 2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가 잔량 2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offerno2(self):
+        """매도호가 건수 2"""
+        return to_number(self._data.get("offerno2"))
+
+    @property
+    def bidno2(self):
+        """매수호가 건수 2"""
+        return to_number(self._data.get("bidno2"))
+
+    @property
+    def offerho3(self):
+        """매도호가 3"""
+        return to_float(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가 3"""
+        return to_float(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가 잔량 3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가 잔량 3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offerno3(self):
+        """매도호가 건수 3"""
+        return to_number(self._data.get("offerno3"))
+
+    @property
+    def bidno3(self):
+        """매수호가 건수 3"""
+        return to_number(self._data.get("bidno3"))
+
+    @property
+    def offerho4(self):
+        """매도호가 4"""
+        return to_float(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가 4"""
+        return to_float(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가 잔량 4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가 잔량 4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offerno4(self):
+        """매도호가 건수 4"""
+        return to_number(self._data.get("offerno4"))
+
+    @property
+    def bidno4(self):
+        """매수호가 건수 4"""
+        return to_number(self._data.get("bidno4"))
+
+    @property
+    def offerho5(self):
+        """매도호가 5"""
+        return to_float(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가 5"""
+        return to_float(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가 잔량 5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가 잔량 5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offerno5(self):
+        """매도호가 건수 5"""
+        return to_number(self._data.get("offerno5"))
+
+    @property
+    def bidno5(self):
+        """매수호가 건수 5"""
+        return to_number(self._data.get("bidno5"))
+
+    @property
+    def totoffercnt(self):
+        """매도호가총건수"""
+        return to_number(self._data.get("totoffercnt"))
+
+    @property
+    def totbidcnt(self):
+        """매수호가총건수"""
+        return to_number(self._data.get("totbidcnt"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+
+class WOCTick(RealtimeRecord):
+    """[WOC] 해외옵션 체결"""
+    __slots__ = ()
+    TR_CODE = "WOC"
+    FIELDS = ("symbol", "ovsdate", "kordate", "trdtm", "kortm", "curpr", "ydiffpr", "ydiffSign", "open", "high", "low", "chgrate", "trdq", "totq", "cgubun", "mdvolume", "msvolume", "ovsmkend")
+
+    @property
+    def symbol(self):
+        """종목코드"""
+        return self._data.get("symbol")
+
+    @property
+    def ovsdate(self):
+        """체결일자(현지)"""
+        return self._data.get("ovsdate")
+
+    @property
+    def kordate(self):
+        """체결일자(한국)"""
+        return self._data.get("kordate")
+
+    @property
+    def trdtm(self):
+        """체결시간(현지)"""
+        return self._data.get("trdtm")
+
+    @property
+    def kortm(self):
+        """체결시간(한국)"""
+        return self._data.get("kortm")
+
+    @property
+    def curpr(self):
+        """체결가격"""
+        return to_float(self._data.get("curpr"))
+
+    @property
+    def ydiffpr(self):
+        """전일대비"""
+        return to_float(self._data.get("ydiffpr"))
+
+    @property
+    def ydiffSign(self):
+        """전일대비기호"""
+        return self._data.get("ydiffSign")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_float(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_float(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_float(self._data.get("low"))
+
+    @property
+    def chgrate(self):
+        """등락율"""
+        return to_float(self._data.get("chgrate"))
+
+    @property
+    def trdq(self):
+        """건별체결수량"""
+        return to_number(self._data.get("trdq"))
+
+    @property
+    def totq(self):
+        """누적체결수량"""
+        return to_number(self._data.get("totq"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def mdvolume(self):
+        """매도누적체결수량"""
+        return to_number(self._data.get("mdvolume"))
+
+    @property
+    def msvolume(self):
+        """매수누적체결수량"""
+        return to_number(self._data.get("msvolume"))
+
+    @property
+    def ovsmkend(self):
+        """장마감일"""
+        return self._data.get("ovsmkend")
+
+
+class WOHTick(RealtimeRecord):
+    """[WOH] 해외옵션 호가"""
+    __slots__ = ()
+    TR_CODE = "WOH"
+    FIELDS = ("symbol", "hotime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offerno1", "bidno1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offerno2", "bidno2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offerno3", "bidno3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offerno4", "bidno4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offerno5", "bidno5", "totoffercnt", "totbidcnt", "totofferrem", "totbidrem")
+
+    @property
+    def symbol(self):
+        """종목코드"""
+        return self._data.get("symbol")
+
+    @property
+    def hotime(self):
+        """호가시간"""
+        return self._data.get("hotime")
+
+    @property
+    def offerho1(self):
+        """매도호가 1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가 1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가 잔량 1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가 잔량 1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offerno1(self):
+        """매도호가 건수 1"""
+        return to_number(self._data.get("offerno1"))
+
+    @property
+    def bidno1(self):
+        """매수호가 건수 1"""
+        return to_number(self._data.get("bidno1"))
+
+    @property
+    def offerho2(self):
+        """매도호가 2"""
+        return to_float(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가 2"""
+        return to_float(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가 잔량 2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가 잔량 2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offerno2(self):
+        """매도호가 건수 2"""
+        return to_number(self._data.get("offerno2"))
+
+    @property
+    def bidno2(self):
+        """매수호가 건수 2"""
+        return to_number(self._data.get("bidno2"))
+
+    @property
+    def offerho3(self):
+        """매도호가 3"""
+        return to_float(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가 3"""
+        return to_float(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가 잔량 3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가 잔량 3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offerno3(self):
+        """매도호가 건수 3"""
+        return to_number(self._data.get("offerno3"))
+
+    @property
+    def bidno3(self):
+        """매수호가 건수 3"""
+        return to_number(self._data.get("bidno3"))
+
+    @property
+    def offerho4(self):
+        """매도호가 4"""
+        return to_float(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가 4"""
+        return to_float(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가 잔량 4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가 잔량 4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offerno4(self):
+        """매도호가 건수 4"""
+        return to_number(self._data.get("offerno4"))
+
+    @property
+    def bidno4(self):
+        """매수호가 건수 4"""
+        return to_number(self._data.get("bidno4"))
+
+    @property
+    def offerho5(self):
+        """매도호가 5"""
+        return to_float(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가 5"""
+        return to_float(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가 잔량 5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가 잔량 5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offerno5(self):
+        """매도호가 건수 5"""
+        return to_number(self._data.get("offerno5"))
+
+    @property
+    def bidno5(self):
+        """매수호가 건수 5"""
+        return to_number(self._data.get("bidno5"))
+
+    @property
+    def totoffercnt(self):
+        """매도호가총건수"""
+        return to_number(self._data.get("totoffercnt"))
+
+    @property
+    def totbidcnt(self):
+        """매수호가총건수"""
+        return to_number(self._data.get("totbidcnt"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+
+class TC1Tick(RealtimeRecord):
+    """[TC1] 해외선물 주문접수"""
+    __slots__ = ()
+    TR_CODE = "TC1"
+    FIELDS = ("lineseq", "key", "user", "svc_id", "ordr_dt", "brn_cd", "ordr_no", "orgn_ordr_no", "mthr_ordr_no", "ac_no", "is_cd", "s_b_ccd", "ordr_ccd", "ordr_typ_cd", "ordr_typ_prd_ccd", "ordr_aplc_strt_dt", "ordr_aplc_end_dt", "ordr_prc", "cndt_ordr_prc", "ordr_q", "ordr_tm", "userid", "xrc_rsv_tp_code")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def key(self):
+        """KEY"""
+        return self._data.get("key")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def svc_id(self):
+        """서비스ID"""
+        return self._data.get("svc_id")
+
+    @property
+    def ordr_dt(self):
+        """주문일자"""
+        return self._data.get("ordr_dt")
+
+    @property
+    def brn_cd(self):
+        """지점번호"""
+        return self._data.get("brn_cd")
+
+    @property
+    def ordr_no(self):
+        """주문번호"""
+        return self._data.get("ordr_no")
+
+    @property
+    def orgn_ordr_no(self):
+        """원주문번호"""
+        return self._data.get("orgn_ordr_no")
+
+    @property
+    def mthr_ordr_no(self):
+        """모주문번호"""
+        return self._data.get("mthr_ordr_no")
+
+    @property
+    def ac_no(self):
+        """계좌번호"""
+        return self._data.get("ac_no")
+
+    @property
+    def is_cd(self):
+        """종목코드"""
+        return self._data.get("is_cd")
+
+    @property
+    def s_b_ccd(self):
+        """매도매수유형"""
+        return self._data.get("s_b_ccd")
+
+    @property
+    def ordr_ccd(self):
+        """정정취소유형"""
+        return self._data.get("ordr_ccd")
+
+    @property
+    def ordr_typ_cd(self):
+        """주문유형코드"""
+        return self._data.get("ordr_typ_cd")
+
+    @property
+    def ordr_typ_prd_ccd(self):
+        """주문기간코드"""
+        return self._data.get("ordr_typ_prd_ccd")
+
+    @property
+    def ordr_aplc_strt_dt(self):
+        """주문적용시작일자"""
+        return self._data.get("ordr_aplc_strt_dt")
+
+    @property
+    def ordr_aplc_end_dt(self):
+        """주문적용종료일자"""
+        return self._data.get("ordr_aplc_end_dt")
+
+    @property
+    def ordr_prc(self):
+        """주문가격"""
+        return to_float(self._data.get("ordr_prc"))
+
+    @property
+    def cndt_ordr_prc(self):
+        """주문조건가격"""
+        return to_float(self._data.get("cndt_ordr_prc"))
+
+    @property
+    def ordr_q(self):
+        """주문수량"""
+        return to_number(self._data.get("ordr_q"))
+
+    @property
+    def ordr_tm(self):
+        """주문시간"""
+        return self._data.get("ordr_tm")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def xrc_rsv_tp_code(self):
+        """행사예약구분코드"""
+        return self._data.get("xrc_rsv_tp_code")
+
+
+class TC2Tick(RealtimeRecord):
+    """[TC2] 해외선물 주문응답"""
+    __slots__ = ()
+    TR_CODE = "TC2"
+    FIELDS = ("lineseq", "key", "user", "svc_id", "ordr_dt", "brn_cd", "ordr_no", "orgn_ordr_no", "mthr_ordr_no", "ac_no", "is_cd", "s_b_ccd", "ordr_ccd", "ordr_typ_cd", "ordr_typ_prd_ccd", "ordr_aplc_strt_dt", "ordr_aplc_end_dt", "ordr_prc", "cndt_ordr_prc", "ordr_q", "ordr_tm", "cnfr_q", "rfsl_cd", "text", "userid")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def key(self):
+        """KEY"""
+        return self._data.get("key")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def svc_id(self):
+        """서비스ID"""
+        return self._data.get("svc_id")
+
+    @property
+    def ordr_dt(self):
+        """주문일자"""
+        return self._data.get("ordr_dt")
+
+    @property
+    def brn_cd(self):
+        """지점번호"""
+        return self._data.get("brn_cd")
+
+    @property
+    def ordr_no(self):
+        """주문번호"""
+        return self._data.get("ordr_no")
+
+    @property
+    def orgn_ordr_no(self):
+        """원주문번호"""
+        return self._data.get("orgn_ordr_no")
+
+    @property
+    def mthr_ordr_no(self):
+        """모주문번호"""
+        return self._data.get("mthr_ordr_no")
+
+    @property
+    def ac_no(self):
+        """계좌번호"""
+        return self._data.get("ac_no")
+
+    @property
+    def is_cd(self):
+        """종목코드"""
+        return self._data.get("is_cd")
+
+    @property
+    def s_b_ccd(self):
+        """매도매수유형"""
+        return self._data.get("s_b_ccd")
+
+    @property
+    def ordr_ccd(self):
+        """정정취소유형"""
+        return self._data.get("ordr_ccd")
+
+    @property
+    def ordr_typ_cd(self):
+        """주문유형코드"""
+        return self._data.get("ordr_typ_cd")
+
+    @property
+    def ordr_typ_prd_ccd(self):
+        """주문기간코드"""
+        return self._data.get("ordr_typ_prd_ccd")
+
+    @property
+    def ordr_aplc_strt_dt(self):
+        """주문적용시작일자"""
+        return self._data.get("ordr_aplc_strt_dt")
+
+    @property
+    def ordr_aplc_end_dt(self):
+        """주문적용종료일자"""
+        return self._data.get("ordr_aplc_end_dt")
+
+    @property
+    def ordr_prc(self):
+        """주문가격"""
+        return to_float(self._data.get("ordr_prc"))
+
+    @property
+    def cndt_ordr_prc(self):
+        """주문조건가격"""
+        return to_float(self._data.get("cndt_ordr_prc"))
+
+    @property
+    def ordr_q(self):
+        """주문수량"""
+        return to_number(self._data.get("ordr_q"))
+
+    @property
+    def ordr_tm(self):
+        """주문시간"""
+        return self._data.get("ordr_tm")
+
+    @property
+    def cnfr_q(self):
+        """호가확인수량"""
+        return to_number(self._data.get("cnfr_q"))
+
+    @property
+    def rfsl_cd(self):
+        """호가거부사유코드"""
+        return self._data.get("rfsl_cd")
+
+    @property
+    def text(self):
+        """호가거부사유코드명"""
+        return self._data.get("text")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+
+class TC3Tick(RealtimeRecord):
+    """[TC3] 해외선물 주문체결"""
+    __slots__ = ()
+    TR_CODE = "TC3"
+    FIELDS = ("lineseq", "key", "user", "svc_id", "ordr_dt", "brn_cd", "ordr_no", "orgn_ordr_no", "mthr_ordr_no", "ac_no", "is_cd", "s_b_ccd", "ordr_ccd", "ccls_q", "ccls_prc", "ccls_no", "ccls_tm", "avg_byng_uprc", "byug_amt", "clr_pl_amt", "ent_fee", "fcm_fee", "userid", "now_prc", "crncy_cd", "mtrt_dt", "ord_prdt_tp_code", "exec_prdt_tp_code", "sprd_base_isu_yn", "ccls_dt", "filler2", "sprd_is_cd", "lme_prdt_ccd", "lme_sprd_prc", "last_now_prc", "bf_mtrt_dt", "clr_q")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def key(self):
+        """KEY"""
+        return self._data.get("key")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def svc_id(self):
+        """서비스ID"""
+        return self._data.get("svc_id")
+
+    @property
+    def ordr_dt(self):
+        """주문일자"""
+        return self._data.get("ordr_dt")
+
+    @property
+    def brn_cd(self):
+        """지점번호"""
+        return self._data.get("brn_cd")
+
+    @property
+    def ordr_no(self):
+        """주문번호"""
+        return self._data.get("ordr_no")
+
+    @property
+    def orgn_ordr_no(self):
+        """원주문번호"""
+        return self._data.get("orgn_ordr_no")
+
+    @property
+    def mthr_ordr_no(self):
+        """모주문번호"""
+        return self._data.get("mthr_ordr_no")
+
+    @property
+    def ac_no(self):
+        """계좌번호"""
+        return self._data.get("ac_no")
+
+    @property
+    def is_cd(self):
+        """종목코드"""
+        return self._data.get("is_cd")
+
+    @property
+    def s_b_ccd(self):
+        """매도매수유형"""
+        return self._data.get("s_b_ccd")
+
+    @property
+    def ordr_ccd(self):
+        """정정취소유형"""
+        return self._data.get("ordr_ccd")
+
+    @property
+    def ccls_q(self):
+        """체결수량"""
+        return to_number(self._data.get("ccls_q"))
+
+    @property
+    def ccls_prc(self):
+        """체결가격"""
+        return to_float(self._data.get("ccls_prc"))
+
+    @property
+    def ccls_no(self):
+        """체결번호"""
+        return self._data.get("ccls_no")
+
+    @property
+    def ccls_tm(self):
+        """체결시간"""
+        return self._data.get("ccls_tm")
+
+    @property
+    def avg_byng_uprc(self):
+        """매입평균단가"""
+        return to_float(self._data.get("avg_byng_uprc"))
+
+    @property
+    def byug_amt(self):
+        """매입금액"""
+        return to_float(self._data.get("byug_amt"))
+
+    @property
+    def clr_pl_amt(self):
+        """청산손익"""
+        return to_float(self._data.get("clr_pl_amt"))
+
+    @property
+    def ent_fee(self):
+        """위탁수수료"""
+        return to_float(self._data.get("ent_fee"))
+
+    @property
+    def fcm_fee(self):
+        """매입잔고수량"""
+        return to_number(self._data.get("fcm_fee"))
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def now_prc(self):
+        """현재가격"""
+        return to_float(self._data.get("now_prc"))
+
+    @property
+    def crncy_cd(self):
+        """통화코드"""
+        return self._data.get("crncy_cd")
+
+    @property
+    def mtrt_dt(self):
+        """만기일자"""
+        return self._data.get("mtrt_dt")
+
+    @property
+    def ord_prdt_tp_code(self):
+        """주문상품구분코드"""
+        return self._data.get("ord_prdt_tp_code")
+
+    @property
+    def exec_prdt_tp_code(self):
+        """주문상품구분코드"""
+        return self._data.get("exec_prdt_tp_code")
+
+    @property
+    def sprd_base_isu_yn(self):
+        """스프레드종목여부"""
+        return self._data.get("sprd_base_isu_yn")
+
+    @property
+    def ccls_dt(self):
+        """체결일자"""
+        return self._data.get("ccls_dt")
+
+    @property
+    def filler2(self):
+        """FILLER2"""
+        return self._data.get("filler2")
+
+    @property
+    def sprd_is_cd(self):
+        """스프레드종목코드"""
+        return self._data.get("sprd_is_cd")
+
+    @property
+    def lme_prdt_ccd(self):
+        """LME상품유형"""
+        return self._data.get("lme_prdt_ccd")
+
+    @property
+    def lme_sprd_prc(self):
+        """LME스프레드가격"""
+        return to_float(self._data.get("lme_sprd_prc"))
+
+    @property
+    def last_now_prc(self):
+        """최종현재가격"""
+        return to_float(self._data.get("last_now_prc"))
+
+    @property
+    def bf_mtrt_dt(self):
+        """이전만기일자"""
+        return self._data.get("bf_mtrt_dt")
+
+    @property
+    def clr_q(self):
+        """청산수량"""
+        return to_number(self._data.get("clr_q"))
+
+
+class AS0Tick(RealtimeRecord):
+    """[AS0] 해외주식주문접수(미국)"""
+    __slots__ = ()
+    TR_CODE = "AS0"
+    FIELDS = ("lineseq", "accno", "user", "len", "gubun", "compress", "encrypt", "offset", "trcode", "comid", "userid", "media", "ifid", "seq", "trid", "pubip", "prvip", "pcbpno", "bpno", "termno", "lang", "proctm", "msgcode", "outgu", "compreq", "funckey", "reqcnt", "filler", "cont", "contkey", "varlen", "varhdlen", "varmsglen", "trsrc", "eventid", "ifinfo", "filler1", "sOrdxctPtnCode", "sOrdMktCode", "sOrdPtnCode", "sOrgOrdNo", "sAcntNo", "sPwd", "sIsuNo", "sShtnIsuNo", "sIsuNm", "sOrdQty", "sOrdPrc", "sOrdCndi", "sOrdprcPtnCode", "sStrtgCode", "sGrpId", "sOrdSeqno", "sCommdaCode", "sOrdNo", "sOrdTime", "sPrntOrdNo", "sOrgOrdUnercQty", "sOrgOrdMdfyQty", "sOrgOrdCancQty", "sNmcpySndNo", "sOrdAmt", "sBnsTp", "sMtiordSeqno", "sOrdUserId", "sSpotOrdQty", "sRuseOrdQty", "sOrdMny", "sOrdSubstAmt", "sOrdRuseAmt", "sUseCmsnAmt", "sSecBalQty", "sSpotOrdAbleQty", "sOrdAbleRuseQty", "sFlctQty", "sSecBalQtyD2", "sSellAbleQty", "sUnercSellOrdQty", "sAvrPchsPrc", "sPchsAmt", "sDeposit", "sSubstAmt", "sCsgnMnyMgn", "sCsgnSubstMgn", "sOrdAbleMny", "sOrdAbleSubstAmt", "sRuseAbleAmt", "sMgntrnCode")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return self._data.get("len")
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return self._data.get("offset")
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def comid(self):
+        """이용사번호"""
+        return self._data.get("comid")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return self._data.get("proctm")
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return self._data.get("varlen")
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return self._data.get("varhdlen")
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return self._data.get("varmsglen")
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def sOrdxctPtnCode(self):
+        """주문체결유형코드"""
+        return self._data.get("sOrdxctPtnCode")
+
+    @property
+    def sOrdMktCode(self):
+        """주문시장코드"""
+        return self._data.get("sOrdMktCode")
+
+    @property
+    def sOrdPtnCode(self):
+        """주문유형코드"""
+        return self._data.get("sOrdPtnCode")
+
+    @property
+    def sOrgOrdNo(self):
+        """원주문번호"""
+        return self._data.get("sOrgOrdNo")
+
+    @property
+    def sAcntNo(self):
+        """계좌번호"""
+        return self._data.get("sAcntNo")
+
+    @property
+    def sPwd(self):
+        """비밀번호"""
+        return self._data.get("sPwd")
+
+    @property
+    def sIsuNo(self):
+        """종목번호"""
+        return self._data.get("sIsuNo")
+
+    @property
+    def sShtnIsuNo(self):
+        """단축종목번호"""
+        return self._data.get("sShtnIsuNo")
+
+    @property
+    def sIsuNm(self):
+        """종목명"""
+        return self._data.get("sIsuNm")
+
+    @property
+    def sOrdQty(self):
+        """주문수량"""
+        return to_number(self._data.get("sOrdQty"))
+
+    @property
+    def sOrdPrc(self):
+        """주문가"""
+        return to_number(self._data.get("sOrdPrc"))
+
+    @property
+    def sOrdCndi(self):
+        """주문조건"""
+        return self._data.get("sOrdCndi")
+
+    @property
+    def sOrdprcPtnCode(self):
+        """호가유형코드"""
+        return self._data.get("sOrdprcPtnCode")
+
+    @property
+    def sStrtgCode(self):
+        """전략코드"""
+        return self._data.get("sStrtgCode")
+
+    @property
+    def sGrpId(self):
+        """그룹ID"""
+        return self._data.get("sGrpId")
+
+    @property
+    def sOrdSeqno(self):
+        """주문회차"""
+        return self._data.get("sOrdSeqno")
+
+    @property
+    def sCommdaCode(self):
+        """통신매체코드"""
+        return self._data.get("sCommdaCode")
+
+    @property
+    def sOrdNo(self):
+        """주문번호"""
+        return self._data.get("sOrdNo")
+
+    @property
+    def sOrdTime(self):
+        """주문시각"""
+        return self._data.get("sOrdTime")
+
+    @property
+    def sPrntOrdNo(self):
+        """모주문번호"""
+        return self._data.get("sPrntOrdNo")
+
+    @property
+    def sOrgOrdUnercQty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("sOrgOrdUnercQty"))
+
+    @property
+    def sOrgOrdMdfyQty(self):
+        """원주문정정수량"""
+        return to_number(self._data.get("sOrgOrdMdfyQty"))
+
+    @property
+    def sOrgOrdCancQty(self):
+        """원주문취소수량"""
+        return to_number(self._data.get("sOrgOrdCancQty"))
+
+    @property
+    def sNmcpySndNo(self):
+        """비회원사송신번호"""
+        return self._data.get("sNmcpySndNo")
+
+    @property
+    def sOrdAmt(self):
+        """주문금액"""
+        return to_number(self._data.get("sOrdAmt"))
+
+    @property
+    def sBnsTp(self):
+        """매매구분"""
+        return self._data.get("sBnsTp")
+
+    @property
+    def sMtiordSeqno(self):
+        """복수주문일련번호"""
+        return self._data.get("sMtiordSeqno")
+
+    @property
+    def sOrdUserId(self):
+        """주문사원번호"""
+        return self._data.get("sOrdUserId")
+
+    @property
+    def sSpotOrdQty(self):
+        """실물주문수량"""
+        return to_number(self._data.get("sSpotOrdQty"))
+
+    @property
+    def sRuseOrdQty(self):
+        """재사용주문수량"""
+        return to_number(self._data.get("sRuseOrdQty"))
+
+    @property
+    def sOrdMny(self):
+        """주문현금"""
+        return to_number(self._data.get("sOrdMny"))
+
+    @property
+    def sOrdSubstAmt(self):
+        """주문대용금액"""
+        return to_number(self._data.get("sOrdSubstAmt"))
+
+    @property
+    def sOrdRuseAmt(self):
+        """주문재사용금액"""
+        return to_number(self._data.get("sOrdRuseAmt"))
+
+    @property
+    def sUseCmsnAmt(self):
+        """사용수수료"""
+        return self._data.get("sUseCmsnAmt")
+
+    @property
+    def sSecBalQty(self):
+        """잔고수량"""
+        return to_number(self._data.get("sSecBalQty"))
+
+    @property
+    def sSpotOrdAbleQty(self):
+        """실물주문가능수량"""
+        return to_number(self._data.get("sSpotOrdAbleQty"))
+
+    @property
+    def sOrdAbleRuseQty(self):
+        """주문가능재사용수량"""
+        return to_number(self._data.get("sOrdAbleRuseQty"))
+
+    @property
+    def sFlctQty(self):
+        """변동수량"""
+        return to_number(self._data.get("sFlctQty"))
+
+    @property
+    def sSecBalQtyD2(self):
+        """잔고수량(D2)"""
+        return self._data.get("sSecBalQtyD2")
+
+    @property
+    def sSellAbleQty(self):
+        """매도주문가능수량"""
+        return to_number(self._data.get("sSellAbleQty"))
+
+    @property
+    def sUnercSellOrdQty(self):
+        """미체결매도주문수량"""
+        return to_number(self._data.get("sUnercSellOrdQty"))
+
+    @property
+    def sAvrPchsPrc(self):
+        """평균매입가"""
+        return to_number(self._data.get("sAvrPchsPrc"))
+
+    @property
+    def sPchsAmt(self):
+        """매입금액"""
+        return to_number(self._data.get("sPchsAmt"))
+
+    @property
+    def sDeposit(self):
+        """예수금"""
+        return to_number(self._data.get("sDeposit"))
+
+    @property
+    def sSubstAmt(self):
+        """대용금"""
+        return to_number(self._data.get("sSubstAmt"))
+
+    @property
+    def sCsgnMnyMgn(self):
+        """위탁현금증거금액"""
+        return to_number(self._data.get("sCsgnMnyMgn"))
+
+    @property
+    def sCsgnSubstMgn(self):
+        """위탁대용증거금액"""
+        return to_number(self._data.get("sCsgnSubstMgn"))
+
+    @property
+    def sOrdAbleMny(self):
+        """주문가능현금"""
+        return to_number(self._data.get("sOrdAbleMny"))
+
+    @property
+    def sOrdAbleSubstAmt(self):
+        """주문가능대용금액"""
+        return to_number(self._data.get("sOrdAbleSubstAmt"))
+
+    @property
+    def sRuseAbleAmt(self):
+        """재사용가능금액"""
+        return to_number(self._data.get("sRuseAbleAmt"))
+
+    @property
+    def sMgntrnCode(self):
+        """신용거래코드"""
+        return self._data.get("sMgntrnCode")
+
+
+class AS1Tick(RealtimeRecord):
+    """[AS1] 해외주식주문체결(미국)"""
+    __slots__ = ()
+    TR_CODE = "AS1"
+    FIELDS = ("lineseq", "accno", "user", "len", "gubun", "compress", "encrypt", "offset", "trcode", "comid", "userid", "media", "ifid", "seq", "trid", "pubip", "prvip", "pcbpno", "bpno", "termno", "lang", "proctm", "msgcode", "outgu", "compreq", "funckey", "reqcnt", "filler", "cont", "contkey", "varlen", "varhdlen", "varmsglen", "trsrc", "eventid", "ifinfo", "filler1", "sOrdxctPtnCode", "sOrdMktCode", "sOrdPtnCode", "sMgmtBrnNo", "sAcntNo", "sAcntNm", "sIsuNo", "sIsuNm", "sOrdNo", "sOrgOrdNo", "sExecNO", "sAbrdExecId", "sOrdQty", "sOrdPrc", "sExecQty", "sExecPrc", "sMdfyCnfQty", "sMdfyCnfPrc", "sCancCnfQty", "sRjtQty", "sOrdTrxPtnCode", "sMtiordSeqno", "sOrdCndi", "sOrdprcPtnCode", "sShtnIsuNo", "sOpDrtnNo", "sUnercQty", "sOrgOrdUnercQty", "sOrgOrdMdfyQty", "sOrgOrdCancQty", "sOrdAvrExecPrc", "sOrdAmt", "sStdIsuNo", "sBnsTp", "sCommdaCode", "sOrdAcntNo", "sAgrgtBrnNo", "sRegMktCode", "sMnyMgnRat", "sSubstMgnRat", "sMnyExecAmt", "sSubstExecAmt", "sCmsnAmtExecAmt", "sPrdayRuseExecVal", "sCrdayRuseExecVal", "sSpotExecQty", "sStslExecQty", "sStrtgCode", "sGrpId", "sOrdSeqno", "sOrdUserId", "sExecTime", "sRcptExecTime", "sRjtRsn", "sSecBalQty", "sSpotOrdAbleQty", "sOrdAbleRuseQty", "sFlctQty", "sSecBalQtyD2", "sSellAbleQty", "sUnercSellOrdQty", "sAvrPchsPrc", "sPchsAmt", "sDeposit", "sSubstAmt", "sCsgnMnyMgn", "sCsgnSubstMgn", "sOrdAbleMny", "sOrdAbleSubstAmt", "sRuseAbleAmt", "sMgntrnCode")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return self._data.get("len")
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return self._data.get("offset")
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def comid(self):
+        """이용사번호"""
+        return self._data.get("comid")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return self._data.get("proctm")
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return self._data.get("varlen")
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return self._data.get("varhdlen")
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return self._data.get("varmsglen")
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def sOrdxctPtnCode(self):
+        """주문체결유형코드"""
+        return self._data.get("sOrdxctPtnCode")
+
+    @property
+    def sOrdMktCode(self):
+        """주문시장코드"""
+        return self._data.get("sOrdMktCode")
+
+    @property
+    def sOrdPtnCode(self):
+        """주문유형코드"""
+        return self._data.get("sOrdPtnCode")
+
+    @property
+    def sMgmtBrnNo(self):
+        """관리지점번호"""
+        return self._data.get("sMgmtBrnNo")
+
+    @property
+    def sAcntNo(self):
+        """계좌번호"""
+        return self._data.get("sAcntNo")
+
+    @property
+    def sAcntNm(self):
+        """계좌명"""
+        return self._data.get("sAcntNm")
+
+    @property
+    def sIsuNo(self):
+        """종목번호"""
+        return self._data.get("sIsuNo")
+
+    @property
+    def sIsuNm(self):
+        """종목명"""
+        return self._data.get("sIsuNm")
+
+    @property
+    def sOrdNo(self):
+        """주문번호"""
+        return self._data.get("sOrdNo")
+
+    @property
+    def sOrgOrdNo(self):
+        """원주문번호"""
+        return self._data.get("sOrgOrdNo")
+
+    @property
+    def sExecNO(self):
+        """체결번호"""
+        return self._data.get("sExecNO")
+
+    @property
+    def sAbrdExecId(self):
+        """해외체결ID"""
+        return self._data.get("sAbrdExecId")
+
+    @property
+    def sOrdQty(self):
+        """주문수량"""
+        return to_number(self._data.get("sOrdQty"))
+
+    @property
+    def sOrdPrc(self):
+        """주문가"""
+        return to_number(self._data.get("sOrdPrc"))
+
+    @property
+    def sExecQty(self):
+        """체결수량"""
+        return to_number(self._data.get("sExecQty"))
+
+    @property
+    def sExecPrc(self):
+        """체결가"""
+        return to_number(self._data.get("sExecPrc"))
+
+    @property
+    def sMdfyCnfQty(self):
+        """정정확인수량"""
+        return to_number(self._data.get("sMdfyCnfQty"))
+
+    @property
+    def sMdfyCnfPrc(self):
+        """정정확인가"""
+        return to_number(self._data.get("sMdfyCnfPrc"))
+
+    @property
+    def sCancCnfQty(self):
+        """취소확인수량"""
+        return to_number(self._data.get("sCancCnfQty"))
+
+    @property
+    def sRjtQty(self):
+        """거부수량"""
+        return to_number(self._data.get("sRjtQty"))
+
+    @property
+    def sOrdTrxPtnCode(self):
+        """주문처리유형코드"""
+        return self._data.get("sOrdTrxPtnCode")
+
+    @property
+    def sMtiordSeqno(self):
+        """복수주문일련번호"""
+        return self._data.get("sMtiordSeqno")
+
+    @property
+    def sOrdCndi(self):
+        """주문조건"""
+        return self._data.get("sOrdCndi")
+
+    @property
+    def sOrdprcPtnCode(self):
+        """호가유형코드"""
+        return self._data.get("sOrdprcPtnCode")
+
+    @property
+    def sShtnIsuNo(self):
+        """단축종목번호"""
+        return self._data.get("sShtnIsuNo")
+
+    @property
+    def sOpDrtnNo(self):
+        """운용지시번호"""
+        return self._data.get("sOpDrtnNo")
+
+    @property
+    def sUnercQty(self):
+        """미체결수량(주문)"""
+        return self._data.get("sUnercQty")
+
+    @property
+    def sOrgOrdUnercQty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("sOrgOrdUnercQty"))
+
+    @property
+    def sOrgOrdMdfyQty(self):
+        """원주문정정수량"""
+        return to_number(self._data.get("sOrgOrdMdfyQty"))
+
+    @property
+    def sOrgOrdCancQty(self):
+        """원주문취소수량"""
+        return to_number(self._data.get("sOrgOrdCancQty"))
+
+    @property
+    def sOrdAvrExecPrc(self):
+        """주문평균체결가"""
+        return to_number(self._data.get("sOrdAvrExecPrc"))
+
+    @property
+    def sOrdAmt(self):
+        """주문금액"""
+        return to_number(self._data.get("sOrdAmt"))
+
+    @property
+    def sStdIsuNo(self):
+        """표준종목번호"""
+        return self._data.get("sStdIsuNo")
+
+    @property
+    def sBnsTp(self):
+        """매매구분"""
+        return self._data.get("sBnsTp")
+
+    @property
+    def sCommdaCode(self):
+        """통신매체코드"""
+        return self._data.get("sCommdaCode")
+
+    @property
+    def sOrdAcntNo(self):
+        """주문계좌번호"""
+        return self._data.get("sOrdAcntNo")
+
+    @property
+    def sAgrgtBrnNo(self):
+        """집계지점번호"""
+        return self._data.get("sAgrgtBrnNo")
+
+    @property
+    def sRegMktCode(self):
+        """등록시장코드"""
+        return self._data.get("sRegMktCode")
+
+    @property
+    def sMnyMgnRat(self):
+        """현금증거금률"""
+        return to_float(self._data.get("sMnyMgnRat"))
+
+    @property
+    def sSubstMgnRat(self):
+        """대용증거금률"""
+        return to_float(self._data.get("sSubstMgnRat"))
+
+    @property
+    def sMnyExecAmt(self):
+        """현금체결금액"""
+        return to_number(self._data.get("sMnyExecAmt"))
+
+    @property
+    def sSubstExecAmt(self):
+        """대용체결금액"""
+        return to_number(self._data.get("sSubstExecAmt"))
+
+    @property
+    def sCmsnAmtExecAmt(self):
+        """수수료체결금액"""
+        return to_number(self._data.get("sCmsnAmtExecAmt"))
+
+    @property
+    def sPrdayRuseExecVal(self):
+        """전일재사용체결금액"""
+        return to_number(self._data.get("sPrdayRuseExecVal"))
+
+    @property
+    def sCrdayRuseExecVal(self):
+        """금일재사용체결금액"""
+        return to_number(self._data.get("sCrdayRuseExecVal"))
+
+    @property
+    def sSpotExecQty(self):
+        """실물체결수량"""
+        return to_number(self._data.get("sSpotExecQty"))
+
+    @property
+    def sStslExecQty(self):
+        """공매도체결수량"""
+        return to_number(self._data.get("sStslExecQty"))
+
+    @property
+    def sStrtgCode(self):
+        """전략코드"""
+        return self._data.get("sStrtgCode")
+
+    @property
+    def sGrpId(self):
+        """그룹ID"""
+        return self._data.get("sGrpId")
+
+    @property
+    def sOrdSeqno(self):
+        """주문회차"""
+        return self._data.get("sOrdSeqno")
+
+    @property
+    def sOrdUserId(self):
+        """주문자ID"""
+        return self._data.get("sOrdUserId")
+
+    @property
+    def sExecTime(self):
+        """체결시각"""
+        return self._data.get("sExecTime")
+
+    @property
+    def sRcptExecTime(self):
+        """거래소수신체결시각"""
+        return self._data.get("sRcptExecTime")
+
+    @property
+    def sRjtRsn(self):
+        """거부사유"""
+        return self._data.get("sRjtRsn")
+
+    @property
+    def sSecBalQty(self):
+        """잔고수량"""
+        return to_number(self._data.get("sSecBalQty"))
+
+    @property
+    def sSpotOrdAbleQty(self):
+        """실물주문가능수량"""
+        return to_number(self._data.get("sSpotOrdAbleQty"))
+
+    @property
+    def sOrdAbleRuseQty(self):
+        """주문가능재사용수량"""
+        return to_number(self._data.get("sOrdAbleRuseQty"))
+
+    @property
+    def sFlctQty(self):
+        """변동수량"""
+        return to_number(self._data.get("sFlctQty"))
+
+    @property
+    def sSecBalQtyD2(self):
+        """잔고수량(D2)"""
+        return self._data.get("sSecBalQtyD2")
+
+    @property
+    def sSellAbleQty(self):
+        """매도주문가능수량"""
+        return to_number(self._data.get("sSellAbleQty"))
+
+    @property
+    def sUnercSellOrdQty(self):
+        """미체결매도주문수량"""
+        return to_number(self._data.get("sUnercSellOrdQty"))
+
+    @property
+    def sAvrPchsPrc(self):
+        """평균매입가"""
+        return to_number(self._data.get("sAvrPchsPrc"))
+
+    @property
+    def sPchsAmt(self):
+        """매입금액"""
+        return to_number(self._data.get("sPchsAmt"))
+
+    @property
+    def sDeposit(self):
+        """예수금"""
+        return to_number(self._data.get("sDeposit"))
+
+    @property
+    def sSubstAmt(self):
+        """대용금"""
+        return to_number(self._data.get("sSubstAmt"))
+
+    @property
+    def sCsgnMnyMgn(self):
+        """위탁현금증거금액"""
+        return to_number(self._data.get("sCsgnMnyMgn"))
+
+    @property
+    def sCsgnSubstMgn(self):
+        """위탁대용증거금액"""
+        return to_number(self._data.get("sCsgnSubstMgn"))
+
+    @property
+    def sOrdAbleMny(self):
+        """주문가능현금"""
+        return to_number(self._data.get("sOrdAbleMny"))
+
+    @property
+    def sOrdAbleSubstAmt(self):
+        """주문가능대용금액"""
+        return to_number(self._data.get("sOrdAbleSubstAmt"))
+
+    @property
+    def sRuseAbleAmt(self):
+        """재사용가능금액"""
+        return to_number(self._data.get("sRuseAbleAmt"))
+
+    @property
+    def sMgntrnCode(self):
+        """신용거래코드"""
+        return self._data.get("sMgntrnCode")
+
+
+class AS2Tick(RealtimeRecord):
+    """[AS2] 해외주식주문정정(미국)"""
+    __slots__ = ()
+    TR_CODE = "AS2"
+    FIELDS = ("lineseq", "accno", "user", "len", "gubun", "compress", "encrypt", "offset", "trcode", "comid", "userid", "media", "ifid", "seq", "trid", "pubip", "prvip", "pcbpno", "bpno", "termno", "lang", "proctm", "msgcode", "outgu", "compreq", "funckey", "reqcnt", "filler", "cont", "contkey", "varlen", "varhdlen", "varmsglen", "trsrc", "eventid", "ifinfo", "filler1", "sOrdxctPtnCode", "sOrdMktCode", "sOrdPtnCode", "sMgmtBrnNo", "sAcntNo", "sAcntNm", "sIsuNo", "sIsuNm", "sOrdNo", "sOrgOrdNo", "sExecNO", "sAbrdExecId", "sOrdQty", "sOrdPrc", "sExecQty", "sExecPrc", "sMdfyCnfQty", "sMdfyCnfPrc", "sCancCnfQty", "sRjtQty", "sOrdTrxPtnCode", "sMtiordSeqno", "sOrdCndi", "sOrdprcPtnCode", "sShtnIsuNo", "sOpDrtnNo", "sUnercQty", "sOrgOrdUnercQty", "sOrgOrdMdfyQty", "sOrgOrdCancQty", "sOrdAvrExecPrc", "sOrdAmt", "sStdIsuNo", "sBnsTp", "sCommdaCode", "sOrdAcntNo", "sAgrgtBrnNo", "sRegMktCode", "sMnyMgnRat", "sSubstMgnRat", "sMnyExecAmt", "sSubstExecAmt", "sCmsnAmtExecAmt", "sPrdayRuseExecVal", "sCrdayRuseExecVal", "sSpotExecQty", "sStslExecQty", "sStrtgCode", "sGrpId", "sOrdSeqno", "sOrdUserId", "sExecTime", "sRcptExecTime", "sRjtRsn", "sSecBalQty", "sSpotOrdAbleQty", "sOrdAbleRuseQty", "sFlctQty", "sSecBalQtyD2", "sSellAbleQty", "sUnercSellOrdQty", "sAvrPchsPrc", "sPchsAmt", "sDeposit", "sSubstAmt", "sCsgnMnyMgn", "sCsgnSubstMgn", "sOrdAbleMny", "sOrdAbleSubstAmt", "sRuseAbleAmt", "sMgntrnCode")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return self._data.get("len")
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return self._data.get("offset")
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def comid(self):
+        """이용사번호"""
+        return self._data.get("comid")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return self._data.get("proctm")
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return self._data.get("varlen")
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return self._data.get("varhdlen")
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return self._data.get("varmsglen")
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def sOrdxctPtnCode(self):
+        """주문체결유형코드"""
+        return self._data.get("sOrdxctPtnCode")
+
+    @property
+    def sOrdMktCode(self):
+        """주문시장코드"""
+        return self._data.get("sOrdMktCode")
+
+    @property
+    def sOrdPtnCode(self):
+        """주문유형코드"""
+        return self._data.get("sOrdPtnCode")
+
+    @property
+    def sMgmtBrnNo(self):
+        """관리지점번호"""
+        return self._data.get("sMgmtBrnNo")
+
+    @property
+    def sAcntNo(self):
+        """계좌번호"""
+        return self._data.get("sAcntNo")
+
+    @property
+    def sAcntNm(self):
+        """계좌명"""
+        return self._data.get("sAcntNm")
+
+    @property
+    def sIsuNo(self):
+        """종목번호"""
+        return self._data.get("sIsuNo")
+
+    @property
+    def sIsuNm(self):
+        """종목명"""
+        return self._data.get("sIsuNm")
+
+    @property
+    def sOrdNo(self):
+        """주문번호"""
+        return self._data.get("sOrdNo")
+
+    @property
+    def sOrgOrdNo(self):
+        """원주문번호"""
+        return self._data.get("sOrgOrdNo")
+
+    @property
+    def sExecNO(self):
+        """체결번호"""
+        return self._data.get("sExecNO")
+
+    @property
+    def sAbrdExecId(self):
+        """해외체결ID"""
+        return self._data.get("sAbrdExecId")
+
+    @property
+    def sOrdQty(self):
+        """주문수량"""
+        return to_number(self._data.get("sOrdQty"))
+
+    @property
+    def sOrdPrc(self):
+        """주문가"""
+        return to_number(self._data.get("sOrdPrc"))
+
+    @property
+    def sExecQty(self):
+        """체결수량"""
+        return to_number(self._data.get("sExecQty"))
+
+    @property
+    def sExecPrc(self):
+        """체결가"""
+        return to_number(self._data.get("sExecPrc"))
+
+    @property
+    def sMdfyCnfQty(self):
+        """정정확인수량"""
+        return to_number(self._data.get("sMdfyCnfQty"))
+
+    @property
+    def sMdfyCnfPrc(self):
+        """정정확인가"""
+        return to_number(self._data.get("sMdfyCnfPrc"))
+
+    @property
+    def sCancCnfQty(self):
+        """취소확인수량"""
+        return to_number(self._data.get("sCancCnfQty"))
+
+    @property
+    def sRjtQty(self):
+        """거부수량"""
+        return to_number(self._data.get("sRjtQty"))
+
+    @property
+    def sOrdTrxPtnCode(self):
+        """주문처리유형코드"""
+        return self._data.get("sOrdTrxPtnCode")
+
+    @property
+    def sMtiordSeqno(self):
+        """복수주문일련번호"""
+        return self._data.get("sMtiordSeqno")
+
+    @property
+    def sOrdCndi(self):
+        """주문조건"""
+        return self._data.get("sOrdCndi")
+
+    @property
+    def sOrdprcPtnCode(self):
+        """호가유형코드"""
+        return self._data.get("sOrdprcPtnCode")
+
+    @property
+    def sShtnIsuNo(self):
+        """단축종목번호"""
+        return self._data.get("sShtnIsuNo")
+
+    @property
+    def sOpDrtnNo(self):
+        """운용지시번호"""
+        return self._data.get("sOpDrtnNo")
+
+    @property
+    def sUnercQty(self):
+        """미체결수량(주문)"""
+        return self._data.get("sUnercQty")
+
+    @property
+    def sOrgOrdUnercQty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("sOrgOrdUnercQty"))
+
+    @property
+    def sOrgOrdMdfyQty(self):
+        """원주문정정수량"""
+        return to_number(self._data.get("sOrgOrdMdfyQty"))
+
+    @property
+    def sOrgOrdCancQty(self):
+        """원주문취소수량"""
+        return to_number(self._data.get("sOrgOrdCancQty"))
+
+    @property
+    def sOrdAvrExecPrc(self):
+        """주문평균체결가"""
+        return to_number(self._data.get("sOrdAvrExecPrc"))
+
+    @property
+    def sOrdAmt(self):
+        """주문금액"""
+        return to_number(self._data.get("sOrdAmt"))
+
+    @property
+    def sStdIsuNo(self):
+        """표준종목번호"""
+        return self._data.get("sStdIsuNo")
+
+    @property
+    def sBnsTp(self):
+        """매매구분"""
+        return self._data.get("sBnsTp")
+
+    @property
+    def sCommdaCode(self):
+        """통신매체코드"""
+        return self._data.get("sCommdaCode")
+
+    @property
+    def sOrdAcntNo(self):
+        """주문계좌번호"""
+        return self._data.get("sOrdAcntNo")
+
+    @property
+    def sAgrgtBrnNo(self):
+        """집계지점번호"""
+        return self._data.get("sAgrgtBrnNo")
+
+    @property
+    def sRegMktCode(self):
+        """등록시장코드"""
+        return self._data.get("sRegMktCode")
+
+    @property
+    def sMnyMgnRat(self):
+        """현금증거금률"""
+        return to_float(self._data.get("sMnyMgnRat"))
+
+    @property
+    def sSubstMgnRat(self):
+        """대용증거금률"""
+        return to_float(self._data.get("sSubstMgnRat"))
+
+    @property
+    def sMnyExecAmt(self):
+        """현금체결금액"""
+        return to_number(self._data.get("sMnyExecAmt"))
+
+    @property
+    def sSubstExecAmt(self):
+        """대용체결금액"""
+        return to_number(self._data.get("sSubstExecAmt"))
+
+    @property
+    def sCmsnAmtExecAmt(self):
+        """수수료체결금액"""
+        return to_number(self._data.get("sCmsnAmtExecAmt"))
+
+    @property
+    def sPrdayRuseExecVal(self):
+        """전일재사용체결금액"""
+        return to_number(self._data.get("sPrdayRuseExecVal"))
+
+    @property
+    def sCrdayRuseExecVal(self):
+        """금일재사용체결금액"""
+        return to_number(self._data.get("sCrdayRuseExecVal"))
+
+    @property
+    def sSpotExecQty(self):
+        """실물체결수량"""
+        return to_number(self._data.get("sSpotExecQty"))
+
+    @property
+    def sStslExecQty(self):
+        """공매도체결수량"""
+        return to_number(self._data.get("sStslExecQty"))
+
+    @property
+    def sStrtgCode(self):
+        """전략코드"""
+        return self._data.get("sStrtgCode")
+
+    @property
+    def sGrpId(self):
+        """그룹ID"""
+        return self._data.get("sGrpId")
+
+    @property
+    def sOrdSeqno(self):
+        """주문회차"""
+        return self._data.get("sOrdSeqno")
+
+    @property
+    def sOrdUserId(self):
+        """주문자ID"""
+        return self._data.get("sOrdUserId")
+
+    @property
+    def sExecTime(self):
+        """체결시각"""
+        return self._data.get("sExecTime")
+
+    @property
+    def sRcptExecTime(self):
+        """거래소수신체결시각"""
+        return self._data.get("sRcptExecTime")
+
+    @property
+    def sRjtRsn(self):
+        """거부사유"""
+        return self._data.get("sRjtRsn")
+
+    @property
+    def sSecBalQty(self):
+        """잔고수량"""
+        return to_number(self._data.get("sSecBalQty"))
+
+    @property
+    def sSpotOrdAbleQty(self):
+        """실물주문가능수량"""
+        return to_number(self._data.get("sSpotOrdAbleQty"))
+
+    @property
+    def sOrdAbleRuseQty(self):
+        """주문가능재사용수량"""
+        return to_number(self._data.get("sOrdAbleRuseQty"))
+
+    @property
+    def sFlctQty(self):
+        """변동수량"""
+        return to_number(self._data.get("sFlctQty"))
+
+    @property
+    def sSecBalQtyD2(self):
+        """잔고수량(D2)"""
+        return self._data.get("sSecBalQtyD2")
+
+    @property
+    def sSellAbleQty(self):
+        """매도주문가능수량"""
+        return to_number(self._data.get("sSellAbleQty"))
+
+    @property
+    def sUnercSellOrdQty(self):
+        """미체결매도주문수량"""
+        return to_number(self._data.get("sUnercSellOrdQty"))
+
+    @property
+    def sAvrPchsPrc(self):
+        """평균매입가"""
+        return to_number(self._data.get("sAvrPchsPrc"))
+
+    @property
+    def sPchsAmt(self):
+        """매입금액"""
+        return to_number(self._data.get("sPchsAmt"))
+
+    @property
+    def sDeposit(self):
+        """예수금"""
+        return to_number(self._data.get("sDeposit"))
+
+    @property
+    def sSubstAmt(self):
+        """대용금"""
+        return to_number(self._data.get("sSubstAmt"))
+
+    @property
+    def sCsgnMnyMgn(self):
+        """위탁현금증거금액"""
+        return to_number(self._data.get("sCsgnMnyMgn"))
+
+    @property
+    def sCsgnSubstMgn(self):
+        """위탁대용증거금액"""
+        return to_number(self._data.get("sCsgnSubstMgn"))
+
+    @property
+    def sOrdAbleMny(self):
+        """주문가능현금"""
+        return to_number(self._data.get("sOrdAbleMny"))
+
+    @property
+    def sOrdAbleSubstAmt(self):
+        """주문가능대용금액"""
+        return to_number(self._data.get("sOrdAbleSubstAmt"))
+
+    @property
+    def sRuseAbleAmt(self):
+        """재사용가능금액"""
+        return to_number(self._data.get("sRuseAbleAmt"))
+
+    @property
+    def sMgntrnCode(self):
+        """신용거래코드"""
+        return self._data.get("sMgntrnCode")
+
+
+class AS3Tick(RealtimeRecord):
+    """[AS3] 해외주식주문취소(미국)"""
+    __slots__ = ()
+    TR_CODE = "AS3"
+    FIELDS = ("lineseq", "accno", "user", "len", "gubun", "compress", "encrypt", "offset", "trcode", "comid", "userid", "media", "ifid", "seq", "trid", "pubip", "prvip", "pcbpno", "bpno", "termno", "lang", "proctm", "msgcode", "outgu", "compreq", "funckey", "reqcnt", "filler", "cont", "contkey", "varlen", "varhdlen", "varmsglen", "trsrc", "eventid", "ifinfo", "filler1", "sOrdxctPtnCode", "sOrdMktCode", "sOrdPtnCode", "sMgmtBrnNo", "sAcntNo", "sAcntNm", "sIsuNo", "sIsuNm", "sOrdNo", "sOrgOrdNo", "sExecNO", "sAbrdExecId", "sOrdQty", "sOrdPrc", "sExecQty", "sExecPrc", "sMdfyCnfQty", "sMdfyCnfPrc", "sCancCnfQty", "sRjtQty", "sOrdTrxPtnCode", "sMtiordSeqno", "sOrdCndi", "sOrdprcPtnCode", "sShtnIsuNo", "sOpDrtnNo", "sUnercQty", "sOrgOrdUnercQty", "sOrgOrdMdfyQty", "sOrgOrdCancQty", "sOrdAvrExecPrc", "sOrdAmt", "sStdIsuNo", "sBnsTp", "sCommdaCode", "sOrdAcntNo", "sAgrgtBrnNo", "sRegMktCode", "sMnyMgnRat", "sSubstMgnRat", "sMnyExecAmt", "sSubstExecAmt", "sCmsnAmtExecAmt", "sPrdayRuseExecVal", "sCrdayRuseExecVal", "sSpotExecQty", "sStslExecQty", "sStrtgCode", "sGrpId", "sOrdSeqno", "sOrdUserId", "sExecTime", "sRcptExecTime", "sRjtRsn", "sSecBalQty", "sSpotOrdAbleQty", "sOrdAbleRuseQty", "sFlctQty", "sSecBalQtyD2", "sSellAbleQty", "sUnercSellOrdQty", "sAvrPchsPrc", "sPchsAmt", "sDeposit", "sSubstAmt", "sCsgnMnyMgn", "sCsgnSubstMgn", "sOrdAbleMny", "sOrdAbleSubstAmt", "sRuseAbleAmt", "sMgntrnCode")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return self._data.get("len")
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return self._data.get("offset")
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def comid(self):
+        """이용사번호"""
+        return self._data.get("comid")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return self._data.get("proctm")
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return self._data.get("varlen")
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return self._data.get("varhdlen")
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return self._data.get("varmsglen")
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def sOrdxctPtnCode(self):
+        """주문체결유형코드"""
+        return self._data.get("sOrdxctPtnCode")
+
+    @property
+    def sOrdMktCode(self):
+        """주문시장코드"""
+        return self._data.get("sOrdMktCode")
+
+    @property
+    def sOrdPtnCode(self):
+        """주문유형코드"""
+        return self._data.get("sOrdPtnCode")
+
+    @property
+    def sMgmtBrnNo(self):
+        """관리지점번호"""
+        return self._data.get("sMgmtBrnNo")
+
+    @property
+    def sAcntNo(self):
+        """계좌번호"""
+        return self._data.get("sAcntNo")
+
+    @property
+    def sAcntNm(self):
+        """계좌명"""
+        return self._data.get("sAcntNm")
+
+    @property
+    def sIsuNo(self):
+        """종목번호"""
+        return self._data.get("sIsuNo")
+
+    @property
+    def sIsuNm(self):
+        """종목명"""
+        return self._data.get("sIsuNm")
+
+    @property
+    def sOrdNo(self):
+        """주문번호"""
+        return self._data.get("sOrdNo")
+
+    @property
+    def sOrgOrdNo(self):
+        """원주문번호"""
+        return self._data.get("sOrgOrdNo")
+
+    @property
+    def sExecNO(self):
+        """체결번호"""
+        return self._data.get("sExecNO")
+
+    @property
+    def sAbrdExecId(self):
+        """해외체결ID"""
+        return self._data.get("sAbrdExecId")
+
+    @property
+    def sOrdQty(self):
+        """주문수량"""
+        return to_number(self._data.get("sOrdQty"))
+
+    @property
+    def sOrdPrc(self):
+        """주문가"""
+        return to_number(self._data.get("sOrdPrc"))
+
+    @property
+    def sExecQty(self):
+        """체결수량"""
+        return to_number(self._data.get("sExecQty"))
+
+    @property
+    def sExecPrc(self):
+        """체결가"""
+        return to_number(self._data.get("sExecPrc"))
+
+    @property
+    def sMdfyCnfQty(self):
+        """정정확인수량"""
+        return to_number(self._data.get("sMdfyCnfQty"))
+
+    @property
+    def sMdfyCnfPrc(self):
+        """정정확인가"""
+        return to_number(self._data.get("sMdfyCnfPrc"))
+
+    @property
+    def sCancCnfQty(self):
+        """취소확인수량"""
+        return to_number(self._data.get("sCancCnfQty"))
+
+    @property
+    def sRjtQty(self):
+        """거부수량"""
+        return to_number(self._data.get("sRjtQty"))
+
+    @property
+    def sOrdTrxPtnCode(self):
+        """주문처리유형코드"""
+        return self._data.get("sOrdTrxPtnCode")
+
+    @property
+    def sMtiordSeqno(self):
+        """복수주문일련번호"""
+        return self._data.get("sMtiordSeqno")
+
+    @property
+    def sOrdCndi(self):
+        """주문조건"""
+        return self._data.get("sOrdCndi")
+
+    @property
+    def sOrdprcPtnCode(self):
+        """호가유형코드"""
+        return self._data.get("sOrdprcPtnCode")
+
+    @property
+    def sShtnIsuNo(self):
+        """단축종목번호"""
+        return self._data.get("sShtnIsuNo")
+
+    @property
+    def sOpDrtnNo(self):
+        """운용지시번호"""
+        return self._data.get("sOpDrtnNo")
+
+    @property
+    def sUnercQty(self):
+        """미체결수량(주문)"""
+        return self._data.get("sUnercQty")
+
+    @property
+    def sOrgOrdUnercQty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("sOrgOrdUnercQty"))
+
+    @property
+    def sOrgOrdMdfyQty(self):
+        """원주문정정수량"""
+        return to_number(self._data.get("sOrgOrdMdfyQty"))
+
+    @property
+    def sOrgOrdCancQty(self):
+        """원주문취소수량"""
+        return to_number(self._data.get("sOrgOrdCancQty"))
+
+    @property
+    def sOrdAvrExecPrc(self):
+        """주문평균체결가"""
+        return to_number(self._data.get("sOrdAvrExecPrc"))
+
+    @property
+    def sOrdAmt(self):
+        """주문금액"""
+        return to_number(self._data.get("sOrdAmt"))
+
+    @property
+    def sStdIsuNo(self):
+        """표준종목번호"""
+        return self._data.get("sStdIsuNo")
+
+    @property
+    def sBnsTp(self):
+        """매매구분"""
+        return self._data.get("sBnsTp")
+
+    @property
+    def sCommdaCode(self):
+        """통신매체코드"""
+        return self._data.get("sCommdaCode")
+
+    @property
+    def sOrdAcntNo(self):
+        """주문계좌번호"""
+        return self._data.get("sOrdAcntNo")
+
+    @property
+    def sAgrgtBrnNo(self):
+        """집계지점번호"""
+        return self._data.get("sAgrgtBrnNo")
+
+    @property
+    def sRegMktCode(self):
+        """등록시장코드"""
+        return self._data.get("sRegMktCode")
+
+    @property
+    def sMnyMgnRat(self):
+        """현금증거금률"""
+        return to_float(self._data.get("sMnyMgnRat"))
+
+    @property
+    def sSubstMgnRat(self):
+        """대용증거금률"""
+        return to_float(self._data.get("sSubstMgnRat"))
+
+    @property
+    def sMnyExecAmt(self):
+        """현금체결금액"""
+        return to_number(self._data.get("sMnyExecAmt"))
+
+    @property
+    def sSubstExecAmt(self):
+        """대용체결금액"""
+        return to_number(self._data.get("sSubstExecAmt"))
+
+    @property
+    def sCmsnAmtExecAmt(self):
+        """수수료체결금액"""
+        return to_number(self._data.get("sCmsnAmtExecAmt"))
+
+    @property
+    def sPrdayRuseExecVal(self):
+        """전일재사용체결금액"""
+        return to_number(self._data.get("sPrdayRuseExecVal"))
+
+    @property
+    def sCrdayRuseExecVal(self):
+        """금일재사용체결금액"""
+        return to_number(self._data.get("sCrdayRuseExecVal"))
+
+    @property
+    def sSpotExecQty(self):
+        """실물체결수량"""
+        return to_number(self._data.get("sSpotExecQty"))
+
+    @property
+    def sStslExecQty(self):
+        """공매도체결수량"""
+        return to_number(self._data.get("sStslExecQty"))
+
+    @property
+    def sStrtgCode(self):
+        """전략코드"""
+        return self._data.get("sStrtgCode")
+
+    @property
+    def sGrpId(self):
+        """그룹ID"""
+        return self._data.get("sGrpId")
+
+    @property
+    def sOrdSeqno(self):
+        """주문회차"""
+        return self._data.get("sOrdSeqno")
+
+    @property
+    def sOrdUserId(self):
+        """주문자ID"""
+        return self._data.get("sOrdUserId")
+
+    @property
+    def sExecTime(self):
+        """체결시각"""
+        return self._data.get("sExecTime")
+
+    @property
+    def sRcptExecTime(self):
+        """거래소수신체결시각"""
+        return self._data.get("sRcptExecTime")
+
+    @property
+    def sRjtRsn(self):
+        """거부사유"""
+        return self._data.get("sRjtRsn")
+
+    @property
+    def sSecBalQty(self):
+        """잔고수량"""
+        return to_number(self._data.get("sSecBalQty"))
+
+    @property
+    def sSpotOrdAbleQty(self):
+        """실물주문가능수량"""
+        return to_number(self._data.get("sSpotOrdAbleQty"))
+
+    @property
+    def sOrdAbleRuseQty(self):
+        """주문가능재사용수량"""
+        return to_number(self._data.get("sOrdAbleRuseQty"))
+
+    @property
+    def sFlctQty(self):
+        """변동수량"""
+        return to_number(self._data.get("sFlctQty"))
+
+    @property
+    def sSecBalQtyD2(self):
+        """잔고수량(D2)"""
+        return self._data.get("sSecBalQtyD2")
+
+    @property
+    def sSellAbleQty(self):
+        """매도주문가능수량"""
+        return to_number(self._data.get("sSellAbleQty"))
+
+    @property
+    def sUnercSellOrdQty(self):
+        """미체결매도주문수량"""
+        return to_number(self._data.get("sUnercSellOrdQty"))
+
+    @property
+    def sAvrPchsPrc(self):
+        """평균매입가"""
+        return to_number(self._data.get("sAvrPchsPrc"))
+
+    @property
+    def sPchsAmt(self):
+        """매입금액"""
+        return to_number(self._data.get("sPchsAmt"))
+
+    @property
+    def sDeposit(self):
+        """예수금"""
+        return to_number(self._data.get("sDeposit"))
+
+    @property
+    def sSubstAmt(self):
+        """대용금"""
+        return to_number(self._data.get("sSubstAmt"))
+
+    @property
+    def sCsgnMnyMgn(self):
+        """위탁현금증거금액"""
+        return to_number(self._data.get("sCsgnMnyMgn"))
+
+    @property
+    def sCsgnSubstMgn(self):
+        """위탁대용증거금액"""
+        return to_number(self._data.get("sCsgnSubstMgn"))
+
+    @property
+    def sOrdAbleMny(self):
+        """주문가능현금"""
+        return to_number(self._data.get("sOrdAbleMny"))
+
+    @property
+    def sOrdAbleSubstAmt(self):
+        """주문가능대용금액"""
+        return to_number(self._data.get("sOrdAbleSubstAmt"))
+
+    @property
+    def sRuseAbleAmt(self):
+        """재사용가능금액"""
+        return to_number(self._data.get("sRuseAbleAmt"))
+
+    @property
+    def sMgntrnCode(self):
+        """신용거래코드"""
+        return self._data.get("sMgntrnCode")
+
+
+class AS4Tick(RealtimeRecord):
+    """[AS4] 해외주식주문거부(미국)"""
+    __slots__ = ()
+    TR_CODE = "AS4"
+    FIELDS = ("lineseq", "accno", "user", "len", "gubun", "compress", "encrypt", "offset", "trcode", "comid", "userid", "media", "ifid", "seq", "trid", "pubip", "prvip", "pcbpno", "bpno", "termno", "lang", "proctm", "msgcode", "outgu", "compreq", "funckey", "reqcnt", "filler", "cont", "contkey", "varlen", "varhdlen", "varmsglen", "trsrc", "eventid", "ifinfo", "filler1", "sOrdxctPtnCode", "sOrdMktCode", "sOrdPtnCode", "sMgmtBrnNo", "sAcntNo", "sAcntNm", "sIsuNo", "sIsuNm", "sOrdNo", "sOrgOrdNo", "sExecNO", "sAbrdExecId", "sOrdQty", "sOrdPrc", "sExecQty", "sExecPrc", "sMdfyCnfQty", "sMdfyCnfPrc", "sCancCnfQty", "sRjtQty", "sOrdTrxPtnCode", "sMtiordSeqno", "sOrdCndi", "sOrdprcPtnCode", "sShtnIsuNo", "sOpDrtnNo", "sUnercQty", "sOrgOrdUnercQty", "sOrgOrdMdfyQty", "sOrgOrdCancQty", "sOrdAvrExecPrc", "sOrdAmt", "sStdIsuNo", "sBnsTp", "sCommdaCode", "sOrdAcntNo", "sAgrgtBrnNo", "sRegMktCode", "sMnyMgnRat", "sSubstMgnRat", "sMnyExecAmt", "sSubstExecAmt", "sCmsnAmtExecAmt", "sPrdayRuseExecVal", "sCrdayRuseExecVal", "sSpotExecQty", "sStslExecQty", "sStrtgCode", "sGrpId", "sOrdSeqno", "sOrdUserId", "sExecTime", "sRcptExecTime", "sRjtRsn", "sSecBalQty", "sSpotOrdAbleQty", "sOrdAbleRuseQty", "sFlctQty", "sSecBalQtyD2", "sSellAbleQty", "sUnercSellOrdQty", "sAvrPchsPrc", "sPchsAmt", "sDeposit", "sSubstAmt", "sCsgnMnyMgn")
+
+    @property
+    def lineseq(self):
+        """라인일련번호"""
+        return self._data.get("lineseq")
+
+    @property
+    def accno(self):
+        """계좌번호"""
+        return self._data.get("accno")
+
+    @property
+    def user(self):
+        """조작자ID"""
+        return self._data.get("user")
+
+    @property
+    def len(self):
+        """헤더길이"""
+        return self._data.get("len")
+
+    @property
+    def gubun(self):
+        """헤더구분"""
+        return self._data.get("gubun")
+
+    @property
+    def compress(self):
+        """압축구분"""
+        return self._data.get("compress")
+
+    @property
+    def encrypt(self):
+        """암호구분"""
+        return self._data.get("encrypt")
+
+    @property
+    def offset(self):
+        """공통시작지점"""
+        return self._data.get("offset")
+
+    @property
+    def trcode(self):
+        """TRCODE"""
+        return self._data.get("trcode")
+
+    @property
+    def comid(self):
+        """이용사번호"""
+        return self._data.get("comid")
+
+    @property
+    def userid(self):
+        """사용자ID"""
+        return self._data.get("userid")
+
+    @property
+    def media(self):
+        """접속매체"""
+        return self._data.get("media")
+
+    @property
+    def ifid(self):
+        """I/F일련번호"""
+        return self._data.get("ifid")
+
+    @property
+    def seq(self):
+        """전문일련번호"""
+        return self._data.get("seq")
+
+    @property
+    def trid(self):
+        """TR추적ID"""
+        return self._data.get("trid")
+
+    @property
+    def pubip(self):
+        """공인IP"""
+        return self._data.get("pubip")
+
+    @property
+    def prvip(self):
+        """사설IP"""
+        return self._data.get("prvip")
+
+    @property
+    def pcbpno(self):
+        """처리지점번호"""
+        return self._data.get("pcbpno")
+
+    @property
+    def bpno(self):
+        """지점번호"""
+        return self._data.get("bpno")
+
+    @property
+    def termno(self):
+        """단말번호"""
+        return self._data.get("termno")
+
+    @property
+    def lang(self):
+        """언어구분"""
+        return self._data.get("lang")
+
+    @property
+    def proctm(self):
+        """AP처리시간"""
+        return self._data.get("proctm")
+
+    @property
+    def msgcode(self):
+        """메세지코드"""
+        return self._data.get("msgcode")
+
+    @property
+    def outgu(self):
+        """메세지출력구분"""
+        return self._data.get("outgu")
+
+    @property
+    def compreq(self):
+        """압축요청구분"""
+        return self._data.get("compreq")
+
+    @property
+    def funckey(self):
+        """기능키"""
+        return self._data.get("funckey")
+
+    @property
+    def reqcnt(self):
+        """요청레코드개수"""
+        return to_number(self._data.get("reqcnt"))
+
+    @property
+    def filler(self):
+        """예비영역"""
+        return self._data.get("filler")
+
+    @property
+    def cont(self):
+        """연속구분"""
+        return self._data.get("cont")
+
+    @property
+    def contkey(self):
+        """연속키값"""
+        return self._data.get("contkey")
+
+    @property
+    def varlen(self):
+        """가변시스템길이"""
+        return self._data.get("varlen")
+
+    @property
+    def varhdlen(self):
+        """가변해더길이"""
+        return self._data.get("varhdlen")
+
+    @property
+    def varmsglen(self):
+        """가변메시지길이"""
+        return self._data.get("varmsglen")
+
+    @property
+    def trsrc(self):
+        """조회발원지"""
+        return self._data.get("trsrc")
+
+    @property
+    def eventid(self):
+        """I/F이벤트ID"""
+        return self._data.get("eventid")
+
+    @property
+    def ifinfo(self):
+        """I/F정보"""
+        return self._data.get("ifinfo")
+
+    @property
+    def filler1(self):
+        """예비영역"""
+        return self._data.get("filler1")
+
+    @property
+    def sOrdxctPtnCode(self):
+        """주문체결유형코드"""
+        return self._data.get("sOrdxctPtnCode")
+
+    @property
+    def sOrdMktCode(self):
+        """주문시장코드"""
+        return self._data.get("sOrdMktCode")
+
+    @property
+    def sOrdPtnCode(self):
+        """주문유형코드"""
+        return self._data.get("sOrdPtnCode")
+
+    @property
+    def sMgmtBrnNo(self):
+        """관리지점번호"""
+        return self._data.get("sMgmtBrnNo")
+
+    @property
+    def sAcntNo(self):
+        """계좌번호"""
+        return self._data.get("sAcntNo")
+
+    @property
+    def sAcntNm(self):
+        """계좌명"""
+        return self._data.get("sAcntNm")
+
+    @property
+    def sIsuNo(self):
+        """종목번호"""
+        return self._data.get("sIsuNo")
+
+    @property
+    def sIsuNm(self):
+        """종목명"""
+        return self._data.get("sIsuNm")
+
+    @property
+    def sOrdNo(self):
+        """주문번호"""
+        return self._data.get("sOrdNo")
+
+    @property
+    def sOrgOrdNo(self):
+        """원주문번호"""
+        return self._data.get("sOrgOrdNo")
+
+    @property
+    def sExecNO(self):
+        """체결번호"""
+        return self._data.get("sExecNO")
+
+    @property
+    def sAbrdExecId(self):
+        """해외체결ID"""
+        return self._data.get("sAbrdExecId")
+
+    @property
+    def sOrdQty(self):
+        """주문수량"""
+        return to_number(self._data.get("sOrdQty"))
+
+    @property
+    def sOrdPrc(self):
+        """주문가"""
+        return to_number(self._data.get("sOrdPrc"))
+
+    @property
+    def sExecQty(self):
+        """체결수량"""
+        return to_number(self._data.get("sExecQty"))
+
+    @property
+    def sExecPrc(self):
+        """체결가"""
+        return to_number(self._data.get("sExecPrc"))
+
+    @property
+    def sMdfyCnfQty(self):
+        """정정확인수량"""
+        return to_number(self._data.get("sMdfyCnfQty"))
+
+    @property
+    def sMdfyCnfPrc(self):
+        """정정확인가"""
+        return to_number(self._data.get("sMdfyCnfPrc"))
+
+    @property
+    def sCancCnfQty(self):
+        """취소확인수량"""
+        return to_number(self._data.get("sCancCnfQty"))
+
+    @property
+    def sRjtQty(self):
+        """거부수량"""
+        return to_number(self._data.get("sRjtQty"))
+
+    @property
+    def sOrdTrxPtnCode(self):
+        """주문처리유형코드"""
+        return self._data.get("sOrdTrxPtnCode")
+
+    @property
+    def sMtiordSeqno(self):
+        """복수주문일련번호"""
+        return self._data.get("sMtiordSeqno")
+
+    @property
+    def sOrdCndi(self):
+        """주문조건"""
+        return self._data.get("sOrdCndi")
+
+    @property
+    def sOrdprcPtnCode(self):
+        """호가유형코드"""
+        return self._data.get("sOrdprcPtnCode")
+
+    @property
+    def sShtnIsuNo(self):
+        """단축종목번호"""
+        return self._data.get("sShtnIsuNo")
+
+    @property
+    def sOpDrtnNo(self):
+        """운용지시번호"""
+        return self._data.get("sOpDrtnNo")
+
+    @property
+    def sUnercQty(self):
+        """미체결수량(주문)"""
+        return self._data.get("sUnercQty")
+
+    @property
+    def sOrgOrdUnercQty(self):
+        """원주문미체결수량"""
+        return to_number(self._data.get("sOrgOrdUnercQty"))
+
+    @property
+    def sOrgOrdMdfyQty(self):
+        """원주문정정수량"""
+        return to_number(self._data.get("sOrgOrdMdfyQty"))
+
+    @property
+    def sOrgOrdCancQty(self):
+        """원주문취소수량"""
+        return to_number(self._data.get("sOrgOrdCancQty"))
+
+    @property
+    def sOrdAvrExecPrc(self):
+        """주문평균체결가"""
+        return to_number(self._data.get("sOrdAvrExecPrc"))
+
+    @property
+    def sOrdAmt(self):
+        """주문금액"""
+        return to_number(self._data.get("sOrdAmt"))
+
+    @property
+    def sStdIsuNo(self):
+        """표준종목번호"""
+        return self._data.get("sStdIsuNo")
+
+    @property
+    def sBnsTp(self):
+        """매매구분"""
+        return self._data.get("sBnsTp")
+
+    @property
+    def sCommdaCode(self):
+        """통신매체코드"""
+        return self._data.get("sCommdaCode")
+
+    @property
+    def sOrdAcntNo(self):
+        """주문계좌번호"""
+        return self._data.get("sOrdAcntNo")
+
+    @property
+    def sAgrgtBrnNo(self):
+        """집계지점번호"""
+        return self._data.get("sAgrgtBrnNo")
+
+    @property
+    def sRegMktCode(self):
+        """등록시장코드"""
+        return self._data.get("sRegMktCode")
+
+    @property
+    def sMnyMgnRat(self):
+        """현금증거금률"""
+        return to_float(self._data.get("sMnyMgnRat"))
+
+    @property
+    def sSubstMgnRat(self):
+        """대용증거금률"""
+        return to_float(self._data.get("sSubstMgnRat"))
+
+    @property
+    def sMnyExecAmt(self):
+        """현금체결금액"""
+        return to_number(self._data.get("sMnyExecAmt"))
+
+    @property
+    def sSubstExecAmt(self):
+        """대용체결금액"""
+        return to_number(self._data.get("sSubstExecAmt"))
+
+    @property
+    def sCmsnAmtExecAmt(self):
+        """수수료체결금액"""
+        return to_number(self._data.get("sCmsnAmtExecAmt"))
+
+    @property
+    def sPrdayRuseExecVal(self):
+        """전일재사용체결금액"""
+        return to_number(self._data.get("sPrdayRuseExecVal"))
+
+    @property
+    def sCrdayRuseExecVal(self):
+        """금일재사용체결금액"""
+        return to_number(self._data.get("sCrdayRuseExecVal"))
+
+    @property
+    def sSpotExecQty(self):
+        """실물체결수량"""
+        return to_number(self._data.get("sSpotExecQty"))
+
+    @property
+    def sStslExecQty(self):
+        """공매도체결수량"""
+        return to_number(self._data.get("sStslExecQty"))
+
+    @property
+    def sStrtgCode(self):
+        """전략코드"""
+        return self._data.get("sStrtgCode")
+
+    @property
+    def sGrpId(self):
+        """그룹ID"""
+        return self._data.get("sGrpId")
+
+    @property
+    def sOrdSeqno(self):
+        """주문회차"""
+        return self._data.get("sOrdSeqno")
+
+    @property
+    def sOrdUserId(self):
+        """주문자ID"""
+        return self._data.get("sOrdUserId")
+
+    @property
+    def sExecTime(self):
+        """체결시각"""
+        return self._data.get("sExecTime")
+
+    @property
+    def sRcptExecTime(self):
+        """거래소수신체결시각"""
+        return self._data.get("sRcptExecTime")
+
+    @property
+    def sRjtRsn(self):
+        """거부사유"""
+        return self._data.get("sRjtRsn")
+
+    @property
+    def sSecBalQty(self):
+        """잔고수량"""
+        return to_number(self._data.get("sSecBalQty"))
+
+    @property
+    def sSpotOrdAbleQty(self):
+        """실물주문가능수량"""
+        return to_number(self._data.get("sSpotOrdAbleQty"))
+
+    @property
+    def sOrdAbleRuseQty(self):
+        """주문가능재사용수량"""
+        return to_number(self._data.get("sOrdAbleRuseQty"))
+
+    @property
+    def sFlctQty(self):
+        """변동수량"""
+        return to_number(self._data.get("sFlctQty"))
+
+    @property
+    def sSecBalQtyD2(self):
+        """잔고수량(D2)"""
+        return self._data.get("sSecBalQtyD2")
+
+    @property
+    def sSellAbleQty(self):
+        """매도주문가능수량"""
+        return to_number(self._data.get("sSellAbleQty"))
+
+    @property
+    def sUnercSellOrdQty(self):
+        """미체결매도주문수량"""
+        return to_number(self._data.get("sUnercSellOrdQty"))
+
+    @property
+    def sAvrPchsPrc(self):
+        """평균매입가"""
+        return to_number(self._data.get("sAvrPchsPrc"))
+
+    @property
+    def sPchsAmt(self):
+        """매입금액"""
+        return to_number(self._data.get("sPchsAmt"))
+
+    @property
+    def sDeposit(self):
+        """예수금"""
+        return to_number(self._data.get("sDeposit"))
+
+    @property
+    def sSubstAmt(self):
+        """대용금"""
+        return to_number(self._data.get("sSubstAmt"))
+
+    @property
+    def sCsgnMnyMgn(self):
+        """위탁현금증거금액"""
+        return to_number(self._data.get("sCsgnMnyMgn"))
+
+
+class GSHTick(RealtimeRecord):
+    """[GSH] 해외주식 호가"""
+    __slots__ = ()
+    TR_CODE = "GSH"
+    FIELDS = ("symbol", "loctime", "kortime", "offerho1", "bidho1", "offerrem1", "bidrem1", "offerno1", "bidno1", "offerho2", "bidho2", "offerrem2", "bidrem2", "offerno2", "bidno2", "offerho3", "bidho3", "offerrem3", "bidrem3", "offerno3", "bidno3", "offerho4", "bidho4", "offerrem4", "bidrem4", "offerno4", "bidno4", "offerho5", "bidho5", "offerrem5", "bidrem5", "offerno5", "bidno5", "offerho6", "bidho6", "offerrem6", "bidrem6", "offerno6", "bidno6", "offerho7", "bidho7", "offerrem7", "bidrem7", "offerno7", "bidno7", "offerho8", "bidho8", "offerrem8", "bidrem8", "offerno8", "bidno8", "offerho9", "bidho9", "offerrem9", "bidrem9", "offerno9", "bidno9", "offerho10", "bidho10", "offerrem10", "bidrem10", "offerno10", "bidno10", "totoffercnt", "totbidcnt", "totofferrem", "totbidrem")
+
+    @property
+    def symbol(self):
+        """종목코드"""
+        return self._data.get("symbol")
+
+    @property
+    def loctime(self):
+        """현지호가시간"""
+        return self._data.get("loctime")
+
+    @property
+    def kortime(self):
+        """한국호가시간"""
+        return self._data.get("kortime")
+
+    @property
+    def offerho1(self):
+        """매도호가1"""
+        return to_float(self._data.get("offerho1"))
+
+    @property
+    def bidho1(self):
+        """매수호가1"""
+        return to_float(self._data.get("bidho1"))
+
+    @property
+    def offerrem1(self):
+        """매도호가잔량1"""
+        return to_number(self._data.get("offerrem1"))
+
+    @property
+    def bidrem1(self):
+        """매수호가잔량1"""
+        return to_number(self._data.get("bidrem1"))
+
+    @property
+    def offerno1(self):
+        """매도호가건수1"""
+        return to_number(self._data.get("offerno1"))
+
+    @property
+    def bidno1(self):
+        """매수호가건수1"""
+        return to_number(self._data.get("bidno1"))
+
+    @property
+    def offerho2(self):
+        """매도호가2"""
+        return to_float(self._data.get("offerho2"))
+
+    @property
+    def bidho2(self):
+        """매수호가2"""
+        return to_float(self._data.get("bidho2"))
+
+    @property
+    def offerrem2(self):
+        """매도호가잔량2"""
+        return to_number(self._data.get("offerrem2"))
+
+    @property
+    def bidrem2(self):
+        """매수호가잔량2"""
+        return to_number(self._data.get("bidrem2"))
+
+    @property
+    def offerno2(self):
+        """매도호가건수2"""
+        return to_number(self._data.get("offerno2"))
+
+    @property
+    def bidno2(self):
+        """매수호가건수2"""
+        return to_number(self._data.get("bidno2"))
+
+    @property
+    def offerho3(self):
+        """매도호가3"""
+        return to_float(self._data.get("offerho3"))
+
+    @property
+    def bidho3(self):
+        """매수호가3"""
+        return to_float(self._data.get("bidho3"))
+
+    @property
+    def offerrem3(self):
+        """매도호가잔량3"""
+        return to_number(self._data.get("offerrem3"))
+
+    @property
+    def bidrem3(self):
+        """매수호가잔량3"""
+        return to_number(self._data.get("bidrem3"))
+
+    @property
+    def offerno3(self):
+        """매도호가건수3"""
+        return to_number(self._data.get("offerno3"))
+
+    @property
+    def bidno3(self):
+        """매수호가건수3"""
+        return to_number(self._data.get("bidno3"))
+
+    @property
+    def offerho4(self):
+        """매도호가4"""
+        return to_float(self._data.get("offerho4"))
+
+    @property
+    def bidho4(self):
+        """매수호가4"""
+        return to_float(self._data.get("bidho4"))
+
+    @property
+    def offerrem4(self):
+        """매도호가잔량4"""
+        return to_number(self._data.get("offerrem4"))
+
+    @property
+    def bidrem4(self):
+        """매수호가잔량4"""
+        return to_number(self._data.get("bidrem4"))
+
+    @property
+    def offerno4(self):
+        """매도호가건수4"""
+        return to_number(self._data.get("offerno4"))
+
+    @property
+    def bidno4(self):
+        """매수호가건수4"""
+        return to_number(self._data.get("bidno4"))
+
+    @property
+    def offerho5(self):
+        """매도호가5"""
+        return to_float(self._data.get("offerho5"))
+
+    @property
+    def bidho5(self):
+        """매수호가5"""
+        return to_float(self._data.get("bidho5"))
+
+    @property
+    def offerrem5(self):
+        """매도호가잔량5"""
+        return to_number(self._data.get("offerrem5"))
+
+    @property
+    def bidrem5(self):
+        """매수호가잔량5"""
+        return to_number(self._data.get("bidrem5"))
+
+    @property
+    def offerno5(self):
+        """매도호가건수5"""
+        return to_number(self._data.get("offerno5"))
+
+    @property
+    def bidno5(self):
+        """매수호가건수5"""
+        return to_number(self._data.get("bidno5"))
+
+    @property
+    def offerho6(self):
+        """매도호가6"""
+        return to_float(self._data.get("offerho6"))
+
+    @property
+    def bidho6(self):
+        """매수호가6"""
+        return to_float(self._data.get("bidho6"))
+
+    @property
+    def offerrem6(self):
+        """매도호가잔량6"""
+        return to_number(self._data.get("offerrem6"))
+
+    @property
+    def bidrem6(self):
+        """매수호가잔량6"""
+        return to_number(self._data.get("bidrem6"))
+
+    @property
+    def offerno6(self):
+        """매도호가건수6"""
+        return to_number(self._data.get("offerno6"))
+
+    @property
+    def bidno6(self):
+        """매수호가건수6"""
+        return to_number(self._data.get("bidno6"))
+
+    @property
+    def offerho7(self):
+        """매도호가7"""
+        return to_float(self._data.get("offerho7"))
+
+    @property
+    def bidho7(self):
+        """매수호가7"""
+        return to_float(self._data.get("bidho7"))
+
+    @property
+    def offerrem7(self):
+        """매도호가잔량7"""
+        return to_number(self._data.get("offerrem7"))
+
+    @property
+    def bidrem7(self):
+        """매수호가잔량7"""
+        return to_number(self._data.get("bidrem7"))
+
+    @property
+    def offerno7(self):
+        """매도호가건수7"""
+        return to_number(self._data.get("offerno7"))
+
+    @property
+    def bidno7(self):
+        """매수호가건수7"""
+        return to_number(self._data.get("bidno7"))
+
+    @property
+    def offerho8(self):
+        """매도호가8"""
+        return to_float(self._data.get("offerho8"))
+
+    @property
+    def bidho8(self):
+        """매수호가8"""
+        return to_float(self._data.get("bidho8"))
+
+    @property
+    def offerrem8(self):
+        """매도호가잔량8"""
+        return to_number(self._data.get("offerrem8"))
+
+    @property
+    def bidrem8(self):
+        """매수호가잔량8"""
+        return to_number(self._data.get("bidrem8"))
+
+    @property
+    def offerno8(self):
+        """매도호가건수8"""
+        return to_number(self._data.get("offerno8"))
+
+    @property
+    def bidno8(self):
+        """매수호가건수8"""
+        return to_number(self._data.get("bidno8"))
+
+    @property
+    def offerho9(self):
+        """매도호가9"""
+        return to_float(self._data.get("offerho9"))
+
+    @property
+    def bidho9(self):
+        """매수호가9"""
+        return to_float(self._data.get("bidho9"))
+
+    @property
+    def offerrem9(self):
+        """매도호가잔량9"""
+        return to_number(self._data.get("offerrem9"))
+
+    @property
+    def bidrem9(self):
+        """매수호가잔량9"""
+        return to_number(self._data.get("bidrem9"))
+
+    @property
+    def offerno9(self):
+        """매도호가건수9"""
+        return to_number(self._data.get("offerno9"))
+
+    @property
+    def bidno9(self):
+        """매수호가건수9"""
+        return to_number(self._data.get("bidno9"))
+
+    @property
+    def offerho10(self):
+        """매도호가10"""
+        return to_float(self._data.get("offerho10"))
+
+    @property
+    def bidho10(self):
+        """매수호가10"""
+        return to_float(self._data.get("bidho10"))
+
+    @property
+    def offerrem10(self):
+        """매도호가잔량10"""
+        return to_number(self._data.get("offerrem10"))
+
+    @property
+    def bidrem10(self):
+        """매수호가잔량10"""
+        return to_number(self._data.get("bidrem10"))
+
+    @property
+    def offerno10(self):
+        """매도호가건수10"""
+        return to_number(self._data.get("offerno10"))
+
+    @property
+    def bidno10(self):
+        """매수호가건수10"""
+        return to_number(self._data.get("bidno10"))
+
+    @property
+    def totoffercnt(self):
+        """매도호가총건수"""
+        return to_number(self._data.get("totoffercnt"))
+
+    @property
+    def totbidcnt(self):
+        """매수호가총건수"""
+        return to_number(self._data.get("totbidcnt"))
+
+    @property
+    def totofferrem(self):
+        """매도호가총수량"""
+        return to_number(self._data.get("totofferrem"))
+
+    @property
+    def totbidrem(self):
+        """매수호가총수량"""
+        return to_number(self._data.get("totbidrem"))
+
+
+class GSCTick(RealtimeRecord):
+    """[GSC] 해외주식 체결"""
+    __slots__ = ()
+    TR_CODE = "GSC"
+    FIELDS = ("symbol", "ovsdate", "kordate", "trdtm", "kortm", "sign", "price", "diff", "rate", "open", "high", "low", "trdq", "totq", "cgubun", "lSeq", "amount", "high52p", "low52p")
+
+    @property
+    def symbol(self):
+        """종목코드"""
+        return self._data.get("symbol")
+
+    @property
+    def ovsdate(self):
+        """체결일자(현지)"""
+        return self._data.get("ovsdate")
+
+    @property
+    def kordate(self):
+        """체결일자(한국)"""
+        return self._data.get("kordate")
+
+    @property
+    def trdtm(self):
+        """체결시간(현지)"""
+        return self._data.get("trdtm")
+
+    @property
+    def kortm(self):
+        """체결시간(한국)"""
+        return self._data.get("kortm")
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def price(self):
+        """체결가격"""
+        return to_float(self._data.get("price"))
+
+    @property
+    def diff(self):
+        """전일대비"""
+        return to_float(self._data.get("diff"))
+
+    @property
+    def rate(self):
+        """등락율"""
+        return to_float(self._data.get("rate"))
+
+    @property
+    def open(self):
+        """시가"""
+        return to_float(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_float(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_float(self._data.get("low"))
+
+    @property
+    def trdq(self):
+        """건별체결수량"""
+        return to_number(self._data.get("trdq"))
+
+    @property
+    def totq(self):
+        """누적체결수량"""
+        return to_number(self._data.get("totq"))
+
+    @property
+    def cgubun(self):
+        """체결구분"""
+        return self._data.get("cgubun")
+
+    @property
+    def lSeq(self):
+        """초당시퀀스"""
+        return self._data.get("lSeq")
+
+    @property
+    def amount(self):
+        """누적거래대금"""
+        return to_number(self._data.get("amount"))
+
+    @property
+    def high52p(self):
+        """52주고가"""
+        return to_float(self._data.get("high52p"))
+
+    @property
+    def low52p(self):
+        """52주저가"""
+        return to_float(self._data.get("low52p"))
+
+
+class JIFTick(RealtimeRecord):
+    """[JIF] 장운영정보"""
+    __slots__ = ()
+    TR_CODE = "JIF"
+    FIELDS = ("jangubun", "jstatus")
+
+    @property
+    def jangubun(self):
+        """장구분"""
+        return self._data.get("jangubun")
+
+    @property
+    def jstatus(self):
+        """장상태"""
+        return self._data.get("jstatus")
+
+
+class NWSTick(RealtimeRecord):
+    """[NWS] 실시간뉴스제목패킷"""
+    __slots__ = ()
+    TR_CODE = "NWS"
+    FIELDS = ("date", "time", "id", "realkey", "title", "code", "bodysize")
+
+    @property
+    def date(self):
+        """날짜"""
+        return self._data.get("date")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def id(self):
+        """뉴스구분자"""
+        return self._data.get("id")
+
+    @property
+    def realkey(self):
+        """키값"""
+        return self._data.get("realkey")
+
+    @property
+    def title(self):
+        """제목"""
+        return self._data.get("title")
+
+    @property
+    def code(self):
+        """단축종목코드"""
+        return self._data.get("code")
+
+    @property
+    def bodysize(self):
+        """BODY길이"""
+        return self._data.get("bodysize")
+
+
+class BMTTick(RealtimeRecord):
+    """[BMT] 시간대별투자자매매추이"""
+    __slots__ = ()
+    TR_CODE = "BMT"
+    FIELDS = ("tjjtime", "tjjcode1", "msvolume1", "mdvolume1", "msvol1", "msvalue1", "mdvalue1", "msval1", "tjjcode2", "msvolume2", "mdvolume2", "msvol2", "msvalue2", "mdvalue2", "msval2", "tjjcode3", "msvolume3", "mdvolume3", "msvol3", "msvalue3", "mdvalue3", "msval3", "tjjcode4", "msvolume4", "mdvolume4", "msvol4", "msvalue4", "mdvalue4", "msval4", "tjjcode5", "msvolume5", "mdvolume5", "msvol5", "msvalue5", "mdvalue5", "msval5", "tjjcode6", "msvolume6", "mdvolume6", "msvol6", "msvalue6", "mdvalue6", "msval6", "tjjcode7", "msvolume7", "mdvolume7", "msvol7", "msvalue7", "mdvalue7", "msval7", "tjjcode8", "msvolume8", "mdvolume8", "msvol8", "msvalue8", "mdvalue8", "msval8", "tjjcode9", "msvolume9", "mdvolume9", "msvol9", "msvalue9", "mdvalue9", "msval9", "tjjcode10", "msvolume10", "mdvolume10", "msvol10", "msvalue10", "mdvalue10", "msval10", "tjjcode11", "msvolume11", "mdvolume11", "msvol11", "msvalue11", "mdvalue11", "msval11", "upcode", "tjjcode0", "msvolume0", "mdvolume0", "msvol0", "msvalue0", "mdvalue0", "msval0")
+
+    @property
+    def tjjtime(self):
+        """수신시간"""
+        return self._data.get("tjjtime")
+
+    @property
+    def tjjcode1(self):
+        """투자자코드1(개인)"""
+        return self._data.get("tjjcode1")
+
+    @property
+    def msvolume1(self):
+        """매수거래량1"""
+        return to_number(self._data.get("msvolume1"))
+
+    @property
+    def mdvolume1(self):
+        """매도거래량1"""
+        return to_number(self._data.get("mdvolume1"))
+
+    @property
+    def msvol1(self):
+        """거래량순매수1"""
+        return to_number(self._data.get("msvol1"))
+
+    @property
+    def msvalue1(self):
+        """매수거래대금1"""
+        return to_number(self._data.get("msvalue1"))
+
+    @property
+    def mdvalue1(self):
+        """매도거래대금1"""
+        return to_number(self._data.get("mdvalue1"))
+
+    @property
+    def msval1(self):
+        """거래대금순매수1"""
+        return to_number(self._data.get("msval1"))
+
+    @property
+    def tjjcode2(self):
+        """투자자코드2(외국인)"""
+        return self._data.get("tjjcode2")
+
+    @property
+    def msvolume2(self):
+        """매수거래량2"""
+        return to_number(self._data.get("msvolume2"))
+
+    @property
+    def mdvolume2(self):
+        """매도거래량2"""
+        return to_number(self._data.get("mdvolume2"))
+
+    @property
+    def msvol2(self):
+        """거래량순매수2"""
+        return to_number(self._data.get("msvol2"))
+
+    @property
+    def msvalue2(self):
+        """매수거래대금2"""
+        return to_number(self._data.get("msvalue2"))
+
+    @property
+    def mdvalue2(self):
+        """매도거래대금2"""
+        return to_number(self._data.get("mdvalue2"))
+
+    @property
+    def msval2(self):
+        """거래대금순매수2"""
+        return to_number(self._data.get("msval2"))
+
+    @property
+    def tjjcode3(self):
+        """투자자코드3(기관계)"""
+        return self._data.get("tjjcode3")
+
+    @property
+    def msvolume3(self):
+        """매수거래량3"""
+        return to_number(self._data.get("msvolume3"))
+
+    @property
+    def mdvolume3(self):
+        """매도거래량3"""
+        return to_number(self._data.get("mdvolume3"))
+
+    @property
+    def msvol3(self):
+        """거래량순매수3"""
+        return to_number(self._data.get("msvol3"))
+
+    @property
+    def msvalue3(self):
+        """매수거래대금3"""
+        return to_number(self._data.get("msvalue3"))
+
+    @property
+    def mdvalue3(self):
+        """매도거래대금3"""
+        return to_number(self._data.get("mdvalue3"))
+
+    @property
+    def msval3(self):
+        """거래대금순매수3"""
+        return to_number(self._data.get("msval3"))
+
+    @property
+    def tjjcode4(self):
+        """투자자코드4(증권)"""
+        return self._data.get("tjjcode4")
+
+    @property
+    def msvolume4(self):
+        """매수거래량4"""
+        return to_number(self._data.get("msvolume4"))
+
+    @property
+    def mdvolume4(self):
+        """매도거래량4"""
+        return to_number(self._data.get("mdvolume4"))
+
+    @property
+    def msvol4(self):
+        """거래량순매수4"""
+        return to_number(self._data.get("msvol4"))
+
+    @property
+    def msvalue4(self):
+        """매수거래대금4"""
+        return to_number(self._data.get("msvalue4"))
+
+    @property
+    def mdvalue4(self):
+        """매도거래대금4"""
+        return to_number(self._data.get("mdvalue4"))
+
+    @property
+    def msval4(self):
+        """거래대금순매수4"""
+        return to_number(self._data.get("msval4"))
+
+    @property
+    def tjjcode5(self):
+        """투자자코드5(투신)"""
+        return self._data.get("tjjcode5")
+
+    @property
+    def msvolume5(self):
+        """매수거래량5"""
+        return to_number(self._data.get("msvolume5"))
+
+    @property
+    def mdvolume5(self):
+        """매도거래량5"""
+        return to_number(self._data.get("mdvolume5"))
+
+    @property
+    def msvol5(self):
+        """거래량순매수5"""
+        return to_number(self._data.get("msvol5"))
+
+    @property
+    def msvalue5(self):
+        """매수거래대금5"""
+        return to_number(self._data.get("msvalue5"))
+
+    @property
+    def mdvalue5(self):
+        """매도거래대금5"""
+        return to_number(self._data.get("mdvalue5"))
+
+    @property
+    def msval5(self):
+        """거래대금순매수5"""
+        return to_number(self._data.get("msval5"))
+
+    @property
+    def tjjcode6(self):
+        """투자자코드6(은행)"""
+        return self._data.get("tjjcode6")
+
+    @property
+    def msvolume6(self):
+        """매수거래량6"""
+        return to_number(self._data.get("msvolume6"))
+
+    @property
+    def mdvolume6(self):
+        """매도거래량6"""
+        return to_number(self._data.get("mdvolume6"))
+
+    @property
+    def msvol6(self):
+        """거래량순매수6"""
+        return to_number(self._data.get("msvol6"))
+
+    @property
+    def msvalue6(self):
+        """매수거래대금6"""
+        return to_number(self._data.get("msvalue6"))
+
+    @property
+    def mdvalue6(self):
+        """매도거래대금6"""
+        return to_number(self._data.get("mdvalue6"))
+
+    @property
+    def msval6(self):
+        """거래대금순매수6"""
+        return to_number(self._data.get("msval6"))
+
+    @property
+    def tjjcode7(self):
+        """투자자코드7(보험)"""
+        return self._data.get("tjjcode7")
+
+    @property
+    def msvolume7(self):
+        """매수거래량7"""
+        return to_number(self._data.get("msvolume7"))
+
+    @property
+    def mdvolume7(self):
+        """매도거래량7"""
+        return to_number(self._data.get("mdvolume7"))
+
+    @property
+    def msvol7(self):
+        """거래량순매수7"""
+        return to_number(self._data.get("msvol7"))
+
+    @property
+    def msvalue7(self):
+        """매수거래대금7"""
+        return to_number(self._data.get("msvalue7"))
+
+    @property
+    def mdvalue7(self):
+        """매도거래대금7"""
+        return to_number(self._data.get("mdvalue7"))
+
+    @property
+    def msval7(self):
+        """거래대금순매수7"""
+        return to_number(self._data.get("msval7"))
+
+    @property
+    def tjjcode8(self):
+        """투자자코드8(종금)"""
+        return self._data.get("tjjcode8")
+
+    @property
+    def msvolume8(self):
+        """매수거래량8"""
+        return to_number(self._data.get("msvolume8"))
+
+    @property
+    def mdvolume8(self):
+        """매도거래량8"""
+        return to_number(self._data.get("mdvolume8"))
+
+    @property
+    def msvol8(self):
+        """거래량순매수8"""
+        return to_number(self._data.get("msvol8"))
+
+    @property
+    def msvalue8(self):
+        """매수거래대금8"""
+        return to_number(self._data.get("msvalue8"))
+
+    @property
+    def mdvalue8(self):
+        """매도거래대금8"""
+        return to_number(self._data.get("mdvalue8"))
+
+    @property
+    def msval8(self):
+        """거래대금순매수8"""
+        return to_number(self._data.get("msval8"))
+
+    @property
+    def tjjcode9(self):
+        """투자자코드9(기금)"""
+        return self._data.get("tjjcode9")
+
+    @property
+    def msvolume9(self):
+        """매수거래량9"""
+        return to_number(self._data.get("msvolume9"))
+
+    @property
+    def mdvolume9(self):
+        """매도거래량9"""
+        return to_number(self._data.get("mdvolume9"))
+
+    @property
+    def msvol9(self):
+        """거래량순매수9"""
+        return to_number(self._data.get("msvol9"))
+
+    @property
+    def msvalue9(self):
+        """매수거래대금9"""
+        return to_number(self._data.get("msvalue9"))
+
+    @property
+    def mdvalue9(self):
+        """매도거래대금9"""
+        return to_number(self._data.get("mdvalue9"))
+
+    @property
+    def msval9(self):
+        """거래대금순매수9"""
+        return to_number(self._data.get("msval9"))
+
+    @property
+    def tjjcode10(self):
+        """투자자코드10(선물업자)"""
+        return self._data.get("tjjcode10")
+
+    @property
+    def msvolume10(self):
+        """매수거래량10"""
+        return to_number(self._data.get("msvolume10"))
+
+    @property
+    def mdvolume10(self):
+        """매도거래량10"""
+        return to_number(self._data.get("mdvolume10"))
+
+    @property
+    def msvol10(self):
+        """거래량순매수10"""
+        return to_number(self._data.get("msvol10"))
+
+    @property
+    def msvalue10(self):
+        """매수거래대금10"""
+        return to_number(self._data.get("msvalue10"))
+
+    @property
+    def mdvalue10(self):
+        """매도거래대금10"""
+        return to_number(self._data.get("mdvalue10"))
+
+    @property
+    def msval10(self):
+        """거래대금순매수10"""
+        return to_number(self._data.get("msval10"))
+
+    @property
+    def tjjcode11(self):
+        """투자자코드11(기타)"""
+        return self._data.get("tjjcode11")
+
+    @property
+    def msvolume11(self):
+        """매수거래량11"""
+        return to_number(self._data.get("msvolume11"))
+
+    @property
+    def mdvolume11(self):
+        """매도거래량11"""
+        return to_number(self._data.get("mdvolume11"))
+
+    @property
+    def msvol11(self):
+        """거래량순매수11"""
+        return to_number(self._data.get("msvol11"))
+
+    @property
+    def msvalue11(self):
+        """매수거래대금11"""
+        return to_number(self._data.get("msvalue11"))
+
+    @property
+    def mdvalue11(self):
+        """매도거래대금11"""
+        return to_number(self._data.get("mdvalue11"))
+
+    @property
+    def msval11(self):
+        """거래대금순매수11"""
+        return to_number(self._data.get("msval11"))
+
+    @property
+    def upcode(self):
+        """업종코드"""
+        return self._data.get("upcode")
+
+    @property
+    def tjjcode0(self):
+        """투자자코드0(사모펀드)"""
+        return self._data.get("tjjcode0")
+
+    @property
+    def msvolume0(self):
+        """매수거래량0"""
+        return to_number(self._data.get("msvolume0"))
+
+    @property
+    def mdvolume0(self):
+        """매도거래량0"""
+        return to_number(self._data.get("mdvolume0"))
+
+    @property
+    def msvol0(self):
+        """거래량순매수0"""
+        return to_number(self._data.get("msvol0"))
+
+    @property
+    def msvalue0(self):
+        """매수거래대금0"""
+        return to_number(self._data.get("msvalue0"))
+
+    @property
+    def mdvalue0(self):
+        """매도거래대금0"""
+        return to_number(self._data.get("mdvalue0"))
+
+    @property
+    def msval0(self):
+        """거래대금순매수0"""
+        return to_number(self._data.get("msval0"))
+
+
+class MK2Tick(RealtimeRecord):
+    """[MK2] US지수"""
+    __slots__ = ()
+    TR_CODE = "MK2"
+    FIELDS = ("date", "time", "kodate", "kotime", "open", "high", "low", "price", "sign", "change", "uprate", "bidho", "bidrem", "offerho", "offerrem", "volume", "xsymbol", "cvolume")
+
+    @property
+    def date(self):
+        """일자"""
+        return self._data.get("date")
+
+    @property
+    def time(self):
+        """시간"""
+        return self._data.get("time")
+
+    @property
+    def kodate(self):
+        """한국일자"""
+        return self._data.get("kodate")
+
+    @property
+    def kotime(self):
+        """한국시간"""
+        return self._data.get("kotime")
+
+    @property
+    def open(self):
+        """시가"""
+        return to_float(self._data.get("open"))
+
+    @property
+    def high(self):
+        """고가"""
+        return to_float(self._data.get("high"))
+
+    @property
+    def low(self):
+        """저가"""
+        return to_float(self._data.get("low"))
+
+    @property
+    def price(self):
+        """현재가"""
+        return to_float(self._data.get("price"))
+
+    @property
+    def sign(self):
+        """전일대비구분"""
+        return self._data.get("sign")
+
+    @property
+    def change(self):
+        """전일대비"""
+        return to_float(self._data.get("change"))
+
+    @property
+    def uprate(self):
+        """등락율"""
+        return to_float(self._data.get("uprate"))
+
+    @property
+    def bidho(self):
+        """매수호가"""
+        return to_float(self._data.get("bidho"))
+
+    @property
+    def bidrem(self):
+        """매수잔량"""
+        return to_number(self._data.get("bidrem"))
+
+    @property
+    def offerho(self):
+        """매도호가"""
+        return to_float(self._data.get("offerho"))
+
+    @property
+    def offerrem(self):
+        """매도잔량"""
+        return to_number(self._data.get("offerrem"))
+
+    @property
+    def volume(self):
+        """누적거래량"""
+        return to_float(self._data.get("volume"))
+
+    @property
+    def xsymbol(self):
+        """심벌"""
+        return self._data.get("xsymbol")
+
+    @property
+    def cvolume(self):
+        """체결거래량"""
+        return to_float(self._data.get("cvolume"))
+
+
+# TR 코드 -> 디코더 클래스
+DECODERS = {
+    "BM_": BMTick,
+    "B7_": B7Tick,
+    "DH1": DH1Tick,
+    "DHA": DHATick,
+    "DK3": DK3Tick,
+    "DS3": DS3Tick,
+    "DVI": DVITick,
+    "H1_": H1Tick,
+    "H2_": H2Tick,
+    "HA_": HATick,
+    "HB_": HBTick,
+    "I5_": I5Tick,
+    "IJ_": IJTick,
+    "K1_": K1Tick,
+    "K3_": K3Tick,
+    "KH_": KHTick,
+    "KM_": KMTick,
+    "KS_": KSTick,
+    "OK_": OKTick,
+    "PH_": PHTick,
+    "PM_": PMTick,
+    "S2_": S2Tick,
+    "S3_": S3Tick,
+    "S4_": S4Tick,
+    "SC0": SC0Tick,
+    "SC1": SC1Tick,
+    "SHC": SHCTick,
+    "SHD": SHDTick,
+    "SHI": SHITick,
+    "SHO": SHOTick,
+    "VI_": VITick,
+    "YJ_": YJTick,
+    "YK3": YK3Tick,
+    "YS3": YS3Tick,
+    "ESN": ESNTick,
+    "h2_": h2Tick,
+    "h3_": h3Tick,
+    "k1_": k1Tick,
+    "s2_": s2Tick,
+    "s3_": s3Tick,
+    "s4_": s4Tick,
+    "Ys3": Ys3Tick,
+    "NS3": NS3Tick,
+    "NH1": NH1Tick,
+    "NS2": NS2Tick,
+    "NYS": NYSTick,
+    "NVI": NVITick,
+    "NK1": NK1Tick,
+    "NPH": NPHTick,
+    "NPM": NPMTick,
+    "NBT": NBTTick,
+    "NBM": NBMTick,
+    "US3": US3Tick,
+    "UH1": UH1Tick,
+    "US2": US2Tick,
+    "UYS": UYSTick,
+    "UPH": UPHTick,
+    "UK1": UK1Tick,
+    "UBT": UBTTick,
+    "UBM": UBMTick,
+    "UPM": UPMTick,
+    "UVI": UVITick,
+    "AFR": AFRTick,
+    "FC0": FC0Tick,
+    "FD0": FD0Tick,
+    "FH0": FH0Tick,
+    "FX0": FX0Tick,
+    "JC0": JC0Tick,
+    "JD0": JD0Tick,
+    "JH0": JH0Tick,
+    "JX0": JX0Tick,
+    "OC0": OC0Tick,
+    "OD0": OD0Tick,
+    "OH0": OH0Tick,
+    "OMG": OMGTick,
+    "OX0": OX0Tick,
+    "YC3": YC3Tick,
+    "YFC": YFCTick,
+    "YJC": YJCTick,
+    "YOC": YOCTick,
+    "DC0": DC0Tick,
+    "O02": O02Tick,
+    "DH0": DH0Tick,
+    "H02": H02Tick,
+    "DD0": DD0Tick,
+    "DX0": DX0Tick,
+    "DYC": DYCTick,
+    "DBM": DBMTick,
+    "DBT": DBTTick,
+    "OVC": OVCTick,
+    "OVH": OVHTick,
+    "WOC": WOCTick,
+    "WOH": WOHTick,
+    "TC1": TC1Tick,
+    "TC2": TC2Tick,
+    "TC3": TC3Tick,
+    "AS0": AS0Tick,
+    "AS1": AS1Tick,
+    "AS2": AS2Tick,
+    "AS3": AS3Tick,
+    "AS4": AS4Tick,
+    "GSH": GSHTick,
+    "GSC": GSCTick,
+    "JIF": JIFTick,
+    "NWS": NWSTick,
+    "BMT": BMTTick,
+    "MK2": MK2Tick,
+}
+
+
+def decode(tr_code: str, data: dict):
+    """실시간 TR 본문을 디코더 객체로 변환합니다. 디코더가 없는 TR은 dict를 그대로 반환합니다."""
+    decoder = DECODERS.get(tr_code)
+    return decoder(data) if decoder is not None else data
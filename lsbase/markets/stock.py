@@ -3,14 +3,24 @@
 from ..core.base import MarketBase
 from ..core.enum import OrderSide, OrderType, RealtimeType
 from ..core.models import (
-    OrderResponse, AccountBalanceSummary, Quote, MarketCapStock, HistoricalPrice
+    OrderResponse, AccountBalanceSummary, Quote, MarketCapStock, HistoricalPrice, ChartBar
 )
 from ..core.exceptions import APIRequestError
 from ..tr_adapter import TrCodeAdapter
 
 from .. import generated_models as gen_models # 1. 자동 생성 모델 임포트
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from datetime import datetime
+import logging
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 연속 조회 페이지를 항목마다 model_validate하지 않고 한 번에 검증합니다.
+_T1444_ITEMS = TypeAdapter(list[gen_models.T1444OutBlock1Item])
+_HISTORICAL_PRICES = TypeAdapter(list[HistoricalPrice])
+# 차트 TR의 거래대금 단위(원). 실시간 집계(BarAggregator)와 같이 원 단위로 맞춥니다.
+_CHART_VALUE_UNITS = {"t8412": 1_000_000}  # 백만원
 
 class StockMarket(MarketBase):
     def __init__(self, api, spec: TrCodeAdapter, account_no, account_pw):
@@ -134,25 +144,29 @@ class StockMarket(MarketBase):
         rank = 1
         
         try:
-            # 2. continuous_query에 모델을 딕셔너리로 변환하여 전달합니다.
-            async for item_dict in self._api.continuous_query(tr.code, request_model.model_dump()):
+            # 2. continuous_pages에 모델을 딕셔너리로 변환하여 전달합니다.
+            #    페이지를 변환하는 동안 다음 페이지를 미리 받아 둡니다.
+            async for batch in self._api.continuous_pages(tr.code, request_model.model_dump(), prefetch=1):
                 
-                # 3. 반환된 딕셔너리(item_dict)를 자동 생성된 Item 모델로 파싱(검증)합니다.
-                item = gen_models.T1444OutBlock1Item.model_validate(item_dict)
+                # 3. 반환된 페이지를 자동 생성된 Item 모델 목록으로 한 번에 파싱(검증)합니다.
+                if limit is not None:
+                    batch = batch[:limit - len(all_stocks)]
+                items = _T1444_ITEMS.validate_python(batch)
                 
                 # 4. 타입-안전하게 속성에 접근하여 데이터를 추출하고 최종 모델로 변환합니다.
-                stock_info = MarketCapStock(
-                    rank=rank,
-                    name=item.hname,
-                    code=item.shcode,
-                    price=item.price,
-                    market_cap_in_b_krw=item.total # 'total' 필드가 시가총액(백만원 단위)
-                )
-                all_stocks.append(stock_info)
+                for item in items:
+                    stock_info = MarketCapStock(
+                        rank=rank,
+                        name=item.hname,
+                        code=item.shcode,
+                        price=item.price,
+                        market_cap_in_b_krw=item.total # 'total' 필드가 시가총액(백만원 단위)
+                    )
+                    all_stocks.append(stock_info)
+                    rank += 1
                 
                 if limit is not None and len(all_stocks) >= limit:
                     break
-                rank += 1
                 
             return all_stocks
         except (APIRequestError, ValueError, AttributeError) as e:
@@ -207,17 +221,8 @@ class StockMarket(MarketBase):
         except (APIRequestError, ValidationError, ValueError, AttributeError) as e:
             return OrderResponse(is_success=False, order_id="", message=f"주문 취소 처리 실패: {e}")
 
-    async def subscribe_realtime(self, key: str, data_type: RealtimeType) -> bool:
-        """
-        지정된 타입의 실시간 데이터를 구독합니다. TrCodeAdapter를 사용합니다.
-        
-        :param key: 종목코드 또는 실시간 TR에 필요한 키 값 (JIF의 경우 "1", "2" 등)
-        :param data_type: 구독할 데이터의 종류 (RealtimeType 열거형)
-        :return: 구독 요청 성공 여부
-        """
-        tr_code = None
-        
-        # RealtimeType에 따라 TrCodeAdapter에서 적절한 TR 코드를 찾아옵니다.
+    def _realtime_tr_code(self, data_type: RealtimeType) -> str:
+        """RealtimeType에 해당하는 실시간 TR 코드를 TrCodeAdapter에서 찾아옵니다."""
         # ※ 참고: 아래 경로는 ls_openapi_specs.json 파일의 구조에 따라 달라질 수 있습니다.
         if data_type == RealtimeType.EXECUTION:
             tr_code = self._spec.주식.실시간_시세.주식체결.code # 예: "S3_"
@@ -229,34 +234,47 @@ class StockMarket(MarketBase):
             tr_code = self._spec.기타.기타_실시간_시세.실시간뉴스제목패킷.code
         else:
             raise NotImplementedError(f"지원하지 않는 실시간 데이터 타입입니다: {data_type}")
-            
+
         if not tr_code:
             raise ValueError(f"'{data_type.value}'에 해당하는 TR 코드를 찾을 수 없습니다.")
+        return tr_code
 
-        print(f"구독 요청 -> TR: {tr_code}, Key: {key}")
+    async def subscribe_realtime(self, key: str, data_type: RealtimeType) -> bool:
+        """
+        지정된 타입의 실시간 데이터를 구독합니다. TrCodeAdapter를 사용합니다.
+        같은 종목을 여러 번 구독하면 참조 카운트만 늘어나며, 그만큼 해제해야 실제로 구독이 해제됩니다.
+        
+        :param key: 종목코드 또는 실시간 TR에 필요한 키 값 (JIF의 경우 "1", "2" 등)
+        :param data_type: 구독할 데이터의 종류 (RealtimeType 열거형)
+        :return: 구독 요청 성공 여부
+        """
+        tr_code = self._realtime_tr_code(data_type)
+        logger.debug(f"구독 요청 -> TR: {tr_code}, Key: {key}")
         return await self._api.subscribe_realtime(tr_code, key)
 
     async def unsubscribe_realtime(self, key: str, data_type: RealtimeType) -> bool:
         """실시간 데이터 구독을 해제합니다."""
-        # subscribe_realtime과 동일한 로직으로 TR 코드를 찾습니다.
-        tr_code = None
-
-        if data_type == RealtimeType.EXECUTION:
-            tr_code = self._spec.주식.실시간_시세.주식체결.code
-        elif data_type == RealtimeType.HOGA:
-            tr_code = self._spec.주식.실시간_시세.주식호가.code
-        elif data_type == RealtimeType.MARKET_STATUS:
-            tr_code = self._spec.기타.기타_실시간_시세.장운영정보.code
-        elif data_type == RealtimeType.NEWS_HEADLINE:
-            tr_code = self._spec.기타.기타_실시간_시세.실시간뉴스제목패킷.code
-        else:
-            raise NotImplementedError(f"지원하지 않는 실시간 데이터 타입입니다: {data_type}")
+        tr_code = self._realtime_tr_code(data_type)
+        logger.debug(f"구독 해제 요청 -> TR: {tr_code}, Key: {key}")
+        return await self._api.unsubscribe_realtime(tr_code, key)
 
-        if not tr_code:
-            raise ValueError(f"'{data_type.value}'에 해당하는 TR 코드를 찾을 수 없습니다.")
+    async def set_realtime_watchlist(self, keys: list[str], data_type: RealtimeType, owner: str = "watchlist") -> dict:
+        """
+        owner의 실시간 구독 종목을 keys로 교체합니다. 이전 목록과 달라진 종목만 등록/해제 요청을 보냅니다.
 
-        print(f"구독 해제 요청 -> TR: {tr_code}, Key: {key}")
-        return await self._api.unsubscribe_realtime(tr_code, key)
+        :param keys: 구독할 종목코드 목록 (빈 목록이면 owner의 구독을 모두 해제)
+        :param owner: 관심종목 목록을 구분하는 이름. 전략마다 다른 이름을 사용하면 서로의 구독에 영향을 주지 않습니다.
+        :return: {"subscribed": [...], "unsubscribed": [...], "failed": [...]}
+        """
+        tr_code = self._realtime_tr_code(data_type)
+        # 같은 owner의 다른 실시간 타입 구독은 유지합니다.
+        owner_key = (owner, tr_code)
+        result = await self._api.apply_realtime_subscriptions(owner_key, [(tr_code, key) for key in keys])
+        logger.info(
+            f"관심종목 갱신 ({owner}, {tr_code}): 등록 {len(result['subscribed'])}, "
+            f"해제 {len(result['unsubscribed'])}, 실패 {len(result['failed'])}"
+        )
+        return result
 
     async def get_server_time(self) -> str:
         """서버의 현재 시간(t0167)을 조회합니다."""
@@ -311,11 +329,11 @@ class StockMarket(MarketBase):
 
         all_prices = []
         try:
-            async for item_dict in self._api.continuous_query(tr.code, request_model.model_dump()):
-                # 자동 생성된 모델로 데이터 검증
-                item = gen_models.T1305OutBlock1Item.model_validate(item_dict)
-                # 사용자 친화적인 모델로 변환하여 추가
-                all_prices.append(HistoricalPrice.model_validate(item.model_dump()))
+            # 한 페이지로 끝나지 않는 경우에만 다음 페이지를 미리 받아 둡니다.
+            prefetch = 1 if count > in_block.cnt else 0
+            async for batch in self._api.continuous_pages(tr.code, request_model.model_dump(), prefetch=prefetch):
+                # 페이지 단위로 사용자 친화적인 모델로 검증하여 추가
+                all_prices.extend(_HISTORICAL_PRICES.validate_python(batch[:count - len(all_prices)]))
 
                 if len(all_prices) >= count:
                     break
@@ -327,6 +345,80 @@ class StockMarket(MarketBase):
                 return []
             raise ConnectionError(f"기간별 주가 조회 실패 ({symbol}): {e}") from e
 
+    async def get_minute_bars(self, symbol: str, interval: int = 1, date: str = "", count: int = 500) -> list[ChartBar]:
+        """
+        주식차트 N분(t8412) 데이터를 최신 봉부터 조회합니다. 연속 조회를 지원합니다.
+
+        :param symbol: 종목코드 (e.g., "005930")
+        :param interval: 봉 단위(분)
+        :param date: 조회 종료일 (YYYYMMDD). 지정하지 않으면 오늘
+        :param count: 조회할 봉의 최대 개수
+        :return: ChartBar 모델 객체의 리스트. time은 봉의 종료 시각(HHMMSS)이며 value는 실시간 집계와 같은 원 단위입니다.
+        """
+        tr = self._spec.주식.주식_차트.주식차트_N분
+        in_block = gen_models.T8412InBlock(
+            shcode=symbol, ncnt=interval, qrycnt=min(count, 500), nday="0",
+            sdate="", stime="", edate=date or datetime.now().strftime('%Y%m%d'), etime="",
+            cts_date="", cts_time="", comp_yn="N",
+        )
+        request_model = gen_models.T8412Request(t8412InBlock=in_block)
+        return await self._get_chart_bars(tr.code, request_model.model_dump(), count, symbol)
+
+    async def get_tick_bars(self, symbol: str, ticks: int = 1, date: str = "", count: int = 500) -> list[ChartBar]:
+        """
+        주식차트 틱/N틱(t8411) 데이터를 최신 봉부터 조회합니다. 연속 조회를 지원합니다.
+
+        :param symbol: 종목코드 (e.g., "005930")
+        :param ticks: 봉 하나에 포함되는 체결 수
+        :param date: 조회 종료일 (YYYYMMDD). 지정하지 않으면 오늘
+        :param count: 조회할 봉의 최대 개수
+        :return: ChartBar 모델 객체의 리스트. time은 봉의 마지막 체결 시각(HHMMSS)이며 value는 0입니다.
+        """
+        tr = self._spec.주식.주식_차트.주식차트_틱_n틱
+        in_block = gen_models.T8411InBlock(
+            shcode=symbol, ncnt=ticks, qrycnt=min(count, 500), nday="0",
+            sdate="", stime="", edate=date or datetime.now().strftime('%Y%m%d'), etime="",
+            cts_date="", cts_time="", comp_yn="N",
+        )
+        request_model = gen_models.T8411Request(t8411InBlock=in_block)
+        return await self._get_chart_bars(tr.code, request_model.model_dump(), count, symbol)
+
+    async def _get_chart_bars(self, tr_code: str, params: dict, count: int, symbol: str) -> list[ChartBar]:
+        """차트 TR(t8411, t8412)의 OutBlock1 항목을 ChartBar로 변환합니다."""
+        bars = []
+        value_unit = _CHART_VALUE_UNITS.get(tr_code, 1)
+        try:
+            # 한 페이지로 끝나지 않는 경우에만 다음 페이지를 미리 받아 둡니다.
+            prefetch = 1 if count > int(params[f"{tr_code}InBlock"]["qrycnt"]) else 0
+            previous_page = None
+            async for batch in self._api.continuous_pages(tr_code, params, prefetch=prefetch):
+                if not batch:
+                    continue
+                # 페이지는 최신 봉부터 오므로, 앞 페이지와 같거나 앞 페이지의 마지막 봉보다 최신인 페이지는
+                # 연속 키(cts_date, cts_time)가 진행되지 않은 것입니다. 같은 봉이 중복되지 않도록 조회를 멈춥니다.
+                if previous_page is not None and (
+                    batch[0] == previous_page[0]
+                    or (batch[0].get("date"), batch[0].get("time")) > (previous_page[-1].get("date"), previous_page[-1].get("time"))
+                ):
+                    logger.warning(f"[{tr_code}] {symbol} 연속 조회 페이지가 진행되지 않아 {len(bars)}개 봉에서 조회를 멈춥니다.")
+                    break
+                previous_page = batch
+                for item_dict in batch:
+                    bar = ChartBar.model_validate(item_dict)
+                    # 차트 TR의 시간은 HHMMSS 뒤에 자리수가 더 붙어 있으므로 실시간 봉과 같이 HHMMSS로 맞춥니다.
+                    bar.time = bar.time[:6]
+                    bar.value *= value_unit
+                    bars.append(bar)
+                    if len(bars) >= count:
+                        break
+                if len(bars) >= count:
+                    break
+            return bars
+        except (APIRequestError, ValidationError, ValueError) as e:
+            if "APBK0042" in str(e): # 입력값 오류 코드
+                return []
+            raise ConnectionError(f"차트 조회 실패 ({tr_code}, {symbol}): {e}") from e
+
     async def get_managed_stocks(self) -> set[str]:
         """관리 종목(t1404) 목록을 조회합니다."""
         tr = self._spec.주식.주식_시세.관리_불성실_투자유의조회
@@ -342,10 +434,9 @@ class StockMarket(MarketBase):
 
         managed_codes = set()
         try:
-            async for item_dict in self._api.continuous_query(tr.code, request_model.model_dump(exclude_none=True)):
-                item = gen_models.T1404OutBlock1Item.model_validate(item_dict)
-                if item.shcode:
-                    managed_codes.add(item.shcode)
+            # 종목코드 열만 페이지 단위로 받습니다.
+            async for columns in self._api.continuous_columns(tr.code, request_model.model_dump(exclude_none=True), prefetch=1, fields=["shcode"]):
+                managed_codes.update(str(code) for code in columns["shcode"] if code)
             return managed_codes
         except (APIRequestError, ValidationError, ValueError, AttributeError) as e:
             print(f"경고: 관리 종목 조회에 실패했습니다. {e}")
@@ -1,6 +1,13 @@
-﻿import aiohttp, asyncio, json, time
+﻿import aiohttp, asyncio, time
 from .tr_code_to_path import tr_code_to_path
 from .code_realtime_account import code_realtime_account
+from .connection_pool import ConnectionPoolConfig, ConnectionTracer, warm_up
+from .codec import JsonCodec, get_codec
+from .token_store import TokenStore
+from .cassette import Cassette
+from .realtime_session import ReconnectPolicy, SubscriptionRegistry
+from .realtime_dispatch import RealtimeDispatcher
+from .subscription_manager import SubscriptionManager
 
 # BASE_URL = "https://openapi.ebestsec.co.kr:8080"
 # WSS_URL_REAL = "wss://openapi.ebestsec.co.kr:9443/websocket"
@@ -11,30 +18,101 @@ BASE_URL = "https://openapi.ls-sec.co.kr:8080"
 WSS_URL_REAL = "wss://openapi.ls-sec.co.kr:9443/websocket"
 WSS_URL_SIMULATION = "wss://openapi.ls-sec.co.kr:29443/websocket"
 
+import logging
 import warnings
+import weakref
 
+logger = logging.getLogger(__name__)
+
+
+_UNPARSED = object()
 
 class ResponseValue:
+    """TR 응답
+
+    body는 처음 접근할 때 파싱한다.
+    retain_raw=False이면 요청 본문은 보관하지 않고, 응답 원문은 body를 파싱한 직후 버린다.
+    이 경우 request_data/response_data/request_text/response_text는 None이다.
+    """
+    __slots__ = (
+        "path", "tr_cd", "tr_cont", "tr_cont_key",
+        "in_tr_cont", "in_tr_cont_key", "request_time", "elapsed_ms",
+        "connection_reused", "response_size",
+        "_body", "_response_data", "_request_data", "_codec", "_retain_raw",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         path: str,
         tr_cd: str,
         tr_cont: str,
         tr_cont_key: str,
-        response_text: str,
+        response_data: bytes | str,
+        codec: JsonCodec = None,
+        retain_raw: bool = True,
     ) -> None:
         self.path = path
         self.tr_cd = tr_cd
         self.tr_cont = tr_cont
         self.tr_cont_key = tr_cont_key
-        self.body = json.loads(response_text)
-        self.response_text = response_text
+        self._body = _UNPARSED
+        self._response_data = response_data
+        self._codec = codec or _default_codec
+        self._retain_raw = retain_raw
+        self.response_size = len(response_data) if response_data else 0
         # additional variables
         self.in_tr_cont = str()
         self.in_tr_cont_key = str()
-        self.request_text = str()
+        self._request_data = bytes() if retain_raw else None
         self.request_time = 0.0
         self.elapsed_ms = 0.0
+        self.connection_reused = None
+
+    @property
+    def body(self) -> dict:
+        """응답 본문 (처음 접근할 때 파싱)"""
+        body = self._body
+        if body is _UNPARSED:
+            body = self._body = self._codec.loads(self._response_data)
+            if not self._retain_raw:
+                self._response_data = None
+        return body
+
+    @body.setter
+    def body(self, value: dict):
+        self._body = value
+
+    @property
+    def response_data(self) -> bytes | str | None:
+        """응답 원문. retain_raw=False이고 body를 파싱한 뒤에는 None"""
+        if not self._retain_raw:
+            return None
+        return self._response_data
+
+    @property
+    def request_data(self) -> bytes | None:
+        """요청 원문. retain_raw=False이면 None"""
+        return self._request_data
+
+    @request_data.setter
+    def request_data(self, value: bytes):
+        if self._retain_raw:
+            self._request_data = value
+
+    @property
+    def response_text(self) -> str | None:
+        """응답 본문 문자열"""
+        data = self.response_data
+        return data.decode("utf-8") if isinstance(data, bytes) else data
+
+    @property
+    def request_text(self) -> str | None:
+        """요청 본문 문자열"""
+        data = self._request_data
+        return data.decode("utf-8") if isinstance(data, bytes) else data
+
+_default_codec = get_codec()
 
 class OpenApi:
 
@@ -65,17 +143,47 @@ class OpenApi:
             self.__slots.clear()
         async def emit_signal(self, *args):
             for slot in self.__slots:
-                if slot.is_coroutine:
-                    await slot.func(*args)
-                else:
-                    slot.func(*args)
+                # 핸들러 예외가 웹소켓 수신 루프나 다른 핸들러로 전파되지 않도록 핸들러별로 처리한다.
+                try:
+                    if slot.is_coroutine:
+                        await slot.func(*args)
+                    else:
+                        slot.func(*args)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception(f"event handler {getattr(slot.func, '__qualname__', slot.func)} raised an exception")
 
-    def __init__(self):
+    def __init__(self, pool_config:ConnectionPoolConfig=None, codec:JsonCodec=None, retain_raw:bool=True, token_store:TokenStore=None, reconnect_policy:ReconnectPolicy=None
+                 , base_url:str=None, wss_url_real:str=None, wss_url_simulation:str=None, cassette:Cassette=None):
+        '''
+        base_url, wss_url_real, wss_url_simulation: 접속할 서버 주소. 생략시 LS증권 서버
+            (lsbase.tools.local_server 등 다른 서버로 접속할 때 지정)
+        cassette: REST 요청/응답 기록 파일. replay 모드이면 서버에 접속하지 않고 기록된 응답만 사용한다.
+        '''
         super().__init__()
         
+        self._base_url = base_url or BASE_URL
+        self._wss_url_real = wss_url_real or WSS_URL_REAL
+        self._wss_url_simulation = wss_url_simulation or WSS_URL_SIMULATION
         self._access_token = ""
+        self._token_expires_at:float = 0.0
+        self._token_store = token_store
+        self._reissue_lock = asyncio.Lock()
+        self._cassette = cassette
+        self._token_refresh_task = None
+        self._appkey = ""
+        self._appsecretkey = ""
         self._http = None
+        self._codec = codec or _default_codec
+        self._retain_raw = retain_raw
+        self._pool_config = pool_config or ConnectionPoolConfig()
+        self._tracer = ConnectionTracer()
         self._websocket = None
+        self._websocket_task = None
+        self._reconnect_policy = reconnect_policy or ReconnectPolicy()
+        self._subscriptions = SubscriptionRegistry()
+        self._subscription_manager = SubscriptionManager(self, self._reconnect_policy.replay_batch_size, self._reconnect_policy.replay_batch_interval)
         self._connected:bool = False
         self._is_simulation:bool = False
         self._last_message:str = ""
@@ -84,10 +192,45 @@ class OpenApi:
     
         # 이벤트 핸들러
         self._on_message = self._event_signal()
-        self._on_realtime = self._event_signal()
+        self._on_realtime = RealtimeDispatcher()
+        self._on_connection = self._event_signal()
+        # 핸들러보다 먼저 수신 순서대로 호출되는 동기 함수 (JournalRecorder 등)
+        self._realtime_taps: list = []
         # self._on_message = lambda sender, msg: print(f"on_message: {msg}")
         # self._on_realtime = lambda sender, trcode, key, realtimedata: print(f"on_realtime: {trcode}, {key}, {realtimedata}")
 
+    @property
+    def base_url(self) -> str:
+        """REST 서버 주소
+
+        A readonly property.
+        """
+        return self._base_url
+
+    @property
+    def access_token(self) -> str:
+        """현재 사용중인 접근토큰
+
+        A readonly property.
+        """
+        return self._access_token
+
+    @property
+    def cassette(self) -> Cassette | None:
+        """REST 요청/응답 기록 파일
+
+        A readonly property.
+        """
+        return self._cassette
+
+    @property
+    def replaying(self) -> bool:
+        """서버에 접속하지 않고 cassette에 기록된 응답만 사용하는지 여부
+
+        A readonly property.
+        """
+        return self._cassette is not None and self._cassette.replaying
+
     @property
     def connected(self) -> bool:
         """로그인 연결상태.
@@ -114,6 +257,32 @@ class OpenApi:
         """
         return self._last_message
 
+    @property
+    def codec(self) -> JsonCodec:
+        """REST/웹소켓 메시지에 사용하는 JSON 코덱
+
+        A readonly property.
+        """
+        return self._codec
+
+    @property
+    def retain_raw(self) -> bool:
+        """ResponseValue에 요청/응답 원문을 보관할지 여부
+        False이면 대용량 응답의 메모리 사용량이 줄어든다.
+        """
+        return self._retain_raw
+
+    @retain_raw.setter
+    def retain_raw(self, value:bool) : self._retain_raw = value
+
+    @property
+    def connection_stats(self) -> dict:
+        """REST 연결 생성/재사용 통계
+
+        A readonly property.
+        """
+        return self._tracer.stats()
+
     @property
     def mac_address(self) -> str:
         """법인인 경우 필수 세팅"""
@@ -142,6 +311,11 @@ class OpenApi:
     def on_realtime(self) :
         """실시간 데이터 수신 이벤트 핸들러
         on_realtime(sender:OpenApi, trcode:str, key:str, realtimedata:dict)
+
+        핸들러는 각자의 큐와 작업 태스크에서 실행되므로 느린 핸들러가 웹소켓 수신을 막지 않는다.
+        on_realtime.connect(func, trcode="S3_", key="005930", maxsize=..., overflow="block"|"drop_oldest"|"conflate")
+        trcode/key를 지정하면 해당하는 데이터만 받는다. 생략하거나 "*"이면 모든 값
+        on_realtime.stats(): 핸들러별 큐 깊이/지연시간/버린 항목/예외 수
         """
         return self._on_realtime
     
@@ -154,9 +328,63 @@ class OpenApi:
                       stacklevel=2)
         self._on_realtime.connect(slot)
     
+    def add_realtime_tap(self, func) -> None:
+        '''
+        실시간 데이터를 수신 순서대로 받는 동기 함수를 등록한다. func(trcode:str, key:str, realtimedata:dict)
+        큐를 거치지 않고 웹소켓 수신 루프에서 직접 호출되므로 데이터를 버리지 않는 대신 즉시 반환해야 한다.
+        '''
+        if func not in self._realtime_taps:
+            self._realtime_taps.append(func)
+
+    def remove_realtime_tap(self, func) -> None:
+        if func in self._realtime_taps:
+            self._realtime_taps.remove(func)
+
+    @property
+    def on_connection(self) :
+        """웹소켓 연결상태 변경 이벤트 핸들러
+        on_connection(sender:OpenApi, event:str, info:dict)
+        event: "disconnected", "reconnecting", "reconnected", "reconnect_failed"
+        """
+        return self._on_connection
+
+    @property
+    def realtime_subscriptions(self) -> SubscriptionRegistry:
+        """현재 등록된 실시간 구독 목록
+
+        A readonly property.
+        """
+        return self._subscriptions
+
+    @property
+    def subscriptions(self) -> SubscriptionManager:
+        """실시간 구독 참조 카운트 관리자
+        여러 곳에서 같은 실시간 데이터를 구독할 때는 add_realtime/remove_realtime 대신 이것을 사용한다.
+
+        A readonly property.
+        """
+        return self._subscription_manager
+
+    @property
+    def token_expires_at(self) -> float:
+        """접근토큰 만료시각 (epoch seconds, 알 수 없으면 0)
+
+        A readonly property.
+        """
+        return self._token_expires_at
+
     async def close(self) -> None:
         """연결 종료"""
         self._connected = False
+        if self._token_refresh_task:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+        if self._websocket_task:
+            self._websocket_task.cancel()
+            self._websocket_task = None
+        self._subscriptions.clear()
+        self._subscription_manager.reset()
+        await self._on_realtime.close()
         if self._websocket and not self._websocket.closed:
             await self._websocket.close()
         if self._http and not self._http.closed:
@@ -176,45 +404,29 @@ class OpenApi:
         if appkey == "" or appsecretkey == "":
             self._last_message = "appkey or appsecretkey is empty"
             return False
+
+        if self.replaying:
+            return self._replay_login(appkey, appsecretkey)
     
-        # 토큰 가져오기
-        timeout = aiohttp.ClientTimeout(total=10) # 10초 타임아웃
-        httpclient = aiohttp.ClientSession(timeout=timeout)
-        token_response = await httpclient.post(BASE_URL + "/oauth2/token"
-                    , data={'grant_type': 'client_credentials', 'appkey': appkey, 'appsecretkey': appsecretkey, 'scope': 'oob'}
+        httpclient = aiohttp.ClientSession(timeout=self._pool_config.create_timeout()
+                    , connector=self._pool_config.create_connector()
+                    , trace_configs=[self._tracer.trace_config]
                     )
-        if token_response.status != 200:
-            await httpclient.close()
-            self._last_message = "Failed to retrieve authentication key."
-            return False
-    
-        # 인증성공
-        token = (await token_response.json())['access_token']
-        httpclient.headers["Authorization"] = f"Bearer {token}"
         httpclient.headers["Content-Type"] = "application/json; charset=UTF-8"
-        self._access_token = token
         self._http = httpclient
-        self._connected = True
-        
-        # 모의투자인지 실투자인지 구분한다.
-        FOCCQ33600 = dict()
-        FOCCQ33600['FOCCQ33600InBlock1'] = {}
-        
-        response = await self.request("FOCCQ33600", FOCCQ33600)
-        if not response :
+        self._appkey = appkey
+        self._appsecretkey = appsecretkey
+
+        # 토큰 가져오기 (토큰 캐시가 있으면 캐시된 토큰을 사용한다)
+        if not await self._authenticate():
             self._connected = False
-            self._last_message = "Failed to require FOCCQ33600"
             await httpclient.close()
             return False
-    
-        rsp_msg:str = response.body["rsp_msg"]
-        if rsp_msg.__contains__("모의투자"):
-            self._is_simulation = True
 
         # 웹소켓 연결
         self._connected = False
         try:
-            websocket = await  httpclient.ws_connect(WSS_URL_SIMULATION if self._is_simulation else WSS_URL_REAL)
+            websocket = await self._ws_connect()
             self._connected = not websocket.closed
         except :
             pass
@@ -225,9 +437,205 @@ class OpenApi:
             return False
     
         self._websocket = websocket
-        asyncio.create_task(self._websocket_listen())
+        self._websocket_task = asyncio.create_task(self._websocket_supervisor())
+        self._websocket_task.add_done_callback(self._on_websocket_task_done)
+        if self._token_expires_at:
+            self._token_refresh_task = asyncio.create_task(self._token_refresh_loop())
+        if self._cassette is not None:
+            self._cassette.save_login(self._is_simulation)
         return True
 
+    def _replay_login(self, appkey:str, appsecretkey:str) -> bool:
+        '''
+        cassette 재생 모드 로그인
+        토큰 발급과 웹소켓 연결 없이 기록된 모의투자 여부만 복원한다.
+        '''
+        recorded = self._cassette.load_login()
+        if recorded is None:
+            self._last_message = f"login is not recorded in cassette. {self._cassette.path}"
+            return False
+        self._appkey = appkey
+        self._appsecretkey = appsecretkey
+        self._is_simulation = recorded["is_simulation"]
+        self._connected = True
+        return True
+
+    async def _authenticate(self) -> bool:
+        '''
+        접근토큰 발급 및 모의투자 여부 확인
+        토큰 캐시에 유효한 토큰이 있으면 토큰 발급과 FOCCQ33600 조회를 생략한다.
+        '''
+        store = self._token_store
+        if store is None:
+            return await self._issue_token()
+
+        cached = store.load(self._token_store_key)
+        if not cached:
+            async with store.lock(self._token_store_key):
+                # 잠금을 기다리는 동안 다른 프로세스가 토큰을 발급했을 수 있다.
+                cached = store.load(self._token_store_key)
+                if not cached:
+                    if not await self._issue_token():
+                        return False
+                    if self._token_expires_at:
+                        store.save(self._token_store_key, self._access_token, self._token_expires_at, self._is_simulation)
+                    return True
+
+        self._set_access_token(cached["access_token"], cached["expires_at"])
+        self._is_simulation = cached["is_simulation"]
+        self._connected = True
+        await self.warm_up()
+        return True
+
+    async def _issue_token(self) -> bool:
+        '''
+        접근토큰을 새로 발급받고 모의투자인지 실투자인지 구분한다.
+        '''
+        issued = await self._post_token()
+        if not issued:
+            return False
+        self._set_access_token(*issued)
+        self._connected = True
+
+        # 모의투자인지 실투자인지 구분한다. 첫 주문 전에 쓸 TLS 연결도 함께 열어 둔다.
+        FOCCQ33600 = dict()
+        FOCCQ33600['FOCCQ33600InBlock1'] = {}
+        
+        response, _ = await asyncio.gather(self.request("FOCCQ33600", FOCCQ33600), self.warm_up())
+        if not response :
+            self._last_message = "Failed to require FOCCQ33600"
+            return False
+    
+        try:
+            rsp_msg:str = response.body["rsp_msg"]
+        except (ValueError, KeyError) as e:
+            # 응답 본문은 처음 접근할 때 파싱되므로 여기서 JSON 오류가 발생할 수 있다.
+            self._last_message = f"Invalid FOCCQ33600 response. {e}"
+            return False
+        self._is_simulation = rsp_msg.__contains__("모의투자")
+        return True
+
+    async def _post_token(self) -> tuple[str, float] | None:
+        '''
+        /oauth2/token 호출
+        return: (접근토큰, 만료시각), 실패시 None
+        '''
+        request_time = time.time()
+        try:
+            token_response = await self._http.post(self._base_url + "/oauth2/token"
+                        , data={'grant_type': 'client_credentials', 'appkey': self._appkey, 'appsecretkey': self._appsecretkey, 'scope': 'oob'}
+                        , headers={"Content-Type": "application/x-www-form-urlencoded"}
+                        )
+            if token_response.status != 200:
+                self._last_message = "Failed to retrieve authentication key."
+                return None
+            payload = await token_response.json()
+        except Exception as e:
+            self._last_message = e
+            return None
+
+        # 인증성공
+        expires_in = int(payload.get('expires_in') or 0)
+        return payload['access_token'], (request_time + expires_in if expires_in > 0 else 0.0)
+
+    @property
+    def _token_store_key(self) -> str:
+        # 다른 서버(로컬 대체 서버 등)에서 받은 토큰이 LS증권 서버 토큰 캐시와 섞이지 않도록 서버 주소를 포함한다.
+        return self._appkey if self._base_url == BASE_URL else f"{self._base_url} {self._appkey}"
+
+    def _set_access_token(self, token:str, expires_at:float) -> None:
+        self._access_token = token
+        self._token_expires_at = expires_at
+        self._http.headers["Authorization"] = f"Bearer {token}"
+
+    async def refresh_token(self) -> bool:
+        '''
+        접근토큰 갱신
+        토큰 캐시를 공유하는 다른 프로세스가 이미 갱신했으면 그 토큰을 사용한다.
+        return: True: 성공, False: 실패, 실패시 last_message에 실패사유가 저장됨
+        '''
+        store = self._token_store
+        if store is None:
+            issued = await self._post_token()
+            if not issued:
+                return False
+            self._set_access_token(*issued)
+            return True
+
+        async with store.lock(self._token_store_key):
+            cached = store.load(self._token_store_key)
+            if cached and cached["expires_at"] > self._token_expires_at:
+                self._set_access_token(cached["access_token"], cached["expires_at"])
+                return True
+            issued = await self._post_token()
+            if not issued:
+                return False
+            self._set_access_token(*issued)
+            if self._token_expires_at:
+                store.save(self._token_store_key, self._access_token, self._token_expires_at, self._is_simulation)
+        return True
+
+    async def reissue_token(self, rejected_token:str) -> bool:
+        '''
+        서버가 거부한 접근토큰(IGW00121)을 토큰 캐시에서 지우고 새로 발급받는다.
+        같은 토큰으로 실패한 다른 요청이나 토큰 캐시를 공유하는 다른 프로세스가 이미 새로 발급받았으면 그 토큰을 사용한다.
+        rejected_token: 거부된 요청에 사용한 접근토큰
+        return: True: 성공, False: 실패, 실패시 last_message에 실패사유가 저장됨
+        '''
+        async with self._reissue_lock:
+            if self._access_token != rejected_token:
+                return True
+
+            store = self._token_store
+            if store is None:
+                issued = await self._post_token()
+                if not issued:
+                    return False
+                self._set_access_token(*issued)
+                return True
+
+            async with store.lock(self._token_store_key):
+                cached = store.load(self._token_store_key)
+                if cached and cached["access_token"] != rejected_token:
+                    self._set_access_token(cached["access_token"], cached["expires_at"])
+                    return True
+                store.clear(self._token_store_key)
+                issued = await self._post_token()
+                if not issued:
+                    return False
+                self._set_access_token(*issued)
+                if self._token_expires_at:
+                    store.save(self._token_store_key, self._access_token, self._token_expires_at, self._is_simulation)
+            return True
+
+    async def _token_refresh_loop(self):
+        '''
+        만료 전에 접근토큰을 미리 갱신하는 백그라운드 작업
+        '''
+        margin = self._token_store.refresh_margin if self._token_store else 600.0
+        while self._connected and self._token_expires_at:
+            await asyncio.sleep(max(0.0, self._token_expires_at - margin - time.time()))
+            if not self._connected:
+                break
+            if await self.refresh_token():
+                await self._inner_on_mesage("access token refreshed.")
+            else:
+                await self._inner_on_mesage(f"access token refresh failed. {self._last_message}")
+                await asyncio.sleep(60)
+
+    async def warm_up(self, count:int=None) -> int:
+        '''
+        REST 서버로 연결을 미리 열어 커넥션 풀에 넣어 둔다.
+        count: 열어 둘 연결 수, 생략시 pool_config.warm_connections
+        return: 성공한 연결 수
+        '''
+        if not self._http or self._http.closed:
+            return 0
+        count = self._pool_config.warm_connections if count is None else count
+        if count <= 0:
+            return 0
+        return await warm_up(self._http, self._base_url, count)
+
     async def request(self, tr_cd:str, data:dict|str
                              ,*
                              , path:str=None
@@ -261,30 +669,67 @@ class OpenApi:
         
         try:
             if isinstance(data, str):
-                request_text = data
+                request_data = data.encode("utf-8")
             else:
-                request_text = json.dumps(data)
+                request_data = self._codec.dumps(data)
+
+            cassette = self._cassette
+            if cassette is not None:
+                recorded = cassette.lookup(path, tr_cd, tr_cont, tr_cont_key, request_data)
+                if recorded is not None:
+                    return await self._replay_response(recorded, path, tr_cd, tr_cont, tr_cont_key, request_data)
+                if cassette.replaying:
+                    self._last_message = f"not recorded in cassette. {tr_cd} tr_cont={tr_cont} tr_cont_key={tr_cont_key}"
+                    return None
+
             request_time = time.time()
             start_time = time.perf_counter_ns()
-            response = await self._http.post(BASE_URL + path, headers=headers, data=request_text)
+            trace_ctx = self._tracer.new_context()
+            response = await self._http.post(self._base_url + path, headers=headers, data=request_data, trace_request_ctx=trace_ctx)
             if response.status != 200:
+                # 실패 응답(초당 전송 건수 초과 등)은 기록하지 않는다. 기록하면 같은 요청이 항상 실패로 재생된다.
                 self._last_message = await response.json()
                 return None
-            response_text = await response.text()
+            response_data = await response.read()
             elapsed_ms = (time.perf_counter_ns() - start_time) / 1000000
-            result = ResponseValue(path, tr_cd, response.headers["tr_cont"], response.headers["tr_cont_key"], response_text)
+            if cassette is not None:
+                cassette.record(path, tr_cd, tr_cont, tr_cont_key, request_data, 200
+                                , {"tr_cont": response.headers["tr_cont"], "tr_cont_key": response.headers["tr_cont_key"]}
+                                , response_data, elapsed_ms)
+            result = ResponseValue(path, tr_cd, response.headers["tr_cont"], response.headers["tr_cont_key"], response_data, self._codec, self._retain_raw)
             result.in_tr_cont = tr_cont
             result.in_tr_cont_key = tr_cont_key
-            result.request_text = request_text
+            result.request_data = request_data
             result.request_time = request_time
             result.elapsed_ms = elapsed_ms
-            self._last_respose_value = result
+            result.connection_reused = trace_ctx.reused
+            self._last_respose_value = weakref.ref(result)
             return result
         except Exception as e:
             self._last_message = e
 
         return None
 
+    async def _replay_response(self, recorded:dict, path:str, tr_cd:str, tr_cont:str, tr_cont_key:str, request_data:bytes) -> ResponseValue | None:
+        '''
+        cassette에 기록된 응답으로 ResponseValue를 만든다.
+        '''
+        delay = self._cassette.delay(recorded)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if recorded["status"] != 200:
+            self._last_message = self._codec.loads(recorded["body"])
+            return None
+        headers = recorded["headers"]
+        result = ResponseValue(path, tr_cd, headers["tr_cont"], headers["tr_cont_key"], recorded["body"].encode("utf-8"), self._codec, self._retain_raw)
+        result.in_tr_cont = tr_cont
+        result.in_tr_cont_key = tr_cont_key
+        result.request_data = request_data
+        result.request_time = time.time()
+        result.elapsed_ms = recorded["elapsed_ms"]
+        self._last_respose_value = weakref.ref(result)
+        return result
+
     def add_realtime(self, tr_cd:str, tr_key:str) :
         """실시간 데이터 요청
         tr_cd: TR코드
@@ -299,11 +744,100 @@ class OpenApi:
         """
         return self._realtime_request(tr_cd, tr_key, "2" if code_realtime_account.__contains__(tr_cd) else "4")
 
+    async def _ws_connect(self) -> aiohttp.ClientWebSocketResponse:
+        return await self._http.ws_connect(self._wss_url_simulation if self._is_simulation else self._wss_url_real
+                    , heartbeat=self._reconnect_policy.heartbeat
+                    )
+
+    async def _websocket_supervisor(self):
+        '''
+        웹소켓 수신을 감시하다가 연결이 끊기면 재연결하고 구독을 복구한다.
+        '''
+        policy = self._reconnect_policy
+        while self._connected:
+            try:
+                await self._websocket_listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 수신 중 예외는 연결 끊김과 같이 처리하여 재연결한다.
+                self._last_message = e
+                logger.exception("websocket listen loop raised an exception")
+            if not self._connected or not policy.enabled:
+                break
+
+            # 연결 끊김
+            disconnected_at = time.time()
+            started = time.perf_counter()
+            await self._inner_on_connection("disconnected", {"time": disconnected_at, "reason": str(self._last_message), "subscriptions": len(self._subscriptions)})
+
+            attempt = 0
+            websocket = None
+            while self._connected and websocket is None:
+                attempt += 1
+                if policy.max_attempts is not None and attempt > policy.max_attempts:
+                    break
+                delay = policy.delay(attempt)
+                await self._inner_on_connection("reconnecting", {"attempt": attempt, "delay": delay})
+                await asyncio.sleep(delay)
+                try:
+                    websocket = await self._ws_connect()
+                except Exception as e:
+                    self._last_message = e
+
+            if websocket is None:
+                if self._connected:
+                    self._connected = False
+                    await self._inner_on_connection("reconnect_failed", {"attempts": attempt - 1, "downtime_ms": (time.perf_counter() - started) * 1000})
+                break
+
+            self._websocket = websocket
+            connected_ms = (time.perf_counter() - started) * 1000
+            replayed = await self._replay_subscriptions()
+            await self._inner_on_connection("reconnected", {
+                "attempts": attempt,
+                "reconnect_ms": connected_ms,
+                "downtime_ms": (time.perf_counter() - started) * 1000,
+                "replayed": replayed,
+            })
+
+    def _on_websocket_task_done(self, task:asyncio.Task) -> None:
+        '''
+        웹소켓 감시 태스크가 예외로 끝나면 기록한다. (재연결도 더 이상 동작하지 않는다)
+        '''
+        if task.cancelled():
+            return
+        e = task.exception()
+        if e is not None:
+            self._last_message = e
+            logger.error("websocket supervisor task terminated unexpectedly", exc_info=e)
+
+    async def _replay_subscriptions(self) -> int:
+        '''
+        등록된 실시간 구독을 새 웹소켓에 배치 단위로 다시 등록한다.
+        return: 다시 등록한 구독 수
+        '''
+        policy = self._reconnect_policy
+        items = self._subscriptions.items()
+        batch_size = max(1, policy.replay_batch_size)
+        replayed = 0
+        try:
+            for i in range(0, len(items), batch_size):
+                if i:
+                    await asyncio.sleep(policy.replay_batch_interval)
+                for tr_cd, tr_key, tr_type in items[i:i + batch_size]:
+                    await self._send_realtime_frame(tr_cd, tr_key, tr_type)
+                    replayed += 1
+        except Exception as e:
+            # 복구 중에 다시 끊기면 수신 루프가 이를 감지하고 재연결을 다시 시도한다.
+            self._last_message = e
+        return replayed
+
     async def _websocket_listen(self):
         async for msg in self._websocket:
             if msg.type == aiohttp.WSMsgType.TEXT:
                 try:
-                    jsondata = json.loads(msg.data)
+                    jsondata = self._codec.loads(msg.data)
                 except Exception as e:
                     self._last_message = e
                     await self._inner_on_mesage(f"websocket exception. {e}")
@@ -332,12 +866,31 @@ class OpenApi:
         if not self._connected:
             self._last_message = "Not connected"
             return False
+        # 구독 목록을 먼저 갱신한다. 재연결 중이면 연결된 뒤 목록대로 다시 등록된다.
+        if tr_type in ("1", "3"):
+            self._subscriptions.add(tr_cd, tr_key, tr_type)
+        else:
+            self._subscriptions.remove(tr_cd, tr_key)
+        if self._websocket is None or self._websocket.closed:
+            return True
+        await self._send_realtime_frame(tr_cd, tr_key, tr_type)
+        return True
+
+    async def _send_realtime_frame(self, tr_cd:str, tr_key:str, tr_type:str) -> None:
         data = f"{{\"header\":{{\"token\":\"{self._access_token}\",\"tr_type\":\"{tr_type}\"}},\"body\":{{\"tr_cd\":\"{tr_cd}\",\"tr_key\":\"{tr_key}\"}}}}"
         await self._websocket.send_str(data)
-        return True
 
     async def _inner_on_mesage(self, msg:str):
         await self._on_message.emit_signal(self, msg)
 
+    async def _inner_on_connection(self, event:str, info:dict):
+        await self._on_connection.emit_signal(self, event, info)
+        await self._inner_on_mesage(f"websocket {event}. {info}")
+
     async def _inner_on_realtime(self, trcode:str, key:str, realtimedata):
+        for tap in self._realtime_taps:
+            try:
+                tap(trcode, key, realtimedata)
+            except Exception as e:
+                self._last_message = e
         await self._on_realtime.emit_signal(self, trcode, key, realtimedata)
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+
+# 기록 모드
+RECORD = "record"   # 항상 서버에 요청하고 응답을 기록한다.
+REPLAY = "replay"   # 기록된 응답만 사용한다. 서버에 접속하지 않는다.
+AUTO = "auto"       # 기록된 응답이 있으면 사용하고, 없으면 서버에 요청하여 기록한다.
+
+_KEY_PREFIX = b'{"key":"'
+_KEY_END = len(_KEY_PREFIX) + 40
+
+
+def cassette_key(path: str, tr_cd: str, tr_cont: str, tr_cont_key: str, request_data: bytes | str) -> str:
+    """요청을 식별하는 키 (sha1). 요청 본문은 키 순서와 공백에 관계없이 같은 키가 되도록 정규화한다."""
+    if isinstance(request_data, bytes):
+        request_data = request_data.decode("utf-8")
+    try:
+        request_data = json.dumps(json.loads(request_data), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        pass
+    text = "\0".join((path, tr_cd, tr_cont, tr_cont_key, request_data))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """REST 요청/응답 기록 파일
+
+    OpenApi.request에 연결하여 (path, tr_cd, tr_cont, tr_cont_key, 요청 본문) -> 응답 헤더/본문을 기록하고,
+    나중에 서버 없이 같은 응답을 재생한다.
+
+        api = OpenApi(cassette=Cassette("tests/stock.cassette", mode="record"))  # 실제 서버에 요청하며 기록
+        api = OpenApi(cassette=Cassette("tests/stock.cassette", mode="replay"))  # 기록만으로 실행
+
+    파일은 한 줄에 요청 하나인 JSON Lines이다. 줄 맨 앞에 키가 있으므로 열 때 줄을 파싱하지 않고
+    키 -> 파일 위치 색인을 만들고, 조회는 seek 한 번과 한 줄 파싱으로 끝난다.
+    같은 요청을 다시 기록하면 파일 뒤에 추가되고 마지막 기록이 사용된다.
+
+    path: 기록 파일 경로
+    mode: "record", "replay", "auto"
+    latency: 재생할 때 기록된 elapsed_ms에 곱해서 기다릴 비율. 0이면 기다리지 않고, 1.0이면 기록된 응답시간만큼 기다린다.
+    """
+    def __init__(self, path: str, mode: str = AUTO, latency: float = 0.0) -> None:
+        if mode not in (RECORD, REPLAY, AUTO):
+            raise ValueError(f"mode must be one of {RECORD!r}, {REPLAY!r}, {AUTO!r}")
+        if mode == REPLAY and not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._index: dict[str, int] = {}
+        self._reader = None
+        self._writer = None
+        self._hits = 0
+        self._misses = 0
+        self._recorded = 0
+        self._load_index()
+
+    @property
+    def replaying(self) -> bool:
+        """서버에 접속하지 않고 기록만 사용하는지 여부"""
+        return self.mode == REPLAY
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.startswith(_KEY_PREFIX):
+                    key = line[len(_KEY_PREFIX):_KEY_END].decode("ascii")
+                elif line.strip():
+                    key = json.loads(line)["key"]
+                else:
+                    key = None
+                if key:
+                    self._index[key] = offset
+                offset += len(line)
+
+    def lookup(self, path: str, tr_cd: str, tr_cont: str, tr_cont_key: str, request_data: bytes | str) -> dict | None:
+        """
+        기록된 응답을 찾는다.
+        return: {"status", "headers", "body", "elapsed_ms", ...}, 없으면 None
+        """
+        if self.mode == RECORD:
+            return None
+        offset = self._index.get(cassette_key(path, tr_cd, tr_cont, tr_cont_key, request_data))
+        if offset is None:
+            self._misses += 1
+            return None
+        if self._reader is None:
+            self._reader = open(self.path, "rb")
+        self._reader.seek(offset)
+        entry = json.loads(self._reader.readline())
+        if self.mode == AUTO and entry.get("status") != 200:
+            # 이전에 기록된 실패 응답(초당 전송 건수 초과 등)은 다시 요청한다.
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry
+
+    def record(self, path: str, tr_cd: str, tr_cont: str, tr_cont_key: str, request_data: bytes | str
+               , status: int, headers: dict, body: bytes | str, elapsed_ms: float) -> None:
+        """요청과 응답을 기록 파일 끝에 추가한다. 실패 응답(status != 200)은 기록하지 않는다."""
+        if self.mode == REPLAY or status != 200:
+            return
+        if isinstance(request_data, bytes):
+            request_data = request_data.decode("utf-8")
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        key = cassette_key(path, tr_cd, tr_cont, tr_cont_key, request_data)
+        # key가 맨 앞에 오도록 dict 순서를 유지한다. (_load_index 참고)
+        entry = {
+            "key": key,
+            "path": path,
+            "tr_cd": tr_cd,
+            "tr_cont": tr_cont,
+            "tr_cont_key": tr_cont_key,
+            "request": request_data,
+            "status": status,
+            "headers": headers,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "body": body,
+        }
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        if self._writer is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._writer = open(self.path, "ab")
+        offset = self._writer.tell()
+        self._writer.write(line)
+        self._writer.flush()
+        self._index[key] = offset
+        self._recorded += 1
+
+    def delay(self, entry: dict) -> float:
+        """재생할 응답을 돌려주기 전에 기다릴 시간(초)"""
+        if not self.latency:
+            return 0.0
+        return entry.get("elapsed_ms", 0.0) * self.latency / 1000
+
+    def save_login(self, is_simulation: bool) -> None:
+        """로그인 결과(모의투자 여부)를 기록한다. 재생할 때는 토큰 발급 없이 이 값을 사용한다."""
+        self.record("/oauth2/token", "", "", "", "", 200, {}, json.dumps({"is_simulation": is_simulation}), 0.0)
+
+    def load_login(self) -> dict | None:
+        """기록된 로그인 결과. 없으면 None"""
+        entry = self.lookup("/oauth2/token", "", "", "", "")
+        return json.loads(entry["body"]) if entry else None
+
+    def stats(self) -> dict:
+        """기록된 요청 수, 재생 성공/실패 수, 이번에 기록한 수"""
+        return {
+            "entries": len(self._index),
+            "hits": self._hits,
+            "misses": self._misses,
+            "recorded": self._recorded,
+        }
+
+    def close(self) -> None:
+        for f in (self._reader, self._writer):
+            if f is not None:
+                f.close()
+        self._reader = None
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
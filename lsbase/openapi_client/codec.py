@@ -0,0 +1,61 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec:
+    """표준 라이브러리 json 기반 코덱
+
+    dumps: 객체 -> UTF-8 bytes
+    loads: bytes 또는 str -> 객체
+    """
+    name = "json"
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes | str):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson 기반 코덱 (pip install orjson)"""
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed. pip install orjson")
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes | str):
+        return orjson.loads(data)
+
+
+_codecs = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def available_codecs() -> list[str]:
+    """현재 환경에서 사용 가능한 코덱 이름 목록"""
+    names = [JsonCodec.name]
+    if orjson is not None:
+        names.append(OrjsonCodec.name)
+    return names
+
+
+def get_codec(name: str = None) -> JsonCodec:
+    """코덱 생성
+    name: "json", "orjson". 생략시 설치된 코덱 중 가장 빠른 것을 사용한다.
+    """
+    if name is None:
+        name = OrjsonCodec.name if orjson is not None else JsonCodec.name
+    if name not in _codecs:
+        raise ValueError(f"unknown codec: {name}")
+    return _codecs[name]()
@@ -0,0 +1,95 @@
+import asyncio
+import types
+
+import aiohttp
+
+
+class ConnectionPoolConfig:
+    """REST 세션의 커넥션 풀 설정
+
+    limit: 전체 동시 연결 수 상한
+    limit_per_host: 호스트별 동시 연결 수 상한
+    keepalive_timeout: 유휴 연결을 유지하는 시간(초)
+    ttl_dns_cache: DNS 조회 결과를 캐시하는 시간(초)
+    warm_connections: 로그인 시 미리 열어 둘 TLS 연결 수
+    request_timeout: 요청 전체 타임아웃(초)
+    """
+    def __init__(
+        self,
+        limit: int = 32,
+        limit_per_host: int = 16,
+        keepalive_timeout: float = 120.0,
+        ttl_dns_cache: int = 600,
+        warm_connections: int = 4,
+        request_timeout: float = 10.0,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.warm_connections = warm_connections
+        self.request_timeout = request_timeout
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+    def create_timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=self.request_timeout)
+
+
+class ConnectionTracer:
+    """aiohttp TraceConfig를 이용해 요청별 연결 재사용 여부를 기록한다.
+
+    요청 시 new_context()로 만든 객체를 trace_request_ctx로 넘기면,
+    요청이 끝난 뒤 ctx.reused에 재사용 여부(True/False)가 기록된다.
+    """
+    def __init__(self) -> None:
+        self.created = 0
+        self.reused = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_connection_create_end.append(self._on_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+
+    @staticmethod
+    def new_context() -> types.SimpleNamespace:
+        return types.SimpleNamespace(reused=None)
+
+    async def _on_create(self, session, trace_config_ctx, params) -> None:
+        self.created += 1
+        ctx = trace_config_ctx.trace_request_ctx
+        if ctx is not None:
+            ctx.reused = False
+
+    async def _on_reuse(self, session, trace_config_ctx, params) -> None:
+        self.reused += 1
+        ctx = trace_config_ctx.trace_request_ctx
+        if ctx is not None:
+            ctx.reused = True
+
+    def stats(self) -> dict:
+        total = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_ratio": self.reused / total if total else 0.0,
+        }
+
+
+async def warm_up(session: aiohttp.ClientSession, url: str, count: int) -> int:
+    """url의 호스트로 count개의 연결을 동시에 열어 풀에 넣어 둔다. 성공한 연결 수를 반환한다."""
+    async def _open() -> bool:
+        try:
+            async with session.get(url) as response:
+                await response.read()
+            return True
+        except Exception:
+            return False
+
+    results = await asyncio.gather(*(_open() for _ in range(count)))
+    return sum(results)
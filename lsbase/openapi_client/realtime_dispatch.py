@@ -0,0 +1,423 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+
+from ..generated_decoders import decode as decode_realtime
+
+logger = logging.getLogger(__name__)
+
+# 큐가 가득 찼을 때의 처리 방식
+OVERFLOW_BLOCK = "block"              # 자리가 날 때까지 수신 루프가 기다린다 (해당 구독자가 느리면 수신도 느려짐)
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # 가장 오래된 항목을 버린다
+OVERFLOW_CONFLATE = "conflate"        # 같은 키(trcode, key)의 대기 항목을 최신 값으로 교체한다
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_CONFLATE)
+
+DEFAULT_MAXSIZE = 10000
+
+# 구독 패턴에서 모든 TR 코드/키를 뜻하는 값
+WILDCARD = "*"
+_ANY = object()
+_EMPTY = ()
+
+
+class SubscriberQueue:
+    """구독자 하나의 크기 제한 큐
+
+    항목은 (enqueue 시각, 값)으로 보관하여 꺼낼 때 지연시간(lag)을 측정한다.
+    conflate 정책에서는 키별로 최신 값 하나만 대기한다.
+    """
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, overflow: str = OVERFLOW_DROP_OLDEST) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._items = OrderedDict() if overflow == OVERFLOW_CONFLATE else deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._closed = False
+
+        # 통계
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.max_depth = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.last_lag = 0.0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put_nowait(self, item, key=None) -> bool:
+        """항목을 넣는다. block 정책에서 큐가 가득 차 있으면 False를 반환한다."""
+        if self._closed:
+            return True
+        now = time.perf_counter()
+        items = self._items
+        if self.overflow == OVERFLOW_CONFLATE:
+            if key in items:
+                # 대기 중인 값은 최신 값으로 교체하되, 처음 대기를 시작한 시각은 유지한다.
+                items[key] = (items[key][0], item)
+                self.conflated += 1
+                return True
+            if len(items) >= self.maxsize:
+                items.popitem(last=False)
+                self.dropped += 1
+            items[key] = (now, item)
+        else:
+            if len(items) >= self.maxsize:
+                if self.overflow == OVERFLOW_BLOCK:
+                    self._not_full.clear()
+                    return False
+                items.popleft()
+                self.dropped += 1
+            items.append((now, item))
+        self.enqueued += 1
+        depth = len(items)
+        if depth > self.max_depth:
+            self.max_depth = depth
+        self._not_empty.set()
+        return True
+
+    async def get_batch(self, max_size: int, max_delay: float) -> list:
+        """항목을 최대 max_size개까지 묶어서 꺼낸다.
+        첫 항목이 들어올 때까지 기다린 뒤, max_delay초 동안 추가 항목을 더 모은다.
+        닫힌 큐가 비면 EOFError
+        """
+        batch = [await self.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_delay
+        while len(batch) < max_size:
+            if self._items:
+                batch.append(self.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self._closed:
+                break
+            try:
+                await asyncio.wait_for(self._not_empty.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def put(self, item, key=None) -> None:
+        """항목을 넣는다. block 정책에서는 자리가 날 때까지 기다린다."""
+        while not self.put_nowait(item, key):
+            await self._not_full.wait()
+
+    def get_nowait(self):
+        """항목을 꺼낸다. 비어 있으면 IndexError"""
+        items = self._items
+        if self.overflow == OVERFLOW_CONFLATE:
+            if not items:
+                raise IndexError("queue is empty")
+            _, (enqueued_at, item) = items.popitem(last=False)
+        else:
+            enqueued_at, item = items.popleft()
+        if not items:
+            self._not_empty.clear()
+        self._not_full.set()
+
+        lag = time.perf_counter() - enqueued_at
+        self.delivered += 1
+        self.total_lag += lag
+        self.last_lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        return item
+
+    async def get(self):
+        """항목을 꺼낸다. 비어 있으면 들어올 때까지 기다린다. 닫힌 큐가 비면 EOFError"""
+        while not self._items:
+            if self._closed:
+                raise EOFError("queue closed")
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def close(self) -> None:
+        """더 이상 항목을 받지 않는다. 대기 중인 get()은 남은 항목을 모두 꺼낸 뒤 EOFError를 받는다."""
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    def stats(self) -> dict:
+        return {
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "maxsize": self.maxsize,
+            "overflow": self.overflow,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "avg_lag_ms": (self.total_lag / self.delivered * 1000) if self.delivered else 0.0,
+            "max_lag_ms": self.max_lag * 1000,
+            "last_lag_ms": self.last_lag * 1000,
+        }
+
+
+def _pattern(value) -> frozenset | None:
+    """None/"*" -> None(모든 값), 문자열 -> {문자열}, 목록 -> 집합"""
+    if value is None or value == WILDCARD:
+        return None
+    if isinstance(value, str):
+        return frozenset((value,))
+    values = frozenset(value)
+    return None if WILDCARD in values else values
+
+
+class _Subscriber:
+    """핸들러 하나와 그 전용 큐/작업 태스크
+
+    func가 None이면 작업 태스크 없이 큐만 채우고, 소비자가 큐를 직접 읽는다. (RealtimeStream)
+    trcodes, keys: 구독할 TR 코드/키 집합. None이면 모든 값
+    decode: True이면 핸들러에 dict 대신 generated_decoders의 디코더 객체를 전달한다.
+    """
+    def __init__(self, func, queue: SubscriberQueue, trcodes: frozenset = None, keys: frozenset = None, decode: bool = False) -> None:
+        self.func = func
+        self.decode = decode
+        self.is_coroutine = asyncio.iscoroutinefunction(func)
+        self.queue = queue
+        self.trcodes = trcodes
+        self.keys = keys
+        self.task = None
+        self.errors = 0
+        # 큐가 비고 꺼낸 항목의 핸들러 호출이 모두 끝났으면 set (join에서 사용)
+        self.idle = asyncio.Event()
+        self.idle.set()
+
+    @property
+    def name(self) -> str:
+        if self.func is None:
+            return f"queue:{self.pattern}"
+        return getattr(self.func, "__qualname__", repr(self.func))
+
+    @property
+    def pattern(self) -> str:
+        trcodes = ",".join(sorted(self.trcodes)) if self.trcodes is not None else WILDCARD
+        keys = ",".join(sorted(self.keys)) if self.keys is not None else WILDCARD
+        return f"{trcodes}/{keys}"
+
+    def routes(self) -> list:
+        """이 구독자를 등록할 (색인 이름, 색인 키) 목록"""
+        if self.trcodes is not None and self.keys is not None:
+            return [("exact", (trcode, key)) for trcode in self.trcodes for key in self.keys]
+        if self.trcodes is not None:
+            return [("trcode", trcode) for trcode in self.trcodes]
+        if self.keys is not None:
+            return [("key", key) for key in self.keys]
+        return [("all", None)]
+
+    def ensure_started(self) -> None:
+        if self.func is None:
+            return
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def wait_idle(self) -> None:
+        """큐가 비고 마지막으로 꺼낸 항목의 핸들러 호출이 끝날 때까지 기다린다. 작업 태스크가 끝나도 반환한다."""
+        task = self.task
+        if self.idle.is_set() or task is None or task.done():
+            return
+        waiter = asyncio.ensure_future(self.idle.wait())
+        try:
+            await asyncio.wait((waiter, task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+
+    async def _run(self) -> None:
+        queue = self.queue
+        while True:
+            try:
+                args = await queue.get()
+            except EOFError:
+                self.idle.set()
+                return
+            try:
+                if self.decode:
+                    sender, trcode, key, data = args
+                    args = (sender, trcode, key, decode_realtime(trcode, data))
+                if self.is_coroutine:
+                    await self.func(*args)
+                else:
+                    self.func(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 핸들러 예외는 해당 구독자에서만 처리하고 다른 구독자/수신 루프에는 영향을 주지 않는다.
+                self.errors += 1
+                logger.exception(f"realtime handler {self.name} raised an exception")
+            if not len(queue):
+                self.idle.set()
+
+    def stats(self) -> dict:
+        return {**self.queue.stats(), "pattern": self.pattern, "errors": self.errors}
+
+
+class RealtimeDispatcher:
+    """실시간 데이터 분배기
+
+    수신 루프는 emit_signal()로 (trcode, key)에 해당하는 구독자의 큐에 넣기만 하고,
+    핸들러는 구독자별 작업 태스크에서 실행된다.
+    느린 핸들러나 예외가 발생한 핸들러가 수신 루프와 다른 핸들러를 막지 않는다.
+
+    구독자는 패턴 종류별 dict에 색인되어, 프레임 하나당 조회 4번으로 대상 구독자를 찾는다.
+        (trcode, key) 지정      -> _exact[(trcode, key)]
+        trcode만 지정           -> _by_trcode[trcode]
+        key만 지정              -> _by_key[key]
+        둘 다 생략(모든 데이터) -> _all
+    """
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, overflow: str = OVERFLOW_DROP_OLDEST) -> None:
+        self._default_maxsize = maxsize
+        self._default_overflow = overflow
+        self._subscribers: list[_Subscriber] = []
+        self._exact: dict[tuple[str, str], list[_Subscriber]] = {}
+        self._by_trcode: dict[str, list[_Subscriber]] = {}
+        self._by_key: dict[str, list[_Subscriber]] = {}
+        self._all: list[_Subscriber] = []
+
+    def connect(self, func, trcode=None, key=None, *, maxsize: int = None, overflow: str = None, decode: bool = False) -> None:
+        """핸들러 등록
+        func(sender, trcode, key, realtimedata)
+        trcode: 받을 TR 코드 또는 그 목록, None/"*"이면 모든 TR
+        key: 받을 키(종목코드 등) 또는 그 목록, None/"*"이면 모든 키
+        maxsize: 이 핸들러의 큐 크기, 생략시 기본값
+        overflow: "block", "drop_oldest", "conflate" 중 하나, 생략시 기본값
+        decode: True이면 realtimedata로 dict 대신 디코더 객체(generated_decoders)를 받는다. 디코딩은 핸들러 작업 태스크에서 수행된다.
+
+        같은 핸들러를 다른 패턴으로 여러 번 등록할 수 있으며, 각 등록은 별도의 큐를 가진다.
+        """
+        if not hasattr(func, "__call__"):
+            raise ValueError("slot must be callable")
+        trcodes, keys = _pattern(trcode), _pattern(key)
+        if next((s for s in self._subscribers if s.func == func and s.trcodes == trcodes and s.keys == keys), None):
+            return
+        queue = SubscriberQueue(maxsize or self._default_maxsize, overflow or self._default_overflow)
+        subscriber = _Subscriber(func, queue, trcodes, keys, decode)
+        self._subscribers.append(subscriber)
+        for index, route in subscriber.routes():
+            self._index(index, route).append(subscriber)
+
+    def subscribe(self, trcode=None, key=None, *, maxsize: int = None, overflow: str = None, decode: bool = False):
+        """connect()의 데코레이터 형태
+
+        @api.on_realtime.subscribe("S3_", "005930")
+        def on_samsung(sender, trcode, key, realtimedata): ...
+        """
+        def decorator(func):
+            self.connect(func, trcode, key, maxsize=maxsize, overflow=overflow, decode=decode)
+            return func
+        return decorator
+
+    def open_queue(self, trcode=None, key=None, *, maxsize: int = None, overflow: str = None) -> SubscriberQueue:
+        """핸들러 대신 큐를 등록한다. 호출자가 큐에서 (sender, trcode, key, realtimedata)를 직접 꺼낸다.
+        사용이 끝나면 close_queue()로 해제한다.
+        """
+        queue = SubscriberQueue(maxsize or self._default_maxsize, overflow or self._default_overflow)
+        subscriber = _Subscriber(None, queue, _pattern(trcode), _pattern(key))
+        self._subscribers.append(subscriber)
+        for index, route in subscriber.routes():
+            self._index(index, route).append(subscriber)
+        return queue
+
+    def close_queue(self, queue: SubscriberQueue) -> None:
+        subscriber = next((s for s in self._subscribers if s.queue is queue), None)
+        if subscriber:
+            self._remove(subscriber)
+
+    def disconnect(self, func, trcode=_ANY, key=_ANY) -> None:
+        """핸들러 해제. trcode/key를 생략하면 해당 핸들러의 모든 등록을 해제한다."""
+        trcodes = _ANY if trcode is _ANY else _pattern(trcode)
+        keys = _ANY if key is _ANY else _pattern(key)
+        for subscriber in [s for s in self._subscribers if s.func is not None and s.func == func]:
+            if trcodes is not _ANY and subscriber.trcodes != trcodes:
+                continue
+            if keys is not _ANY and subscriber.keys != keys:
+                continue
+            self._remove(subscriber)
+
+    def disconnect_all(self) -> None:
+        for subscriber in self._subscribers:
+            subscriber.queue.close()
+        self._subscribers.clear()
+        self._exact.clear()
+        self._by_trcode.clear()
+        self._by_key.clear()
+        self._all.clear()
+
+    def _index(self, index: str, route) -> list:
+        if index == "all":
+            return self._all
+        table = {"exact": self._exact, "trcode": self._by_trcode, "key": self._by_key}[index]
+        return table.setdefault(route, [])
+
+    def _remove(self, subscriber: _Subscriber) -> None:
+        self._subscribers.remove(subscriber)
+        for index, route in subscriber.routes():
+            if index == "all":
+                self._all.remove(subscriber)
+                continue
+            table = {"exact": self._exact, "trcode": self._by_trcode, "key": self._by_key}[index]
+            subscribers = table[route]
+            subscribers.remove(subscriber)
+            if not subscribers:
+                del table[route]
+        subscriber.queue.close()
+
+    def has_subscribers(self, trcode: str, key: str) -> bool:
+        """(trcode, key) 데이터를 받을 구독자가 있는지"""
+        return bool(self._all or (trcode, key) in self._exact or trcode in self._by_trcode or key in self._by_key)
+
+    async def emit_signal(self, sender, trcode: str, key: str, realtimedata) -> None:
+        """수신한 실시간 데이터를 (trcode, key)에 해당하는 구독자 큐에 넣는다."""
+        args = (sender, trcode, key, realtimedata)
+        conflate_key = (trcode, key)
+        for subscribers in (
+            self._exact.get(conflate_key, _EMPTY),
+            self._by_trcode.get(trcode, _EMPTY),
+            self._by_key.get(key, _EMPTY),
+            self._all,
+        ):
+            for subscriber in subscribers:
+                subscriber.ensure_started()
+                subscriber.idle.clear()
+                if not subscriber.queue.put_nowait(args, conflate_key):
+                    await subscriber.queue.put(args, conflate_key)
+
+    async def join(self) -> None:
+        """핸들러 구독자의 큐가 모두 비고 핸들러 호출이 모두 끝날 때까지 기다린다. (기록 재생 등에서 처리 완료를 확인할 때)"""
+        while True:
+            busy = [s for s in self._subscribers if not s.idle.is_set() and s.task is not None and not s.task.done()]
+            if not busy:
+                return
+            for subscriber in busy:
+                await subscriber.wait_idle()
+
+    async def close(self) -> None:
+        """모든 작업 태스크를 종료한다. 등록된 핸들러는 유지되며 다음 emit_signal 때 다시 시작된다."""
+        tasks = [s.task for s in self._subscribers if s.task and not s.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for subscriber in self._subscribers:
+            subscriber.task = None
+
+    def stats(self) -> dict:
+        """핸들러별 구독 패턴, 큐 깊이, 지연시간, 버린 항목 수, 예외 수"""
+        result = {}
+        for subscriber in self._subscribers:
+            name = subscriber.name
+            if name in result:
+                name = f"{name}#{len(result)}"
+            result[name] = subscriber.stats()
+        return result
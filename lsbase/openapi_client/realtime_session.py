@@ -0,0 +1,78 @@
+import random
+
+
+class ReconnectPolicy:
+    """웹소켓 재연결 정책
+
+    enabled: 연결이 끊겼을 때 자동으로 재연결할지 여부
+    initial_delay: 첫 재연결 시도 전 대기시간(초)
+    max_delay: 재연결 대기시간 상한(초)
+    multiplier: 실패할 때마다 대기시간에 곱하는 값
+    jitter: 대기시간에 더하는 무작위 비율 (0.1 -> 최대 +10%)
+    max_attempts: 최대 재연결 시도 횟수, None이면 무제한
+    heartbeat: ping 간격(초). 응답이 없으면 끊긴 것으로 판단한다. None이면 사용하지 않는다.
+    replay_batch_size: 재연결 후 구독을 복구할 때 한 번에 보내는 구독 요청 수
+    replay_batch_interval: 구독 복구 배치 사이의 대기시간(초)
+    """
+    def __init__(
+        self,
+        enabled: bool = True,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.1,
+        max_attempts: int = None,
+        heartbeat: float = 30.0,
+        replay_batch_size: int = 20,
+        replay_batch_interval: float = 0.2,
+    ) -> None:
+        self.enabled = enabled
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.heartbeat = heartbeat
+        self.replay_batch_size = replay_batch_size
+        self.replay_batch_interval = replay_batch_interval
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(1부터) 재연결 시도 전 대기시간"""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        return delay * (1.0 + random.random() * self.jitter)
+
+
+class SubscriptionRegistry:
+    """웹소켓에 등록된 실시간 구독 목록
+
+    (tr_cd, tr_key) -> 등록 tr_type을 등록 순서대로 보관한다.
+    재연결 후 이 목록을 그대로 다시 등록한다.
+    """
+    def __init__(self) -> None:
+        self._items: dict[tuple[str, str], str] = {}
+
+    def add(self, tr_cd: str, tr_key: str, tr_type: str) -> None:
+        self._items[(tr_cd, tr_key)] = tr_type
+
+    def remove(self, tr_cd: str, tr_key: str) -> None:
+        self._items.pop((tr_cd, tr_key), None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def items(self) -> list[tuple[str, str, str]]:
+        """[(tr_cd, tr_key, tr_type), ...]"""
+        return [(tr_cd, tr_key, tr_type) for (tr_cd, tr_key), tr_type in self._items.items()]
+
+    def snapshot(self) -> frozenset[tuple[str, str]]:
+        """현재 구독 중인 (tr_cd, tr_key) 집합"""
+        return frozenset(self._items)
+
+    def __contains__(self, item: tuple[str, str]) -> bool:
+        return item in self._items
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,125 @@
+import logging
+from typing import NamedTuple
+
+from ..generated_decoders import decode as decode_realtime
+from .realtime_dispatch import DEFAULT_MAXSIZE, OVERFLOW_DROP_OLDEST
+
+logger = logging.getLogger(__name__)
+
+
+class RealtimeEvent(NamedTuple):
+    """스트림으로 전달되는 실시간 데이터 하나"""
+    trcode: str
+    key: str
+    data: dict  # decode=True이면 디코더 객체 (generated_decoders)
+
+
+class RealtimeStream:
+    """실시간 데이터 비동기 이터레이터
+
+    async for tick in RealtimeStream(api, "S3_", ["005930", "000660"]):
+        print(tick.key, tick.data["price"])
+
+    처음 반복할 때 구독을 등록하고, 반복이 끝나거나(break 포함) close()하면 구독을 해제한다.
+    구독은 api.subscriptions(SubscriptionManager)의 참조 카운트로 관리되어 다른 구독자에 영향을 주지 않는다.
+    async with로 사용하면 블록을 벗어날 때 확실하게 해제된다.
+
+    api: OpenApi
+    trcode: 실시간 TR 코드
+    keys: 종목코드 등 TR 키 또는 그 목록
+    maxsize: 이 스트림의 버퍼 크기
+    overflow: 버퍼가 가득 찼을 때의 처리 방식 ("block", "drop_oldest", "conflate")
+    decode: True이면 dict 대신 디코더 객체로 변환하여 전달한다. (tick.data.price -> int)
+    """
+    def __init__(self, api, trcode: str, keys, maxsize: int = DEFAULT_MAXSIZE, overflow: str = OVERFLOW_DROP_OLDEST, decode: bool = False) -> None:
+        self._api = api
+        self.trcode = trcode
+        self.keys = [keys] if isinstance(keys, str) else list(keys)
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._decode = decode
+        self._queue = None
+        self._acquired = False
+        self._closed = False
+
+    @property
+    def opened(self) -> bool:
+        return self._queue is not None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def open(self) -> None:
+        """버퍼를 등록하고 실시간 데이터를 구독한다."""
+        if self._queue is not None or self._closed:
+            return
+        # 구독 응답보다 먼저 도착하는 데이터를 놓치지 않도록 버퍼를 먼저 등록한다.
+        self._queue = self._api.on_realtime.open_queue(self.trcode, self.keys, maxsize=self._maxsize, overflow=self._overflow)
+        self._acquired = True
+        await self._api.subscriptions.acquire(self.trcode, self.keys)
+
+    async def close(self) -> None:
+        """구독을 해제하고 버퍼를 닫는다. 버퍼에 남은 데이터는 계속 꺼낼 수 있다."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._queue is None:
+            return
+        self._api.on_realtime.close_queue(self._queue)
+        if self._acquired and self._api.connected:
+            await self._api.subscriptions.release(self.trcode, self.keys)
+        self._acquired = False
+
+    aclose = close
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        await self.open()
+        queue = self._queue
+        try:
+            while True:
+                try:
+                    _, trcode, key, data = await queue.get()
+                except EOFError:
+                    return
+                yield RealtimeEvent(trcode, key, decode_realtime(trcode, data) if self._decode else data)
+        finally:
+            await self.close()
+
+    async def batches(self, max_size: int = 100, max_delay: float = 0.05):
+        """데이터를 묶어서 전달한다. tick마다 깨어나는 비용을 줄일 때 사용한다.
+
+        async for batch in stream.batches(max_size=200, max_delay=0.1):
+            for tick in batch: ...
+
+        max_size: 한 묶음의 최대 개수
+        max_delay: 첫 데이터를 받은 뒤 더 기다리는 최대 시간(초)
+        """
+        await self.open()
+        queue = self._queue
+        try:
+            while True:
+                try:
+                    items = await queue.get_batch(max_size, max_delay)
+                except EOFError:
+                    return
+                if self._decode:
+                    yield [RealtimeEvent(trcode, key, decode_realtime(trcode, data)) for _, trcode, key, data in items]
+                else:
+                    yield [RealtimeEvent(trcode, key, data) for _, trcode, key, data in items]
+        finally:
+            await self.close()
+
+    def stats(self) -> dict:
+        """버퍼 깊이, 지연시간, 버린 항목 수"""
+        return self._queue.stats() if self._queue is not None else {}
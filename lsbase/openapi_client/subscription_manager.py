@@ -0,0 +1,143 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _pairs(trcode: str, keys) -> list[tuple[str, str]]:
+    if isinstance(keys, str):
+        keys = (keys,)
+    return [(trcode, key) for key in dict.fromkeys(keys)]
+
+
+class SubscriptionManager:
+    """실시간 구독 참조 카운트 관리자
+
+    (trcode, key)마다 몇 곳에서 구독 중인지 센다. 처음 구독할 때만 등록 프레임을,
+    마지막 구독이 해제될 때만 해제 프레임을 보내므로 한 곳의 해제가 다른 곳의 구독을 끊지 않는다.
+
+    apply(owner, desired)는 소유자별로 원하는 구독 집합을 받아 달라진 부분만 반영한다.
+    등록/해제 프레임은 batch_size개씩 batch_interval초 간격으로 나누어 보낸다.
+
+    api: OpenApi
+    """
+    def __init__(self, api, batch_size: int = 20, batch_interval: float = 0.2) -> None:
+        self._api = api
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._refs: dict[tuple[str, str], int] = {}
+        self._owners: dict[object, set[tuple[str, str]]] = {}
+        self._send_lock = asyncio.Lock()
+
+        # 통계
+        self.frames_sent = 0
+        self.frames_failed = 0
+        self.frames_saved = 0
+
+    def refcount(self, trcode: str, key: str) -> int:
+        return self._refs.get((trcode, key), 0)
+
+    def live(self) -> frozenset[tuple[str, str]]:
+        """현재 구독 중인 (trcode, key) 집합"""
+        return frozenset(self._refs)
+
+    def owned(self, owner) -> frozenset[tuple[str, str]]:
+        """apply()로 owner가 등록한 (trcode, key) 집합"""
+        return frozenset(self._owners.get(owner, ()))
+
+    async def acquire(self, trcode: str, keys) -> bool:
+        """구독 참조를 하나씩 늘린다. 새로 구독해야 하는 키만 등록 프레임을 보낸다."""
+        return not (await self._update(_pairs(trcode, keys), ()))["failed"]
+
+    async def release(self, trcode: str, keys) -> bool:
+        """구독 참조를 하나씩 줄인다. 더 이상 참조가 없는 키만 해제 프레임을 보낸다."""
+        return not (await self._update((), _pairs(trcode, keys)))["failed"]
+
+    async def apply(self, owner, desired) -> dict:
+        """owner의 구독 집합을 desired로 바꾼다.
+
+        desired: (trcode, key) 목록
+        return: {"subscribed": [...], "unsubscribed": [...], "failed": [...]} 실제로 프레임을 보낸 항목
+        """
+        desired = set(desired)
+        current = self._owners.get(owner, set())
+        added = [pair for pair in desired if pair not in current]
+        removed = [pair for pair in current if pair not in desired]
+        if desired:
+            self._owners[owner] = desired
+        else:
+            self._owners.pop(owner, None)
+        result = await self._update(added, removed)
+        if result["failed"] and owner in self._owners:
+            self._owners[owner].difference_update(result["failed"])
+        return result
+
+    async def release_owner(self, owner) -> dict:
+        """owner가 apply()로 등록한 구독을 모두 해제한다."""
+        return await self.apply(owner, ())
+
+    def reset(self) -> None:
+        """연결을 종료할 때 참조 카운트를 모두 지운다. 프레임은 보내지 않는다."""
+        self._refs.clear()
+        self._owners.clear()
+
+    async def _update(self, added, removed) -> dict:
+        refs = self._refs
+        to_subscribe = []
+        to_unsubscribe = []
+        # 해제를 먼저 계산하여 같은 호출 안에서 빠졌다가 들어오는 항목은 프레임 없이 유지한다.
+        for pair in removed:
+            count = refs.get(pair, 0)
+            if count <= 1:
+                if count:
+                    del refs[pair]
+                    to_unsubscribe.append(pair)
+            else:
+                refs[pair] = count - 1
+                self.frames_saved += 1
+        for pair in added:
+            count = refs.get(pair, 0)
+            refs[pair] = count + 1
+            if count:
+                self.frames_saved += 1
+            else:
+                to_subscribe.append(pair)
+
+        # 서버의 구독 개수 제한에 걸리지 않도록 해제 프레임을 먼저 보낸다.
+        unsubscribed, _ = await self._send_frames(self._api.remove_realtime, to_unsubscribe)
+        subscribed, failed = await self._send_frames(self._api.add_realtime, to_subscribe)
+        for pair in failed:
+            count = refs.get(pair, 0)
+            if count <= 1:
+                refs.pop(pair, None)
+            else:
+                refs[pair] = count - 1
+        return {"subscribed": subscribed, "unsubscribed": unsubscribed, "failed": failed}
+
+    async def _send_frames(self, send, pairs) -> tuple[list, list]:
+        done, failed = [], []
+        if not pairs:
+            return done, failed
+        async with self._send_lock:
+            for i in range(0, len(pairs), self.batch_size):
+                if i:
+                    await asyncio.sleep(self.batch_interval)
+                for trcode, key in pairs[i:i + self.batch_size]:
+                    if await send(trcode, key):
+                        done.append((trcode, key))
+                        self.frames_sent += 1
+                    else:
+                        failed.append((trcode, key))
+                        self.frames_failed += 1
+                        logger.warning(f"실시간 구독 요청 실패 ({trcode}, {key}): {self._api.last_message}")
+        return done, failed
+
+    def stats(self) -> dict:
+        """구독 중인 항목 수, 소유자 수, 보낸/실패한/생략한 프레임 수"""
+        return {
+            "live": len(self._refs),
+            "owners": len(self._owners),
+            "frames_sent": self.frames_sent,
+            "frames_failed": self.frames_failed,
+            "frames_saved": self.frames_saved,
+        }
@@ -0,0 +1,98 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenStore:
+    """접근토큰 디스크 캐시
+
+    앱키별로 접근토큰, 만료시각, 모의투자 여부를 파일에 저장한다.
+    같은 앱키를 사용하는 여러 프로세스가 파일 잠금으로 토큰 발급을 직렬화하여
+    한 프로세스가 발급한 토큰을 나머지가 재사용한다.
+
+    cache_dir: 토큰 파일을 저장할 디렉토리
+    refresh_margin: 만료 몇 초 전부터 토큰을 갱신 대상으로 볼지
+    """
+    def __init__(self, cache_dir: str, refresh_margin: float = 600.0) -> None:
+        self.cache_dir = cache_dir
+        self.refresh_margin = refresh_margin
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, appkey: str, suffix: str) -> str:
+        # 앱키를 그대로 파일명에 쓰지 않는다.
+        digest = hashlib.sha256(appkey.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"token-{digest}{suffix}")
+
+    def load(self, appkey: str) -> dict | None:
+        """저장된 토큰을 읽는다. 없거나 refresh_margin 이내에 만료되면 None"""
+        try:
+            with open(self._path(appkey, ".json"), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not record.get("access_token") or record.get("expires_at", 0) - self.refresh_margin <= time.time():
+            return None
+        return record
+
+    def save(self, appkey: str, access_token: str, expires_at: float, is_simulation: bool) -> None:
+        """토큰을 저장한다. 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 본다."""
+        record = {"access_token": access_token, "expires_at": expires_at, "is_simulation": is_simulation}
+        path = self._path(appkey, ".json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+    def clear(self, appkey: str) -> None:
+        """저장된 토큰을 삭제한다. 토큰이 폐기되었을 때 사용한다."""
+        try:
+            os.remove(self._path(appkey, ".json"))
+        except OSError:
+            pass
+
+    @asynccontextmanager
+    async def lock(self, appkey: str, timeout: float = 30.0, poll: float = 0.05):
+        """앱키별 프로세스 간 잠금. 이벤트 루프를 막지 않도록 비차단 잠금을 주기적으로 재시도한다."""
+        fd = os.open(self._path(appkey, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        deadline = time.monotonic() + timeout
+        try:
+            while not _try_lock(fd):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError("token store lock timeout")
+                await asyncio.sleep(poll)
+            try:
+                yield
+            finally:
+                _unlock(fd)
+        finally:
+            os.close(fd)
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd: int) -> None:
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,341 @@
+# lsbase/realtime/bar_aggregator.py
+
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..core.models import ChartBar, MarketState
+from ..generated_decoders import RealtimeRecord
+from .tick_store import EXECUTION_TR_CODES
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 체결 TR -> JIF 시장 구분 (1: 코스피, 2: 코스닥)
+MARKET_BY_TRCODE = {"S3_": "1", "K3_": "2"}
+
+LABEL_END = "end"        # 봉의 종료 시각 (t8412와 같음. 09:00:00~09:00:59 -> "090100")
+LABEL_START = "start"    # 봉의 시작 시각 (09:00:00~09:00:59 -> "090000")
+
+SESSION_FLUSH = "flush"  # 시장 상태가 바뀌면 진행 중인 봉을 완성된 봉으로 내보냄
+SESSION_RESET = "reset"  # 시장 상태가 바뀌면 진행 중인 봉을 버림
+
+_UNITS = {"s": 1, "m": 60, "t": 0}
+
+
+def parse_interval(interval: str) -> Tuple[str, int]:
+    """"1s", "1m", "5m", "100t" -> ("time", 초) 또는 ("tick", 체결 수)"""
+    text = interval.strip().lower()
+    unit = text[-1:]
+    try:
+        n = int(text[:-1])
+    except ValueError:
+        n = 0
+    if unit not in _UNITS or n < 1:
+        raise ValueError(f"지원하지 않는 봉 단위입니다: {interval!r} (예: '1s', '1m', '5m', '100t')")
+    if unit == "t":
+        return "tick", n
+    return "time", n * _UNITS[unit]
+
+
+def _seconds(hhmmss: int) -> int:
+    return hhmmss // 10000 * 3600 + hhmmss // 100 % 100 * 60 + hhmmss % 100
+
+
+def _hhmmss(seconds: int) -> str:
+    return f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}"
+
+
+class _Bar:
+    """진행 중인 봉. 체결마다 필드만 갱신하고 완성될 때 ChartBar로 변환합니다."""
+    __slots__ = ("date", "start", "time", "open", "high", "low", "close", "volume", "value", "ticks")
+
+    def __init__(self, date: str, start: int, time: str, price: int, volume: int):
+        self.date = date
+        self.start = start  # 시간봉: 구간 시작(자정 이후 초), 틱봉: 사용하지 않음
+        self.time = time
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+        self.value = price * volume
+        self.ticks = 1
+
+    def update(self, price: int, volume: int) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.value += price * volume
+        self.ticks += 1
+
+    def to_model(self) -> ChartBar:
+        return ChartBar(
+            date=self.date, time=self.time, open=self.open, high=self.high, low=self.low,
+            close=self.close, volume=self.volume, value=self.value,
+        )
+
+
+class _TimeBars:
+    """N초 시간봉 한 종류. 구간은 origin(기본 09:00:00)부터 N초 간격입니다."""
+    __slots__ = ("interval", "seconds", "origin", "label_end", "bar")
+
+    def __init__(self, interval: str, seconds: int, origin: int, label_end: bool):
+        self.interval = interval
+        self.seconds = seconds
+        self.origin = origin
+        self.label_end = label_end
+        self.bar: Optional[_Bar] = None
+
+    def add(self, date: str, seconds: int, hhmmss: str, price: int, volume: int) -> Optional[_Bar]:
+        """체결 하나를 반영합니다. 이전 구간의 봉이 완성되면 그 봉을 반환합니다."""
+        start = self.origin + (seconds - self.origin) // self.seconds * self.seconds
+        bar = self.bar
+        # 늦게 도착한 이전 구간의 체결은 진행 중인 봉에 포함합니다. (완성된 봉은 다시 열지 않음)
+        if bar is not None and start <= bar.start:
+            bar.update(price, volume)
+            return None
+        label = _hhmmss(start + self.seconds if self.label_end else start)
+        self.bar = _Bar(date, start, label, price, volume)
+        return bar
+
+
+class _TickBars:
+    """N틱봉 한 종류. N번째 체결에서 봉이 완성되며 시간은 마지막 체결 시각입니다."""
+    __slots__ = ("interval", "ticks", "bar")
+
+    def __init__(self, interval: str, ticks: int):
+        self.interval = interval
+        self.ticks = ticks
+        self.bar: Optional[_Bar] = None
+
+    def add(self, date: str, seconds: int, hhmmss: str, price: int, volume: int) -> Optional[_Bar]:
+        bar = self.bar
+        if bar is None:
+            bar = self.bar = _Bar(date, 0, hhmmss, price, volume)
+        else:
+            bar.update(price, volume)
+            bar.time = hhmmss
+        if bar.ticks < self.ticks:
+            return None
+        self.bar = None
+        return bar
+
+
+class BarAggregator:
+    """
+    체결(S3_, K3_) 데이터로 시간봉(1초, 1분, N분)과 틱봉(N틱)을 실시간으로 만듭니다.
+    체결 하나당 봉 종류마다 고정된 연산만 하며, 봉이 완성될 때만 ChartBar를 만들어 콜백을 호출합니다.
+    봉의 스키마와 시간 표기는 StockMarket.get_minute_bars()/get_tick_bars()와 같습니다.
+
+        bars = BarAggregator(intervals=("1m", "5m", "100t"))
+        bars.subscribe(lambda symbol, interval, bar: print(symbol, interval, bar), interval="1m")
+        bars.attach(client._open_api)   # on_realtime 핸들러로 연결
+        bars.bind_market(client)        # JIF 시장 상태가 바뀌면 진행 중인 봉을 정리
+        # 또는 await bars.feed(client.stream("S3_", symbols))
+
+    시간봉은 다음 구간의 체결이 들어올 때 완성됩니다. 체결이 없는 구간은 봉을 만들지 않습니다. (t8412와 같음)
+    """
+    def __init__(
+        self,
+        intervals: Iterable[str] = ("1m",),
+        label: str = LABEL_END,
+        origin: str = "090000",
+        session_change: str = SESSION_FLUSH,
+    ):
+        """
+        :param intervals: 봉 단위 목록 ("1s", "1m", "5m", "100t" 등)
+        :param label: 시간봉의 시간 표기. "end"(종료 시각, 기본값) 또는 "start"(시작 시각)
+        :param origin: 시간봉 구간의 기준 시각 (HHMMSS). 정규장 시작 시각을 기준으로 N분 구간을 나눕니다.
+        :param session_change: 시장 상태가 바뀔 때 진행 중인 봉의 처리. "flush" 또는 "reset"
+        """
+        if label not in (LABEL_END, LABEL_START):
+            raise ValueError(f"label은 '{LABEL_END}' 또는 '{LABEL_START}'이어야 합니다.")
+        if session_change not in (SESSION_FLUSH, SESSION_RESET):
+            raise ValueError(f"session_change는 '{SESSION_FLUSH}' 또는 '{SESSION_RESET}'이어야 합니다.")
+        self._specs: List[Tuple[str, str, int]] = []
+        for interval in dict.fromkeys(intervals):
+            kind, n = parse_interval(interval)
+            self._specs.append((interval, kind, n))
+        if not self._specs:
+            raise ValueError("intervals가 비어 있습니다.")
+        self.label = label
+        self.origin = _seconds(int(origin))
+        self.session_change = session_change
+
+        self._builders: Dict[str, list] = {}
+        self._markets: Dict[str, Optional[str]] = {}
+        self._dates: Dict[str, str] = {}
+        # (symbol, interval) -> 콜백 목록. None은 전체
+        self._listeners: Dict[Tuple[Optional[str], Optional[str]], List[Callable[[str, str, ChartBar], None]]] = {}
+        self._api = None
+        self._market_client = None
+        self._date = datetime.now().strftime("%Y%m%d")
+
+        self.ticks = 0
+        self.bars = 0
+        self.errors = 0
+
+    @property
+    def intervals(self) -> List[str]:
+        return [interval for interval, _, _ in self._specs]
+
+    def symbols(self) -> List[str]:
+        return list(self._builders)
+
+    def _new_builders(self) -> list:
+        label_end = self.label == LABEL_END
+        return [
+            _TimeBars(interval, n, self.origin, label_end) if kind == "time" else _TickBars(interval, n)
+            for interval, kind, n in self._specs
+        ]
+
+    # --- 콜백 ---
+
+    def subscribe(self, callback: Callable[[str, str, ChartBar], None], symbol: Optional[str] = None, interval: Optional[str] = None) -> None:
+        """완성된 봉 콜백 등록. callback(symbol, interval, bar). symbol/interval을 생략하면 전체"""
+        listeners = self._listeners.setdefault((symbol, interval), [])
+        if callback not in listeners:
+            listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str, ChartBar], None], symbol: Optional[str] = None, interval: Optional[str] = None) -> None:
+        listeners = self._listeners.get((symbol, interval))
+        if listeners and callback in listeners:
+            listeners.remove(callback)
+            if not listeners:
+                del self._listeners[(symbol, interval)]
+
+    def _emit(self, symbol: str, interval: str, bar: _Bar) -> None:
+        self.bars += 1
+        if not self._listeners:
+            return
+        model = bar.to_model()
+        for key in ((symbol, interval), (symbol, None), (None, interval), (None, None)):
+            listeners = self._listeners.get(key)
+            if not listeners:
+                continue
+            for callback in listeners:
+                try:
+                    callback(symbol, interval, model)
+                except Exception:
+                    logger.exception(f"[BarAggregator] 콜백 처리 중 예외가 발생했습니다 ({symbol}, {interval})")
+
+    # --- 입력 ---
+
+    def add(self, symbol: str, data, trcode: Optional[str] = None, date: Optional[str] = None) -> None:
+        """
+        체결 TR 본문(dict 또는 디코더 객체) 하나를 반영합니다.
+
+        :param trcode: 체결 TR 코드. 지정하면 종목의 시장을 기억하여 해당 시장의 상태 변경에만 봉을 정리합니다.
+        :param date: 체결 일자 (YYYYMMDD). 생략하면 오늘 날짜 (기록된 데이터를 재생할 때 지정)
+        """
+        if isinstance(data, RealtimeRecord):
+            data = data.raw
+        try:
+            hhmmss = data["chetime"]
+            seconds = _seconds(int(hhmmss))
+            price = int(data["price"])
+            volume = int(data["cvolume"])
+        except (KeyError, TypeError, ValueError):
+            self.errors += 1
+            logger.debug(f"[BarAggregator] 체결 데이터를 해석할 수 없습니다 ({symbol}): {data}")
+            return
+        builders = self._builders.get(symbol)
+        if builders is None:
+            builders = self._builders[symbol] = self._new_builders()
+            self._markets[symbol] = MARKET_BY_TRCODE.get(trcode)
+        self.ticks += 1
+        date = date or self._date
+        if self._dates.get(symbol) != date:
+            # 날짜가 바뀌면 채워지지 않은 봉이라도 완성된 봉으로 내보냅니다.
+            self.flush(symbol)
+            self._dates[symbol] = date
+        for builder in builders:
+            closed = builder.add(date, seconds, hhmmss, price, volume)
+            if closed is not None:
+                self._emit(symbol, builder.interval, closed)
+
+    def on_realtime(self, sender, trcode: str, key: str, realtimedata) -> None:
+        """OpenApi.on_realtime 핸들러"""
+        self.add(key, realtimedata, trcode)
+
+    def attach(self, api, trcodes: Iterable[str] = EXECUTION_TR_CODES) -> None:
+        """api(OpenApi)의 체결 데이터를 받도록 on_realtime에 등록합니다. 구독은 별도로 해야 합니다."""
+        self._api = api
+        api.on_realtime.connect(self.on_realtime, trcode=list(trcodes))
+
+    def detach(self) -> None:
+        if self._api is not None:
+            self._api.on_realtime.disconnect(self.on_realtime)
+            self._api = None
+
+    async def feed(self, stream, max_size: int = 500, max_delay: float = 0.05) -> None:
+        """RealtimeStream의 체결을 묶음 단위로 받아 반영합니다. 스트림이 끝날 때까지 반환하지 않습니다."""
+        add = self.add
+        async for batch in stream.batches(max_size=max_size, max_delay=max_delay):
+            for tick in batch:
+                add(tick.key, tick.data, tick.trcode)
+
+    # --- 장 구분 ---
+
+    def bind_market(self, client) -> None:
+        """MarketClient의 JIF 시장 상태 변경을 받아 진행 중인 봉을 정리합니다."""
+        self._market_client = client
+        client.add_market_state_listener(self.on_market_state)
+
+    def unbind_market(self) -> None:
+        if self._market_client is not None:
+            self._market_client.remove_market_state_listener(self.on_market_state)
+            self._market_client = None
+
+    def on_market_state(self, market_code: str, state: MarketState) -> None:
+        """
+        시장 상태가 바뀌면(장 시작, 장 마감, 시간외 등) 그 시장 종목의 진행 중인 봉을 정리합니다.
+        장전 동시호가 체결과 정규장 체결, 장 마감 전후 체결이 한 봉에 섞이지 않습니다.
+        """
+        self._date = datetime.now().strftime("%Y%m%d")
+        symbols = [symbol for symbol, market in self._markets.items() if market in (market_code, None)]
+        if not symbols:
+            return
+        logger.debug(f"[BarAggregator] 시장 상태 변경 ({state.market_name}: {state.status.value}), 종목 {len(symbols)}개 봉 정리")
+        if self.session_change == SESSION_FLUSH:
+            for symbol in symbols:
+                self.flush(symbol)
+        else:
+            for symbol in symbols:
+                self.reset(symbol)
+
+    # --- 조회/정리 ---
+
+    def current(self, symbol: str, interval: str) -> Optional[ChartBar]:
+        """진행 중인(아직 완성되지 않은) 봉. 없으면 None"""
+        for builder in self._builders.get(symbol, ()):
+            if builder.interval == interval and builder.bar is not None:
+                return builder.bar.to_model()
+        return None
+
+    def flush(self, symbol: Optional[str] = None) -> None:
+        """진행 중인 봉을 완성된 봉으로 내보냅니다. symbol을 생략하면 모든 종목"""
+        for name in ([symbol] if symbol is not None else list(self._builders)):
+            for builder in self._builders.get(name, ()):
+                bar, builder.bar = builder.bar, None
+                if bar is not None:
+                    self._emit(name, builder.interval, bar)
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """진행 중인 봉을 내보내지 않고 버립니다. symbol을 생략하면 모든 종목"""
+        for name in ([symbol] if symbol is not None else list(self._builders)):
+            for builder in self._builders.get(name, ()):
+                builder.bar = None
+
+    # --- 통계 ---
+
+    def stats(self) -> Dict[str, float]:
+        """종목 수, 반영한 체결 수, 완성된 봉 수, 해석하지 못한 체결 수"""
+        return {
+            "symbols": len(self._builders),
+            "intervals": len(self._specs),
+            "ticks": self.ticks,
+            "bars": self.bars,
+            "errors": self.errors,
+        }
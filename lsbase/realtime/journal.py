@@ -0,0 +1,394 @@
+# lsbase/realtime/journal.py
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from ..openapi_client.codec import JsonCodec, get_codec
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기록 파일 형식 (little endian)
+#   파일 헤더: MAGIC(4) version(1) flags(1) 생성시각 ns(8)
+#   프레임: 길이(4) crc32(4) | 수신시각 ns(8) 종류(1) TR 코드 길이(1) 키 길이(2) TR 코드 키 본문(JSON)
+#   길이와 crc32는 '|' 뒤의 바이트를 대상으로 합니다.
+MAGIC = b"LSJ1"
+VERSION = 1
+FLAG_DELTA = 0x01
+FRAME_FULL = 0   # 본문 전체
+FRAME_DELTA = 1  # 같은 (TR 코드, 키)의 직전 프레임에서 바뀐 필드만
+JOURNAL_SUFFIX = ".lsj"
+
+_FILE_HEADER = struct.Struct("<4sBBq")
+_FRAME_HEADER = struct.Struct("<IIqBBH")
+_FRAME_PREFIX = struct.Struct("<II")
+_FRAME_META = struct.Struct("<qBBH")
+
+_ROTATE = object()
+
+
+class JournalFrame(NamedTuple):
+    time_ns: int   # 수신시각 (time.time_ns())
+    trcode: str
+    key: str
+    data: dict
+
+
+class JournalRecorder:
+    """
+    실시간 데이터를 수신 순서대로 기록 파일(.lsj)에 추가합니다.
+
+    수신 루프에서는 (수신시각, TR 코드, 키, 본문)을 deque에 넣기만 하고,
+    인코딩/압축/쓰기는 백그라운드 스레드에서 처리합니다.
+    delta=True이면 같은 (TR 코드, 키)의 직전 프레임에서 바뀐 필드만 기록하고,
+    keyframe_interval 프레임마다 전체 본문을 기록합니다. 파일마다 전체 본문부터 시작하므로 파일 하나만으로 읽을 수 있습니다.
+
+        recorder = JournalRecorder("journal", trcodes=("S3_", "H1_", "JIF", "NWS"))
+        recorder.attach(client._open_api)  # OpenApi.add_realtime_tap()으로 연결
+        recorder.bind_market(client)       # 장 상태가 바뀔 때마다 새 파일
+        ...
+        recorder.stop()
+
+    본문 dict는 복사하지 않고 참조만 보관합니다. 핸들러에서 realtimedata를 수정하면 수정된 값이 기록될 수 있습니다.
+    """
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "realtime",
+        trcodes: Optional[Iterable[str]] = None,
+        delta: bool = True,
+        keyframe_interval: int = 1000,
+        max_bytes: int = 256 * 1024 * 1024,
+        flush_interval: float = 0.05,
+        max_pending: int = 1000000,
+        codec: JsonCodec = None,
+    ):
+        """
+        :param directory: 기록 파일을 만들 디렉터리
+        :param prefix: 파일 이름 접두어 ({prefix}-{YYYYMMDD-HHMMSS}-{순번}.lsj)
+        :param trcodes: 기록할 TR 코드. 생략하면 모두 기록
+        :param delta: 바뀐 필드만 기록할지 여부
+        :param keyframe_interval: delta 기록 시 (TR 코드, 키)마다 전체 본문을 기록하는 간격(프레임 수)
+        :param max_bytes: 파일 하나의 최대 크기. 넘으면 새 파일로 바꿉니다.
+        :param flush_interval: 기록할 프레임이 없을 때 쓰기 스레드가 대기하는 시간(초)
+        :param max_pending: 쓰기를 기다리는 프레임 수 상한. 넘으면 새 프레임을 버리고 dropped를 늘립니다.
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self._trcodes = frozenset(trcodes) if trcodes is not None else None
+        self.delta = delta
+        self.keyframe_interval = keyframe_interval
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._codec = codec or get_codec()
+
+        self._pending: deque = deque()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._api = None
+        self._market_client = None
+        self._session_markets: frozenset = frozenset()
+
+        # 쓰기 스레드 상태
+        self._file = None
+        self._file_bytes = 0
+        self._sequence = 0
+        self._state: Dict[tuple, list] = {}  # (trcode, key) -> [직전 본문, 마지막 전체 본문 이후 프레임 수]
+        self._names: Dict[str, bytes] = {}
+        self.files: List[str] = []
+
+        # 통계
+        self.frames = 0
+        self.full_frames = 0
+        self.delta_frames = 0
+        self.bytes = 0
+        self.dropped = 0
+        self.errors = 0
+
+    # --- 수신 루프 (hot path) ---
+
+    def record(self, trcode: str, key: str, realtimedata) -> None:
+        """프레임 하나를 쓰기 대기열에 넣습니다. OpenApi.add_realtime_tap()에 등록하는 함수입니다."""
+        if self._trcodes is not None and trcode not in self._trcodes:
+            return
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append((time.time_ns(), trcode, key, realtimedata))
+
+    def rotate(self) -> None:
+        """대기 중인 프레임을 모두 쓴 뒤 새 파일로 바꿉니다."""
+        self._pending.append(_ROTATE)
+
+    # --- 연결 ---
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="JournalRecorder", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """대기 중인 프레임을 모두 쓰고 파일을 닫습니다."""
+        self.detach()
+        self.unbind_market()
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def attach(self, api) -> None:
+        """api(OpenApi)의 실시간 수신 경로에 연결하고 쓰기 스레드를 시작합니다. 구독은 별도로 해야 합니다."""
+        self.start()
+        self._api = api
+        api.add_realtime_tap(self.record)
+
+    def detach(self) -> None:
+        if self._api is not None:
+            self._api.remove_realtime_tap(self.record)
+            self._api = None
+
+    def bind_market(self, client, markets: Iterable[str] = ("1",)) -> None:
+        """MarketClient의 JIF 시장 상태가 바뀔 때마다 새 파일로 바꿉니다. (markets: JIF 시장 구분)"""
+        self._market_client = client
+        self._session_markets = frozenset(markets)
+        client.add_market_state_listener(self.on_market_state)
+
+    def unbind_market(self) -> None:
+        if self._market_client is not None:
+            self._market_client.remove_market_state_listener(self.on_market_state)
+            self._market_client = None
+
+    def on_market_state(self, market_code: str, state) -> None:
+        if market_code in self._session_markets:
+            logger.info(f"[JournalRecorder] 시장 상태 변경 ({state.market_name}: {state.status.value}), 새 기록 파일로 바꿉니다.")
+            self.rotate()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- 쓰기 스레드 ---
+
+    def _run(self) -> None:
+        pending = self._pending
+        while True:
+            if not pending:
+                if self._file is not None:
+                    self._file.flush()
+                if self._stop_event.is_set():
+                    break
+                self._stop_event.wait(self.flush_interval)
+                continue
+            item = pending.popleft()
+            if item is _ROTATE:
+                self._close_file()
+                continue
+            try:
+                self._write(*item)
+            except Exception:
+                self.errors += 1
+                logger.exception("[JournalRecorder] 프레임 기록 중 예외가 발생했습니다")
+        self._close_file()
+
+    def _open_file(self) -> None:
+        self._sequence += 1
+        name = f"{self.prefix}-{datetime.now():%Y%m%d-%H%M%S}-{self._sequence:04d}{JOURNAL_SUFFIX}"
+        path = os.path.join(self.directory, name)
+        self._file = open(path, "xb", buffering=1024 * 1024)
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION, FLAG_DELTA if self.delta else 0, time.time_ns()))
+        self._file_bytes = _FILE_HEADER.size
+        # 파일마다 전체 본문부터 기록합니다.
+        self._state.clear()
+        self.files.append(path)
+        logger.info(f"[JournalRecorder] 기록 파일을 엽니다: {path}")
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _name(self, value: str) -> bytes:
+        encoded = self._names.get(value)
+        if encoded is None:
+            encoded = self._names[value] = value.encode("utf-8")
+        return encoded
+
+    def _write(self, time_ns: int, trcode: str, key: str, data) -> None:
+        if self._file is None:
+            self._open_file()
+        kind = FRAME_FULL
+        body = data
+        if self.delta and isinstance(data, dict):
+            state_key = (trcode, key)
+            state = self._state.get(state_key)
+            if state is not None and state[1] < self.keyframe_interval and state[0].keys() == data.keys():
+                previous = state[0]
+                body = {name: value for name, value in data.items() if previous[name] != value}
+                kind = FRAME_DELTA
+                state[0] = dict(data)
+                state[1] += 1
+            else:
+                self._state[state_key] = [dict(data), 0]
+
+        trcode_bytes = self._name(trcode or "")
+        key_bytes = self._name(key or "")
+        payload = b"".join((trcode_bytes, key_bytes, self._codec.dumps(body)))
+        meta = _FRAME_META.pack(time_ns, kind, len(trcode_bytes), len(key_bytes))
+        crc = zlib.crc32(payload, zlib.crc32(meta))
+        length = len(meta) + len(payload)
+        self._file.write(_FRAME_PREFIX.pack(length, crc))
+        self._file.write(meta)
+        self._file.write(payload)
+
+        size = _FRAME_PREFIX.size + length
+        self._file_bytes += size
+        self.bytes += size
+        self.frames += 1
+        if kind == FRAME_DELTA:
+            self.delta_frames += 1
+        else:
+            self.full_frames += 1
+        if self._file_bytes >= self.max_bytes:
+            self._close_file()
+
+    # --- 통계 ---
+
+    def stats(self) -> Dict[str, float]:
+        """기록한 프레임/바이트 수, 대기 중인 프레임 수, 버린 프레임 수, 파일 수"""
+        return {
+            "frames": self.frames,
+            "full_frames": self.full_frames,
+            "delta_frames": self.delta_frames,
+            "bytes": self.bytes,
+            "bytes_per_frame": self.bytes / self.frames if self.frames else 0.0,
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "files": len(self.files),
+        }
+
+
+class JournalReader:
+    """
+    기록 파일(.lsj)을 메모리 매핑하여 프레임을 순서대로 읽습니다.
+    delta 프레임은 직전 본문에 적용하여 항상 전체 본문(새 dict)을 돌려줍니다.
+
+        with JournalReader(path) as reader:
+            for frame in reader.frames(trcodes={"S3_"}):
+                ...
+
+    마지막 프레임이 잘려 있으면(기록 중 종료) 그 앞까지만 읽습니다.
+    crc가 맞지 않는 프레임은 건너뛰고, 해당 (TR 코드, 키)는 다음 전체 본문이 나올 때까지 건너뜁니다.
+    """
+    def __init__(self, path: str, codec: JsonCodec = None):
+        self.path = path
+        self._codec = codec or get_codec()
+        self._file = open(path, "rb")
+        self._mm = None
+        self.flags = 0
+        self.created_ns = 0
+        self.corrupted = 0
+        if os.fstat(self._file.fileno()).st_size >= _FILE_HEADER.size:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, self.flags, self.created_ns = _FILE_HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                self.close()
+                raise ValueError(f"기록 파일 형식이 아닙니다: {path}")
+            if version != VERSION:
+                self.close()
+                raise ValueError(f"지원하지 않는 기록 파일 버전입니다: {version} ({path})")
+
+    @property
+    def size(self) -> int:
+        return len(self._mm) if self._mm is not None else 0
+
+    def __iter__(self) -> Iterator[JournalFrame]:
+        return self.frames()
+
+    def frames(self, trcodes: Optional[Iterable[str]] = None, keys: Optional[Iterable[str]] = None) -> Iterator[JournalFrame]:
+        """
+        프레임을 기록 순서대로 반환합니다.
+        trcodes/keys를 지정하면 해당하지 않는 프레임은 본문을 해석하지 않고 건너뜁니다.
+        """
+        mm = self._mm
+        if mm is None:
+            return
+        trcodes = frozenset(trcodes) if trcodes is not None else None
+        keys = frozenset(keys) if keys is not None else None
+        loads = self._codec.loads
+        unpack_from = _FRAME_HEADER.unpack_from
+        header_size = _FRAME_HEADER.size
+        names: Dict[bytes, str] = {}
+        state: Dict[tuple, dict] = {}
+        end = len(mm)
+        offset = _FILE_HEADER.size
+
+        while offset + header_size <= end:
+            length, crc, time_ns, kind, trcode_len, key_len = unpack_from(mm, offset)
+            start = offset + _FRAME_PREFIX.size
+            next_offset = start + length
+            if next_offset > end:
+                logger.warning(f"[JournalReader] 잘린 프레임에서 읽기를 멈춥니다 ({self.path}, offset={offset})")
+                return
+            pos = offset + header_size
+            raw = mm[pos:pos + trcode_len]
+            trcode = names.get(raw)
+            if trcode is None:
+                trcode = names[raw] = raw.decode("utf-8")
+            pos += trcode_len
+            raw = mm[pos:pos + key_len]
+            key = names.get(raw)
+            if key is None:
+                key = names[raw] = raw.decode("utf-8")
+            pos += key_len
+            offset = next_offset
+
+            if (trcodes is not None and trcode not in trcodes) or (keys is not None and key not in keys):
+                continue
+            if zlib.crc32(mm[start:next_offset]) != crc:
+                self.corrupted += 1
+                state.pop((trcode, key), None)
+                logger.warning(f"[JournalReader] crc가 맞지 않는 프레임을 건너뜁니다 ({self.path}, {trcode}, {key})")
+                continue
+            body = loads(mm[pos:next_offset])
+            if kind == FRAME_DELTA:
+                previous = state.get((trcode, key))
+                if previous is None:
+                    continue
+                data = dict(previous)
+                data.update(body)
+            else:
+                data = body
+            if isinstance(data, dict):
+                state[(trcode, key)] = data
+            yield JournalFrame(time_ns, trcode, key, data)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,281 @@
+# lsbase/realtime/order_book.py
+
+import logging
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..generated_decoders import RealtimeRecord
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+LEVELS = 10
+
+# 호가 TR 코드 -> 잔량 필드 접두어. UH1(통합)은 KRX/NXT 합산 잔량(unt_)을 사용합니다.
+BOOK_TR_CODES: Dict[str, str] = {
+    "H1_": "",      # KOSPI호가잔량
+    "HA_": "",      # KOSDAQ호가잔량
+    "NH1": "",      # (NXT)호가잔량
+    "UH1": "unt_",  # (통합)호가잔량
+}
+
+
+def _field_keys(prefix: str) -> Tuple[Tuple[str, ...], ...]:
+    """프레임에서 읽을 필드 이름. (매도호가, 매수호가, 매도잔량, 매수잔량) 각 10개와 (총매도잔량, 총매수잔량)"""
+    return (
+        tuple(f"offerho{i}" for i in range(1, LEVELS + 1)),
+        tuple(f"bidho{i}" for i in range(1, LEVELS + 1)),
+        tuple(f"{prefix}offerrem{i}" for i in range(1, LEVELS + 1)),
+        tuple(f"{prefix}bidrem{i}" for i in range(1, LEVELS + 1)),
+        (f"{prefix}totofferrem", f"{prefix}totbidrem"),
+    )
+
+
+_FIELD_KEYS: Dict[str, Tuple[Tuple[str, ...], ...]] = {trcode: _field_keys(prefix) for trcode, prefix in BOOK_TR_CODES.items()}
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return 0
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class OrderBook:
+    """
+    한 종목의 10단계 호가를 array로 보관합니다.
+    프레임의 원문 문자열을 이전 값과 비교하여 바뀐 필드만 변환하고 갱신합니다.
+    잔량 합계는 잔량이 바뀔 때 차이만큼 갱신하므로 모든 조회가 O(1)입니다.
+    """
+    __slots__ = (
+        "symbol", "trcode", "ask_price", "bid_price", "ask_qty", "bid_qty",
+        "total_ask_qty", "total_bid_qty", "time", "updates", "_raw", "_ask_depth", "_bid_depth",
+    )
+
+    def __init__(self, symbol: str, trcode: str = ""):
+        self.symbol = symbol
+        self.trcode = trcode                            # 호가 TR 코드 (H1_, UH1 등)
+        self.ask_price = array("d", bytes(8 * LEVELS))  # 매도호가 1~10
+        self.bid_price = array("d", bytes(8 * LEVELS))  # 매수호가 1~10
+        self.ask_qty = array("q", bytes(8 * LEVELS))    # 매도잔량 1~10
+        self.bid_qty = array("q", bytes(8 * LEVELS))    # 매수잔량 1~10
+        self.total_ask_qty = 0                          # 총매도잔량 (거래소 제공 값)
+        self.total_bid_qty = 0                          # 총매수잔량 (거래소 제공 값)
+        self.time = ""                                  # 호가시간
+        self.updates = 0                                # 실제로 변경된 프레임 수
+        # 마지막으로 반영한 원문 문자열. (매도호가, 매수호가, 매도잔량, 매수잔량, 총잔량)
+        self._raw: Tuple[List[Optional[str]], ...] = tuple([None] * LEVELS for _ in range(4)) + ([None, None],)
+        # 10단계 잔량 합계
+        self._ask_depth = 0
+        self._bid_depth = 0
+
+    def update(self, trcode: str, data: dict) -> bool:
+        """호가 프레임을 반영합니다. 하나라도 바뀐 단계가 있으면 True"""
+        get = data.get
+        ask_price_keys, bid_price_keys, ask_qty_keys, bid_qty_keys, total_keys = _FIELD_KEYS[trcode]
+        raw_ask_price, raw_bid_price, raw_ask_qty, raw_bid_qty, raw_total = self._raw
+        changed = False
+
+        for level, key in enumerate(ask_price_keys):
+            value = get(key)
+            if value is not None and value != raw_ask_price[level]:
+                raw_ask_price[level] = value
+                self.ask_price[level] = _to_float(value)
+                changed = True
+        for level, key in enumerate(bid_price_keys):
+            value = get(key)
+            if value is not None and value != raw_bid_price[level]:
+                raw_bid_price[level] = value
+                self.bid_price[level] = _to_float(value)
+                changed = True
+        for level, key in enumerate(ask_qty_keys):
+            value = get(key)
+            if value is not None and value != raw_ask_qty[level]:
+                raw_ask_qty[level] = value
+                qty = _to_int(value)
+                self._ask_depth += qty - self.ask_qty[level]
+                self.ask_qty[level] = qty
+                changed = True
+        for level, key in enumerate(bid_qty_keys):
+            value = get(key)
+            if value is not None and value != raw_bid_qty[level]:
+                raw_bid_qty[level] = value
+                qty = _to_int(value)
+                self._bid_depth += qty - self.bid_qty[level]
+                self.bid_qty[level] = qty
+                changed = True
+        value = get(total_keys[0])
+        if value is not None and value != raw_total[0]:
+            raw_total[0] = value
+            self.total_ask_qty = _to_int(value)
+            changed = True
+        value = get(total_keys[1])
+        if value is not None and value != raw_total[1]:
+            raw_total[1] = value
+            self.total_bid_qty = _to_int(value)
+            changed = True
+
+        if changed:
+            self.time = get("hotime", self.time)
+            self.updates += 1
+        return changed
+
+    # --- O(1) 조회 ---
+
+    @property
+    def best_ask(self) -> float:
+        return self.ask_price[0]
+
+    @property
+    def best_bid(self) -> float:
+        return self.bid_price[0]
+
+    @property
+    def best_ask_qty(self) -> int:
+        return self.ask_qty[0]
+
+    @property
+    def best_bid_qty(self) -> int:
+        return self.bid_qty[0]
+
+    @property
+    def spread(self) -> float:
+        """매도1호가 - 매수1호가. 한쪽 호가가 없으면 0"""
+        if not self.ask_price[0] or not self.bid_price[0]:
+            return 0.0
+        return self.ask_price[0] - self.bid_price[0]
+
+    @property
+    def mid(self) -> float:
+        if not self.ask_price[0] or not self.bid_price[0]:
+            return 0.0
+        return (self.ask_price[0] + self.bid_price[0]) / 2
+
+    def ask_depth(self, levels: int = LEVELS) -> int:
+        """매도 1~levels단계 잔량 합계"""
+        return self._ask_depth if levels >= LEVELS else sum(self.ask_qty[:levels])
+
+    def bid_depth(self, levels: int = LEVELS) -> int:
+        """매수 1~levels단계 잔량 합계"""
+        return self._bid_depth if levels >= LEVELS else sum(self.bid_qty[:levels])
+
+    def imbalance(self, levels: int = LEVELS) -> float:
+        """(매수잔량 - 매도잔량) / (매수잔량 + 매도잔량), -1(매도 우위) ~ 1(매수 우위)"""
+        bid = self.bid_depth(levels)
+        ask = self.ask_depth(levels)
+        total = bid + ask
+        return (bid - ask) / total if total else 0.0
+
+    def levels(self) -> List[Tuple[float, int, float, int]]:
+        """[(매도호가, 매도잔량, 매수호가, 매수잔량), ...] 1단계부터"""
+        return list(zip(self.ask_price, self.ask_qty, self.bid_price, self.bid_qty))
+
+    def __repr__(self) -> str:
+        return f"<OrderBook {self.symbol} {self.best_bid}/{self.best_ask} spread={self.spread} imbalance={self.imbalance():.3f}>"
+
+
+class OrderBookManager:
+    """
+    종목별 OrderBook을 호가 TR(H1_, HA_, NH1, UH1) 프레임으로 갱신합니다.
+    호가가 실제로 바뀐 경우에만 등록된 콜백을 호출합니다.
+    잔량의 기준이 TR마다 다르므로(H1_: KRX, UH1: KRX+NXT 합산) OrderBook은 (TR 코드, 종목)별로 따로 보관합니다.
+
+        books = OrderBookManager()
+        books.attach(client._open_api)
+        books.subscribe(lambda book: print(book.spread), symbol="005930")
+    """
+    def __init__(self):
+        self._books: Dict[Tuple[str, str], OrderBook] = {}
+        # 종목 -> 그 종목의 OrderBook 목록 (처음 받은 TR 순서)
+        self._by_symbol: Dict[str, List[OrderBook]] = {}
+        self._listeners: Dict[Optional[str], List[Callable[[OrderBook], None]]] = {}
+        self._api = None
+
+        self.frames = 0
+        self.changes = 0
+
+    def book(self, symbol: str, trcode: Optional[str] = None) -> Optional[OrderBook]:
+        """종목의 OrderBook. trcode를 생략하면 그 종목에서 처음 받은 호가 TR의 OrderBook"""
+        if trcode is not None:
+            return self._books.get((trcode, symbol))
+        books = self._by_symbol.get(symbol)
+        return books[0] if books else None
+
+    def books(self, symbol: str) -> List[OrderBook]:
+        """종목의 호가 TR별 OrderBook 목록"""
+        return list(self._by_symbol.get(symbol, ()))
+
+    def symbols(self) -> List[str]:
+        return list(self._by_symbol)
+
+    def subscribe(self, callback: Callable[[OrderBook], None], symbol: Optional[str] = None) -> None:
+        """호가 변경 콜백 등록. symbol을 생략하면 모든 종목"""
+        listeners = self._listeners.setdefault(symbol, [])
+        if callback not in listeners:
+            listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[OrderBook], None], symbol: Optional[str] = None) -> None:
+        listeners = self._listeners.get(symbol)
+        if listeners and callback in listeners:
+            listeners.remove(callback)
+            if not listeners:
+                del self._listeners[symbol]
+
+    def update(self, trcode: str, symbol: str, data) -> Optional[OrderBook]:
+        """호가 프레임(dict 또는 디코더 객체)을 반영합니다. 바뀐 경우 OrderBook, 아니면 None"""
+        if trcode not in _FIELD_KEYS:
+            return None
+        if isinstance(data, RealtimeRecord):
+            data = data.raw
+        self.frames += 1
+        book = self._books.get((trcode, symbol))
+        if book is None:
+            book = self._books[(trcode, symbol)] = OrderBook(symbol, trcode)
+            self._by_symbol.setdefault(symbol, []).append(book)
+        if not book.update(trcode, data):
+            return None
+        self.changes += 1
+        for listeners in (self._listeners.get(symbol), self._listeners.get(None)):
+            if not listeners:
+                continue
+            for callback in listeners:
+                try:
+                    callback(book)
+                except Exception:
+                    logger.exception(f"[OrderBook] 콜백 처리 중 예외가 발생했습니다 ({symbol})")
+        return book
+
+    def on_realtime(self, sender, trcode: str, key: str, realtimedata) -> None:
+        """OpenApi.on_realtime 핸들러"""
+        self.update(trcode, key, realtimedata)
+
+    def attach(self, api, trcodes: Iterable[str] = tuple(BOOK_TR_CODES)) -> None:
+        """api(OpenApi)의 호가 데이터를 받도록 on_realtime에 등록합니다. 구독은 별도로 해야 합니다."""
+        self._api = api
+        # 최신 호가만 의미가 있으므로 밀린 프레임은 종목별로 최신 것만 남깁니다.
+        api.on_realtime.connect(self.on_realtime, trcode=list(trcodes), overflow="conflate")
+
+    def detach(self) -> None:
+        if self._api is not None:
+            self._api.on_realtime.disconnect(self.on_realtime)
+            self._api = None
+
+    def stats(self) -> Dict[str, float]:
+        """종목 수, (TR 코드, 종목)별 OrderBook 수, 받은 프레임 수, 실제로 바뀐 프레임 수"""
+        return {
+            "symbols": len(self._by_symbol),
+            "books": len(self._books),
+            "frames": self.frames,
+            "changes": self.changes,
+            "unchanged_ratio": 1 - self.changes / self.frames if self.frames else 0.0,
+        }
@@ -0,0 +1,136 @@
+# lsbase/realtime/replay.py
+
+import asyncio
+import heapq
+import logging
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .journal import JOURNAL_SUFFIX, JournalFrame, JournalReader
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 재생 속도. None이면 기다리지 않고 최대한 빠르게 재생합니다.
+SPEED_REALTIME = 1.0
+SPEED_FAST = None
+
+
+def find_journals(paths: Union[str, Iterable[str]]) -> List[str]:
+    """파일 또는 디렉터리 목록에서 기록 파일(.lsj)을 찾아 이름 순서로 반환합니다."""
+    if isinstance(paths, str):
+        paths = [paths]
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith(JOURNAL_SUFFIX)
+            )
+        else:
+            found.append(path)
+    return sorted(dict.fromkeys(found))
+
+
+class ReplayEngine:
+    """
+    JournalRecorder로 기록한 파일을 메모리 매핑하여 OpenApi의 실시간 수신 경로로 다시 보냅니다.
+    on_realtime 핸들러, RealtimeStream, add_realtime_tap()으로 연결한 구성요소가 실제 수신과 같은 방식으로 데이터를 받습니다.
+
+        engine = ReplayEngine("journal/", speed=10, trcodes={"S3_"})
+        api = OpenApi()                       # 로그인하지 않아도 됩니다.
+        api.on_realtime.connect(on_tick, trcode="S3_")
+        result = await engine.run(api)
+        print(result["fps"])
+
+    여러 파일의 프레임은 수신시각 순서로 합치며, 수신시각이 같으면 파일 이름 순서, 파일 안의 기록 순서를 따릅니다.
+    같은 파일과 옵션으로 재생하면 항상 같은 순서로 전달됩니다.
+    """
+    def __init__(
+        self,
+        paths: Union[str, Iterable[str]],
+        speed: Optional[float] = SPEED_FAST,
+        trcodes: Optional[Iterable[str]] = None,
+        keys: Optional[Iterable[str]] = None,
+        yield_every: int = 256,
+    ):
+        """
+        :param paths: 기록 파일 또는 디렉터리 (목록 가능)
+        :param speed: 1.0이면 기록된 시간 간격 그대로, N이면 N배 빠르게, None이면 기다리지 않고 재생
+        :param trcodes: 재생할 TR 코드. 생략하면 모두
+        :param keys: 재생할 키(종목코드 등). 생략하면 모두
+        :param yield_every: 기다리지 않고 재생할 때 핸들러가 실행될 수 있도록 이벤트 루프에 양보하는 간격(프레임 수)
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed는 0보다 커야 합니다. 최대 속도로 재생하려면 None을 사용하세요.")
+        self.paths = find_journals(paths)
+        self.speed = speed
+        self.trcodes = frozenset(trcodes) if trcodes is not None else None
+        self.keys = frozenset(keys) if keys is not None else None
+        self.yield_every = max(1, yield_every)
+        self._stats: Dict[str, float] = {}
+
+    def frames(self) -> Iterator[JournalFrame]:
+        """모든 파일의 프레임을 수신시각 순서로 합쳐 반환합니다. (이벤트 루프 없이 직접 처리할 때)"""
+        readers = [JournalReader(path) for path in self.paths]
+        try:
+            iterators = [reader.frames(self.trcodes, self.keys) for reader in readers]
+            # heapq.merge는 키가 같으면 앞의 iterator를 먼저 내보내므로 순서가 결정적입니다.
+            yield from heapq.merge(*iterators, key=lambda frame: frame.time_ns)
+        finally:
+            self._stats["corrupted"] = sum(reader.corrupted for reader in readers)
+            for reader in readers:
+                reader.close()
+
+    async def run(self, api, drain: bool = True) -> Dict[str, float]:
+        """
+        프레임을 api(OpenApi)의 실시간 수신 경로로 보냅니다.
+
+        :param drain: True이면 핸들러가 마지막 프레임까지 처리한 뒤 반환합니다. (fps에 핸들러 처리 시간 포함)
+        :return: stats()와 같은 dict
+        """
+        emit = api._inner_on_realtime
+        speed = self.speed
+        yield_every = self.yield_every
+        frames = 0
+        first_ns = last_ns = 0
+        max_lag = 0.0
+        started = time.perf_counter()
+
+        for frame in self.frames():
+            if frames == 0:
+                first_ns = frame.time_ns
+            last_ns = frame.time_ns
+            if speed is not None:
+                delay = (frame.time_ns - first_ns) / 1e9 / speed - (time.perf_counter() - started)
+                if delay > 0.001:
+                    await asyncio.sleep(delay)
+                elif delay < 0 and -delay > max_lag:
+                    max_lag = -delay
+            await emit(frame.trcode, frame.key, frame.data)
+            frames += 1
+            if frames % yield_every == 0:
+                await asyncio.sleep(0)
+
+        if drain:
+            await api.on_realtime.join()
+        elapsed = time.perf_counter() - started
+        span = (last_ns - first_ns) / 1e9
+        self._stats.update({
+            "files": len(self.paths),
+            "frames": frames,
+            "elapsed_s": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else 0.0,
+            "span_s": span,
+            "speedup": span / elapsed if elapsed > 0 else 0.0,
+            "max_lag_ms": max_lag * 1000,
+        })
+        logger.info(
+            f"[ReplayEngine] {frames:,} 프레임 재생 완료: {elapsed:.2f}초, {self._stats['fps']:,.0f} frames/s "
+            f"(기록 구간 {span:.1f}초, x{self._stats['speedup']:.1f})"
+        )
+        return self.stats()
+
+    def stats(self) -> Dict[str, float]:
+        """마지막 재생의 파일 수, 프레임 수, 소요 시간, 초당 프레임 수, 기록 구간 대비 배속, 최대 지연, crc 오류 수"""
+        return dict(self._stats)
@@ -0,0 +1,233 @@
+# lsbase/realtime/tick_store.py
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..generated_decoders import RealtimeRecord
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+# 종목별 기본 보관 tick 수
+DEFAULT_CAPACITY = 10000
+# 체결 TR (KOSPI, KOSDAQ)
+EXECUTION_TR_CODES = ("S3_", "K3_")
+
+# 컬럼 이름 -> dtype. tick 하나당 4 + 8 + 4 + 1 + 8 = 25바이트
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("time", "int32"),        # 체결시간 HHMMSS (093015)
+    ("price", "float64"),     # 체결가
+    ("volume", "int32"),      # 체결량
+    ("side", "int8"),         # 체결구분 1: 매수(+), -1: 매도(-), 0: 알 수 없음
+    ("cum_volume", "int64"),  # 누적거래량
+)
+SIDES = {"+": 1, "-": -1}
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is not installed. pip install numpy")
+
+
+class TickBuffer:
+    """한 종목의 고정 크기 컬럼형 링 버퍼
+
+    생성 시 컬럼별 배열을 미리 할당하고, 가득 차면 가장 오래된 tick부터 덮어씁니다.
+    """
+    __slots__ = ("capacity", "columns", "_time", "_price", "_volume", "_side", "_cum_volume", "_count")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        _require_numpy()
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.columns: Dict[str, "np.ndarray"] = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS}
+        # append()에서 dict 조회를 피하기 위해 배열을 속성으로도 보관합니다.
+        self._time = self.columns["time"]
+        self._price = self.columns["price"]
+        self._volume = self.columns["volume"]
+        self._side = self.columns["side"]
+        self._cum_volume = self.columns["cum_volume"]
+        self._count = 0  # 지금까지 추가된 전체 tick 수
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """덮어쓴 tick을 포함해 지금까지 추가된 tick 수"""
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def append(self, time: int, price: float, volume: int, side: int, cum_volume: int) -> None:
+        i = self._count % self.capacity
+        self._time[i] = time
+        self._price[i] = price
+        self._volume[i] = volume
+        self._side[i] = side
+        self._cum_volume[i] = cum_volume
+        self._count += 1
+
+    def views(self) -> List[Dict[str, "np.ndarray"]]:
+        """
+        보관 중인 tick을 시간 순서의 세그먼트(1개 또는 2개) 목록으로 반환합니다. 복사하지 않는 읽기 전용 뷰입니다.
+        뷰는 버퍼를 직접 가리키므로 이후 추가되는 tick이 오래된 위치를 덮어쓰면 내용이 바뀝니다.
+        계속 보관하려면 snapshot()을 사용하세요.
+        """
+        n = len(self)
+        if n == 0:
+            return []
+        if self._count <= self.capacity:
+            segments = [slice(0, n)]
+        else:
+            head = self._count % self.capacity
+            segments = [slice(head, self.capacity), slice(0, head)] if head else [slice(0, self.capacity)]
+        result = []
+        for segment in segments:
+            views = {}
+            for name, column in self.columns.items():
+                view = column[segment]
+                view.flags.writeable = False
+                views[name] = view
+            result.append(views)
+        return result
+
+    def snapshot(self, last: Optional[int] = None) -> Dict[str, "np.ndarray"]:
+        """보관 중인(또는 최근 last개) tick을 시간 순서의 연속 배열로 복사하여 반환합니다."""
+        segments = self.views()
+        if not segments:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS}
+        if len(segments) == 1:
+            result = {name: view.copy() for name, view in segments[0].items()}
+        else:
+            result = {name: np.concatenate([segment[name] for segment in segments]) for name, _ in COLUMNS}
+        if last is not None:
+            result = {name: column[-last:] for name, column in result.items()}
+        return result
+
+    def clear(self) -> None:
+        self._count = 0
+
+
+class TickStore:
+    """
+    종목별 체결(S3_, K3_) tick을 TickBuffer에 보관합니다. numpy가 필요합니다.
+
+        store = TickStore(capacity=20000, capacities={"005930": 100000})
+        store.attach(client._open_api)               # on_realtime 핸들러로 연결
+        # 또는 await store.feed(client.stream("S3_", symbols))
+
+        segments = store.views("005930")            # 복사 없는 뷰
+        data = store.snapshot("005930")             # 연속 배열 복사본
+    """
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, capacities: Optional[Dict[str, int]] = None):
+        """
+        :param capacity: 종목별 기본 보관 tick 수
+        :param capacities: 종목별 보관 tick 수 (기본값 대신 사용)
+        """
+        _require_numpy()
+        self._default_capacity = capacity
+        self._capacities: Dict[str, int] = dict(capacities or {})
+        self._buffers: Dict[str, TickBuffer] = {}
+        self._api = None
+        self.errors = 0
+
+    # --- 버퍼 ---
+
+    def buffer(self, symbol: str) -> TickBuffer:
+        """종목의 버퍼를 반환합니다. 없으면 설정된 크기로 새로 할당합니다."""
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            buffer = self._buffers[symbol] = TickBuffer(self._capacities.get(symbol, self._default_capacity))
+        return buffer
+
+    def set_capacity(self, symbol: str, capacity: int) -> None:
+        """종목의 보관 tick 수를 바꿉니다. 이미 버퍼가 있으면 최근 tick을 유지한 채 다시 할당합니다."""
+        self._capacities[symbol] = capacity
+        old = self._buffers.get(symbol)
+        if old is None or old.capacity == capacity:
+            return
+        new = TickBuffer(capacity)
+        data = old.snapshot(last=capacity)
+        n = len(data["time"])
+        for name, column in new.columns.items():
+            column[:n] = data[name]
+        new._count = n
+        self._buffers[symbol] = new
+
+    def symbols(self) -> List[str]:
+        return list(self._buffers)
+
+    def views(self, symbol: str) -> List[Dict[str, "np.ndarray"]]:
+        """TickBuffer.views() 참고. 종목이 없으면 빈 목록"""
+        buffer = self._buffers.get(symbol)
+        return buffer.views() if buffer is not None else []
+
+    def snapshot(self, symbol: str, last: Optional[int] = None) -> Dict[str, "np.ndarray"]:
+        """TickBuffer.snapshot() 참고"""
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS}
+        return buffer.snapshot(last)
+
+    # --- 입력 ---
+
+    def add(self, symbol: str, data) -> None:
+        """체결 TR 본문(dict 또는 디코더 객체) 하나를 추가합니다."""
+        if isinstance(data, RealtimeRecord):
+            data = data.raw
+        try:
+            time = int(data["chetime"])
+            price = float(data["price"])
+            volume = int(data["cvolume"])
+            cum_volume = int(data["volume"])
+        except (KeyError, TypeError, ValueError):
+            self.errors += 1
+            logger.debug(f"[TickStore] 체결 데이터를 해석할 수 없습니다 ({symbol}): {data}")
+            return
+        self.buffer(symbol).append(time, price, volume, SIDES.get(data.get("cgubun"), 0), cum_volume)
+
+    def on_realtime(self, sender, trcode: str, key: str, realtimedata) -> None:
+        """OpenApi.on_realtime 핸들러"""
+        self.add(key, realtimedata)
+
+    def attach(self, api, trcodes: Iterable[str] = EXECUTION_TR_CODES) -> None:
+        """api(OpenApi)의 체결 데이터를 받도록 on_realtime에 등록합니다. 구독은 별도로 해야 합니다."""
+        self._api = api
+        api.on_realtime.connect(self.on_realtime, trcode=list(trcodes))
+
+    def detach(self) -> None:
+        if self._api is not None:
+            self._api.on_realtime.disconnect(self.on_realtime)
+            self._api = None
+
+    async def feed(self, stream, max_size: int = 500, max_delay: float = 0.05) -> None:
+        """RealtimeStream의 tick을 묶음 단위로 받아 추가합니다. 스트림이 끝날 때까지 반환하지 않습니다."""
+        add = self.add
+        async for batch in stream.batches(max_size=max_size, max_delay=max_delay):
+            for tick in batch:
+                add(tick.key, tick.data)
+
+    # --- 통계 ---
+
+    def stats(self) -> Dict[str, float]:
+        """종목 수, 보관 중인 tick 수, 할당된 메모리와 tick당 바이트"""
+        ticks = sum(len(buffer) for buffer in self._buffers.values())
+        capacity = sum(buffer.capacity for buffer in self._buffers.values())
+        nbytes = sum(buffer.nbytes for buffer in self._buffers.values())
+        return {
+            "symbols": len(self._buffers),
+            "ticks": ticks,
+            "capacity": capacity,
+            "bytes": nbytes,
+            "bytes_per_tick": nbytes / capacity if capacity else 0.0,
+            "errors": self.errors,
+        }
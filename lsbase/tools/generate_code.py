@@ -1,13 +1,32 @@
 # tools/generate_code.py (v9.2 - 최종)
+import importlib.util
 import json
 import os
 import re
+import sys
 from jinja2 import Environment, FileSystemLoader
 
 # --- 상수 정의 ---
 OUTPUT_FILENAME = "../generated_models.py"
 SPECS_FILENAME = "ls_openapi_specs.json"
 TEMPLATE_NAME = "api_client_template.py.jinja2"
+DECODERS_OUTPUT_FILENAME = "../generated_decoders.py"
+DECODERS_TEMPLATE_NAME = "realtime_decoders_template.py.jinja2"
+CONTINUATION_OUTPUT_FILENAME = "../generated_continuation.py"
+CONTINUATION_TEMPLATE_NAME = "continuation_template.py.jinja2"
+
+# 실시간 TR 필드 중 숫자로 변환할 필드를 한글명 끝부분으로 판별합니다. (명세의 타입 코드는 대부분 문자열)
+NUMERIC_NAME_SUFFIXES = ("가", "가격", "금", "액", "량", "대금", "건수", "수", "대비", "합계")
+FLOAT_NAME_SUFFIXES = ("율", "률", "강도", "비중")
+# 숫자처럼 보여도 문자열로 유지할 필드 (시간/코드/번호 등은 앞자리 0이 의미가 있음)
+STRING_NAME_MARKERS = ("구분", "코드", "시간", "시각", "번호", "여부", "일자", "명", "ID", "IP", "키")
+
+# 연속 조회 키로 볼 필드. InBlock과 OutBlock에 함께 있는 필드 중 cts_* > idx/date 순으로 고릅니다.
+# 그 밖의 공통 필드(shcode, IsuNo 등)는 요청 값을 되돌려 주는 것이므로 연속 키로 보지 않습니다.
+CONTINUATION_FIELD_PREFIX = "cts"  # cts_date, cts_idx, cts, ctsshcode 등
+CONTINUATION_FIELD_NAMES = ("idx", "date")
+# 연속 조회 TR과 주문 TR을 가려내기 위한 TR 코드 -> REST 경로 표
+TR_PATHS_FILENAME = "../openapi_client/tr_code_to_path.py"
 
 # --- 헬퍼 함수 ---
 def to_pascal_case(name: str) -> str:
@@ -106,6 +125,166 @@ def analyze_json_structure(sample_data: dict, block_name: str, field_specs: dict
     models.append({"class_name": main_class_name, "fields_str": get_fields_as_string(main_model_fields)})
     return models
 
+# --- 실시간 디코더 ---
+def is_realtime_code(tr_code: str) -> bool:
+    """실시간 TR 코드는 3자리입니다. (S3_, JIF, SC0 ...)"""
+    return len(tr_code) == 3
+
+def decoder_class_name(tr_code: str) -> str:
+    # 대소문자만 다른 TR이 있으므로 (H2_/h2_) 대소문자를 유지합니다.
+    return f"{re.sub(r'[^a-zA-Z0-9]', '', tr_code)}Tick"
+
+def infer_realtime_converter(korean_name: str, length: str, spec_type: str) -> str:
+    """실시간 필드의 변환 함수 이름 ("", "to_number", "to_float")"""
+    if spec_type == "float" or (isinstance(length, str) and '.' in length):
+        return "to_float"
+    if spec_type == "int":
+        return "to_number"
+    name = re.sub(r'[\d\s]+$', '', korean_name or "")
+    if name.endswith(STRING_NAME_MARKERS):
+        return ""
+    if name.endswith(FLOAT_NAME_SUFFIXES):
+        return "to_float"
+    if name.endswith(NUMERIC_NAME_SUFFIXES):
+        return "to_number"
+    return ""
+
+def build_decoder_spec(tr_code: str, tr_name: str, res_field_specs: dict) -> dict:
+    fields = []
+    for field_name, spec in res_field_specs.items():
+        converter = infer_realtime_converter(spec.get("korean_name"), spec.get("length"), spec.get("type", "str"))
+        fields.append({"name": field_name, "converter": converter, "korean_name": spec.get("korean_name", "")})
+    return {"code": tr_code, "name": tr_name, "class_name": decoder_class_name(tr_code), "fields": fields}
+
+def render_decoders(env: Environment, script_dir: str, decoder_specs: list) -> None:
+    template = env.get_template(DECODERS_TEMPLATE_NAME)
+    output_path = os.path.join(script_dir, DECODERS_OUTPUT_FILENAME)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(template.render(decoders=decoder_specs))
+    print(f"✅ 성공! '{os.path.abspath(output_path)}' 파일이 생성되었습니다. (실시간 디코더 {len(decoder_specs)}개)")
+
+def load_realtime_specs_from_models(models_path: str) -> list:
+    """명세 파일 없이 generated_models.py의 실시간 응답 모델에서 필드 명세를 복원합니다."""
+    with open(models_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    sections = re.split(r'^# \[([^\]]+)\] ?(.*)$', source, flags=re.M)
+    field_pattern = re.compile(
+        r'^    (\w+): Optional\[(\w+)\] = Field\(default=None, description="(.*) \(길이: \s*([^)]*)\)"\)', re.M
+    )
+    specs = []
+    for i in range(1, len(sections), 3):
+        tr_code, tr_name, body = sections[i].strip(), sections[i + 1].strip(), sections[i + 2]
+        if not is_realtime_code(tr_code):
+            continue
+        response_part = body.split("응답 모델 ---", 1)[-1]
+        res_field_specs = {
+            m.group(1): {"type": m.group(2), "korean_name": m.group(3), "length": m.group(4).strip()}
+            for m in field_pattern.finditer(response_part)
+        }
+        if res_field_specs:
+            specs.append(build_decoder_spec(tr_code, tr_name, res_field_specs))
+    return specs
+
+# --- 연속 조회 계획 ---
+def load_tr_paths(script_dir: str) -> dict:
+    """TR 코드 -> REST 경로. (lsbase 패키지를 임포트하지 않도록 파일만 읽습니다.)"""
+    path = os.path.join(script_dir, TR_PATHS_FILENAME)
+    module_spec = importlib.util.spec_from_file_location("tr_code_to_path", path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module.tr_code_to_path
+
+def is_continuation_candidate(tr_code: str, tr_paths: dict) -> bool:
+    """연속 조회 계획을 만들 TR인지 여부. 주문 TR(/order)과 TR이 아닌 항목(token, revoke 등)은 제외합니다."""
+    tr_path = tr_paths.get(tr_code)
+    return tr_path is not None and not tr_path.endswith("/order")
+
+def _is_continuation_field(name: str) -> bool:
+    return name.startswith(CONTINUATION_FIELD_PREFIX) or name == "idx"
+
+def _block_number(block: str) -> str:
+    """블록 이름 끝의 번호 (t1305InBlock -> "", CSPAQ13700OutBlock1 -> "1")"""
+    match = re.search(r'Block(\d*)$', block)
+    return match.group(1) if match else ""
+
+def build_continuation_plan(tr_code: str, tr_name: str, in_blocks: dict, out_blocks: dict) -> dict | None:
+    """
+    InBlock과 연속 조회용 OutBlock(목록이 아닌 블록)에 함께 있는 연속 키 필드(cts_*, idx, date)로 연속 키 계획을 만듭니다.
+    InBlock에 연속 키 필드가 없으면 필드가 빈 계획을 만들며, 이런 TR은 tr_cont_key 헤더만으로 다음 페이지를 조회합니다.
+    InBlock에 연속 키 필드(cts_*, idx)가 있는데 명세/모델에 짝이 되는 OutBlock이 없으면 None을 반환합니다.
+    (계획 없이 실행 시점에 응답으로 연속 키를 찾습니다. LSTradingAPI._guess_continuation)
+    in_blocks, out_blocks: {블록 이름: {필드 이름: 타입("str", "int", "float")}}
+    """
+    for in_block, in_fields in in_blocks.items():
+        for out_block, out_fields in out_blocks.items():
+            # InBlock1 -> OutBlock1처럼 번호가 같은 블록은 요청 값을 되돌려 주는 블록입니다.
+            if _block_number(in_block) and _block_number(in_block) == _block_number(out_block):
+                continue
+            common = [name for name in out_fields if name in in_fields]
+            keys = [name for name in common if name.startswith(CONTINUATION_FIELD_PREFIX)] \
+                or [name for name in common if name in CONTINUATION_FIELD_NAMES]
+            if not keys:
+                continue
+            return {
+                "code": tr_code, "name": tr_name, "in_block": in_block, "out_block": out_block,
+                "fields": [
+                    {"out_field": name, "in_field": name, "stop": "blank" if out_fields[name] == "str" else "zero"}
+                    for name in keys
+                ],
+            }
+    if any(_is_continuation_field(name) for in_fields in in_blocks.values() for name in in_fields):
+        return None
+    return {"code": tr_code, "name": tr_name, "in_block": None, "out_block": None, "fields": []}
+
+def render_continuation(env: Environment, script_dir: str, plans: list) -> None:
+    template = env.get_template(CONTINUATION_TEMPLATE_NAME)
+    output_path = os.path.join(script_dir, CONTINUATION_OUTPUT_FILENAME)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(template.render(plans=plans))
+    print(f"✅ 성공! '{os.path.abspath(output_path)}' 파일이 생성되었습니다. (연속 조회 계획 {len(plans)}개)")
+
+def load_continuation_plans_from_models(models_path: str) -> list:
+    """명세 파일 없이 generated_models.py의 요청/응답 모델에서 연속 조회 계획을 복원합니다."""
+    with open(models_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    sections = re.split(r'^# \[([^\]]+)\] ?(.*)$', source, flags=re.M)
+    class_pattern = re.compile(r'^class (\w+)\(BaseModel\):\n((?:    .*\n)*)', re.M)
+    field_pattern = re.compile(r'^    (\w+): ([\w\[\]]+) = Field', re.M)
+    tr_paths = load_tr_paths(os.path.dirname(os.path.abspath(__file__)))
+    plans = []
+    for i in range(1, len(sections), 3):
+        tr_code, tr_name, body = sections[i].strip(), sections[i + 1].strip(), sections[i + 2]
+        if is_realtime_code(tr_code) or not is_continuation_candidate(tr_code, tr_paths):
+            continue
+        classes = {m.group(1): dict(field_pattern.findall(m.group(2))) for m in class_pattern.finditer(body)}
+        request = classes.get(f"{to_pascal_case(tr_code)}Request", {})
+        response = classes.get(f"{to_pascal_case(tr_code)}Response", {})
+        # 블록 필드의 타입은 블록 클래스 이름입니다. (목록 블록은 List[...])
+        in_blocks = {name: classes[type_name] for name, type_name in request.items() if type_name in classes}
+        out_blocks = {name: classes[type_name] for name, type_name in response.items() if type_name in classes}
+        plan = build_continuation_plan(tr_code, tr_name, in_blocks, out_blocks)
+        if plan:
+            plans.append(plan)
+    return plans
+
+def main_from_models():
+    print("generated_models.py에서 실시간 디코더와 연속 조회 계획을 생성합니다...")
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    models_path = os.path.join(script_dir, OUTPUT_FILENAME)
+    env = Environment(loader=FileSystemLoader(script_dir), trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+    render_decoders(env, script_dir, load_realtime_specs_from_models(models_path))
+    render_continuation(env, script_dir, load_continuation_plans_from_models(models_path))
+
+def _block_field_types(example: dict, field_specs: dict) -> dict:
+    """예제의 블록(목록이 아닌 dict)별 {필드 이름: 타입}. 모델 생성과 같은 규칙으로 타입을 정합니다."""
+    return {
+        block: {
+            name: infer_type_from_value(value, field_specs.get(name, {}).get("type", "str"))
+            for name, value in fields.items()
+        }
+        for block, fields in example.items() if isinstance(fields, dict)
+    }
+
 def main():
     print("Pydantic 모델 코드 생성을 시작합니다 (v9.2 최종)...")
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -121,6 +300,9 @@ def main():
         specs_data = json.load(f)
 
     all_tr_specs = []
+    decoder_specs = []
+    continuation_plans = []
+    tr_paths = load_tr_paths(script_dir)
     for category in specs_data:
         for group in category.get('api_groups', []):
             for tr in group.get('tr_list', []):
@@ -143,11 +325,19 @@ def main():
                     class_name = f"{to_pascal_case(tr_code)}Response"
                     fields_str = get_fields_as_string(realtime_fields, is_realtime=True)
                     res_models = [{"class_name": class_name, "fields_str": fields_str}]
+                    if is_realtime_code(tr_code) and res_field_specs:
+                        decoder_specs.append(build_decoder_spec(tr_code, tr.get('name'), res_field_specs))
                 else:
                     res_example = tr['example'].get('response', {})
                     if not isinstance(res_example, dict): res_example = {}
                     res_field_specs = get_field_specs_dict(tr.get('response_body', []))
                     res_models = analyze_json_structure(res_example, f"{tr_code}Response", res_field_specs)
+                    if is_continuation_candidate(tr_code, tr_paths):
+                        plan = build_continuation_plan(tr_code, tr.get('name'),
+                                                       _block_field_types(req_example, req_field_specs),
+                                                       _block_field_types(res_example, res_field_specs))
+                        if plan:
+                            continuation_plans.append(plan)
                 all_tr_specs.append({
                     "code": tr_code, "name": tr.get('name'),
                     "request_models": req_models,
@@ -159,5 +349,13 @@ def main():
         f.write(rendered_code)
     print(f"✅ 성공! '{os.path.abspath(output_path)}' 파일이 생성되었습니다.")
 
+    env = Environment(loader=FileSystemLoader(script_dir), trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+    render_decoders(env, script_dir, decoder_specs)
+    render_continuation(env, script_dir, continuation_plans)
+
 if __name__ == "__main__":
-    main()
+    # --from-models: 명세 파일 없이 generated_models.py에서 실시간 디코더와 연속 조회 계획만 다시 생성합니다.
+    if "--from-models" in sys.argv:
+        main_from_models()
+    else:
+        main()
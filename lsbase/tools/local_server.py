@@ -0,0 +1,474 @@
+# lsbase/tools/local_server.py
+
+"""
+LS증권 Open API를 흉내 내는 로컬 서버입니다. 장 시간이나 TPS 제한 없이 OpenApi/MarketClient를 시험하고 벤치마크할 때 사용합니다.
+
+    python -m lsbase.tools.local_server --port 18080 --latency 0.02 --tick-rate 20
+
+    api = OpenApi(base_url="http://127.0.0.1:18080",
+                  wss_url_real="ws://127.0.0.1:18080/websocket",
+                  wss_url_simulation="ws://127.0.0.1:18080/websocket")
+    # MarketClient는 .env의 LS_BASE_URL, LS_WSS_URL_REAL, LS_WSS_URL_SIMULATION을 사용합니다.
+
+- /oauth2/token: 접근토큰 발급. 발급하지 않은 토큰(revoke_tokens로 폐기한 토큰 등)으로 요청하면 IGW00121 오류를 반환합니다.
+- tr_code_to_path의 REST 경로: 응답은 ls_openapi_specs.json의 example 응답으로 만들고,
+  명세가 없으면 generated_models의 응답 모델로 값을 채웁니다.
+  OutBlock1 목록이 있는 TR은 pages개의 페이지로 나누어 tr_cont/tr_cont_key 연속 조회를 흉내 냅니다.
+- TR별 TPS(명세의 transaction_per_sec 또는 지정값)를 넘으면 LS증권과 같이 IGW00201 오류를 반환합니다.
+- /websocket: 구독 요청에 응답하고, 구독 중인 (TR 코드, 키)마다 초당 tick_rate개의 가상 실시간 데이터를 보냅니다.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import secrets
+import time
+import typing
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Union
+
+from aiohttp import WSMsgType, web
+from pydantic import BaseModel
+
+from .. import generated_decoders, generated_models
+from ..openapi_client.code_realtime_account import code_realtime_account
+from ..openapi_client.tr_code_to_path import tr_code_to_path
+
+# 모듈 레벨 로거 설정
+logger = logging.getLogger(__name__)
+
+SPECS_FILENAME = "ls_openapi_specs.json"
+DEFAULT_PORT = 18080
+
+RATE_LIMIT_RESPONSE = {"rsp_cd": "IGW00201", "rsp_msg": "초당 전송 건수를 초과하였습니다."}
+INVALID_TOKEN_RESPONSE = {"rsp_cd": "IGW00121", "rsp_msg": "유효하지 않은 token 입니다."}
+UNKNOWN_TR_RESPONSE = {"rsp_cd": "IGW00000", "rsp_msg": "지원하지 않는 TR 코드입니다."}
+
+
+def load_spec_examples(specs_path: str) -> Dict[str, Dict[str, Any]]:
+    """명세 파일에서 TR 코드 -> {"response": 예제 응답 dict, "tps": 초당 전송 건수 또는 None}"""
+    with open(specs_path, "r", encoding="utf-8") as f:
+        specs_data = json.load(f)
+    examples = {}
+    for category in specs_data:
+        for group in category.get("api_groups", []):
+            for tr in group.get("tr_list", []):
+                code = (tr.get("code") or "").strip()
+                if not code:
+                    continue
+                response = (tr.get("example") or {}).get("response", {})
+                if isinstance(response, str):
+                    try:
+                        response = json.loads(response)
+                    except json.JSONDecodeError:
+                        response = {}
+                try:
+                    tps = float(tr.get("transaction_per_sec"))
+                except (TypeError, ValueError):
+                    tps = None
+                examples[code] = {"response": response if isinstance(response, dict) else {}, "tps": tps}
+    return examples
+
+
+def _model_class(tr_code: str, suffix: str):
+    name = tr_code[0].upper() + tr_code[1:].lower() + suffix
+    return getattr(generated_models, name, None)
+
+
+def _unwrap(annotation):
+    """Optional[X] -> X"""
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return args[0] if args else str
+    return annotation
+
+
+def _synthesize_value(name: str, annotation, rng: random.Random):
+    annotation = _unwrap(annotation)
+    if typing.get_origin(annotation) in (list, typing.List):
+        item = typing.get_args(annotation)[0]
+        return [_synthesize_value(name, item, rng)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {field: _synthesize_value(field, info.annotation, rng) for field, info in annotation.model_fields.items()}
+    if annotation is int:
+        return rng.randint(1, 100000)
+    if annotation is float:
+        return round(rng.uniform(-10, 10), 2)
+    lowered = name.lower()
+    if lowered.endswith("date") or lowered == "dt":
+        return datetime.now().strftime("%Y%m%d")
+    if lowered.endswith("time"):
+        return datetime.now().strftime("%H%M%S")
+    return ""
+
+
+def synthesize_response(tr_code: str, rng: random.Random) -> Dict[str, Any]:
+    """generated_models의 응답 모델로 예제 응답을 만듭니다. 모델이 없으면 빈 dict"""
+    model = _model_class(tr_code, "Response")
+    if model is None:
+        return {}
+    return {
+        name: _synthesize_value(name, info.annotation, rng)
+        for name, info in model.model_fields.items()
+        if name not in ("rsp_cd", "rsp_msg")
+    }
+
+
+def _is_continuation_field(name: str) -> bool:
+    return name.startswith("cts_") or name in ("idx", "cts")
+
+
+class LocalLSServer:
+    """
+    LS증권 Open API 대체 서버
+
+        async with LocalLSServer(latency=0.01, tick_rate=50) as server:
+            api = OpenApi(base_url=server.base_url, wss_url_real=server.wss_url, wss_url_simulation=server.wss_url)
+            await api.login("key", "secret")
+    """
+    def __init__(
+        self,
+        specs_path: Optional[str] = None,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        tps: Optional[Dict[str, float]] = None,
+        default_tps: Optional[float] = None,
+        pages: int = 3,
+        page_size: int = 20,
+        tick_rate: float = 10.0,
+        simulation: bool = True,
+        token_expires_in: int = 86400,
+        seed: int = 0,
+    ):
+        """
+        :param specs_path: 예제 응답과 TPS를 읽을 명세 파일. 생략하면 이 디렉터리의 ls_openapi_specs.json (없으면 모델로 생성)
+        :param latency: REST 응답 지연(초). (최소, 최대)이면 그 사이의 임의 값
+        :param tps: TR 코드별 초당 전송 건수 (명세 값보다 우선)
+        :param default_tps: 명세와 tps에 없는 TR의 초당 전송 건수. None이면 제한하지 않음
+        :param pages: OutBlock1 목록이 있는 TR의 연속 조회 페이지 수
+        :param page_size: 페이지당 OutBlock1 항목 수
+        :param tick_rate: 구독 중인 (TR 코드, 키)마다 초당 보내는 실시간 데이터 수. 0이면 보내지 않음
+        :param simulation: True이면 모의투자 서버처럼 응답합니다. (OpenApi가 모의투자 웹소켓 주소를 사용)
+        """
+        if specs_path is None:
+            specs_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), SPECS_FILENAME)
+        self._examples = load_spec_examples(specs_path) if os.path.exists(specs_path) else {}
+        if not self._examples:
+            logger.info(f"[LocalLSServer] 명세 파일이 없어 generated_models로 응답을 만듭니다: {specs_path}")
+        self.latency = latency
+        self._tps = dict(tps or {})
+        self.default_tps = default_tps
+        self.pages = max(1, pages)
+        self.page_size = max(1, page_size)
+        self.tick_rate = tick_rate
+        self.simulation = simulation
+        self.token_expires_in = token_expires_in
+        self._rng = random.Random(seed)
+        self._responses: Dict[str, Dict[str, Any]] = {}
+        self._windows: Dict[str, deque] = {}
+        self._tokens: set = set()
+        self._runner: Optional[web.AppRunner] = None
+        self.host = "127.0.0.1"
+        self.port = 0
+
+        # 통계
+        self.requests: Dict[str, int] = {}
+        self.throttled = 0
+        self.ws_connections = 0
+        self.ws_frames = 0
+
+    # --- 주소 ---
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def wss_url(self) -> str:
+        return f"ws://{self.host}:{self.port}/websocket"
+
+    # --- 실행 ---
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/oauth2/token", self._handle_token)
+        app.router.add_get("/websocket", self._handle_websocket)
+        for path in sorted(set(tr_code_to_path.values())):
+            app.router.add_post(path, self._handle_tr)
+        # OpenApi.warm_up()은 REST 서버 주소로 GET 요청을 보내 연결만 열어 둡니다.
+        app.router.add_get("/", self._handle_root)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 시작하고 REST 주소를 반환합니다. port가 0이면 빈 포트를 사용합니다."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.host = host
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"[LocalLSServer] {self.base_url} 에서 시작했습니다.")
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start(self.host, self.port)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    # --- REST ---
+
+    async def _handle_root(self, request: web.Request) -> web.Response:
+        return web.Response(text="LocalLSServer")
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if not form.get("appkey") or not form.get("appsecretkey"):
+            return web.json_response({"rsp_cd": "IGW00105", "rsp_msg": "appkey 또는 appsecretkey가 없습니다."}, status=401)
+        token = secrets.token_hex(16)
+        self._tokens.add(token)
+        return web.json_response({
+            "access_token": token,
+            "scope": "oob",
+            "token_type": "Bearer",
+            "expires_in": self.token_expires_in,
+        })
+
+    def revoke_tokens(self) -> None:
+        """발급한 접근토큰을 모두 폐기합니다. (서버가 토큰을 폐기한 경우를 흉내 냅니다)"""
+        self._tokens.clear()
+
+    def _authorized(self, request: web.Request) -> bool:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        return scheme == "Bearer" and token in self._tokens
+
+    async def _delay(self) -> None:
+        latency = self.latency
+        if isinstance(latency, tuple):
+            latency = self._rng.uniform(*latency)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+    def tps_for(self, tr_code: str) -> Optional[float]:
+        if tr_code in self._tps:
+            return self._tps[tr_code]
+        example = self._examples.get(tr_code)
+        if example and example["tps"]:
+            return example["tps"]
+        return self.default_tps
+
+    def _throttled(self, tr_code: str) -> bool:
+        """최근 1초 동안의 요청 수가 TPS를 넘으면 True"""
+        tps = self.tps_for(tr_code)
+        if not tps:
+            return False
+        now = time.monotonic()
+        window = self._windows.setdefault(tr_code, deque())
+        while window and now - window[0] >= 1.0:
+            window.popleft()
+        if len(window) >= tps:
+            return True
+        window.append(now)
+        return False
+
+    def _example_response(self, tr_code: str) -> Dict[str, Any]:
+        response = self._responses.get(tr_code)
+        if response is None:
+            example = self._examples.get(tr_code)
+            response = dict(example["response"]) if example and example["response"] else synthesize_response(tr_code, self._rng)
+            response.pop("rsp_cd", None)
+            response.pop("rsp_msg", None)
+            self._responses[tr_code] = response
+        return response
+
+    def build_page(self, tr_code: str, page: int, in_block: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        page(0부터)번째 응답 본문과 다음 페이지가 있는지 여부
+        in_block: 요청 InBlock. OutBlock에 같은 이름의 필드(shcode 등)가 있으면 요청 값을 그대로 돌려줍니다.
+        """
+        in_block = in_block or {}
+        body = {}
+        paged = False
+        for name, value in self._example_response(tr_code).items():
+            if isinstance(value, list):
+                paged = True
+                body[name] = [value[i % len(value)] for i in range(self.page_size)] if value else []
+            elif isinstance(value, dict) and in_block:
+                body[name] = {
+                    field: in_block[field] if field in in_block and not _is_continuation_field(field) else field_value
+                    for field, field_value in value.items()
+                }
+            else:
+                body[name] = value
+        has_next = paged and page + 1 < self.pages
+        if paged:
+            for name, value in body.items():
+                if isinstance(value, dict):
+                    # 연속 조회 키는 다음 페이지가 있으면 페이지 번호, 마지막 페이지이면 빈 값으로 채웁니다.
+                    block = dict(value)
+                    for field, field_value in block.items():
+                        if _is_continuation_field(field):
+                            if isinstance(field_value, (int, float)):
+                                block[field] = page + 1 if has_next else 0
+                            else:
+                                block[field] = str(page + 1) if has_next else ""
+                    body[name] = block
+        body["rsp_cd"] = "00000"
+        body["rsp_msg"] = "모의투자 조회가 완료되었습니다." if self.simulation else "조회가 완료되었습니다."
+        return body, has_next
+
+    async def _handle_tr(self, request: web.Request) -> web.Response:
+        tr_code = request.headers.get("tr_cd", "")
+        data = await request.read()
+        self.requests[tr_code] = self.requests.get(tr_code, 0) + 1
+        await self._delay()
+        if tr_code_to_path.get(tr_code) != request.path:
+            return web.json_response(UNKNOWN_TR_RESPONSE, status=500)
+        if not self._authorized(request):
+            return web.json_response(INVALID_TOKEN_RESPONSE, status=500)
+        if self._throttled(tr_code):
+            self.throttled += 1
+            return web.json_response(RATE_LIMIT_RESPONSE, status=500)
+
+        page = 0
+        if request.headers.get("tr_cont") == "Y":
+            try:
+                page = int(request.headers.get("tr_cont_key", "0"))
+            except ValueError:
+                page = 0
+        try:
+            payload = json.loads(data) if data else {}
+        except ValueError:
+            payload = {}
+        in_block = next((block for key, block in payload.items() if "InBlock" in key and isinstance(block, dict)), None) if isinstance(payload, dict) else None
+        body, has_next = self.build_page(tr_code, page, in_block)
+        headers = {
+            "tr_cd": tr_code,
+            "tr_cont": "Y" if has_next else "N",
+            "tr_cont_key": str(page + 1) if has_next else "",
+        }
+        return web.json_response(body, headers=headers)
+
+    # --- 웹소켓 ---
+
+    def make_realtime_body(self, tr_code: str, key: str, state: Dict[str, Any]) -> Dict[str, str]:
+        """가상 실시간 데이터. 체결 TR은 가격이 임의로 움직이고 누적거래량이 늘어납니다."""
+        decoder = generated_decoders.DECODERS.get(tr_code)
+        fields = decoder.FIELDS if decoder is not None else ()
+        body = {name: "0" for name in fields}
+        now = datetime.now().strftime("%H%M%S")
+        if "price" in body:
+            price = state.get("price") or self._rng.randint(100, 1000) * 100
+            price = max(100, price + self._rng.randint(-2, 2) * 100)
+            volume = self._rng.randint(1, 500)
+            state["price"] = price
+            state["volume"] = state.get("volume", 0) + volume
+            body.update({
+                "price": str(price),
+                "cvolume": str(volume),
+                "volume": str(state["volume"]),
+                "cgubun": self._rng.choice("+-"),
+            })
+        for name in ("chetime", "hotime", "time"):
+            if name in body:
+                body[name] = now
+        for name in ("shcode", "upcode", "jangubun"):
+            if name in body:
+                body[name] = key
+        if tr_code == "JIF":
+            body["jstatus"] = "21"
+        return body
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.ws_connections += 1
+        subscriptions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        feed = asyncio.ensure_future(self._feed(ws, subscriptions)) if self.tick_rate > 0 else None
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    frame = json.loads(message.data)
+                    tr_type = frame["header"]["tr_type"]
+                    tr_code = frame["body"]["tr_cd"]
+                    key = frame["body"]["tr_key"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if tr_type in ("1", "3"):
+                    # 계좌 실시간 TR(주문 체결 등)은 응답만 하고 데이터는 보내지 않습니다.
+                    if tr_code not in code_realtime_account:
+                        subscriptions.setdefault((tr_code, key), {})
+                else:
+                    subscriptions.pop((tr_code, key), None)
+                await ws.send_str(json.dumps({
+                    "header": {"tr_cd": tr_code, "tr_key": key, "tr_type": tr_type, "rsp_cd": "00000", "rsp_msg": "정상처리되었습니다"},
+                    "body": None,
+                }, ensure_ascii=False))
+        finally:
+            if feed is not None:
+                feed.cancel()
+        return ws
+
+    async def _feed(self, ws: web.WebSocketResponse, subscriptions: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+        interval = 1.0 / self.tick_rate
+        next_time = time.monotonic()
+        while not ws.closed:
+            next_time += interval
+            await asyncio.sleep(max(0.0, next_time - time.monotonic()))
+            for (tr_code, key), state in list(subscriptions.items()):
+                body = self.make_realtime_body(tr_code, key, state)
+                try:
+                    await ws.send_str(json.dumps({"header": {"tr_cd": tr_code, "tr_key": key}, "body": body}))
+                except ConnectionError:
+                    return
+                self.ws_frames += 1
+
+    # --- 통계 ---
+
+    def stats(self) -> Dict[str, Any]:
+        """TR별 요청 수, TPS 초과로 거절한 요청 수, 웹소켓 연결 수, 보낸 실시간 데이터 수"""
+        return {
+            "requests": dict(self.requests),
+            "throttled": self.throttled,
+            "ws_connections": self.ws_connections,
+            "ws_frames": self.ws_frames,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LS증권 Open API 로컬 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--specs", default=None, help="명세 파일 경로 (기본: lsbase/tools/ls_openapi_specs.json)")
+    parser.add_argument("--latency", type=float, default=0.0, help="REST 응답 지연(초)")
+    parser.add_argument("--default-tps", type=float, default=None, help="명세에 TPS가 없는 TR의 초당 전송 건수")
+    parser.add_argument("--pages", type=int, default=3, help="연속 조회 페이지 수")
+    parser.add_argument("--page-size", type=int, default=20, help="페이지당 항목 수")
+    parser.add_argument("--tick-rate", type=float, default=10.0, help="구독 항목마다 초당 보내는 실시간 데이터 수")
+    parser.add_argument("--real", action="store_true", help="실투자 서버처럼 응답")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = LocalLSServer(
+        specs_path=args.specs, latency=args.latency, default_tps=args.default_tps,
+        pages=args.pages, page_size=args.page_size, tick_rate=args.tick_rate, simulation=not args.real,
+    )
+    print(f"LS_BASE_URL=http://{args.host}:{args.port}")
+    print(f"LS_WSS_URL_REAL=ws://{args.host}:{args.port}/websocket")
+    print(f"LS_WSS_URL_SIMULATION=ws://{args.host}:{args.port}/websocket")
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
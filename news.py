@@ -18,7 +18,7 @@ async def main():
     client = MarketClient()
     
     # 사용자는 뉴스 수신과 같은 추가적인 실시간 데이터만 직접 핸들링합니다.
-    client._open_api.on_realtime.connect(news_handler)
+    client._open_api.on_realtime.connect(news_handler, trcode="NWS")
     
     try:
         if not await client.connect():
@@ -2,38 +2,21 @@
 
 import asyncio
 from lsbase import MarketClient
-from lsbase import generated_models as gen_models
-from pydantic import ValidationError
 
-def on_samsung_price_update(sender, trcode, key, realtimedata):
-    if trcode == "S3_" and key == "005930":
-        try:
-            # 이제 S3Response는 realtimedata와 구조가 일치하는 평평한 모델입니다.
-            data = gen_models.S3Response.model_validate(realtimedata)
-            
-            if data.chetime and data.price and data.cvolume:
-                chetime = data.chetime
-                price = int(data.price)
-                cvolume = int(data.cvolume)
-                
-                formatted_time = f"{chetime[:2]}:{chetime[2:4]}:{chetime[4:]}"
-                print(f"[실시간 체결] 시간: {formatted_time}, 현재가: {price: ,d} 원, 체결량: {cvolume: ,d} 주")
-
-        except ValidationError as e:
-            print(f"S3_ 데이터 파싱 오류: {e}")
-        except (AttributeError, TypeError, ValueError) as e:
-            # 'S3Response' 모델 자체가 없는 경우를 대비한 예외 처리
-            if 'has no attribute' in str(e):
-                 print(f"오류: 'generated_models.py'에 '{e.name}' 모델이 없습니다. 코드 생성기를 다시 실행하세요.")
-            else:
-                 print(f"S3_ 처리 오류: {e}. realtimedata: {realtimedata}")
+def on_samsung_price_update(sender, trcode, key, tick):
+    # decode=True로 등록했으므로 tick은 generated_decoders.S3Tick입니다.
+    # pydantic 검증 없이, 접근한 필드만 int/float로 변환됩니다.
+    if tick.chetime and tick.price and tick.cvolume:
+        chetime = tick.chetime
+        formatted_time = f"{chetime[:2]}:{chetime[2:4]}:{chetime[4:]}"
+        print(f"[실시간 체결] 시간: {formatted_time}, 현재가: {tick.price: ,d} 원, 체결량: {tick.cvolume: ,d} 주")
 
 # async def main() 부분은 이전과 동일
 async def main():
     client = MarketClient(monitor_market_state=False) 
     samsung_symbol = "005930"
     try:
-        client._open_api.on_realtime.connect(on_samsung_price_update)
+        client._open_api.on_realtime.connect(on_samsung_price_update, trcode="S3_", key=samsung_symbol, decode=True)
         if not await client.connect():
             print("서버 연결에 실패했습니다.")
             return